@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Python tooling, run against synthetic scale data.
+
+Each benchmark runs at several input sizes and reports wall time and the
+peak memory allocated while it ran (tracemalloc), so scaling problems show
+up as a growing column rather than a single slow number.
+
+Results can be saved as a JSON baseline and later runs compared against it;
+a benchmark that got slower (or hungrier) than the threshold fails the run,
+so performance work can be measured before and protected after. Benchmarks
+with a reference (REFERENCES: the implementation they replaced) also fail
+when their output differs from it or they run slower than it.
+
+Usage:
+    python benchmarks.py                          # Run every benchmark
+    python benchmarks.py notebooklm-render        # Run one benchmark
+    python benchmarks.py --sizes 1000 10000       # Override input sizes
+    python benchmarks.py --list                   # List benchmarks
+    python benchmarks.py --save --repeat 3        # Save results as the baseline
+    python benchmarks.py --compare --repeat 3     # Compare against the baseline, best of 3 (exit 1 on regression)
+    python benchmarks.py latest-images --compare --threshold 0.5
+    python benchmarks.py --save before.json       # Named baselines for a before/after comparison
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import contextlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+from synthetic_data import synthetic_filename, synthetic_prompts, write_synthetic_csv, write_synthetic_memories
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / ".cache" / "benchmarks" / "baseline.json"
+DEFAULT_THRESHOLD = 0.25  # Relative slowdown (or peak-memory growth) that counts as a regression
+MIN_COMPARABLE_SECONDS = 0.005  # Faster timings are mostly noise; they never count as regressions
+
+
+def measure(fn) -> tuple[float, int]:
+    """Run fn() once; return (seconds, peak traced bytes)."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_notebooklm_render(size: int, workdir: Path) -> tuple[float, int]:
+    """Render the master guide and every category file for `size` questions."""
+    from generate_notebooklm_materials import (
+        build_document_model, generate_category_file, generate_master_file, parse_leetcode_csv,
+    )
+
+    csv_path = write_synthetic_csv(workdir / f"questions_{size}.csv", size)
+    questions = parse_leetcode_csv(str(csv_path))
+
+    output_dir = workdir / f"out_{size}"
+    output_dir.mkdir(exist_ok=True)
+
+    def run():
+        model = build_document_model(questions)
+        for category in model["categories"]:
+            generate_category_file(category, output_dir)
+        generate_master_file(model, output_dir)
+
+    return measure(run)
+
+
+def bench_csv_ingest(size: int, workdir: Path) -> tuple[float, int]:
+    """Parse a synthetic CSV of `size` questions."""
+    from generate_notebooklm_materials import parse_leetcode_csv
+
+    csv_path = write_synthetic_csv(workdir / f"questions_{size}.csv", size)
+    return measure(lambda: parse_leetcode_csv(str(csv_path)))
+
+
+class ReferenceMismatch(Exception):
+    """The optimized implementation returned something its reference did not."""
+
+
+# The keyword table and scan of extract_key_pattern before it was optimized,
+# kept verbatim as the reference its replacement must match and beat
+REFERENCE_KEY_PATTERNS = {
+    "hash map": "Hash Map", "hashmap": "Hash Map", "hashset": "Hash Set",
+    "sliding window": "Sliding Window", "two pointers": "Two Pointers",
+    "left/right": "Two Pointers", "left, right": "Two Pointers",
+    "dfs": "DFS (Depth-First Search)", "bfs": "BFS (Breadth-First Search)",
+    "dynamic programming": "Dynamic Programming", "dp:": "Dynamic Programming",
+    "dp ": "Dynamic Programming", "recursion": "Recursion", "recursive": "Recursion",
+    "binary search": "Binary Search", "sorted": "Binary Search",
+    "divide and conquer": "Divide and Conquer", "greedy": "Greedy",
+    "backtracking": "Backtracking", "trie": "Trie", "heap": "Heap/Priority Queue",
+    "priority": "Heap/Priority Queue", "union find": "Union-Find",
+    "topological": "Topological Sort", "topsort": "Topological Sort",
+    "bit shift": "Bit Manipulation", "bitwise": "Bit Manipulation",
+    "xor": "XOR/Bit Manipulation", "stack": "Stack", "queue": "Queue",
+    "prefix": "Prefix Sum/Product", "memoization": "Memoization", "cache": "Memoization",
+}
+
+
+def reference_key_pattern(notes: str, category: str) -> str:
+    notes_lower = notes.lower()
+    found_patterns = []
+    for pattern, name_p in REFERENCE_KEY_PATTERNS.items():
+        if pattern in notes_lower and name_p not in found_patterns:
+            found_patterns.append(name_p)
+    if found_patterns:
+        return ", ".join(found_patterns[:2])
+    return category
+
+
+def key_pattern_notes(size: int) -> list[str]:
+    """
+    Synthetic notes: realistic fragments, plus keywords glued together
+    ("topsorted") and mixed case, where overlapping matches differ.
+    """
+    import random
+    from synthetic_data import NOTE_FRAGMENTS
+
+    rng = random.Random(size)
+    keywords = list(REFERENCE_KEY_PATTERNS)
+    notes = []
+    for i in range(size):
+        note = ", ".join(rng.sample(NOTE_FRAGMENTS, rng.randint(1, 4)))
+        if i % 4 == 0:
+            note += " " + "".join(rng.sample(keywords, rng.randint(2, 3)))
+        notes.append(note.upper() if i % 7 == 0 else note)
+    return notes
+
+
+def bench_key_pattern(size: int, workdir: Path) -> tuple[float, int]:
+    """Tag `size` synthetic notes with extract_key_pattern, checked against the reference."""
+    from generate_notebooklm_materials import extract_key_pattern
+
+    notes = key_pattern_notes(size)
+    for note in notes:
+        expected, actual = reference_key_pattern(note, "Arrays"), extract_key_pattern(note, "Arrays")
+        if actual != expected:
+            raise ReferenceMismatch(f"{note!r}: {actual!r}, reference {expected!r}")
+
+    def run():
+        for note in notes:
+            extract_key_pattern(note, "Arrays")
+
+    return measure(run)
+
+
+def bench_key_pattern_reference(size: int, workdir: Path) -> tuple[float, int]:
+    """The same notes through reference_key_pattern."""
+    notes = key_pattern_notes(size)
+
+    def run():
+        for note in notes:
+            reference_key_pattern(note, "Arrays")
+
+    return measure(run)
+
+
+def bench_master_file(size: int, workdir: Path) -> tuple[float, int]:
+    """Render the master study guide alone for `size` questions."""
+    from generate_notebooklm_materials import build_document_model, generate_master_file, parse_leetcode_csv
+
+    csv_path = write_synthetic_csv(workdir / f"questions_{size}.csv", size)
+    questions = parse_leetcode_csv(str(csv_path))
+    output_dir = workdir / f"master_{size}"
+    output_dir.mkdir(exist_ok=True)
+    return measure(lambda: generate_master_file(build_document_model(questions), output_dir))
+
+
+@contextlib.contextmanager
+def synthetic_prompt_library(size: int):
+    """
+    Swap prompt_library.PROMPTS for `size` synthetic prompts while the block runs.
+
+    The dict is updated in place because problem_catalog imports PROMPTS by name.
+    """
+    import prompt_library
+
+    original = dict(prompt_library.PROMPTS)
+    prompt_library.PROMPTS.clear()
+    prompt_library.PROMPTS.update(synthetic_prompts(size))
+    try:
+        yield prompt_library
+    finally:
+        prompt_library.PROMPTS.clear()
+        prompt_library.PROMPTS.update(original)
+
+
+def bench_build_prompt(size: int, workdir: Path) -> tuple[float, int]:
+    """Build the full prompt for every problem in a `size`-entry library."""
+    with synthetic_prompt_library(size) as library:
+        numbers = library.get_all_problem_numbers()
+        return measure(lambda: [library.build_prompt(number) for number in numbers])
+
+
+def bench_latest_images(size: int, workdir: Path) -> tuple[float, int]:
+    """Pick the latest version per problem from a memories folder of `size` PNG stubs."""
+    import upload_mnemonics_to_supabase as uploader
+
+    memories_dir = workdir / f"memories_{size}"
+    write_synthetic_memories(memories_dir, size)
+
+    original_dir = uploader.MEMORIES_DIR
+    uploader.MEMORIES_DIR = memories_dir
+    try:
+        return measure(uploader.get_latest_images)
+    finally:
+        uploader.MEMORIES_DIR = original_dir
+
+
+def bench_ungenerated(size: int, workdir: Path) -> tuple[float, int]:
+    """Find ungenerated problems in a `size`-entry library with every other image on disk."""
+    # generate_batch builds its OpenAI client at import; no request is ever made here
+    os.environ.setdefault("OPENAI_API_KEY", "unused-by-benchmarks")
+    import generate_batch
+
+    output_dir = workdir / f"generated_{size}"
+    output_dir.mkdir(exist_ok=True)
+    for number in range(1, size + 1, 2):
+        (output_dir / synthetic_filename(number)).touch()
+
+    import problem_catalog
+
+    original_dir, original_catalog = generate_batch.OUTPUT_DIR, problem_catalog._catalog
+    generate_batch.OUTPUT_DIR = str(output_dir)
+    try:
+        # generate_batch reads the shared catalog, so build one over the synthetic library
+        with synthetic_prompt_library(size):
+            catalog_path = workdir / f"catalog_{size}.sqlite"
+            problem_catalog.build_catalog(catalog_path)
+        problem_catalog._catalog = problem_catalog.ProblemCatalog(catalog_path)
+        return measure(generate_batch.get_ungenerated_problems)
+    finally:
+        problem_catalog._catalog.close()
+        generate_batch.OUTPUT_DIR, problem_catalog._catalog = original_dir, original_catalog
+
+
+# name -> (function, default sizes, description)
+BENCHMARKS = {
+    "csv-ingest": (
+        bench_csv_ingest,
+        [1000, 5000, 10000],
+        "parse_leetcode_csv (header scan, dedupe, pattern tagging)",
+    ),
+    "key-pattern": (
+        bench_key_pattern,
+        [1000, 10000, 50000],
+        "extract_key_pattern over synthetic notes",
+    ),
+    "notebooklm-render": (
+        bench_notebooklm_render,
+        [1000, 5000, 10000],
+        "build_document_model + every markdown file (parse excluded)",
+    ),
+    "master-file": (
+        bench_master_file,
+        [1000, 5000, 10000],
+        "build_document_model + generate_master_file (parse excluded)",
+    ),
+    "build-prompt": (
+        bench_build_prompt,
+        [500, 1000, 5000],
+        "build_prompt for every entry of a synthetic prompt library",
+    ),
+    "latest-images": (
+        bench_latest_images,
+        [5000, 20000, 50000],
+        "get_latest_images over a memories folder of versioned PNG stubs",
+    ),
+    "ungenerated": (
+        bench_ungenerated,
+        [500, 1000, 5000],
+        "get_ungenerated_problems against a half-generated output folder",
+    ),
+}
+
+# name -> the implementation it replaced, timed on the same input; a benchmark
+# slower than its reference by more than the threshold fails the run
+REFERENCES = {
+    "key-pattern": bench_key_pattern_reference,
+}
+
+
+def run_benchmark(name: str, sizes: list[int] | None = None, repeat: int = 1) -> list[dict]:
+    """
+    Run `name` at each size; with repeat > 1, keep the fastest time and smallest peak.
+    Benchmarks with a reference also record the reference's time as reference_seconds.
+    """
+    fn, default_sizes, description = BENCHMARKS[name]
+    reference = REFERENCES.get(name)
+    print(f"\n⏱️  {name}: {description}")
+    print(f"   {'size':>8}{'seconds':>12}{'µs/item':>10}{'peak MB':>10}" + (f"{'ref s':>10}{'vs ref':>9}" if reference else ""))
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes or default_sizes:
+            try:
+                timings = [fn(size, Path(tmp)) for _ in range(repeat)]
+            except ImportError as e:
+                print(f"   ⚠️  Skipped: {e} (pip install -r requirements.txt)")
+                return []
+            elapsed = min(seconds for seconds, _ in timings)
+            peak = min(peak_bytes for _, peak_bytes in timings)
+            result = {"size": size, "seconds": elapsed, "peak_bytes": peak}
+            line = f"   {size:>8}{elapsed:>12.4f}{elapsed / size * 1e6:>10.1f}{peak / 1024 / 1024:>10.2f}"
+            if reference:
+                result["reference_seconds"] = min(reference(size, Path(tmp))[0] for _ in range(repeat))
+                line += f"{result['reference_seconds']:>10.4f}{elapsed / result['reference_seconds'] - 1:>+9.0%}"
+            results.append(result)
+            print(line)
+    return results
+
+
+def reference_regressions(name: str, runs: list[dict], threshold: float) -> list[str]:
+    """Sizes at which `name` is slower than its reference by more than threshold."""
+    return [
+        f"{name} @ {run['size']}: {run['seconds'] / run['reference_seconds'] - 1:+.0%} vs reference"
+        for run in runs
+        if "reference_seconds" in run and run["seconds"] >= MIN_COMPARABLE_SECONDS
+        and run["seconds"] > run["reference_seconds"] * (1 + threshold)
+    ]
+
+
+# ============================================================================
+# BASELINES
+# ============================================================================
+
+def load_baseline(path: Path) -> dict:
+    """A saved baseline: {"benchmarks": {name: [{size, seconds, peak_bytes}, ...]}, ...}."""
+    if not path.exists():
+        return {"benchmarks": {}}
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, results: dict[str, list[dict]]) -> None:
+    """Merge `results` into the baseline at `path` (benchmarks not run keep their old entries)."""
+    baseline = load_baseline(path)
+    baseline["benchmarks"].update(results)
+    baseline.update({
+        "saved_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+    })
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(baseline, indent=2) + "\n")
+    os.replace(tmp_path, path)
+
+
+def compare_results(baseline: dict, results: dict[str, list[dict]], threshold: float) -> list[str]:
+    """Print current vs baseline per benchmark and size; return the regressions found."""
+    regressions = []
+    print(f"\n{'Benchmark':<20}{'size':>8}{'base s':>10}{'now s':>10}{'time':>9}{'base MB':>10}{'now MB':>10}{'memory':>9}")
+    print("-" * 86)
+    for name, runs in results.items():
+        base_by_size = {run["size"]: run for run in baseline["benchmarks"].get(name, [])}
+        for run in runs:
+            base = base_by_size.get(run["size"])
+            if base is None:
+                print(f"{name:<20}{run['size']:>8}{'-':>10}{run['seconds']:>10.4f}{'new':>9}")
+                continue
+            time_change = run["seconds"] / base["seconds"] - 1 if base["seconds"] else 0.0
+            memory_change = run["peak_bytes"] / base["peak_bytes"] - 1 if base["peak_bytes"] else 0.0
+            flags = []
+            if time_change > threshold and run["seconds"] >= MIN_COMPARABLE_SECONDS:
+                flags.append(f"time {time_change:+.0%}")
+            if memory_change > threshold:
+                flags.append(f"memory {memory_change:+.0%}")
+            if flags:
+                regressions.append(f"{name} @ {run['size']}: {', '.join(flags)}")
+            print(f"{name:<20}{run['size']:>8}{base['seconds']:>10.4f}{run['seconds']:>10.4f}{time_change:>+9.0%}"
+                  f"{base['peak_bytes'] / 1024 / 1024:>10.2f}{run['peak_bytes'] / 1024 / 1024:>10.2f}"
+                  f"{memory_change:>+9.0%}{'  ❌' if flags else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scripts' hot paths on synthetic data")
+    parser.add_argument("benchmarks", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Input sizes (default: per benchmark)")
+    parser.add_argument("--list", action="store_true", help="List available benchmarks")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per size, best kept (default: 1)")
+    parser.add_argument("--save", type=Path, nargs="?", const=DEFAULT_BASELINE_PATH, metavar="FILE",
+                        help=f"Save results as a JSON baseline (default: {DEFAULT_BASELINE_PATH.relative_to(Path(__file__).parent)})")
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE_PATH, metavar="FILE",
+                        help="Compare results against a saved baseline; exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Relative slowdown or memory growth counted as a regression (default: {DEFAULT_THRESHOLD})")
+
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (_, sizes, description) in BENCHMARKS.items():
+            print(f"{name:24s} {description} (sizes: {', '.join(map(str, sizes))})")
+        return
+
+    names = args.benchmarks or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    baseline = None
+    if args.compare:
+        if not args.compare.exists():
+            print(f"❌ Baseline not found: {args.compare} (create one with --save)")
+            sys.exit(1)
+        baseline = load_baseline(args.compare)
+
+    results = {}
+    failures = []
+    for name in names:
+        # Re-run at the baseline's sizes so every row has something to compare against
+        baseline_sizes = [run["size"] for run in baseline["benchmarks"].get(name, [])] if baseline else None
+        try:
+            runs = run_benchmark(name, args.sizes or baseline_sizes, args.repeat)
+        except ReferenceMismatch as e:
+            print(f"   ❌ Output differs from the reference: {e}")
+            failures.append(f"{name}: output differs from the reference")
+            continue
+        failures += reference_regressions(name, runs, args.threshold)
+        if runs:
+            results[name] = runs
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"\n💾 Baseline saved to {args.save}")
+
+    if failures:
+        print(f"\n❌ {len(failures)} benchmark(s) failed against their reference:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+
+    if baseline is not None:
+        regressions = compare_results(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Publish the problem catalog as a static, content-hashed bundle in storage.
+
+Every session otherwise queries blind_problems for prompts, steps, hints,
+definitions, groups and mnemonic URLs, although the table only changes when
+seeds or mnemonic uploads run. This exporter:
+
+1. Asks the database for one md5 over every catalog row (a single-row query)
+   and stops there if the published bundle was built from the same rows
+2. Otherwise reads the rows and writes the bundle in every format:
+       catalog/catalog.<hash>.json        plain JSON
+       catalog/catalog.<hash>.json.gz     gzip -9
+       catalog/catalog.<hash>.json.br     brotli (needs the brotli package)
+       catalog/catalog.<hash>.msgpack     with --msgpack (needs msgpack)
+   where <hash> is the SHA-256 of the JSON, so a name never changes meaning
+3. Uploads the bundle files with a one-year immutable cache lifetime, then
+   the small pointer catalog/latest.json (60s cache) naming the current hash
+
+Clients read the pointer, then the bundle it names (services/databaseService.ts
+fetchCatalogBundle) and trust it, so a session makes no database round trip
+for the catalog; a cached bundle is never stale, only the pointer is. Keeping
+the pointer current is this script's job: the jobs that write blind_problems
+(upload_mnemonics_to_supabase.py, sync_seed_data.py, related_problems.py and
+migrate.py when it seeds) call republish() after their writes, which compares
+the rows' md5 with the published one, and the uploader's --gc keeps every
+image the published bundle references.
+
+Usage:
+    python build_catalog_bundle.py                 # Publish if the rows changed
+    python build_catalog_bundle.py --dry-run       # Build into scripts/.cache/catalog, no upload
+    python build_catalog_bundle.py --from-seed     # Build from seed_data/blind_problems.json (no database)
+    python build_catalog_bundle.py --check         # Exit 1 if the published bundle is stale
+    python build_catalog_bundle.py --force --msgpack
+
+Needs DATABASE_URL (see migrate.py) for the rows and the Supabase service
+role key (see upload_mnemonics_to_supabase.py) for the upload.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import upload_mnemonics_to_supabase as uploader
+
+SCRIPT_DIR = Path(__file__).parent
+OUTPUT_DIR = SCRIPT_DIR / ".cache" / "catalog"
+OBJECT_PREFIX = "catalog/"
+POINTER_OBJECT = "catalog/latest.json"
+POINTER_CACHE_SECONDS = 60
+BUNDLE_VERSION = 1
+
+# Every blind_problems column the app reads (mapDbProblemToProblem)
+CATALOG_COLUMNS = [
+    "id", "title", "prompt", "example", "constraints", "pattern", "key_idea", "detailed_hint",
+    "definition", "solution", "time_complexity", "space_complexity", "steps", "expected_edge_cases",
+    "topics", "difficulty", "problem_group", "leetcode_number", "mnemonic_image_url", "related_problems",
+]
+
+ROWS_MD5_SQL = f"""
+SELECT md5(string_agg(to_jsonb(p)::text, E'\\n' ORDER BY p.title)), count(*)
+FROM (SELECT {', '.join(CATALOG_COLUMNS)} FROM public.blind_problems) p
+"""
+
+# (pointer key, file suffix, content type)
+VARIANTS = [
+    ("json", ".json", "application/json"),
+    ("gzip", ".json.gz", "application/gzip"),
+    ("brotli", ".json.br", "application/x-brotli"),
+    ("msgpack", ".msgpack", "application/msgpack"),
+]
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        print("❌ msgpack package not installed. Install with: pip install msgpack")
+        sys.exit(1)
+    return msgpack
+
+
+def _import_brotli():
+    """brotli is optional: without it the .br variant is skipped."""
+    try:
+        import brotli
+    except ImportError:
+        print("⚠️  brotli package not installed; skipping the .br variant (pip install brotli)")
+        return None
+    return brotli
+
+
+# ============================================================================
+# ROWS
+# ============================================================================
+
+def fetch_rows_md5(conn) -> tuple[str | None, int]:
+    """One md5 over every catalog row, computed server-side, and the row count."""
+    return conn.execute(ROWS_MD5_SQL).fetchone()
+
+
+def fetch_rows(conn) -> list[dict]:
+    cursor = conn.execute(f"SELECT {', '.join(CATALOG_COLUMNS)} FROM public.blind_problems ORDER BY title")
+    return [dict(zip(CATALOG_COLUMNS, row)) for row in cursor.fetchall()]
+
+
+def seed_rows() -> tuple[list[dict], str]:
+    """Rows from the seed file (no ids or mnemonic URLs) and their md5."""
+    from generate_seed_sql import load_seed_data
+
+    rows = [{column: row.get(column) for column in CATALOG_COLUMNS}
+            for row in sorted(load_seed_data(), key=lambda row: row["title"])]
+    canonical = "\n".join(json.dumps(row, sort_keys=True, ensure_ascii=False) for row in rows)
+    return rows, hashlib.md5(canonical.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# BUNDLE
+# ============================================================================
+
+def encode_bundle(rows: list[dict], msgpack_module=None, brotli_module=None) -> tuple[str, dict[str, bytes]]:
+    """
+    Serialize the rows in every available format.
+
+    Returns:
+        (content hash, {variant: bytes}); the hash is of the JSON, so all
+        variants of one catalog share it
+    """
+    bundle = {"version": BUNDLE_VERSION, "columns": CATALOG_COLUMNS, "problems": rows}
+    data = json.dumps(bundle, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    variants = {"json": data, "gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli_module is not None:
+        variants["brotli"] = brotli_module.compress(data, quality=11)
+    if msgpack_module is not None:
+        variants["msgpack"] = msgpack_module.packb(json.loads(data), use_bin_type=True)
+    digest = hashlib.sha256(data).hexdigest()[:uploader.CONTENT_HASH_LENGTH]
+    return digest, variants
+
+
+def object_names(digest: str, variants: dict[str, bytes]) -> dict[str, str]:
+    return {key: f"{OBJECT_PREFIX}catalog.{digest}{suffix}" for key, suffix, _ in VARIANTS if key in variants}
+
+
+def build_pointer(digest: str, rows_md5: str, row_count: int, objects: dict[str, str],
+                  variants: dict[str, bytes]) -> dict:
+    return {
+        "version": digest,
+        "rows_md5": rows_md5,
+        "rows": row_count,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "objects": objects,
+        "bytes": {key: len(data) for key, data in variants.items()},
+    }
+
+
+def fetch_published_pointer(supabase) -> dict | None:
+    """The pointer currently in storage, or None if there is none yet."""
+    try:
+        return json.loads(supabase.storage.from_(uploader.BUCKET_NAME).download(POINTER_OBJECT))
+    except Exception:
+        return None
+
+
+def publish(supabase, objects: dict[str, str], variants: dict[str, bytes], pointer: dict) -> None:
+    """Upload the bundle files (immutable), then the pointer that names them."""
+    bucket = supabase.storage.from_(uploader.BUCKET_NAME)
+    content_types = {key: content_type for key, _, content_type in VARIANTS}
+    for key, object_name in objects.items():
+        bucket.upload(
+            path=object_name,
+            file=variants[key],
+            file_options={"content-type": content_types[key],
+                          "cache-control": str(uploader.IMMUTABLE_CACHE_SECONDS), "upsert": "true"},
+        )
+        print(f"  ✅ Uploaded: {object_name} ({len(variants[key]) / 1024:.1f} KB)")
+    bucket.upload(
+        path=POINTER_OBJECT,
+        file=json.dumps(pointer, indent=2).encode("utf-8"),
+        file_options={"content-type": "application/json",
+                      "cache-control": str(POINTER_CACHE_SECONDS), "upsert": "true"},
+    )
+    print(f"  ✅ Uploaded: {POINTER_OBJECT} -> {pointer['version']}")
+
+
+def write_bundle(rows: list[dict], rows_md5: str, row_count: int,
+                 msgpack_module=None) -> tuple[dict[str, str], dict[str, bytes], dict]:
+    """Encode the rows, write every file into OUTPUT_DIR and return (objects, variants, pointer)."""
+    digest, variants = encode_bundle(rows, msgpack_module, _import_brotli())
+    objects = object_names(digest, variants)
+    pointer = build_pointer(digest, rows_md5, row_count, objects, variants)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for key, object_name in objects.items():
+        (OUTPUT_DIR / Path(object_name).name).write_bytes(variants[key])
+    (OUTPUT_DIR / Path(POINTER_OBJECT).name).write_text(json.dumps(pointer, indent=2))
+
+    print(f"\n📦 Bundle {digest}:")
+    for key, data in variants.items():
+        print(f"   {key:<8} {len(data) / 1024:>8.1f} KB")
+    return objects, variants, pointer
+
+
+def republish(conn, supabase=None, force: bool = False, msgpack_module=None) -> str | None:
+    """
+    Publish a new bundle if blind_problems changed since the published one.
+
+    Jobs that write catalog rows (the mnemonic uploader, sync_seed_data.py,
+    related_problems.py) call this after their writes, so the bundle the app
+    trusts never lags behind the database.
+
+    Returns:
+        The new bundle hash, or None if the published bundle was up to date
+    """
+    supabase = supabase or uploader.get_supabase_client()
+    rows_md5, row_count = fetch_rows_md5(conn)
+    print(f"   blind_problems: {row_count} rows (md5 {(rows_md5 or '-')[:12]})")
+    published = fetch_published_pointer(supabase)
+    if published and published.get("rows_md5") == rows_md5 and not force:
+        print(f"\n✨ Published bundle {published['version']} is up to date")
+        return None
+
+    objects, variants, pointer = write_bundle(fetch_rows(conn), rows_md5, row_count, msgpack_module)
+    print()
+    publish(supabase, objects, variants, pointer)
+    return pointer["version"]
+
+
+def is_stale(conn, supabase=None) -> bool:
+    """True if no bundle is published or blind_problems changed since it was."""
+    supabase = supabase or uploader.get_supabase_client()
+    rows_md5, row_count = fetch_rows_md5(conn)
+    print(f"   blind_problems: {row_count} rows (md5 {(rows_md5 or '-')[:12]})")
+    published = fetch_published_pointer(supabase)
+    if not published:
+        print("\n⚠️  No bundle is published")
+        return True
+    if published.get("rows_md5") != rows_md5:
+        print(f"\n⚠️  Published bundle {published['version']} is stale "
+              f"(built from {published.get('rows')} rows, md5 {published.get('rows_md5', '-')[:12]})")
+        return True
+    print(f"\n✨ Published bundle {published['version']} is up to date")
+    return False
+
+
+def republish_after_write(conn=None, supabase=None) -> None:
+    """
+    republish() for the jobs that just wrote catalog rows.
+
+    Opens its own connection unless one is passed. A failure is reported
+    loudly but does not fail the job, whose rows are already written; rerun
+    build_catalog_bundle.py once the cause is fixed.
+    """
+    from migrate import connect
+
+    print("\n📦 Republishing the catalog bundle...")
+    own_conn = conn is None
+    try:
+        if own_conn:
+            conn = connect()
+        republish(conn, supabase)
+    except Exception as e:
+        print(f"  ⚠️  Catalog bundle NOT republished ({e}); the app serves the previous one until it is.")
+        print("     Run build_catalog_bundle.py once this is fixed.")
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
+
+
+def published_image_urls(supabase) -> set[str]:
+    """mnemonic_image_url values in the published bundle (empty if none is published)."""
+    pointer = fetch_published_pointer(supabase)
+    if not pointer:
+        return set()
+    bucket = supabase.storage.from_(uploader.BUCKET_NAME)
+    bundle = json.loads(bucket.download(pointer["objects"]["json"]))
+    return {row["mnemonic_image_url"] for row in bundle["problems"] if row.get("mnemonic_image_url")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish the problem catalog as a static bundle")
+    parser.add_argument("--dry-run", action="store_true", help=f"Build into {OUTPUT_DIR} without uploading")
+    parser.add_argument("--from-seed", action="store_true",
+                        help="Use seed_data/blind_problems.json instead of the database (implies --dry-run)")
+    parser.add_argument("--force", action="store_true", help="Rebuild and upload even if the rows are unchanged")
+    parser.add_argument("--msgpack", action="store_true", help="Also publish a MessagePack variant")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report whether the published bundle matches the rows; exit 1 if not "
+                             "(for rows edited outside the scripts, e.g. in the SQL editor)")
+
+    args = parser.parse_args()
+    msgpack_module = _import_msgpack() if args.msgpack else None
+
+    print("=" * 60)
+    print("Problem Catalog Bundle")
+    print("=" * 60)
+
+    if args.from_seed:
+        rows, rows_md5 = seed_rows()
+        print(f"\n🌱 {len(rows)} rows from the seed file (md5 {rows_md5[:12]})")
+        write_bundle(rows, rows_md5, len(rows), msgpack_module)
+        print(f"\n🏃 DRY RUN - bundle written to {OUTPUT_DIR}, nothing uploaded")
+        return
+
+    from migrate import connect
+
+    print("\n🔌 Connecting to the database...")
+    conn = connect()
+    try:
+        if args.check:
+            stale = is_stale(conn)
+            if stale:
+                print("   Run build_catalog_bundle.py to republish it.")
+            sys.exit(1 if stale else 0)
+
+        if args.dry_run:
+            rows_md5, row_count = fetch_rows_md5(conn)
+            print(f"   blind_problems: {row_count} rows (md5 {(rows_md5 or '-')[:12]})")
+            write_bundle(fetch_rows(conn), rows_md5, row_count, msgpack_module)
+            print(f"\n🏃 DRY RUN - bundle written to {OUTPUT_DIR}, nothing uploaded")
+            return
+
+        digest = republish(conn, force=args.force, msgpack_module=msgpack_module)
+    finally:
+        conn.close()
+
+    if digest:
+        print("=" * 60)
+        print(f"Done! Published catalog {digest}.")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Pack thumbnails of the latest mnemonic images into WebP sprite atlases.
+
+The progress grid and spot cards can show dozens of problems at once; one
+request per mnemonic makes those views slow. This build step:
+
+1. Picks the latest image of every problem (get_latest_images())
+2. Makes a small thumbnail of each, cached by the source's SHA-256
+3. Packs the thumbnails into fixed-slot WebP atlases (columns x rows each)
+4. Writes sprites/sprite-atlas.json, mapping leetcode_number -> atlas + offset
+5. Uploads changed atlases (content-hashed, cacheable for a year) and the map
+
+Slots are stable across builds: a problem keeps its atlas and position, a new
+problem takes the first free slot, and only atlases whose slots changed are
+re-encoded and re-uploaded. Replacing one image therefore rebuilds one atlas.
+
+Map format (services/spriteAtlasService.ts reads it):
+    {
+      "version": 1,
+      "thumb": {"width": 192, "height": 128},
+      "atlases": [{"object": "sprites/atlas-0.<hash>.webp", "width": 3072, "height": 1024}],
+      "problems": {"141": {"atlas": 0, "x": 384, "y": 128}}
+    }
+
+Usage:
+    python build_sprite_atlas.py                   # Rebuild what changed, upload atlases and map
+    python build_sprite_atlas.py --no-upload       # Build into scripts/.cache/sprites only
+    python build_sprite_atlas.py --full            # Re-thumbnail and repack everything
+    python build_sprite_atlas.py --thumb-size 240x160 --columns 12 --rows 8
+
+Prerequisites:
+    pip install pillow supabase python-dotenv
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import upload_mnemonics_to_supabase as uploader
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR / ".cache" / "sprites"
+STATE_FILENAME = "state.json"
+MAP_OBJECT = "sprites/sprite-atlas.json"
+ATLAS_PREFIX = "sprites/atlas"
+
+MAP_VERSION = 1
+DEFAULT_THUMB_SIZE = (192, 128)  # Same 3:2 shape as the 1536x1024 originals
+DEFAULT_COLUMNS = 16
+DEFAULT_ROWS = 8
+WEBP_QUALITY = 80
+BACKGROUND = (255, 255, 255)
+# The map changes whenever an atlas does, so clients should revalidate it quickly
+MAP_CACHE_SECONDS = 60
+
+
+def _import_pillow():
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        print("❌ pillow package not installed. Install with: pip install pillow")
+        sys.exit(1)
+    return Image, ImageOps
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ============================================================================
+# STATE
+# ============================================================================
+
+def load_state(cache_dir: Path) -> dict:
+    path = cache_dir / STATE_FILENAME
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_state(cache_dir: Path, state: dict) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_dir / (STATE_FILENAME + ".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+    os.replace(tmp_path, cache_dir / STATE_FILENAME)
+
+
+def layout_of(args) -> dict:
+    return {"thumb": list(args.thumb_size), "columns": args.columns, "rows": args.rows,
+            "quality": args.quality}
+
+
+def source_hashes(latest_images: dict[int, str], memories_dir: Path, previous: dict) -> dict[int, dict]:
+    """
+    {problem: {"source", "sha256", "size", "mtime_ns"}} for the latest images.
+
+    Files whose size and mtime match the previous build keep their hash
+    instead of being read again.
+    """
+    sources = {}
+    for number, filename in latest_images.items():
+        stat = (memories_dir / filename).stat()
+        old = previous.get(str(number))
+        if old and old["source"] == filename and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+            sha256 = old["sha256"]
+        else:
+            sha256 = file_sha256(memories_dir / filename)
+        sources[number] = {"source": filename, "sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return sources
+
+
+def assign_slots(sources: dict[int, dict], previous: dict, per_atlas: int) -> tuple[dict[int, int], set[int]]:
+    """
+    Keep every surviving problem's slot and give new ones the lowest free slots.
+
+    Returns:
+        ({problem: global slot}, atlases that need re-encoding), where global
+        slot // per_atlas is the atlas and the remainder the cell in it
+    """
+    slots = {}
+    dirty = set()
+    for key, entry in previous.items():
+        number = int(key)
+        if number in sources:
+            slots[number] = entry["slot"]
+            if entry["sha256"] != sources[number]["sha256"]:
+                dirty.add(entry["slot"] // per_atlas)
+        else:
+            dirty.add(entry["slot"] // per_atlas)  # Removed: its cell must be blanked
+
+    used = set(slots.values())
+    free = (slot for slot in range(len(sources) + len(used) + 1) if slot not in used)
+    for number in sorted(set(sources) - set(slots)):
+        slots[number] = next(free)
+        dirty.add(slots[number] // per_atlas)
+    return slots, dirty
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def thumbnail(Image, ImageOps, source: Path, sha256: str, size: tuple[int, int], cache_dir: Path):
+    """Thumbnail of `source`, cropped to fill `size`; cached as PNG by content hash."""
+    cached = cache_dir / "thumbs" / f"{sha256[:16]}_{size[0]}x{size[1]}.png"
+    if cached.exists():
+        thumb = Image.open(cached)
+        thumb.load()  # Reads the pixels and closes the file
+        return thumb
+    with Image.open(source) as image:
+        thumb = ImageOps.fit(image.convert("RGB"), size, Image.Resampling.LANCZOS)
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    thumb.save(cached, optimize=True)
+    return thumb
+
+
+def render_atlas(Image, ImageOps, index: int, members: dict[int, int], sources: dict[int, dict],
+                 memories_dir: Path, args) -> tuple[bytes, int, int]:
+    """Encode atlas `index` from {problem: cell}; returns (webp bytes, width, height)."""
+    width, height = args.thumb_size
+    rows_used = max((cell // args.columns for cell in members.values()), default=0) + 1
+    atlas = Image.new("RGB", (args.columns * width, rows_used * height), BACKGROUND)
+    for number, cell in members.items():
+        thumb = thumbnail(Image, ImageOps, memories_dir / sources[number]["source"],
+                          sources[number]["sha256"], args.thumb_size, CACHE_DIR)
+        atlas.paste(thumb, ((cell % args.columns) * width, (cell // args.columns) * height))
+    buffer = io.BytesIO()
+    atlas.save(buffer, "WEBP", quality=args.quality, method=6)
+    return buffer.getvalue(), atlas.width, atlas.height
+
+
+def build_map(slots: dict[int, int], atlases: list[dict], args) -> dict:
+    width, height = args.thumb_size
+    per_atlas = args.columns * args.rows
+    return {
+        "version": MAP_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "thumb": {"width": width, "height": height},
+        "atlases": [{"object": atlas["object"], "width": atlas["width"], "height": atlas["height"]}
+                    for atlas in atlases],
+        "problems": {
+            str(number): {
+                "atlas": slot // per_atlas,
+                "x": (slot % per_atlas) % args.columns * width,
+                "y": (slot % per_atlas) // args.columns * height,
+            }
+            for number, slot in sorted(slots.items())
+        },
+    }
+
+
+def upload_object(supabase, object_name: str, data: bytes, content_type: str, cache_seconds: int) -> None:
+    supabase.storage.from_(uploader.BUCKET_NAME).upload(
+        path=object_name,
+        file=data,
+        file_options={"content-type": content_type, "cache-control": str(cache_seconds), "upsert": "true"},
+    )
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    return width, height
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack mnemonic thumbnails into WebP sprite atlases")
+    parser.add_argument("--no-upload", action="store_true", help=f"Build into {CACHE_DIR} without uploading")
+    parser.add_argument("--full", action="store_true", help="Ignore the previous build and repack everything")
+    parser.add_argument("--thumb-size", type=parse_size, default=DEFAULT_THUMB_SIZE, metavar="WxH",
+                        help=f"Thumbnail size (default: {DEFAULT_THUMB_SIZE[0]}x{DEFAULT_THUMB_SIZE[1]})")
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS,
+                        help=f"Thumbnails per atlas row (default: {DEFAULT_COLUMNS})")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS,
+                        help=f"Rows per atlas before starting another (default: {DEFAULT_ROWS})")
+    parser.add_argument("--quality", type=int, default=WEBP_QUALITY, help=f"WebP quality (default: {WEBP_QUALITY})")
+
+    args = parser.parse_args()
+    Image, ImageOps = _import_pillow()
+
+    print("=" * 60)
+    print("Mnemonic Sprite Atlas Builder")
+    print("=" * 60)
+
+    state = {} if args.full else load_state(CACHE_DIR)
+    if state and state.get("layout") != layout_of(args):
+        print("\n📐 Layout changed since the last build - repacking everything")
+        state = {}
+    previous = state.get("problems", {})
+    per_atlas = args.columns * args.rows
+
+    print("\n🔍 Scanning memories folder...")
+    latest_images = uploader.get_latest_images()
+    sources = source_hashes(latest_images, uploader.MEMORIES_DIR, previous)
+    slots, dirty = assign_slots(sources, previous, per_atlas)
+    atlas_count = max(slots.values()) // per_atlas + 1 if slots else 0
+    atlases = state.get("atlases", [])[:atlas_count]
+    dirty |= set(range(len(atlases), atlas_count))
+    print(f"   {len(sources)} problems in {atlas_count} atlas(es); {len(dirty)} to rebuild")
+
+    published = all(atlas["uploaded"] for atlas in atlases) and state.get("uploaded_map") == state.get("map_sha256")
+    if not dirty and (published or args.no_upload):
+        print("\n✨ Sprite atlases are up to date")
+        return
+
+    atlases += [None] * (atlas_count - len(atlases))
+    for index in sorted(dirty):
+        if index >= atlas_count:
+            continue  # Trailing atlas emptied by removals
+        members = {n: slot % per_atlas for n, slot in slots.items() if slot // per_atlas == index}
+        data, width, height = render_atlas(Image, ImageOps, index, members, sources, uploader.MEMORIES_DIR, args)
+        digest = hashlib.sha256(data).hexdigest()[:uploader.CONTENT_HASH_LENGTH]
+        object_name = f"{ATLAS_PREFIX}-{index}.{digest}.webp"
+        (CACHE_DIR / "atlases").mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / "atlases" / Path(object_name).name).write_bytes(data)
+        atlases[index] = {"object": object_name, "width": width, "height": height, "uploaded": False}
+        print(f"   🖼️  {object_name}: {len(members)} thumbnails, {width}x{height}, {len(data) / 1024:.0f} KB")
+
+    current = {Path(atlas["object"]).name for atlas in atlases}
+    for stale in (CACHE_DIR / "atlases").glob("*.webp"):
+        if stale.name not in current:
+            stale.unlink()
+
+    sprite_map = build_map(slots, atlases, args)
+    map_bytes = (json.dumps(sprite_map, separators=(",", ":")) + "\n").encode("utf-8")
+    (CACHE_DIR / Path(MAP_OBJECT).name).write_bytes(map_bytes)
+    # generated_at aside, an unchanged map needs no upload
+    map_sha256 = hashlib.sha256(json.dumps({**sprite_map, "generated_at": None}, sort_keys=True).encode()).hexdigest()
+
+    state.update({
+        "layout": layout_of(args),
+        "problems": {str(n): {**sources[n], "slot": slot} for n, slot in slots.items()},
+        "atlases": atlases,
+        "map_sha256": map_sha256,
+    })
+
+    if args.no_upload:
+        save_state(CACHE_DIR, state)
+        print(f"\n💾 Built locally in {CACHE_DIR} (not uploaded)")
+        return
+
+    print("\n🔌 Connecting to Supabase...")
+    supabase = uploader.get_supabase_client()
+    for atlas in atlases:
+        if not atlas["uploaded"]:
+            data = (CACHE_DIR / "atlases" / Path(atlas["object"]).name).read_bytes()
+            upload_object(supabase, atlas["object"], data, "image/webp", uploader.IMMUTABLE_CACHE_SECONDS)
+            atlas["uploaded"] = True
+            print(f"  ✅ Uploaded: {atlas['object']}")
+            save_state(CACHE_DIR, state)
+
+    # The map goes last, so it never points at an atlas that is not there yet
+    if state.get("uploaded_map") != map_sha256:
+        upload_object(supabase, MAP_OBJECT, map_bytes, "application/json", MAP_CACHE_SECONDS)
+        state["uploaded_map"] = map_sha256
+        print(f"  ✅ Uploaded: {MAP_OBJECT}")
+    save_state(CACHE_DIR, state)
+
+    print("=" * 60)
+    print(f"Done! {len(slots)} thumbnails in {atlas_count} atlas(es), {len(dirty)} rebuilt.")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
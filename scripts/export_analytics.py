@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Export progress, daily activity and reports to partitioned Parquet for analytics.
+
+Questions like "which problems have the worst pass rate" otherwise mean ad-hoc
+queries against production and JSON digging in saved_reports.report_data.
+This pipeline copies the tables into local columnar files instead:
+
+1. Streams each table in (watermark, id) order with keyset-paginated queries,
+   starting after the last row exported by the previous run (incremental)
+2. Flattens saved_reports.report_data into typed columns (scores, rubric,
+   checklist, counts, problem title) - the raw JSON is left behind
+3. Writes one file per month partition and run:
+       <output>/<table>/month=YYYY-MM/part-<run>-<n>.parquet
+   and records the new watermark in <output>/_state.json
+
+    user_problem_progress   watermark updated_at   partitioned by updated_at
+    user_daily_activity     watermark updated_at   partitioned by activity_date
+    saved_reports           watermark report_date  partitioned by report_date
+
+Rows newer than --lag-seconds are left for the next run, so transactions that
+commit late are not skipped. A changed progress row is exported again, so the
+files are a change log: take the latest updated_at per id, or run --compact to
+rewrite each table with only the latest version of every row. saved_reports has
+no updated_at; reports whose report_date is edited into the past are not
+picked up again (re-export with --full).
+
+Query with anything that reads Parquet, e.g. DuckDB:
+    SELECT problem_title, avg((best_score >= 70)::int) AS pass_rate
+    FROM read_parquet('scripts/.cache/analytics/user_problem_progress/*/*.parquet')
+    GROUP BY 1 ORDER BY 2 LIMIT 10;
+
+Usage:
+    python export_analytics.py                         # Incremental export of all tables
+    python export_analytics.py --tables saved_reports
+    python export_analytics.py --format arrow          # Arrow IPC files instead of Parquet
+    python export_analytics.py --full                  # Drop previous exports and start over
+    python export_analytics.py --compact               # Keep only the latest version of each row
+
+Needs DATABASE_URL (see migrate.py) and pyarrow. Run migrate.py up first so
+supabase-add-export-indexes.sql makes each page an index range scan.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from migrate import connect
+from precompute_review_queues import iter_keyset_pages
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_OUTPUT_DIR = SCRIPT_DIR / ".cache" / "analytics"
+STATE_FILENAME = "_state.json"
+
+DEFAULT_PAGE_SIZE = 10_000
+DEFAULT_LAG_SECONDS = 300
+ROWS_PER_FILE = 250_000  # A partition's rows are split into files of at most this many
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+class ExportTable(NamedTuple):
+    """One exported table."""
+    name: str
+    columns: tuple[tuple[str, str], ...]  # (column, kind) selected from the table
+    watermark: str                        # Incremental cursor column (id breaks ties)
+    partition: str                        # Column whose month names the partition
+    flatten: Callable | None = None       # row -> {derived column: value}
+    derived: tuple[tuple[str, str], ...] = ()
+    drop: tuple[str, ...] = ()            # Selected for flatten() but not written
+
+    @property
+    def schema_columns(self) -> list[tuple[str, str]]:
+        return [c for c in self.columns if c[0] not in self.drop] + list(self.derived)
+
+
+# =============================================================================
+# REPORT FLATTENING
+# =============================================================================
+
+# (column, kind, path into PerformanceReport); see types.ts
+REPORT_FIELDS = [
+    ("summary", "string", ("summary",)),
+    ("session_mode", "string", ("sessionMode",)),
+    ("time_spent_seconds", "number", ("timeSpentSeconds",)),
+    ("detected_auto_score", "string", ("detectedAutoScore",)),
+    ("code_language", "string", ("codeLanguage",)),
+    # Walkie Talkie rubric and checklist
+    ("rubric_algorithm", "number", ("rubricScores", "algorithmScore")),
+    ("rubric_edge_cases", "number", ("rubricScores", "edgeCasesScore")),
+    ("rubric_time_complexity", "number", ("rubricScores", "timeComplexityScore")),
+    ("rubric_space_complexity", "number", ("rubricScores", "spaceComplexityScore")),
+    ("checklist_correct_pattern", "bool", ("mentalModelChecklist", "correctPattern")),
+    ("checklist_logic_correct", "bool", ("mentalModelChecklist", "logicCorrect")),
+    ("checklist_time_complexity_correct", "bool", ("mentalModelChecklist", "timeComplexityCorrect")),
+    ("checklist_space_complexity_correct", "bool", ("mentalModelChecklist", "spaceComplexityCorrect")),
+    ("checklist_edge_cases_mentioned", "bool", ("mentalModelChecklist", "edgeCasesMentioned")),
+    # Teach mode
+    ("teaching_score", "number", ("teachingReportData", "teachingScore")),
+    ("teaching_student_outcome", "string", ("teachingReportData", "studentOutcome")),
+    ("teaching_junior_summary_correct", "bool", ("teachingReportData", "juniorSummaryCorrect")),
+    ("teaching_factual_errors", "count", ("teachingReportData", "factualErrors")),
+    # Explain mode (readiness)
+    ("readiness_score", "number", ("readinessReportData", "readinessScore")),
+    ("readiness_is_ready", "bool", ("readinessReportData", "isReadyToTeach")),
+    ("readiness_missing_elements", "count", ("readinessReportData", "missingElements")),
+    # Coding interview rubric
+    ("coding_problem_understanding", "number", ("codingRubric", "problemUnderstanding")),
+    ("coding_solution_approach", "number", ("codingRubric", "solutionApproach")),
+    ("coding_functional_correctness", "number", ("codingRubric", "functionalCorrectness")),
+    ("coding_code_hygiene", "number", ("codingRubric", "codeHygiene")),
+    ("coding_communication", "number", ("codingRubric", "communication")),
+    ("code_issues", "count", ("codeIssues",)),
+    # Feedback volume
+    ("suggestions", "count", ("suggestions",)),
+    ("detailed_feedback", "count", ("detailedFeedback",)),
+    ("highlights", "count", ("highlights",)),
+    ("missing_edge_cases", "count", ("missingEdgeCases",)),
+]
+REPORT_PROBLEM_KEYS = ("teachingProblem", "readinessProblem")
+
+
+def _lookup(data, path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _typed(kind: str, value):
+    """Value as `kind`, or None when the JSON holds something else."""
+    if kind == "number":
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+    if kind == "bool":
+        return value if isinstance(value, bool) else None
+    if kind == "count":
+        return len(value) if isinstance(value, list) else None
+    return value if isinstance(value, str) else None
+
+
+def flatten_report(row: dict) -> dict:
+    """Typed columns from saved_reports.report_data."""
+    data = row["report_data"]
+    if isinstance(data, str):
+        data = json.loads(data)
+    flat = {column: _typed(kind, _lookup(data, path)) for column, kind, path in REPORT_FIELDS}
+
+    problem = next((data[key] for key in REPORT_PROBLEM_KEYS if isinstance(data, dict) and isinstance(data.get(key), dict)),
+                   {})
+    # Teach/readiness reports are titled after the problem when no problem is embedded
+    flat["problem_title"] = _typed("string", problem.get("title")) or (
+        row["title"] if row["type"] in ("teach", "readiness") else None)
+    flat["problem_difficulty"] = _typed("string", problem.get("difficulty"))
+    return flat
+
+
+TABLES = {
+    "user_problem_progress": ExportTable(
+        name="user_problem_progress",
+        columns=(("id", "uuid"), ("user_id", "uuid"), ("problem_title", "string"), ("status", "string"),
+                 ("best_score", "int"), ("reviews_needed", "int"), ("reviews_completed", "int"),
+                 ("last_reviewed_at", "timestamp"), ("next_review_at", "timestamp"),
+                 ("created_at", "timestamp"), ("updated_at", "timestamp")),
+        watermark="updated_at",
+        partition="updated_at",
+    ),
+    "user_daily_activity": ExportTable(
+        name="user_daily_activity",
+        columns=(("id", "uuid"), ("user_id", "uuid"), ("activity_date", "date"),
+                 ("problems_completed", "strings"), ("problems_count", "int"),
+                 ("reviews_completed", "strings"), ("reviews_count", "int"), ("time_spent_minutes", "int"),
+                 ("created_at", "timestamp"), ("updated_at", "timestamp")),
+        watermark="updated_at",
+        partition="activity_date",
+    ),
+    "saved_reports": ExportTable(
+        name="saved_reports",
+        columns=(("id", "uuid"), ("user_id", "uuid"), ("title", "string"), ("type", "string"),
+                 ("rating", "int"), ("report_date", "timestamp"), ("created_at", "timestamp"),
+                 ("report_data", "json")),
+        watermark="report_date",
+        partition="report_date",
+        flatten=flatten_report,
+        derived=tuple((column, "float" if kind == "number" else "int" if kind == "count" else kind)
+                      for column, kind, _ in REPORT_FIELDS)
+        + (("problem_title", "string"), ("problem_difficulty", "string")),
+        drop=("report_data",),
+    ),
+}
+
+
+# =============================================================================
+# ARROW
+# =============================================================================
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute  # noqa: F401
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        print("❌ pyarrow package not installed. Install with: pip install pyarrow")
+        sys.exit(1)
+    return pyarrow
+
+
+def arrow_schema(pa, spec: ExportTable):
+    types = {
+        "uuid": pa.string(), "string": pa.string(), "int": pa.int64(), "float": pa.float64(),
+        "bool": pa.bool_(), "timestamp": pa.timestamp("us", tz="UTC"), "date": pa.date32(),
+        "strings": pa.list_(pa.string()),
+    }
+    return pa.schema([(column, types[kind]) for column, kind in spec.schema_columns])
+
+
+def _cell(kind: str, value):
+    if value is None:
+        return None
+    if kind == "uuid":
+        return str(value)
+    if kind == "date" and isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if kind == "strings" and isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def _month(value) -> str:
+    return value.strftime("%Y-%m") if value is not None else "unknown"
+
+
+def write_file(pa, table, path: Path, fmt: str) -> None:
+    """Write an Arrow table to `path` atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    if fmt == "parquet":
+        pa.parquet.write_table(table, tmp_path, compression="zstd")
+    else:
+        with pa.ipc.new_file(tmp_path, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def read_files(pa, paths: list[Path], fmt: str):
+    if fmt == "parquet":
+        tables = [pa.parquet.read_table(path) for path in paths]
+    else:
+        tables = [pa.ipc.open_file(path).read_all() for path in paths]
+    return pa.concat_tables(tables)
+
+
+# =============================================================================
+# STATE
+# =============================================================================
+
+def load_state(output_dir: Path) -> dict:
+    path = output_dir / STATE_FILENAME
+    if not path.exists():
+        return {"tables": {}}
+    return json.loads(path.read_text())
+
+
+def save_state(output_dir: Path, state: dict) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_dir / (STATE_FILENAME + ".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+    os.replace(tmp_path, output_dir / STATE_FILENAME)
+
+
+def part_files(output_dir: Path, table: str, fmt: str) -> list[Path]:
+    return sorted((output_dir / table).glob(f"*/part-*{FORMATS[fmt]}"))
+
+
+def _run_of(path: Path) -> str:
+    return path.stem.split("-")[1]  # part-<run>-<n>
+
+
+def remove_uncommitted(output_dir: Path, table_state: dict, table: str, fmt: str) -> int:
+    """Delete files left by runs that failed before recording their watermark."""
+    committed = set(table_state.get("runs", []))
+    removed = 0
+    for path in part_files(output_dir, table, fmt):
+        if _run_of(path) not in committed:
+            path.unlink()
+            removed += 1
+    for path in (output_dir / table).glob("*/*.tmp"):
+        path.unlink()
+    return removed
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def _parse_key(value: str):
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        return value
+
+
+def export_table(conn, spec: ExportTable, output_dir: Path, state: dict, run_id: str, fmt: str = "parquet",
+                 page_size: int = DEFAULT_PAGE_SIZE, lag_seconds: int = DEFAULT_LAG_SECONDS) -> dict:
+    """Export the rows of `spec` newer than its watermark; updates `state` in place."""
+    pa = _import_pyarrow()
+    schema = arrow_schema(pa, spec)
+    table_state = state["tables"].setdefault(spec.name, {"runs": [], "rows": 0})
+    remove_uncommitted(output_dir, table_state, spec.name, fmt)
+
+    names = [spec.watermark, "id"] + [c for c, _ in spec.columns if c not in (spec.watermark, "id")]
+    kinds = dict(spec.columns)
+    after = None
+    if table_state.get("watermark"):
+        watermark, key = table_state["watermark"]
+        after = (datetime.fromisoformat(watermark), _parse_key(key))
+
+    buffers: dict[str, list[dict]] = {}
+    files = []
+    stats = {"rows": 0, "pages": 0}
+
+    def flush(month: str):
+        rows = buffers.pop(month)
+        path = output_dir / spec.name / f"month={month}" / f"part-{run_id}-{len(files):04d}{FORMATS[fmt]}"
+        write_file(pa, pa.Table.from_pylist(rows, schema=schema), path, fmt)
+        files.append(path)
+
+    pages = iter_keyset_pages(
+        conn, f"SELECT {', '.join(names)} FROM {spec.name}", [spec.watermark, "id"], page_size,
+        after=after, condition=f"{spec.watermark} < NOW() - make_interval(secs => %s)", params=(lag_seconds,),
+    )
+    last = None
+    for page in pages:
+        stats["pages"] += 1
+        for values in page:
+            raw = dict(zip(names, values))
+            row = {column: _cell(kinds[column], raw[column]) for column in names if column not in spec.drop}
+            if spec.flatten:
+                row.update(spec.flatten(raw))
+            month = _month(row[spec.partition])
+            buffers.setdefault(month, []).append(row)
+            if len(buffers[month]) >= ROWS_PER_FILE:
+                flush(month)
+        stats["rows"] += len(page)
+        last = page[-1]
+    for month in list(buffers):
+        flush(month)
+
+    if last is not None:
+        table_state["watermark"] = [last[0].isoformat(), str(last[1])]
+        table_state["rows"] += stats["rows"]
+        table_state["runs"].append(run_id)
+    stats["files"] = len(files)
+    return stats
+
+
+def compact_table(spec: ExportTable, output_dir: Path, state: dict, run_id: str, fmt: str = "parquet") -> dict:
+    """Rewrite a table's files keeping only the latest version (by watermark) of each id."""
+    pa = _import_pyarrow()
+    pc = pa.compute
+    table_state = state["tables"].get(spec.name)
+    if not table_state:
+        return {"before": 0, "after": 0, "files": 0}
+    remove_uncommitted(output_dir, table_state, spec.name, fmt)
+    old_files = part_files(output_dir, spec.name, fmt)
+    if not old_files:
+        return {"before": 0, "after": 0, "files": 0}
+
+    table = read_files(pa, old_files, fmt).sort_by([("id", "ascending"), (spec.watermark, "descending")])
+    ids = table["id"].combine_chunks()
+    first = pc.not_equal(ids.slice(1), ids.slice(0, len(ids) - 1))
+    latest = table.filter(pa.concat_arrays([pa.array([True]), first.fill_null(True)]))
+
+    months = pc.strftime(latest[spec.partition], format="%Y-%m").fill_null("unknown")
+    files = []
+    for month in pc.unique(months).to_pylist():
+        part = latest.filter(pc.equal(months, month))
+        for start in range(0, part.num_rows, ROWS_PER_FILE):
+            path = output_dir / spec.name / f"month={month}" / f"part-{run_id}-{len(files):04d}{FORMATS[fmt]}"
+            write_file(pa, part.slice(start, ROWS_PER_FILE), path, fmt)
+            files.append(path)
+
+    # Commit the new files, then drop the old ones
+    table_state["runs"] = [run_id]
+    save_state(output_dir, state)
+    for path in old_files:
+        path.unlink()
+    for directory in (output_dir / spec.name).iterdir():
+        if directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+    return {"before": table.num_rows, "after": latest.num_rows, "files": len(files)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental columnar export of progress, activity and reports")
+    parser.add_argument("--database-url", help="Postgres URL (default: $DATABASE_URL)")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help=f"Export directory (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument("--tables", nargs="+", choices=list(TABLES), default=list(TABLES))
+    parser.add_argument("--format", choices=list(FORMATS), default="parquet")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Rows per keyset page (default: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument("--lag-seconds", type=int, default=DEFAULT_LAG_SECONDS,
+                        help=f"Leave rows newer than this for the next run (default: {DEFAULT_LAG_SECONDS})")
+    parser.add_argument("--full", action="store_true", help="Delete previous exports of the tables and start over")
+    parser.add_argument("--compact", action="store_true",
+                        help="Rewrite exported files keeping the latest version of each row (no database)")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Analytics Export")
+    print("=" * 60)
+
+    _import_pyarrow()
+    state = load_state(args.output_dir)
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+    if args.compact:
+        for name in args.tables:
+            stats = compact_table(TABLES[name], args.output_dir, state, run_id, args.format)
+            print(f"  🗜️  {name}: {stats['before']:,} -> {stats['after']:,} rows in {stats['files']} file(s)")
+        return
+
+    if args.full:
+        for name in args.tables:
+            shutil.rmtree(args.output_dir / name, ignore_errors=True)
+            state["tables"].pop(name, None)
+        save_state(args.output_dir, state)
+
+    conn = connect(args.database_url)
+    conn.autocommit = True
+    try:
+        for name in args.tables:
+            spec = TABLES[name]
+            started = time.perf_counter()
+            stats = export_table(conn, spec, args.output_dir, state, run_id, args.format,
+                                 args.page_size, args.lag_seconds)
+            save_state(args.output_dir, state)
+            elapsed = time.perf_counter() - started
+            watermark = state["tables"][name].get("watermark")
+            print(f"  📦 {name}: {stats['rows']:,} new rows in {stats['pages']} page(s) -> "
+                  f"{stats['files']} file(s) in {elapsed:.1f}s"
+                  + (f" (up to {spec.watermark} {watermark[0]})" if watermark else ""))
+    finally:
+        conn.close()
+
+    print(f"\n✅ Export in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+In-process stand-in for the parts of the Supabase client the scripts use.
+
+Covers exactly what upload_mnemonics_to_supabase.py touches:
+
+    client.storage.from_(bucket).upload / remove / list / get_public_url
+    client.table(name).select(...).eq(...).in_(...).execute()
+    client.table(name).update({...}).eq(...).execute()
+    client.rpc("set_mnemonic_image_urls", {...}).execute()
+
+Every simulated network call can be slowed down (latency + jitter) and made to
+fail (random failure rate or a per-operation predicate), so the publish path
+can be benchmarked and regression-tested without touching a real project.
+
+Example:
+    fake = FakeSupabase(latency=0.02, failure_rate=0.01, seed=7)
+    fake.seed_table("blind_problems", [{"leetcode_number": 1, "title": "Two Sum"}])
+    upload_mnemonics_to_supabase.execute_plan(fake, plan)
+    print(fake.stats)
+"""
+
+import hashlib
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+class FakeSupabaseError(Exception):
+    """Injected or simulated API failure."""
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+def _now() -> str:
+    """A timestamp in the format Storage lists objects with."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class FakeSupabase:
+    """
+    Fake Supabase client with configurable latency and failure injection.
+
+    Args:
+        latency: seconds added to every simulated network call
+        jitter: extra random delay in [0, jitter) seconds
+        failure_rate: probability in [0, 1] that a call raises FakeSupabaseError
+        fail_on: optional callable (operation, detail) -> bool forcing a failure,
+            e.g. lambda op, detail: op == "storage.upload" and detail.startswith("141_")
+        seed: random seed for reproducible jitter/failures
+        base_url: used to build public URLs
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        fail_on=None,
+        seed: int | None = None,
+        base_url: str = "http://fake.supabase.local",
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.fail_on = fail_on
+        self.base_url = base_url.rstrip("/")
+        self.buckets = {}  # {bucket: {path: {"data", "content_type", "cache_control", "created_at", "updated_at"}}}
+        self.tables = {}   # {table: [row dict, ...]}
+        self.functions = {"set_mnemonic_image_urls": self._rpc_set_mnemonic_image_urls}
+        self.stats = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.storage = _FakeStorage(self)
+
+    # ---------------------------------------------------------------
+    # Setup helpers
+    # ---------------------------------------------------------------
+
+    def seed_table(self, name: str, rows: list[dict]) -> None:
+        self.tables[name] = [dict(row) for row in rows]
+
+    def seed_object(self, bucket: str, path: str, data: bytes, content_type: str = "image/png",
+                    updated_at: str | None = None) -> None:
+        timestamp = updated_at or _now()
+        self.buckets.setdefault(bucket, {})[path] = {
+            "data": data,
+            "content_type": content_type,
+            "cache_control": None,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+
+    # ---------------------------------------------------------------
+    # Client API
+    # ---------------------------------------------------------------
+
+    def table(self, name: str):
+        return _FakeQuery(self, name)
+
+    def rpc(self, name: str, params: dict | None = None):
+        return _FakeRpc(self, name, params or {})
+
+    # ---------------------------------------------------------------
+    # Internals
+    # ---------------------------------------------------------------
+
+    def _call(self, operation: str, detail: str = "") -> None:
+        """Simulate one network round trip: count it, delay it, maybe fail it."""
+        with self._lock:
+            self.stats[operation] += 1
+            delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0.0)
+            fail = bool(self.failure_rate) and self._random.random() < self.failure_rate
+        if delay:
+            time.sleep(delay)
+        if fail or (self.fail_on and self.fail_on(operation, detail)):
+            with self._lock:
+                self.stats["errors"] += 1
+                self.stats[f"errors.{operation}"] += 1
+            raise FakeSupabaseError(f"Injected failure in {operation} {detail}".rstrip())
+
+    def _rpc_set_mnemonic_image_urls(self, params: dict) -> int:
+        urls = {u["leetcode_number"]: u["url"] for u in params["updates"]}
+        updated = 0
+        with self._lock:
+            for row in self.tables.get("blind_problems", []):
+                url = urls.get(row.get("leetcode_number"))
+                if url is not None and row.get("mnemonic_image_url") != url:
+                    row["mnemonic_image_url"] = url
+                    updated += 1
+        return updated
+
+
+class _FakeStorage:
+    def __init__(self, client: FakeSupabase):
+        self._client = client
+
+    def from_(self, bucket: str):
+        return _FakeBucket(self._client, bucket)
+
+
+class _FakeBucket:
+    def __init__(self, client: FakeSupabase, bucket: str):
+        self._client = client
+        self._bucket = bucket
+
+    @property
+    def _objects(self) -> dict:
+        return self._client.buckets.setdefault(self._bucket, {})
+
+    def upload(self, path: str, file, file_options: dict | None = None):
+        self._client._call("storage.upload", path)
+        if isinstance(file, (str, Path)):
+            data = Path(file).read_bytes()
+        elif hasattr(file, "read"):
+            data = file.read()
+        else:
+            data = bytes(file)
+        options = file_options or {}
+        with self._client._lock:
+            if path in self._objects and str(options.get("upsert", options.get("x-upsert", ""))).lower() != "true":
+                raise FakeSupabaseError(f"The resource already exists: {path}")
+            now = _now()
+            self._objects[path] = {
+                "data": data,
+                "content_type": options.get("content-type", "application/octet-stream"),
+                "cache_control": options.get("cache-control"),
+                "created_at": self._objects.get(path, {}).get("created_at", now),
+                "updated_at": now,
+            }
+            self._client.stats["storage.bytes_uploaded"] += len(data)
+        return FakeResponse({"Key": f"{self._bucket}/{path}"})
+
+    def download(self, path: str) -> bytes:
+        self._client._call("storage.download", path)
+        with self._client._lock:
+            if path not in self._objects:
+                raise FakeSupabaseError(f"Object not found: {path}")
+            return self._objects[path]["data"]
+
+    def remove(self, paths: list[str]):
+        self._client._call("storage.remove", ",".join(paths[:3]))
+        removed = []
+        with self._client._lock:
+            for path in paths:
+                if self._objects.pop(path, None) is not None:
+                    removed.append({"name": path})
+        return removed
+
+    def list(self, path: str = "", options: dict | None = None):
+        self._client._call("storage.list", path)
+        options = options or {}
+        limit = options.get("limit", 100)
+        offset = options.get("offset", 0)
+        prefix = f"{path.rstrip('/')}/" if path else ""
+        with self._client._lock:
+            names = sorted(name for name in self._objects if name.startswith(prefix))
+            page = names[offset:offset + limit]
+            return [
+                {
+                    "name": name[len(prefix):],
+                    "created_at": self._objects[name]["created_at"],
+                    "updated_at": self._objects[name]["updated_at"],
+                    "metadata": {
+                        "size": len(self._objects[name]["data"]),
+                        "eTag": f'"{hashlib.md5(self._objects[name]["data"]).hexdigest()}"',
+                        "mimetype": self._objects[name]["content_type"],
+                        "cacheControl": self._objects[name]["cache_control"],
+                    },
+                }
+                for name in page
+            ]
+
+    def get_public_url(self, path: str) -> str:
+        # Built locally by the real client too: no round trip
+        return f"{self._client.base_url}/storage/v1/object/public/{self._bucket}/{path}"
+
+
+class _FakeQuery:
+    """Minimal PostgREST query builder: select/update with eq/in_ filters."""
+
+    def __init__(self, client: FakeSupabase, table: str):
+        self._client = client
+        self._table = table
+        self._columns = None
+        self._values = None
+        self._filters = []
+
+    def select(self, columns: str = "*"):
+        self._columns = None if columns.strip() == "*" else [c.strip() for c in columns.split(",")]
+        return self
+
+    def update(self, values: dict):
+        self._values = dict(values)
+        return self
+
+    def eq(self, column: str, value):
+        self._filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column: str, values):
+        allowed = set(values)
+        self._filters.append(lambda row: row.get(column) in allowed)
+        return self
+
+    def execute(self) -> FakeResponse:
+        operation = f"table.{'update' if self._values is not None else 'select'}"
+        self._client._call(operation, self._table)
+        with self._client._lock:
+            rows = [row for row in self._client.tables.get(self._table, [])
+                    if all(f(row) for f in self._filters)]
+            if self._values is not None:
+                for row in rows:
+                    row.update(self._values)
+                return FakeResponse([])
+            if self._columns is None:
+                return FakeResponse([dict(row) for row in rows])
+            return FakeResponse([{c: row.get(c) for c in self._columns} for row in rows])
+
+
+class _FakeRpc:
+    def __init__(self, client: FakeSupabase, name: str, params: dict):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> FakeResponse:
+        self._client._call(f"rpc.{self._name}")
+        if self._name not in self._client.functions:
+            raise FakeSupabaseError(f"Could not find the function public.{self._name}")
+        return FakeResponse(self._client.functions[self._name](self._params))
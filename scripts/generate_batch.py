@@ -10,6 +10,9 @@ Usage:
     python generate_batch.py --version v2      # Generate with version suffix (for comparison)
     python generate_batch.py --list            # List all available problems
     python generate_batch.py --status          # Show generation status
+    python generate_batch.py --trace trace.json  # Record API/decode/write spans (see tracing.py)
+    python generate_batch.py --batch-size 20 --workers 4  # Generate 4 images at a time
+    python generate_batch.py --workers 4 --profile-memory --memory-limit 512  # Peak/per-image memory, 512 MB ceiling
 """
 
 import os
@@ -22,8 +25,11 @@ from openai import OpenAI
 # Load environment variables from .env.local
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", ".env.local"))
 
-# Import the prompt library
-from prompt_library import PROMPTS, get_all_problem_numbers, build_prompt
+# Titles, punchlines and filenames come from the shared catalog; prompts from the library
+from prompt_library import build_prompt
+from problem_catalog import get_catalog
+import tracing
+import memory_profile
 
 # Configuration
 OUTPUT_DIR = "/Users/lilyzhang/Desktop/MicDrop/memories"
@@ -35,6 +41,11 @@ VERSION = None  # Set via command line, e.g., "v2"
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 
+def mnemonic_problems() -> dict[int, dict]:
+    """Catalog records of every problem with a mnemonic prompt, by number."""
+    return {record["number"]: record for record in get_catalog() if record["mnemonic_filename"]}
+
+
 def get_existing_images() -> set:
     """Get set of existing image filenames."""
     if not os.path.exists(OUTPUT_DIR):
@@ -47,9 +58,8 @@ def get_ungenerated_problems() -> list:
     existing = get_existing_images()
     ungenerated = []
     
-    for num in get_all_problem_numbers():
-        filename = PROMPTS[num]["filename"]
-        if filename not in existing:
+    for num, problem in mnemonic_problems().items():
+        if problem["mnemonic_filename"] not in existing:
             ungenerated.append(num)
     
     return ungenerated
@@ -66,12 +76,12 @@ def get_versioned_filename(filename: str, version: str = None) -> str:
 
 def generate_image(problem_number: int, version: str = None) -> bool:
     """Generate image for a specific problem."""
-    if problem_number not in PROMPTS:
+    problem = get_catalog().get(problem_number)
+    if not problem or not problem["mnemonic_filename"]:
         print(f"❌ Problem {problem_number} not found in library")
         return False
     
-    problem = PROMPTS[problem_number]
-    filename = get_versioned_filename(problem["filename"], version)
+    filename = get_versioned_filename(problem["mnemonic_filename"], version)
     output_path = os.path.join(OUTPUT_DIR, filename)
     
     print(f"🎨 Generating #{problem_number}: {problem['title']}")
@@ -80,32 +90,47 @@ def generate_image(problem_number: int, version: str = None) -> bool:
     # Build the full prompt with meta instruction
     full_prompt = build_prompt(problem_number)
     
-    try:
-        response = client.images.generate(
-            model=MODEL,
-            prompt=full_prompt,
-            n=1,
-            size="1536x1024",
-            quality="high",
-        )
-        
-        # Get and save image
-        image_data = response.data[0].b64_json
-        image_bytes = base64.b64decode(image_data)
-        
-        with open(output_path, "wb") as f:
-            f.write(image_bytes)
-        
-        print(f"   ✅ Saved: {filename}")
-        return True
-        
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-        return False
-
-
-def generate_batch(batch_size: int = DEFAULT_BATCH_SIZE, version: str = None, problems: list = None) -> None:
-    """Generate a batch of images. If problems is provided, generate those specific ones."""
+    with tracing.span("generate_image", problem=problem_number, version=version) as span, \
+            memory_profile.item(f"#{problem_number}"):
+        try:
+            with tracing.span("images.generate", problem=problem_number, model=MODEL):
+                response = client.images.generate(
+                    model=MODEL,
+                    prompt=full_prompt,
+                    n=1,
+                    size="1536x1024",
+                    quality="high",
+                )
+            
+            # Get and save image
+            image_data = response.data[0].b64_json
+            with tracing.span("b64decode", problem=problem_number, encoded_bytes=len(image_data)):
+                image_bytes = base64.b64decode(image_data)
+            # Peak for this image: the base64 string and decoded bytes are both live
+            memory_profile.checkpoint(f"decoded #{problem_number}")
+            
+            with tracing.span("write", problem=problem_number, file=filename, bytes=len(image_bytes)):
+                with open(output_path, "wb") as f:
+                    f.write(image_bytes)
+            
+            span.set(bytes=len(image_bytes))
+            print(f"   ✅ Saved: {filename}")
+            return True
+            
+        except Exception as e:
+            span.set(error=str(e))
+            print(f"   ❌ Error: {e}")
+            return False
+
+
+def generate_batch(batch_size: int = DEFAULT_BATCH_SIZE, version: str = None, problems: list = None,
+                   workers: int = 1) -> None:
+    """
+    Generate a batch of images. If problems is provided, generate those specific ones.
+    
+    With workers > 1 that many images are requested at once (fewer near a
+    --memory-limit ceiling).
+    """
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     if problems:
@@ -126,11 +151,22 @@ def generate_batch(batch_size: int = DEFAULT_BATCH_SIZE, version: str = None, pr
     print("=" * 60)
     print()
     
-    success_count = 0
-    for problem_number in batch:
-        if generate_image(problem_number, version):
-            success_count += 1
+    limiter = memory_profile.limiter(workers)
+    
+    def run(problem_number):
+        with limiter:
+            ok = generate_image(problem_number, version)
         print()
+        return ok
+    
+    with memory_profile.stage("generate"):
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(run, batch))
+        else:
+            results = [run(problem_number) for problem_number in batch]
+    success_count = sum(results)
     
     print("=" * 60)
     print(f"Done! Generated {success_count}/{len(batch)} images.")
@@ -148,11 +184,10 @@ def show_status() -> None:
     
     generated = []
     missing = []
+    problems = mnemonic_problems()
     
-    for num in get_all_problem_numbers():
-        problem = PROMPTS[num]
-        filename = problem["filename"]
-        if filename in existing:
+    for num, problem in problems.items():
+        if problem["mnemonic_filename"] in existing:
             generated.append((num, problem["title"]))
         else:
             missing.append((num, problem["title"]))
@@ -165,17 +200,17 @@ def show_status() -> None:
     for num, title in missing:
         print(f"   {num:3d}. {title}")
     
-    print(f"\nTotal: {len(generated)}/{len(PROMPTS)} generated")
+    print(f"\nTotal: {len(generated)}/{len(problems)} generated")
 
 
 def list_problems() -> None:
     """List all problems in the library."""
+    problems = mnemonic_problems()
     print("=" * 60)
-    print(f"Prompt Library ({len(PROMPTS)} problems)")
+    print(f"Prompt Library ({len(problems)} problems)")
     print("=" * 60)
     
-    for num in get_all_problem_numbers():
-        problem = PROMPTS[num]
+    for num, problem in problems.items():
         print(f"{num:3d}. {problem['title']}")
         print(f"     \"{problem['punchline']}\"")
         print()
@@ -190,8 +225,13 @@ def main():
     parser.add_argument("--version", type=str, help="Version suffix for comparison (e.g., 'v2')")
     parser.add_argument("--list", action="store_true", help="List all problems in library")
     parser.add_argument("--status", action="store_true", help="Show generation status")
+    parser.add_argument("--workers", type=int, default=1, help="Images to generate concurrently (default: 1)")
+    tracing.add_argument(parser)
+    memory_profile.add_arguments(parser)
     
     args = parser.parse_args()
+    tracing.start_from_args(args)
+    memory_profile.start_from_args(args)
     
     if args.list:
         list_problems()
@@ -203,9 +243,9 @@ def main():
     elif args.problems:
         # Parse comma-separated list of problem numbers
         problem_list = [int(p.strip()) for p in args.problems.split(",")]
-        generate_batch(len(problem_list), args.version, problem_list)
+        generate_batch(len(problem_list), args.version, problem_list, workers=args.workers)
     else:
-        generate_batch(args.batch_size, args.version)
+        generate_batch(args.batch_size, args.version, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Generate the blind_problems seed SQL from structured data.
+
+The problem catalog lives in scripts/seed_data/blind_problems.json (one object
+per problem, JSONB columns as real JSON). This script renders it as a handful
+of batched statements in one transaction:
+
+    INSERT ... VALUES (...), (...), ... ON CONFLICT (title) DO UPDATE   one per --batch-size rows
+    UPDATE ... SET detailed_hint = v.detailed_hint FROM (VALUES ...)    one statement
+    UPDATE ... SET definition = v.definition FROM (VALUES ...)          one statement
+    UPDATE ... SET problem_group = v.problem_group FROM (VALUES ...)    one statement
+
+instead of the ~225 single-row statements in supabase-seed-blind-problems.sql,
+supabase-seed-detailed-hints.sql, supabase-seed-definitions.sql and
+supabase-update-problem-groups.sql. The generated SQL is parsed back with
+seed_sql and compared with the data before it is written, so an escaping bug
+fails the build instead of the database.
+
+Usage:
+    python generate_seed_sql.py                 # Write ../supabase-seed-catalog.sql
+    python generate_seed_sql.py --check         # Exit 1 if the SQL file is out of date
+    python generate_seed_sql.py --batch-size 10
+    python generate_seed_sql.py --import-sql    # Rebuild the JSON from the legacy seed files
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import seed_sql
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_DIR = SCRIPT_DIR.parent
+SEED_DATA_PATH = SCRIPT_DIR / "seed_data" / "blind_problems.json"
+OUTPUT_PATH = PROJECT_DIR / "supabase-seed-catalog.sql"
+
+TABLE = "public.blind_problems"
+DEFAULT_BATCH_SIZE = 25
+
+INSERT_COLUMNS = [
+    "title", "prompt", "example", "constraints", "pattern", "key_idea", "solution",
+    "time_complexity", "space_complexity", "steps", "expected_edge_cases", "topics",
+    "difficulty", "leetcode_number",
+]
+JSON_COLUMNS = {"constraints", "steps", "expected_edge_cases", "topics"}
+
+# Columns added by later migrations, seeded with one batched UPDATE each
+UPDATE_COLUMNS = {
+    "detailed_hint": "supabase-add-detailed-hint.sql",
+    "definition": "supabase-add-definition.sql",
+    "problem_group": "supabase-add-problem-group.sql",
+}
+
+LEGACY_SEED_FILES = {
+    "inserts": PROJECT_DIR / "supabase-seed-blind-problems.sql",
+    "detailed_hint": PROJECT_DIR / "supabase-seed-detailed-hints.sql",
+    "definition": PROJECT_DIR / "supabase-seed-definitions.sql",
+    "problem_group": PROJECT_DIR / "supabase-update-problem-groups.sql",
+}
+
+# A backslash or any C0 control character but newline forces an E'' literal
+# (escaped) instead of a plain '' literal
+E_STRING_TRIGGER_RE = re.compile(r"[\\\x01-\x09\x0b-\x1f]")
+E_STRING_ESCAPE_RE = re.compile(r"[\\'\x01-\x09\x0b-\x1f]")
+# Escapes with a short form; every other control character is written \xHH
+E_STRING_ESCAPES = {"\\": "\\\\", "'": "''", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+
+
+# =============================================================================
+# LITERALS
+# =============================================================================
+
+def sql_literal(value) -> str:
+    """
+    Render a Python value as a PostgreSQL literal.
+
+    Strings use plain '...' quoting (quotes doubled, newlines kept as-is),
+    which is exact under standard_conforming_strings. Strings containing a
+    backslash or control character use E'...' with every backslash escaped
+    and every control character but newline escaped (\\t, or \\x01 for those
+    without a short form), so they mean the same thing whatever that setting
+    is and no raw control byte reaches the file. PostgreSQL text cannot hold
+    NUL, so a string containing one raises ValueError.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if not isinstance(value, str):
+        raise TypeError(f"Cannot render {type(value).__name__} as a SQL literal")
+    if "\x00" in value:
+        raise ValueError(f"NUL character in {value[:40]!r}: PostgreSQL text cannot store it")
+    if E_STRING_TRIGGER_RE.search(value):
+        escaped = E_STRING_ESCAPE_RE.sub(
+            lambda match: E_STRING_ESCAPES.get(match.group(0), f"\\x{ord(match.group(0)):02x}"), value
+        )
+        return f"E'{escaped}'"
+    return "'" + value.replace("'", "''") + "'"
+
+
+def column_value(row: dict, column: str):
+    value = row.get(column)
+    if column in JSON_COLUMNS and value is not None:
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _tuple(values: list, indent: str = "    ") -> str:
+    inner = f",\n{indent}    ".join(sql_literal(value) for value in values)
+    return f"{indent}(\n{indent}    {inner}\n{indent})"
+
+
+# =============================================================================
+# GENERATION
+# =============================================================================
+
+def iter_insert_statements(rows: list[dict], batch_size: int = DEFAULT_BATCH_SIZE):
+    """Yield one multi-row upsert per batch of rows."""
+    updates = ",\n".join(f"    {column} = EXCLUDED.{column}" for column in INSERT_COLUMNS[1:])
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        values = ",\n".join(_tuple([column_value(row, c) for c in INSERT_COLUMNS]) for row in batch)
+        yield (
+            f"-- Problems {start + 1}-{start + len(batch)}\n"
+            f"INSERT INTO {TABLE} ({', '.join(INSERT_COLUMNS)})\n"
+            f"VALUES\n{values}\n"
+            f"ON CONFLICT (title) DO UPDATE SET\n{updates};\n"
+        )
+
+
+def update_statement(rows: list[dict], column: str) -> str | None:
+    """One UPDATE ... FROM (VALUES ...) setting `column` for every row that has it."""
+    pairs = [(row["title"], row[column]) for row in rows if row.get(column) is not None]
+    if not pairs:
+        return None
+    values = ",\n".join(_tuple(list(pair)) for pair in pairs)
+    return (
+        f"-- {column} for {len(pairs)} problems (requires {UPDATE_COLUMNS[column]})\n"
+        f"UPDATE {TABLE} AS bp\n"
+        f"SET {column} = v.{column}\n"
+        f"FROM (VALUES\n{values}\n) AS v(title, {column})\n"
+        f"WHERE bp.title = v.title;\n"
+    )
+
+
+def generate_seed_sql(rows: list[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> str:
+    """Render the full seed script for the given problem rows."""
+    statements = list(iter_insert_statements(rows, batch_size))
+    statements += [s for s in (update_statement(rows, column) for column in UPDATE_COLUMNS) if s]
+
+    header = (
+        "-- Blind75 Problems Seed Data (batched)\n"
+        "-- GENERATED by scripts/generate_seed_sql.py from scripts/seed_data/blind_problems.json.\n"
+        "-- Do not edit by hand: edit the JSON and re-run the generator.\n"
+        "--\n"
+        "-- Run this AFTER supabase-blind-problems.sql and the add-column migrations\n"
+        f"-- ({', '.join(UPDATE_COLUMNS.values())}).\n"
+        "-- The upsert leaves columns it does not list (e.g. mnemonic_image_url) untouched.\n"
+        f"-- {len(rows)} problems in {len(statements)} statements.\n"
+    )
+    return header + "\nBEGIN;\n\n" + "\n".join(statements) + "\nCOMMIT;\n"
+
+
+def verify_round_trip(sql: str, rows: list[dict]) -> None:
+    """Parse the generated SQL back and check that it carries exactly `rows`."""
+    parsed_rows = []
+    updates = {}
+    for tokens in seed_sql.iter_statements(sql):
+        if tokens[0] == ("word", "INSERT"):
+            parsed_rows.extend(seed_sql.parse_insert(tokens)[1])
+        elif tokens[0] == ("word", "UPDATE"):
+            for assignments, (_, title) in seed_sql.parse_update_from_values(tokens)[1]:
+                updates.setdefault(title, {}).update(assignments)
+
+    if len(parsed_rows) != len(rows):
+        raise ValueError(f"Round trip: {len(parsed_rows)} rows parsed, {len(rows)} expected")
+    for row, parsed in zip(rows, parsed_rows):
+        for column in INSERT_COLUMNS:
+            if parsed[column] != column_value(row, column):
+                raise ValueError(f"Round trip: {row['title']!r} column {column} differs")
+        for column in UPDATE_COLUMNS:
+            if updates.get(row["title"], {}).get(column) != row.get(column):
+                raise ValueError(f"Round trip: {row['title']!r} column {column} differs")
+
+
+# =============================================================================
+# DATA
+# =============================================================================
+
+def load_seed_data(path: Path = SEED_DATA_PATH) -> list[dict]:
+    rows = json.loads(Path(path).read_text(encoding="utf-8"))
+    titles = set()
+    for row in rows:
+        missing = [column for column in ("title", "prompt", "pattern", "key_idea", "difficulty") if not row.get(column)]
+        if missing:
+            raise ValueError(f"{row.get('title', '?')}: missing {', '.join(missing)}")
+        if row["difficulty"] not in ("easy", "medium", "hard"):
+            raise ValueError(f"{row['title']}: difficulty must be easy, medium or hard")
+        if row["title"] in titles:
+            raise ValueError(f"Duplicate title: {row['title']}")
+        titles.add(row["title"])
+    return rows
+
+
+def import_legacy_sql() -> list[dict]:
+    """Build the structured rows from the hand-written single-row seed files."""
+    rows = seed_sql.parse_inserts(LEGACY_SEED_FILES["inserts"], TABLE)
+    for row in rows:
+        for column in JSON_COLUMNS:
+            if row.get(column) is not None:
+                row[column] = json.loads(row[column])
+
+    by_title = {row["title"]: row for row in rows}
+    for column in UPDATE_COLUMNS:
+        for title, values in seed_sql.parse_updates(LEGACY_SEED_FILES[column], TABLE).items():
+            if title not in by_title:
+                print(f"  ⚠️  {LEGACY_SEED_FILES[column].name}: no inserted problem titled {title!r}")
+                continue
+            if column in values:
+                by_title[title][column] = values[column]
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate batched blind_problems seed SQL")
+    parser.add_argument("--data", type=Path, default=SEED_DATA_PATH, help="Structured seed data (JSON)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="SQL file to write")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Rows per INSERT statement (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--check", action="store_true", help="Only check that the SQL file is up to date")
+    parser.add_argument("--import-sql", action="store_true",
+                        help="Rebuild the JSON data from the legacy single-row seed files")
+
+    args = parser.parse_args()
+
+    if args.import_sql:
+        rows = import_legacy_sql()
+        args.data.parent.mkdir(parents=True, exist_ok=True)
+        args.data.write_text(json.dumps(rows, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"✅ Imported {len(rows)} problems into {args.data}")
+        return
+
+    rows = load_seed_data(args.data)
+    sql = generate_seed_sql(rows, args.batch_size)
+    verify_round_trip(sql, rows)
+
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else None
+        if current != sql:
+            print(f"❌ {args.output} is out of date; run generate_seed_sql.py")
+            sys.exit(1)
+        print(f"✅ {args.output} is up to date")
+        return
+
+    args.output.write_text(sql, encoding="utf-8")
+    print(f"✅ Wrote {args.output} ({len(rows)} problems)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Load test for the mnemonic publish path against an in-process fake Supabase.
+
+Generates thousands of synthetic versioned PNG stubs, seeds a fake
+blind_problems table, then runs the real planner and executor from
+upload_mnemonics_to_supabase.py in each mode:
+
+    serial      one upload + one UPDATE per problem, one at a time
+    concurrent  same calls spread over a thread pool
+    bulk-db     concurrent uploads, URL changes written with one RPC call per batch
+
+For every mode it reports wall time, throughput, API call counts and how
+injected failures surfaced. A second, no-op sync is timed as well, since
+planning runs before every sync.
+
+Usage:
+    python load_test_publish.py                              # 2000 images, 5ms latency
+    python load_test_publish.py --images 5000 --latency 0.01 --workers 16
+    python load_test_publish.py --failure-rate 0.02 --json results.json
+    python load_test_publish.py --modes serial bulk-db
+    python load_test_publish.py --images 200 --trace trace.json  # Per-call spans on one timeline
+    python load_test_publish.py --images 200 --image-bytes 2000000 --profile-memory --memory-limit 16
+"""
+
+import io
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+import tracing
+import memory_profile
+import upload_mnemonics_to_supabase as uploader
+from fake_supabase import FakeSupabase
+from synthetic_data import write_synthetic_images
+
+MODES = {
+    "serial": {"workers": 1, "bulk_db": False},
+    "concurrent": {"workers": None, "bulk_db": False},
+    "bulk-db": {"workers": None, "bulk_db": True},
+}
+
+
+def make_fake(count: int, args) -> FakeSupabase:
+    fake = FakeSupabase(
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    fake.seed_table("blind_problems", [
+        {"leetcode_number": n, "title": f"Synthetic Problem {n}", "mnemonic_image_url": None}
+        for n in range(1, count + 1)
+    ])
+    return fake
+
+
+def run_mode(name: str, latest_images: dict[int, str], args) -> dict:
+    """Run one full sync plus one no-op re-sync in the given mode."""
+    config = MODES[name]
+    workers = config["workers"] or args.workers
+    fake = make_fake(args.images, args)
+
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        start = time.perf_counter()
+        plan = uploader.plan_sync(fake, latest_images)
+        plan_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with memory_profile.stage(name):
+            succeeded, attempted = uploader.execute_plan(
+                fake, plan, workers=workers, bulk_db=config["bulk_db"]
+            )
+        execute_seconds = time.perf_counter() - start
+
+        # Failure injection off for the re-sync so it measures pure planning cost
+        fake.failure_rate = 0.0
+        start = time.perf_counter()
+        replan = uploader.plan_sync(fake, latest_images)
+        replan_seconds = time.perf_counter() - start
+
+    stored_urls = {
+        row["leetcode_number"]: row["mnemonic_image_url"]
+        for row in fake.tables["blind_problems"]
+    }
+    consistent = sum(
+        1 for action in plan["actions"]
+        if action["problem"] is not None and stored_urls.get(action["problem"]) == action["url"]
+    )
+
+    return {
+        "mode": name,
+        "workers": workers,
+        "images": attempted,
+        "succeeded": succeeded,
+        "failed": attempted - succeeded,
+        "urls_consistent": consistent,
+        "plan_seconds": round(plan_seconds, 4),
+        "execute_seconds": round(execute_seconds, 4),
+        "images_per_second": round(succeeded / execute_seconds, 1) if execute_seconds else None,
+        "resync_plan_seconds": round(replan_seconds, 4),
+        "resync_pending": replan["summary"]["upload"] + replan["summary"]["repoint"],
+        "calls": {k: v for k, v in sorted(fake.stats.items()) if not k.startswith("errors")},
+        "errors": {k: v for k, v in sorted(fake.stats.items()) if k.startswith("errors")},
+    }
+
+
+def print_results(results: list[dict]) -> None:
+    print(f"\n{'Mode':<12}{'Workers':>8}{'OK':>8}{'Failed':>8}{'img/s':>10}"
+          f"{'Exec s':>10}{'Plan s':>9}{'Resync s':>10}{'Left':>6}")
+    print("-" * 81)
+    for r in results:
+        print(f"{r['mode']:<12}{r['workers']:>8}{r['succeeded']:>8}{r['failed']:>8}"
+              f"{r['images_per_second'] or 0:>10.1f}{r['execute_seconds']:>10.2f}"
+              f"{r['plan_seconds']:>9.3f}{r['resync_plan_seconds']:>10.3f}{r['resync_pending']:>6}")
+    print()
+    for r in results:
+        calls = ", ".join(f"{k}={v}" for k, v in r["calls"].items())
+        print(f"  {r['mode']}: {calls}")
+        if r["errors"]:
+            errors = ", ".join(f"{k}={v}" for k, v in r["errors"].items())
+            print(f"  {' ' * len(r['mode'])}  injected: {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the mnemonic publish path against a fake Supabase")
+    parser.add_argument("--images", type=int, default=2000, help="Number of synthetic problems (default: 2000)")
+    parser.add_argument("--image-bytes", type=int, default=4096, help="Size of each PNG stub (default: 4096)")
+    parser.add_argument("--latency", type=float, default=0.005, help="Seconds per API call (default: 0.005)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency per call (default: 0)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability a call fails (default: 0)")
+    parser.add_argument("--workers", type=int, default=8, help="Workers for concurrent modes (default: 8)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="Modes to run")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--json", type=Path, help="Write results to a JSON file")
+    tracing.add_argument(parser)
+    memory_profile.add_arguments(parser)
+
+    args = parser.parse_args()
+    tracing.start_from_args(args)
+    memory_profile.start_from_args(args)
+
+    print("=" * 60)
+    print("Publish Path Load Test (fake Supabase)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        memories_dir = Path(tmp) / "memories"
+        print(f"\n🧪 Writing {args.images} synthetic problems ({args.image_bytes} bytes each)...")
+        write_synthetic_images(memories_dir, args.images, args.image_bytes, seed=args.seed)
+
+        original_dir = uploader.MEMORIES_DIR
+        uploader.MEMORIES_DIR = memories_dir
+        try:
+            latest_images = uploader.get_latest_images()
+            results = []
+            for mode in args.modes:
+                print(f"⏱️  Running {mode}...")
+                results.append(run_mode(mode, latest_images, args))
+        finally:
+            uploader.MEMORIES_DIR = original_dir
+
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps({"config": vars(args) | {"json": str(args.json)}, "results": results},
+                                        indent=2) + "\n")
+        print(f"\n💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+"""
+Peak-memory profiling and a memory ceiling for the batch and upload scripts.
+
+Every image passes through memory whole - generate_image() holds the base64
+response and the decoded bytes, upload_image() reads the file in one go - so
+concurrent runs can exhaust a small container. This module measures that with
+tracemalloc and can throttle concurrency before it happens:
+
+    import memory_profile
+
+    with memory_profile.stage("execute"):
+        limiter = memory_profile.limiter(workers)
+        ...
+        with limiter, memory_profile.item(f"#{problem}"):
+            data = read()
+            memory_profile.checkpoint(f"read #{problem}")  # buffers are live here
+
+Scripts expose this as --profile-memory [FILE] and --memory-limit MB (see
+add_arguments / start_from_args). The report lists per-stage and per-image
+peaks plus the top allocation sites near the highest checkpoint (snapshots
+are only retaken when memory grows by SNAPSHOT_GROWTH, which keeps a steady
+climb from costing one snapshot per image). Like
+tracing.py, every hook is a no-op unless profiling or a limit is active.
+
+Measurements are Python allocations as tracemalloc sees them, which for these
+scripts are dominated by image buffers. Per-image peaks are exact with one
+worker; with several they include the other images in flight.
+"""
+
+import atexit
+import linecache
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_REPORT_DIR = Path(__file__).parent / ".cache" / "memory"
+TRACEBACK_FRAMES = 10
+TOP_SITES = 25
+TOP_ITEMS = 20
+
+# Concurrency is halved at THROTTLE_AT of the ceiling and restored one worker
+# at a time below RECOVER_AT; at the ceiling itself no new image starts
+# until one in flight finishes
+THROTTLE_AT = 0.8
+RECOVER_AT = 0.5
+
+# A full snapshot costs far more than an image; checkpoints only take a new
+# one when traced memory exceeds the last snapshotted high water by this share
+SNAPSHOT_GROWTH = 0.10
+
+MB = 1024 * 1024
+
+_profiler = None  # MemoryProfiler while --profile-memory is on
+_limit_bytes: int | None = None
+
+
+class _Noop:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _Noop()
+
+
+class MemoryProfiler:
+    """Collects stage peaks, per-item allocations and the high-water snapshot."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.stages: dict[str, dict] = {}  # name -> {"peak", "net", "items", "snapshots"}
+        self.items: list[tuple[str, str, int, int]] = []  # (stage, label, net, peak)
+        self.current_stage = "main"
+        self.peak = 0
+        self.high_water: tuple[int, str, tracemalloc.Snapshot] | None = None
+        self.highest_checkpoint: tuple[int, str] | None = None
+        self.snapshotting = False
+
+    def _fold_peak(self) -> tuple[int, int]:
+        """Record the peak since the last reset before anyone resets it; caller holds the lock."""
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        stage = self.stages.get(self.current_stage)
+        if stage is not None:
+            stage["peak"] = max(stage["peak"], peak)
+        return current, peak
+
+    def stage(self, name: str):
+        return _Stage(self, name)
+
+    def item(self, label: str):
+        return _Item(self, label)
+
+    def checkpoint(self, label: str) -> None:
+        """
+        Snapshot allocations here if memory is SNAPSHOT_GROWTH above the last
+        snapshot (one thread at a time); otherwise only note the level.
+        """
+        current, _ = tracemalloc.get_traced_memory()
+        with self.lock:
+            if self.highest_checkpoint is None or current > self.highest_checkpoint[0]:
+                self.highest_checkpoint = (current, label)
+            if self.snapshotting or (
+                self.high_water is not None and current <= self.high_water[0] * (1 + SNAPSHOT_GROWTH)
+            ):
+                return
+            self.snapshotting = True
+        try:
+            snapshot = _take_snapshot()
+        finally:
+            with self.lock:
+                self.snapshotting = False
+        with self.lock:
+            if self.high_water is None or current > self.high_water[0]:
+                self.high_water = (current, label, snapshot)
+
+    def item_stats(self) -> dict[str, dict]:
+        """Per stage: count, mean and max of per-item peak and net allocation."""
+        stats = {}
+        for stage, _, net, peak in self.items:
+            entry = stats.setdefault(stage, {"count": 0, "peak_total": 0, "peak_max": 0, "net_total": 0})
+            entry["count"] += 1
+            entry["peak_total"] += peak
+            entry["peak_max"] = max(entry["peak_max"], peak)
+            entry["net_total"] += net
+        return stats
+
+    def write_report(self, path: Path, top: int = TOP_SITES) -> None:
+        with self.lock:
+            self._fold_peak()
+        lines = [
+            f"Memory profile: {Path(sys.argv[0]).name} {' '.join(sys.argv[1:])}",
+            f"Started: {datetime.fromtimestamp(self.started).isoformat(timespec='seconds')}",
+            f"Peak traced memory: {self.peak / MB:.1f} MB"
+            + (f" (ceiling {_limit_bytes / MB:.0f} MB)" if _limit_bytes else ""),
+            "",
+            "STAGES",
+            f"  {'stage':<16}{'peak MB':>10}{'net MB':>10}{'items':>8}",
+        ]
+        for name, stage in self.stages.items():
+            lines.append(f"  {name:<16}{stage['peak'] / MB:>10.1f}{stage['net'] / MB:>10.1f}{stage['items']:>8}")
+
+        stats = self.item_stats()
+        if stats:
+            lines += ["", "PER IMAGE", f"  {'stage':<16}{'count':>7}{'mean peak MB':>14}{'max peak MB':>13}{'mean net KB':>13}"]
+            for name, entry in stats.items():
+                lines.append(f"  {name:<16}{entry['count']:>7}{entry['peak_total'] / entry['count'] / MB:>14.2f}"
+                             f"{entry['peak_max'] / MB:>13.2f}{entry['net_total'] / entry['count'] / 1024:>13.1f}")
+            lines += ["", f"  Largest {TOP_ITEMS} by peak:"]
+            for stage, label, net, peak in sorted(self.items, key=lambda item: -item[3])[:TOP_ITEMS]:
+                lines.append(f"    {label:<28}{stage:<12}peak {peak / MB:>8.2f} MB   net {net / 1024:>9.1f} KB")
+
+        if self.high_water is not None:
+            current, label, snapshot = self.high_water
+            highest, highest_label = self.highest_checkpoint
+            lines += ["", f"TOP ALLOCATION SITES at high water ({label}, {current / MB:.1f} MB live; "
+                          f"highest checkpoint {highest_label}, {highest / MB:.1f} MB)"]
+            lines += _format_statistics(_filtered(snapshot).statistics("traceback")[:top])
+
+        for name, stage in self.stages.items():
+            if stage["snapshots"]:
+                start, end = stage["snapshots"]
+                retained = _filtered(end).compare_to(_filtered(start), "lineno")
+                lines += ["", f"RETAINED BY STAGE {name} (grew between stage start and end)"]
+                lines += _format_statistics(retained[:top], diff=True)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(lines) + "\n")
+
+
+# Import machinery and the profiler itself are noise in every snapshot
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """
+    A raw snapshot. filter_traces() walks every trace in Python and costs
+    seconds on a large heap, so it is left to _filtered() at report time.
+    """
+    return tracemalloc.take_snapshot()
+
+
+def _filtered(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    return snapshot.filter_traces(_SNAPSHOT_FILTERS)
+
+
+def _format_statistics(statistics, diff: bool = False, callers: int = 3) -> list[str]:
+    """One line per allocation site (most recent frame first), then its callers' source lines."""
+    lines = []
+    for stat in statistics:
+        size = stat.size_diff if diff else stat.size
+        count = stat.count_diff if diff else stat.count
+        if diff and size <= 0:
+            continue
+        frames = list(reversed(stat.traceback))[:callers + 1]
+        site = frames[0]
+        lines.append(f"  {size / 1024:>10.1f} KB {count:>8} blocks  {site.filename}:{site.lineno}")
+        for frame in frames:
+            source = linecache.getline(frame.filename, frame.lineno).strip()
+            if source:
+                lines.append(f"  {'':>30}{Path(frame.filename).name}:{frame.lineno}  {source}")
+    return lines
+
+
+class _Stage:
+    """Stage peak comes from tracemalloc's peak, reset when the stage starts."""
+
+    def __init__(self, profiler: MemoryProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start_current = 0
+        self.start_snapshot = None
+        self.previous = None
+
+    def __enter__(self):
+        profiler = self.profiler
+        self.start_snapshot = _take_snapshot()
+        with profiler.lock:
+            profiler._fold_peak()
+            self.previous = profiler.current_stage
+            profiler.current_stage = self.name
+            profiler.stages.setdefault(self.name, {"peak": 0, "net": 0, "items": 0, "snapshots": None})
+            tracemalloc.reset_peak()
+            self.start_current, _ = tracemalloc.get_traced_memory()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        profiler = self.profiler
+        with profiler.lock:
+            current, _ = profiler._fold_peak()
+            stage = profiler.stages[self.name]
+            stage["net"] += current - self.start_current
+            profiler.current_stage = self.previous
+        end_snapshot = _take_snapshot()
+        with profiler.lock:
+            stage["snapshots"] = (self.start_snapshot, end_snapshot)
+        return False
+
+
+class _Item:
+    """
+    One image's allocations: net is what it left behind, peak the most live
+    memory above its starting point. The peak is reset per item, so each
+    _fold_peak() first credits the previous peak to the stage.
+    """
+
+    def __init__(self, profiler: MemoryProfiler, label: str):
+        self.profiler = profiler
+        self.label = label
+        self.start_current = 0
+
+    def __enter__(self):
+        profiler = self.profiler
+        with profiler.lock:
+            profiler._fold_peak()
+            tracemalloc.reset_peak()
+            self.start_current, _ = tracemalloc.get_traced_memory()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        profiler = self.profiler
+        with profiler.lock:
+            current, peak = profiler._fold_peak()
+            stage = profiler.current_stage
+            profiler.items.append((stage, self.label, current - self.start_current,
+                                   max(0, peak - self.start_current)))
+            if stage in profiler.stages:
+                profiler.stages[stage]["items"] += 1
+        return False
+
+
+class ConcurrencyLimiter:
+    """
+    Context manager that caps how many images are in flight under a memory ceiling.
+
+    Workers enter it before each image. Near the ceiling the allowance is
+    halved (down to one); once memory falls well below, it grows back one
+    worker at a time toward the configured count.
+    """
+
+    def __init__(self, workers: int, limit_bytes: int):
+        self.workers = workers
+        self.limit_bytes = limit_bytes
+        self.allowed = workers
+        self.active = 0
+        self.lowest = workers
+        self.condition = threading.Condition()
+
+    def _adjust(self, used: int) -> None:
+        """Caller holds the condition."""
+        if used >= self.limit_bytes * THROTTLE_AT and self.allowed > 1:
+            previous, self.allowed = self.allowed, max(1, self.allowed // 2)
+            self.lowest = min(self.lowest, self.allowed)
+            print(f"  ⚠️  Memory {used / MB:.0f}/{self.limit_bytes / MB:.0f} MB: "
+                  f"concurrency {previous} -> {self.allowed}")
+        elif used < self.limit_bytes * RECOVER_AT and self.allowed < self.workers:
+            self.allowed += 1
+
+    def __enter__(self):
+        with self.condition:
+            while True:
+                used, _ = tracemalloc.get_traced_memory()
+                self._adjust(used)
+                # A lone image always runs, even over the ceiling, or nothing could finish
+                if self.active == 0 or (self.active < self.allowed and used < self.limit_bytes):
+                    break
+                self.condition.wait(timeout=0.1)
+            self.active += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self.condition:
+            self.active -= 1
+            self.condition.notify_all()
+        return False
+
+
+def stage(name: str):
+    """Context manager for a phase of the run (no-op unless profiling)."""
+    return _profiler.stage(name) if _profiler is not None else _NOOP
+
+
+def item(label: str):
+    """Context manager around one image's work (no-op unless profiling)."""
+    return _profiler.item(label) if _profiler is not None else _NOOP
+
+
+def checkpoint(label: str) -> None:
+    """Mark a point where image buffers are live (no-op unless profiling)."""
+    if _profiler is not None:
+        _profiler.checkpoint(label)
+
+
+def limiter(workers: int):
+    """A ConcurrencyLimiter for `workers` under --memory-limit, else a no-op."""
+    if _limit_bytes is None:
+        return _NOOP
+    return ConcurrencyLimiter(workers, _limit_bytes)
+
+
+def is_enabled() -> bool:
+    return _profiler is not None
+
+
+def add_arguments(parser) -> None:
+    """Add --profile-memory [FILE] and --memory-limit MB to a script's argument parser."""
+    parser.add_argument("--profile-memory", type=Path, nargs="?", const=True, metavar="FILE",
+                        help=f"Report peak and per-image memory, with top allocation sites written to FILE "
+                             f"(default: {DEFAULT_REPORT_DIR.relative_to(Path(__file__).parent)}/)")
+    parser.add_argument("--memory-limit", type=float, metavar="MB",
+                        help="Memory ceiling: lower concurrency as traced memory approaches it")
+
+
+def start_from_args(args) -> Path | None:
+    """Start tracemalloc if --profile-memory or --memory-limit asks for it; the report is written at exit."""
+    global _profiler, _limit_bytes
+    report = getattr(args, "profile_memory", None)
+    limit = getattr(args, "memory_limit", None)
+    if not report and not limit:
+        return None
+
+    if limit:
+        _limit_bytes = int(limit * MB)
+    # A ceiling alone only needs the running total, so skip the tracebacks
+    tracemalloc.start(TRACEBACK_FRAMES if report else 1)
+    if not report:
+        return None
+
+    if report is True:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        report = DEFAULT_REPORT_DIR / f"{Path(sys.argv[0]).stem}-{stamp}.txt"
+    _profiler = MemoryProfiler()
+
+    def finish():
+        _profiler.write_report(report)
+        print(f"\n🧠 Memory: peak {_profiler.peak / MB:.1f} MB traced")
+        for name, entry in _profiler.item_stats().items():
+            print(f"   {name:<12} {entry['count']:>5} images  mean peak {entry['peak_total'] / entry['count'] / MB:.2f} MB"
+                  f"  max {entry['peak_max'] / MB:.2f} MB")
+        print(f"   Allocation sites written to {report}")
+
+    atexit.register(finish)
+    return report
@@ -0,0 +1,123 @@
+"""
+Version retention and garbage collection for mnemonic images.
+
+Every regenerated mnemonic gets a new _vN file, and older versions are never
+removed from the 'mnemonic-images' bucket or the local memories folder. This
+module decides what can go:
+
+- Per problem, the latest K versions are kept (K = keep).
+- Any object referenced by blind_problems.mnemonic_image_url, or by the
+  published catalog bundle, is kept, even if it is older than the latest K.
+- Files whose names do not parse as <number>_<slug>[_vN].png are never touched.
+
+Remote candidates come from one bucket listing and are deleted with batched
+remove([...]) calls. Local candidates can be deleted or moved to an archive
+folder.
+"""
+
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+REMOVE_BATCH_SIZE = 100
+
+
+def group_versions(names, parse_filename, written_at=None) -> dict[int, list[tuple[int, str]]]:
+    """
+    Group filenames by problem number, newest version first.
+
+    Files with the same version (the content-hashed copies --immutable
+    uploads) are ordered by written_at, {filename: ISO timestamp} from the
+    storage listing or file mtimes, newest first; the filename only breaks
+    ties that remain, since a hash says nothing about age.
+
+    Returns:
+        {problem_number: [(version, filename), ...]}
+    """
+    written_at = written_at or {}
+    groups = {}
+    for name in names:
+        parsed = parse_filename(name)
+        if not parsed:
+            continue
+        problem_number, version, filename = parsed
+        groups.setdefault(problem_number, []).append((version, filename))
+    for versions in groups.values():
+        versions.sort(key=lambda x: (x[0], written_at.get(x[1]) or "", x[1]), reverse=True)
+    return groups
+
+
+def mtime_timestamp(path: Path) -> str:
+    """A file's mtime in the storage listing's timestamp format, for written_at."""
+    return datetime.fromtimestamp(path.stat().st_mtime, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def select_superseded(names, parse_filename, keep: int, protected: set[str] = frozenset(),
+                      written_at=None) -> list[str]:
+    """
+    Return the filenames that fall outside the retention policy.
+
+    Args:
+        names: candidate filenames (bucket objects or local files)
+        parse_filename: filename parser from upload_mnemonics_to_supabase
+        keep: number of newest versions to keep per problem (at least 1)
+        protected: filenames that must be kept regardless of age
+        written_at: {filename: ISO timestamp} ordering copies of the same version
+    """
+    if keep < 1:
+        raise ValueError("keep must be at least 1 so every problem retains its latest image")
+
+    superseded = []
+    for versions in group_versions(names, parse_filename, written_at).values():
+        for _, filename in versions[keep:]:
+            if filename not in protected:
+                superseded.append(filename)
+    return sorted(superseded)
+
+
+def referenced_objects(listing, referenced_urls, public_url) -> set[str]:
+    """Bucket objects whose public URL is among referenced_urls (blind_problems, the catalog bundle)."""
+    urls = {url for url in referenced_urls if url}
+    return {name for name in listing if public_url(name) in urls}
+
+
+def remove_objects(supabase, bucket: str, names: list[str], batch_size: int = REMOVE_BATCH_SIZE) -> int:
+    """
+    Delete objects in batches of batch_size per remove() call.
+
+    Returns:
+        Number of objects removed.
+    """
+    removed = 0
+    for start in range(0, len(names), batch_size):
+        batch = names[start:start + batch_size]
+        try:
+            result = supabase.storage.from_(bucket).remove(batch)
+            removed += len(result) if result is not None else len(batch)
+            print(f"  🗑️  Removed batch {start // batch_size + 1} ({len(batch)} objects)")
+        except Exception as e:
+            print(f"  ❌ Failed to remove batch starting at {batch[0]}: {e}")
+    return removed
+
+
+def prune_local(memories_dir: Path, filenames: list[str], archive_dir: Path | None = None) -> int:
+    """
+    Delete old local versions, or move them into archive_dir if given.
+
+    Returns:
+        Number of files pruned.
+    """
+    if archive_dir is not None:
+        archive_dir.mkdir(parents=True, exist_ok=True)
+
+    pruned = 0
+    for filename in filenames:
+        source = memories_dir / filename
+        if not source.exists():
+            continue
+        if archive_dir is not None:
+            shutil.move(str(source), str(archive_dir / filename))
+        else:
+            source.unlink()
+        pruned += 1
+    return pruned
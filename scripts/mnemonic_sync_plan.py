@@ -0,0 +1,236 @@
+"""
+Remote-state diff planner for the mnemonic image uploader.
+
+Instead of blindly re-uploading every image, the uploader first reads what is
+already published with two bulk calls:
+
+1. One listing of the 'mnemonic-images' bucket (name, size, eTag)
+2. One select of blind_problems (leetcode_number, mnemonic_image_url)
+
+and compares it with the latest local images to produce an exact plan:
+
+    upload   - object missing or its content differs; URL is (re)pointed after upload
+    repoint  - object is already correct but the table points somewhere else
+    skip     - object and URL are both up to date
+    orphan   - object in the bucket that no latest image or table row refers to
+
+Plans are plain dicts so they can be written to JSON, reviewed, and applied later.
+"""
+
+import json
+import hashlib
+import re
+from pathlib import Path
+from datetime import datetime, timezone
+
+PLAN_VERSION = 1
+LIST_PAGE_SIZE = 1000
+# eTags of single-part uploads are the content MD5; multipart (chunked TUS,
+# --resumable) eTags look like "<md5 of part md5s>-<parts>" and say nothing
+# comparable about the file
+PLAIN_MD5_ETAG = re.compile(r"[0-9a-f]{32}")
+
+UPLOAD = "upload"
+REPOINT = "repoint"
+SKIP = "skip"
+ORPHAN = "orphan"
+
+
+def fetch_bucket_listing(supabase, bucket: str) -> dict[str, dict]:
+    """
+    List every object at the root of a bucket.
+
+    Returns:
+        {object_name: {"size": int | None, "etag": str | None, "updated_at": str | None}}
+        where updated_at is Storage's ISO timestamp of the last write
+        (created_at if the listing has no updated_at)
+    """
+    listing = {}
+    offset = 0
+    while True:
+        page = supabase.storage.from_(bucket).list("", {
+            "limit": LIST_PAGE_SIZE,
+            "offset": offset,
+            "sortBy": {"column": "name", "order": "asc"},
+        })
+        for obj in page:
+            metadata = obj.get("metadata") or {}
+            if not metadata:
+                continue  # Folder placeholder, not an object
+            etag = metadata.get("eTag")
+            listing[obj["name"]] = {
+                "size": metadata.get("size"),
+                "etag": etag.strip('"') if etag else None,
+                "updated_at": obj.get("updated_at") or obj.get("created_at"),
+            }
+        if len(page) < LIST_PAGE_SIZE:
+            return listing
+        offset += LIST_PAGE_SIZE
+
+
+def fetch_problem_urls(supabase) -> dict[int, str | None]:
+    """
+    Fetch the current mnemonic URL of every problem in one query.
+
+    Returns:
+        {leetcode_number: mnemonic_image_url}
+    """
+    result = supabase.table("blind_problems").select("leetcode_number, mnemonic_image_url").execute()
+    return {
+        row["leetcode_number"]: row.get("mnemonic_image_url")
+        for row in result.data
+        if row.get("leetcode_number") is not None
+    }
+
+
+def file_md5(filepath: Path) -> str:
+    """MD5 of a file, read in chunks (matches the eTag of single-part uploads)."""
+    digest = hashlib.md5()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def object_matches(filepath: Path, remote: dict | None) -> bool:
+    """
+    True if the remote object has the same content as the local file.
+
+    Compared by MD5 when the eTag is one; otherwise (no eTag, or a multipart
+    eTag) an equal size is taken as a match.
+    """
+    if remote is None:
+        return False
+    if remote["size"] is not None and remote["size"] != filepath.stat().st_size:
+        return False
+    if remote["etag"] and PLAIN_MD5_ETAG.fullmatch(remote["etag"].lower()):
+        return remote["etag"].lower() == file_md5(filepath)
+    return remote["size"] is not None
+
+
+def build_plan(
+    latest_images: dict[int, str],
+    memories_dir: Path,
+    listing: dict[str, dict],
+    problem_urls: dict[int, str | None],
+    public_url,
+    bucket: str,
+    force: bool = False,
+    object_name=None,
+) -> dict:
+    """
+    Compare local images with the bucket listing and table URLs.
+
+    Args:
+        latest_images: {problem_number: filename} from get_latest_images()
+        memories_dir: folder holding the local images
+        listing: result of fetch_bucket_listing()
+        problem_urls: result of fetch_problem_urls()
+        public_url: callable mapping an object name to its public URL
+        bucket: bucket name (recorded in the plan)
+        force: upload every image even if the bucket copy is identical
+        object_name: optional callable mapping a local filename to the object
+            name it is stored under (e.g. a content-hashed name); defaults to
+            the filename itself
+
+    Returns:
+        Serializable plan dict with "actions" and "summary".
+    """
+    actions = []
+    referenced = set()
+
+    for problem_number in sorted(latest_images):
+        filename = latest_images[problem_number]
+        name = object_name(filename) if object_name else filename
+        referenced.add(name)
+        expected_url = public_url(name)
+        has_row = problem_number in problem_urls
+        current_url = problem_urls.get(problem_number)
+
+        action = {
+            "action": SKIP,
+            "problem": problem_number,
+            "filename": filename,
+            "object": name,
+            "url": expected_url,
+            "current_url": current_url,
+            "update_url": has_row and current_url != expected_url,
+            "has_row": has_row,
+        }
+
+        if force or not object_matches(memories_dir / filename, listing.get(name)):
+            action["action"] = UPLOAD
+            action["reason"] = "forced" if force else (
+                "missing in bucket" if name not in listing else "content differs"
+            )
+        elif action["update_url"]:
+            action["action"] = REPOINT
+            action["reason"] = "table points at a different URL"
+        else:
+            action["reason"] = "up to date" if has_row else "up to date (no blind_problems row)"
+
+        actions.append(action)
+
+    # Objects still referenced by the table are not orphans, even if superseded locally
+    referenced_urls = {url for url in problem_urls.values() if url}
+    for name in sorted(listing):
+        if name in referenced or public_url(name) in referenced_urls:
+            continue
+        actions.append({
+            "action": ORPHAN,
+            "problem": None,
+            "filename": name,
+            "object": name,
+            "url": public_url(name),
+            "reason": "not a latest image and not referenced by blind_problems",
+        })
+
+    summary = {kind: 0 for kind in (UPLOAD, REPOINT, SKIP, ORPHAN)}
+    for action in actions:
+        summary[action["action"]] += 1
+
+    return {
+        "version": PLAN_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "bucket": bucket,
+        "immutable": object_name is not None,
+        "summary": summary,
+        "actions": actions,
+    }
+
+
+def filter_plan(plan: dict, problems: set[int]) -> dict:
+    """Restrict a plan to the given problem numbers (orphans are dropped)."""
+    actions = [a for a in plan["actions"] if a["problem"] in problems]
+    summary = {kind: 0 for kind in plan["summary"]}
+    for action in actions:
+        summary[action["action"]] += 1
+    return {**plan, "actions": actions, "summary": summary}
+
+
+def save_plan(plan: dict, path: Path) -> None:
+    """Write a plan as pretty JSON for review."""
+    Path(path).write_text(json.dumps(plan, indent=2) + "\n", encoding="utf-8")
+
+
+def load_plan(path: Path) -> dict:
+    """Load a plan written by save_plan()."""
+    plan = json.loads(Path(path).read_text(encoding="utf-8"))
+    if plan.get("version") != PLAN_VERSION:
+        raise ValueError(f"Unsupported plan version: {plan.get('version')}")
+    return plan
+
+
+def print_plan(plan: dict) -> None:
+    """Print a human-readable summary of a plan."""
+    icons = {UPLOAD: "📤", REPOINT: "🔗", SKIP: "✓ ", ORPHAN: "🗑️ "}
+    for action in plan["actions"]:
+        if action["action"] == SKIP:
+            continue
+        label = f"#{action['problem']}" if action["problem"] is not None else "(orphan)"
+        print(f"  {icons[action['action']]} {action['action']:8s} {label:>9s}  "
+              f"{action['filename']}  ({action['reason']})")
+
+    summary = plan["summary"]
+    print(f"\n  Plan: {summary[UPLOAD]} upload, {summary[REPOINT]} repoint, "
+          f"{summary[SKIP]} skip, {summary[ORPHAN]} orphan")
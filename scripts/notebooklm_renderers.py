@@ -0,0 +1,107 @@
+"""
+Non-markdown renderers for the NotebookLM study materials.
+
+Every renderer takes (part of) the document model built once by
+generate_notebooklm_materials.build_document_model() and yields text chunks,
+which the generator streams to disk with write_chunks_atomic(). Renderers
+never re-parse the CSV or consult the lookup tables themselves, so adding a
+format does not add parse cost.
+
+Formats:
+    html   one standalone page per category
+    json   the whole model, for the web app
+    print  a compact single-page HTML sheet of every problem, for printing
+"""
+
+import json
+from html import escape
+
+HTML_STYLE = """
+body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif; max-width: 860px;
+       margin: 2rem auto; padding: 0 1rem; line-height: 1.5; color: #1f2933; }
+h1 { border-bottom: 2px solid #e4e7eb; padding-bottom: .3rem; }
+.question { border: 1px solid #e4e7eb; border-radius: 8px; padding: 1rem 1.25rem; margin: 1rem 0; }
+.meta { color: #52606d; font-size: .9rem; }
+.easy { color: #2f8132; } .medium { color: #b7791f; } .hard { color: #c53030; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #e4e7eb; padding: .35rem .5rem; text-align: left; }
+"""
+
+PRINT_STYLE = """
+@page { size: A4 landscape; margin: 8mm; }
+body { font-family: "Helvetica Neue", Arial, sans-serif; font-size: 7pt; margin: 0; }
+h1 { font-size: 11pt; margin: 0 0 2mm; }
+.grid { column-count: 3; column-gap: 4mm; }
+section { break-inside: avoid; margin-bottom: 2mm; }
+h2 { font-size: 8.5pt; margin: 1mm 0; border-bottom: .5pt solid #999; }
+.q { break-inside: avoid; margin: 0 0 1mm; }
+.q b { font-size: 7.5pt; }
+.m { color: #555; }
+"""
+
+
+def _difficulty_class(difficulty: str) -> str:
+    return escape(difficulty.lower())
+
+
+def iter_category_html(category: dict):
+    """Yield a standalone HTML page for one category of the model."""
+    yield "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+    yield f"<title>{escape(category['title'])}</title>\n<style>{HTML_STYLE}</style>\n</head>\n<body>\n"
+    yield f"<h1>{escape(category['title'])}</h1>\n"
+    yield f"<p>{escape(category['description'])}</p>\n"
+    yield f"<p><strong>When to Use:</strong> {escape(category['when_to_use'])}</p>\n"
+    yield f"<p><strong>Typical Complexity:</strong> {escape(category['complexity'])}</p>\n"
+    yield "<h2>Problems</h2>\n"
+
+    for q in category["questions"]:
+        yield f"<div class=\"question\" id=\"{escape(q['slug'])}\">\n"
+        yield f"<h3>{escape(q['name'])}</h3>\n"
+        yield (f"<p class=\"meta\"><span class=\"{_difficulty_class(q['difficulty'])}\">"
+               f"{escape(q['difficulty'])}</span> · Time {escape(q['time'])} · Space {escape(q['space'])}</p>\n")
+        yield f"<p><strong>Key Pattern:</strong> {escape(q['key_pattern'])}</p>\n"
+        yield f"<p><strong>The Insight:</strong> {escape(q['insight'])}</p>\n"
+        yield f"<p><strong>Full Approach:</strong> {escape(q['notes'])}</p>\n"
+        yield (f"<p><a href=\"{escape(q['leetcode_url'])}\">LeetCode Problem</a> · "
+               f"<a href=\"{escape(q['video_url'])}\">NeetCode Video Solution</a></p>\n")
+        yield "</div>\n"
+
+    if category["quiz"]:
+        yield "<h2>Pattern Recognition Questions</h2>\n<ul>\n"
+        for question in category["quiz"]:
+            yield f"<li>{escape(question)}</li>\n"
+        yield "</ul>\n"
+
+    yield "<h2>Pattern Cheat Sheet</h2>\n<table>\n"
+    yield "<tr><th>Problem</th><th>Key Pattern</th><th>Time</th><th>Space</th></tr>\n"
+    for q in category["questions"]:
+        yield (f"<tr><td>{escape(q['name'])}</td><td>{escape(q['key_pattern'])}</td>"
+               f"<td>{escape(q['time'])}</td><td>{escape(q['space'])}</td></tr>\n")
+    yield "</table>\n</body>\n</html>\n"
+
+
+def iter_json(model: dict):
+    """Yield the model as JSON, one category at a time."""
+    header = {key: value for key, value in model.items() if key != "categories"}
+    yield json.dumps(header, ensure_ascii=False)[:-1]
+    yield ', "categories": [' if header else '"categories": ['
+    for i, category in enumerate(model["categories"]):
+        if i:
+            yield ", "
+        yield json.dumps(category, ensure_ascii=False)
+    yield "]}\n"
+
+
+def iter_print_html(model: dict):
+    """Yield a dense, single-page printable sheet of every problem."""
+    yield "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+    yield f"<title>{escape(model['title'])} - Print Sheet</title>\n<style>{PRINT_STYLE}</style>\n</head>\n<body>\n"
+    yield f"<h1>{escape(model['title'])} - Cheat Sheet</h1>\n<div class=\"grid\">\n"
+    for category in model["categories"]:
+        yield f"<section>\n<h2>{escape(category['title'])}</h2>\n"
+        for q in category["questions"]:
+            yield (f"<div class=\"q\"><b>{escape(q['name'])}</b> "
+                   f"<span class=\"m\">{escape(q['difficulty'][0])} · {escape(q['time'])}/{escape(q['space'])} · "
+                   f"{escape(q['key_pattern'])}</span><br>{escape(q['insight'])}</div>\n")
+        yield "</section>\n"
+    yield "</div>\n</body>\n</html>\n"
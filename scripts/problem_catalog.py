@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Unified problem catalog shared by the scripts.
+
+Problem data lives in several places, each keyed differently:
+
+    prompt_library.PROMPTS            LeetCode number
+    NeetCode CSV (views/...Sheet1)    display name + LeetCode URL
+    views/leetcode_group.csv          free-text "1 Two Sum" / "167. Two Sum II" cells
+    DIFFICULTY_MAP / COMPLEXITY_MAP   display name (generate_notebooklm_materials)
+    seed_data/blind_problems.json     blind_problems title (+ leetcode_number, group)
+
+build_catalog() joins them once on the LeetCode number, resolving names
+through normalized aliases (every title spelling and URL slug seen in any
+source), and writes the result to a small SQLite file:
+
+    problems(number PRIMARY KEY, title, slug, difficulty, ...)
+    aliases(alias PRIMARY KEY, number)         WITHOUT ROWID
+    meta(key PRIMARY KEY, value)               source fingerprint, build stats
+
+Lookups go through get_catalog(), which opens the file on first use and
+rebuilds it only if a source file changed since the last build:
+
+    from problem_catalog import get_catalog
+    catalog = get_catalog()
+    catalog.get(141)["title"]                   # 'Linked List Cycle'
+    catalog.get("Detect Cycle in a Linked List")["number"]   # 141
+    catalog.get("https://leetcode.com/problems/linked-list-cycle/")
+
+Usage:
+    python problem_catalog.py build             # Rebuild now
+    python problem_catalog.py lookup 141 "two sum ii"
+    python problem_catalog.py stats
+"""
+
+import argparse
+import copy
+import csv
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_DIR = SCRIPT_DIR.parent
+CATALOG_PATH = SCRIPT_DIR / ".cache" / "problem_catalog.sqlite"
+CATALOG_VERSION = 2
+
+NEETCODE_CSV = PROJECT_DIR / "views" / "Leetcode 75 Questions (NeetCode on yt) - Sheet1.csv"
+GROUP_CSV = PROJECT_DIR / "views" / "leetcode_group.csv"
+
+# Every file whose content feeds the catalog; a change to any of them triggers a rebuild
+SOURCE_FILES = [
+    NEETCODE_CSV,
+    GROUP_CSV,
+    SCRIPT_DIR / "seed_data" / "blind_problems.json",
+    SCRIPT_DIR / "prompt_library.py",
+    SCRIPT_DIR / "generate_notebooklm_materials.py",
+    SCRIPT_DIR / "key_patterns.json",
+    Path(__file__),
+]
+
+COLUMNS = [
+    "number", "title", "slug", "difficulty", "category", "problem_group", "pattern",
+    "key_pattern", "time_complexity", "space_complexity", "leetcode_url", "video_url",
+    "notes", "key_idea", "punchline", "mnemonic_filename", "topics", "study_groups",
+    "aliases", "sources",
+]
+JSON_COLUMNS = {"topics", "study_groups", "aliases", "sources"}
+
+SCHEMA = """
+CREATE TABLE problems (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    difficulty TEXT,
+    category TEXT,
+    problem_group TEXT,
+    pattern TEXT,
+    key_pattern TEXT,
+    time_complexity TEXT,
+    space_complexity TEXT,
+    leetcode_url TEXT,
+    video_url TEXT,
+    notes TEXT,
+    key_idea TEXT,
+    punchline TEXT,
+    mnemonic_filename TEXT,
+    topics TEXT,
+    study_groups TEXT,
+    aliases TEXT,
+    sources TEXT
+);
+CREATE TABLE aliases (alias TEXT PRIMARY KEY, number INTEGER NOT NULL) WITHOUT ROWID;
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+"""
+
+LEETCODE_SLUG_RE = re.compile(r"leetcode\.com/problems/([a-z0-9-]+)")
+GROUP_CELL_RE = re.compile(r"^\s*(\d+)\.?\s*(.+?)\s*$")
+# Annotations in group cells: "(nt 150)", "(lc 150)", "(150)", "⭐"
+GROUP_ANNOTATION_RE = re.compile(r"\([^)]*\)|⭐")
+# LeetCode slugs that were renamed after the NeetCode sheet was made
+SLUG_REDIRECTS = {
+    "add-and-search-word-data-structure-design": "design-add-and-search-words-data-structure",
+}
+
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def normalize_key(text: str) -> str:
+    """
+    Normalize a title, slug or URL to the alias key form.
+
+    "Linked List Cycle", "linked-list-cycle" and
+    "https://leetcode.com/problems/linked-list-cycle/" all map to
+    "linked list cycle". Parenthesized notes ("(Leetcode Premium)") are dropped.
+    """
+    match = LEETCODE_SLUG_RE.search(text)
+    if match:
+        text = match.group(1)
+    text = re.sub(r"\([^)]*\)", " ", text.casefold())
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text).split())
+
+
+def slug_from_url(url: str) -> str | None:
+    match = LEETCODE_SLUG_RE.search(url or "")
+    return match.group(1) if match else None
+
+
+def title_slug(title: str) -> str:
+    return normalize_key(title).replace(" ", "-")
+
+
+# =============================================================================
+# SOURCES
+# =============================================================================
+
+def iter_group_cells(csv_path: Path = GROUP_CSV):
+    """
+    Yield (group, number, title) for every numbered cell of leetcode_group.csv.
+
+    A blank group cell continues the previous group; cells without a leading
+    LeetCode number (e.g. "AD 8 - 1 branch factorial") are skipped.
+    """
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Header
+        group = ""
+        for row in reader:
+            if not row:
+                continue
+            if row[0].strip():
+                group = " / ".join(part.strip(" .") for part in row[0].splitlines() if part.strip(" ."))
+            for cell in row[1:]:
+                first_line = cell.strip().splitlines()[0] if cell.strip() else ""
+                match = GROUP_CELL_RE.match(GROUP_ANNOTATION_RE.sub("", first_line))
+                if match:
+                    yield group, int(match.group(1)), match.group(2)
+
+
+class _CatalogBuilder:
+    """Accumulates records by number and aliases by normalized key."""
+
+    def __init__(self):
+        self.records: dict[int, dict] = {}
+        self.alias_index: dict[str, int] = {}
+        self.unresolved: list[tuple[str, str]] = []
+
+    def record(self, number: int, title: str, source: str) -> dict:
+        record = self.records.get(number)
+        if record is None:
+            record = {column: None for column in COLUMNS}
+            record.update(number=number, title=title, slug=title_slug(title),
+                          study_groups=[], aliases=[], sources=[], topics=[])
+            self.records[number] = record
+        if source not in record["sources"]:
+            record["sources"].append(source)
+        self.add_alias(number, title)
+        return record
+
+    def add_alias(self, number: int, text: str) -> None:
+        key = normalize_key(text)
+        if not key:
+            return
+        self.alias_index.setdefault(key, number)
+        record = self.records[number]
+        if key not in record["aliases"]:
+            record["aliases"].append(key)
+
+    def resolve(self, *texts: str) -> int | None:
+        for text in texts:
+            if text:
+                number = self.alias_index.get(normalize_key(text))
+                if number is not None:
+                    return number
+        return None
+
+    def fill(self, record: dict, **values) -> None:
+        """Set fields that no higher-priority source has set yet."""
+        for column, value in values.items():
+            if value not in (None, "") and record[column] in (None, ""):
+                record[column] = value
+
+
+def _collect(builder: _CatalogBuilder) -> None:
+    # Imported here so that opening an existing catalog stays cheap
+    from prompt_library import PROMPTS
+    from generate_seed_sql import load_seed_data
+    from generate_notebooklm_materials import COMPLEXITY_MAP, DIFFICULTY_MAP, parse_leetcode_csv
+
+    # 1. Seed data: the titles and numbers the app actually serves
+    for row in load_seed_data():
+        if row.get("leetcode_number") is None:
+            builder.unresolved.append(("seed", row["title"]))
+            continue
+        record = builder.record(row["leetcode_number"], row["title"], "seed")
+        builder.fill(
+            record,
+            difficulty=row["difficulty"].capitalize(),
+            problem_group=row.get("problem_group"),
+            pattern=row.get("pattern"),
+            key_idea=row.get("key_idea"),
+            time_complexity=row.get("time_complexity"),
+            space_complexity=row.get("space_complexity"),
+        )
+        if row.get("topics"):
+            record["topics"] = list(row["topics"])
+
+    # 2. Prompt library: mnemonic prompts keyed by number
+    for number, prompt in PROMPTS.items():
+        record = builder.record(number, prompt["title"], "prompt_library")
+        builder.fill(record, punchline=prompt.get("punchline"), mnemonic_filename=prompt.get("filename"))
+
+    # 3. Group sheet: numbered cells, also a source of title spellings
+    for group, number, title in iter_group_cells():
+        record = builder.record(number, title, "leetcode_group")
+        if group and group not in record["study_groups"]:
+            record["study_groups"].append(group)
+
+    # 4. NeetCode sheet + the generator's lookup tables, keyed by display name
+    for question in parse_leetcode_csv(str(NEETCODE_CSV)):
+        name = question["name"]
+        slug = slug_from_url(question["leetcode_url"])
+        slug = SLUG_REDIRECTS.get(slug, slug)
+        number = builder.resolve(slug, name)
+        if number is None:
+            builder.unresolved.append(("neetcode_csv", name))
+            continue
+        record = builder.records[number]
+        if "neetcode_csv" not in record["sources"]:
+            record["sources"].append("neetcode_csv")
+        builder.add_alias(number, name)
+        if slug:
+            record["slug"] = slug
+        time_c, space_c = COMPLEXITY_MAP.get(name, (None, None))
+        builder.fill(
+            record,
+            difficulty=DIFFICULTY_MAP.get(name),
+            category=question["category"],
+            key_pattern=question["key_pattern"],
+            time_complexity=time_c,
+            space_complexity=space_c,
+            leetcode_url=question["leetcode_url"],
+            video_url=question["video_url"],
+            notes=question["notes"],
+        )
+
+    for record in builder.records.values():
+        builder.add_alias(record["number"], record["slug"])
+        if not record["leetcode_url"]:
+            record["leetcode_url"] = f"https://leetcode.com/problems/{record['slug']}/"
+
+
+def source_fingerprint() -> str:
+    """Size and mtime of every source file; cheap to compute on every open."""
+    parts = [f"v{CATALOG_VERSION}"]
+    for path in SOURCE_FILES:
+        try:
+            stat = path.stat()
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{path.name}:missing")
+    return "|".join(parts)
+
+
+def build_catalog(path: Path = CATALOG_PATH) -> dict:
+    """
+    Join every source and write the catalog file atomically.
+
+    Returns:
+        Build stats: problems, aliases, unresolved [(source, name), ...]
+    """
+    builder = _CatalogBuilder()
+    _collect(builder)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique name per build, so concurrent rebuilds never share a temp file
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany(
+            f"INSERT INTO problems ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+            (
+                [json.dumps(record[c], ensure_ascii=False) if c in JSON_COLUMNS else record[c] for c in COLUMNS]
+                for _, record in sorted(builder.records.items())
+            ),
+        )
+        conn.executemany("INSERT INTO aliases VALUES (?, ?)", sorted(builder.alias_index.items()))
+        for number in builder.records:
+            conn.execute("INSERT OR IGNORE INTO aliases VALUES (?, ?)", (str(number), number))
+
+        stats = {
+            "problems": len(builder.records),
+            "aliases": conn.execute("SELECT COUNT(*) FROM aliases").fetchone()[0],
+            "unresolved": builder.unresolved,
+        }
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("fingerprint", source_fingerprint()),
+            ("stats", json.dumps(stats)),
+        ])
+        conn.commit()
+    except BaseException:
+        conn.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    conn.close()
+
+    os.replace(tmp_path, path)
+    return stats
+
+
+# =============================================================================
+# LOOKUPS
+# =============================================================================
+
+class ProblemCatalog:
+    """
+    Read-only view of a built catalog file.
+
+    The SQLite connection is opened on first lookup, and each key's result is
+    memoized per instance (cleared by close()), so repeated lookups cost a
+    dict hit plus a copy; callers may modify what they get back.
+    """
+
+    def __init__(self, path: Path = CATALOG_PATH):
+        self.path = Path(path)
+        self._conn = None
+        self._records: dict = {}  # key -> record or None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._records.clear()
+
+    def meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> dict:
+        return {key: json.loads(row[key]) if key in JSON_COLUMNS and row[key] else row[key]
+                for key in row.keys()}
+
+    def number_for(self, key) -> int | None:
+        """Resolve a number, title, alias, slug or LeetCode URL to a LeetCode number."""
+        if isinstance(key, int):
+            alias = str(key)
+        else:
+            alias = key.strip().lstrip("#") if key.strip().lstrip("#").isdigit() else normalize_key(key)
+        row = self.conn.execute("SELECT number FROM aliases WHERE alias = ?", (alias,)).fetchone()
+        return row[0] if row else None
+
+    def get(self, key) -> dict | None:
+        """The catalog record for a number, title, alias, slug or URL (None if unknown)."""
+        if key not in self._records:
+            number = self.number_for(key)
+            row = None if number is None else self.conn.execute(
+                "SELECT * FROM problems WHERE number = ?", (number,)
+            ).fetchone()
+            self._records[key] = self._decode(row) if row else None
+        return copy.deepcopy(self._records[key])
+
+    def __contains__(self, key) -> bool:
+        return self.number_for(key) is not None
+
+    def __iter__(self):
+        for row in self.conn.execute("SELECT * FROM problems ORDER BY number"):
+            yield self._decode(row)
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+
+    def numbers(self) -> list[int]:
+        return [row[0] for row in self.conn.execute("SELECT number FROM problems ORDER BY number")]
+
+
+_catalog = None
+
+
+def get_catalog(path: Path = CATALOG_PATH, rebuild_if_stale: bool = True) -> ProblemCatalog:
+    """
+    Shared catalog for this process, built on first use.
+
+    The source fingerprint (file sizes and mtimes) is compared with the one
+    stored at build time, so an edited CSV or seed file is picked up without
+    a manual rebuild.
+    """
+    global _catalog
+    if _catalog is not None and _catalog.path == Path(path):
+        return _catalog
+
+    catalog = ProblemCatalog(path)
+    if rebuild_if_stale:
+        stale = not Path(path).exists()
+        if not stale:
+            try:
+                stale = catalog.meta("fingerprint") != source_fingerprint()
+            except sqlite3.DatabaseError:
+                stale = True
+        if stale:
+            catalog.close()
+            build_catalog(Path(path))
+
+    _catalog = catalog
+    return catalog
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the unified problem catalog")
+    parser.add_argument("--path", type=Path, default=CATALOG_PATH, help=f"Catalog file (default: {CATALOG_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Rebuild the catalog from its sources")
+    lookup = sub.add_parser("lookup", help="Look up problems by number, title, slug or URL")
+    lookup.add_argument("keys", nargs="+")
+    lookup.add_argument("--json", action="store_true", help="Print full records as JSON")
+    sub.add_parser("stats", help="Show catalog size and unresolved source rows")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        stats = build_catalog(args.path)
+        print(f"✅ Built {args.path}: {stats['problems']} problems, {stats['aliases']} aliases")
+        for source, name in stats["unresolved"]:
+            print(f"  ⚠️  Unresolved {source} row: {name}")
+        return
+
+    catalog = get_catalog(args.path)
+
+    if args.command == "stats":
+        stats = json.loads(catalog.meta("stats"))
+        print(f"📚 {args.path}")
+        print(f"  Problems: {stats['problems']}")
+        print(f"  Aliases:  {stats['aliases']}")
+        print(f"  Size:     {args.path.stat().st_size / 1024:.1f} KB")
+        for source, name in stats["unresolved"]:
+            print(f"  ⚠️  Unresolved {source} row: {name}")
+        return
+
+    missing = 0
+    for key in args.keys:
+        record = catalog.get(key)
+        if record is None:
+            print(f"❌ {key}: not found")
+            missing += 1
+        elif args.json:
+            print(json.dumps(record, indent=2, ensure_ascii=False))
+        else:
+            print(f"#{record['number']:4d}  {record['title']}  [{record['difficulty'] or '?'}]  "
+                  f"{record['category'] or record['problem_group'] or ''}")
+    sys.exit(1 if missing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Precompute each problem's related problems from the similarity of its texts.
+
+A "related problems" list computed on demand would compare every problem's
+texts at request time. This job does it once, offline:
+
+1. One document per problem from pattern, key_idea, detailed_hint and topics
+   (each topic is a single feature, so "Hash Table" never matches "Table")
+2. A sparse TF-IDF matrix (SciPy CSR): sublinear term frequency, field
+   weights, smoothed IDF, rows L2-normalized so a dot product is the cosine
+3. Top-k cosine neighbours, a block of rows at a time: each block is scored
+   against every problem (block x problems scores, sized by --memory-mb) and
+   reduced to its k best with argpartition before the next block starts
+4. One bulk UPDATE writes every list into blind_problems.related_problems
+   (supabase-add-related-problems.sql); rows whose list is unchanged are not
+   rewritten
+
+The column is part of the catalog bundle (build_catalog_bundle.py), which is
+republished after a write, so the app reads Problem.relatedProblems: a
+precomputed array.
+
+Usage:
+    python related_problems.py                      # Compute from the database and write back
+    python related_problems.py --dry-run            # Compute and print, no write
+    python related_problems.py --from-seed          # From seed_data/blind_problems.json (implies --dry-run)
+    python related_problems.py -k 8 --min-score 0.1
+    python related_problems.py --from-seed --show "Two Sum"
+
+Needs DATABASE_URL (see migrate.py) unless --from-seed is given.
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+OUTPUT_PATH = SCRIPT_DIR / ".cache" / "related_problems.json"
+
+DEFAULT_K = 5
+DEFAULT_MIN_SCORE = 0.05
+DEFAULT_MEMORY_MB = 256  # Bound on one block of scores and its work arrays
+# Per score cell: the sparse product (float32 + int32 index), the dense float32
+# block and the int64 positions argpartition returns
+BYTES_PER_SCORE = 4 + 4 + 4 + 8
+MAX_DOCUMENT_FREQUENCY = 0.8  # Terms in more than this share of problems carry no signal
+
+TEXT_FIELDS = ["pattern", "key_idea", "detailed_hint"]
+# Term-count multiplier per field; topics are weighted like pattern
+FIELD_WEIGHTS = {"pattern": 3.0, "key_idea": 2.0, "detailed_hint": 1.0, "topics": 3.0}
+
+STOPWORDS = frozenset("""
+a an and are as at be but by can do does each for from has have how if in into is it its
+just like not of on one or so than that the then this to use used uses using was we what
+when where which while will with you your
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+FETCH_SQL = """
+SELECT leetcode_number, title, pattern, key_idea, detailed_hint, topics, related_problems
+FROM public.blind_problems
+WHERE leetcode_number IS NOT NULL
+ORDER BY leetcode_number
+"""
+
+# One statement for every row: the lists travel as a single JSON parameter
+BULK_UPDATE_SQL = """
+UPDATE public.blind_problems AS bp
+SET related_problems = v.related
+FROM jsonb_to_recordset(%s::jsonb) AS v(leetcode_number INTEGER, related INTEGER[])
+WHERE bp.leetcode_number = v.leetcode_number
+  AND bp.related_problems IS DISTINCT FROM v.related
+"""
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        print("❌ numpy package not installed. Install with: pip install numpy")
+        sys.exit(1)
+    return numpy
+
+
+def _import_scipy_sparse():
+    try:
+        from scipy import sparse
+    except ImportError:
+        print("❌ scipy package not installed. Install with: pip install scipy")
+        sys.exit(1)
+    return sparse
+
+
+# ============================================================================
+# DOCUMENTS
+# ============================================================================
+
+def fetch_rows(conn) -> list[dict]:
+    cursor = conn.execute(FETCH_SQL)
+    columns = [column.name for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def seed_rows() -> list[dict]:
+    from generate_seed_sql import load_seed_data
+
+    rows = [row for row in load_seed_data() if row.get("leetcode_number")]
+    return sorted(rows, key=lambda row: row["leetcode_number"])
+
+
+def tokenize(text: str | None) -> list[str]:
+    return [token for token in TOKEN_PATTERN.findall((text or "").lower())
+            if len(token) > 1 and token not in STOPWORDS]
+
+
+def weighted_terms(row: dict) -> Counter:
+    """Weighted term counts of one problem across the text fields and topics."""
+    terms = Counter()
+    for field in TEXT_FIELDS:
+        for token in tokenize(row.get(field)):
+            terms[token] += FIELD_WEIGHTS[field]
+    for topic in row.get("topics") or []:
+        terms[f"topic:{topic.strip().lower()}"] += FIELD_WEIGHTS["topics"]
+    return terms
+
+
+# ============================================================================
+# TF-IDF
+# ============================================================================
+
+def build_tfidf(documents: list[Counter]):
+    """
+    Sparse TF-IDF matrix with L2-normalized rows.
+
+    Terms found in only one problem cannot link two problems and terms in
+    more than MAX_DOCUMENT_FREQUENCY of them link everything; both are dropped.
+
+    Returns:
+        (CSR matrix of shape problems x terms, vocabulary in column order)
+    """
+    np = _import_numpy()
+    sparse = _import_scipy_sparse()
+
+    count = len(documents)
+    document_frequency = Counter(term for terms in documents for term in terms)
+    vocabulary = sorted(term for term, frequency in document_frequency.items()
+                        if 1 < frequency <= MAX_DOCUMENT_FREQUENCY * count)
+    columns = {term: index for index, term in enumerate(vocabulary)}
+    idf = {term: math.log((1 + count) / (1 + document_frequency[term])) + 1 for term in vocabulary}
+
+    indptr, indices, data = [0], [], []
+    for terms in documents:
+        for term, weight in terms.items():
+            if term in columns:
+                indices.append(columns[term])
+                data.append((1 + math.log(weight)) * idf[term])
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+        shape=(count, len(vocabulary)),
+    )
+    matrix.sort_indices()
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(matrix).tocsr().astype(np.float32), vocabulary
+
+
+def block_rows(problem_count: int, memory_mb: float) -> int:
+    """Rows per block so that scoring one block against every problem fits memory_mb."""
+    return max(1, min(problem_count, int(memory_mb * 1024 * 1024) // (BYTES_PER_SCORE * max(problem_count, 1))))
+
+
+def top_k_neighbours(matrix, k: int, block_size: int, min_score: float = 0.0):
+    """
+    The k most similar rows of every row, scored a block of rows at a time.
+
+    Only one block x problems score matrix exists at once; each block is
+    reduced to its top k with argpartition (linear) and a sort of k columns.
+
+    Returns:
+        (indices, scores), both problems x k; slots below min_score (or past
+        the last other problem) hold index -1 and score 0
+    """
+    np = _import_numpy()
+
+    count = matrix.shape[0]
+    k = max(0, min(k, count - 1))
+    indices = np.full((count, k), -1, dtype=np.int32)
+    scores = np.zeros((count, k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+
+    transposed = matrix.T.tocsc()
+    for start in range(0, count, block_size):
+        stop = min(start + block_size, count)
+        block = (matrix[start:stop] @ transposed).toarray()
+        rows = np.arange(stop - start)
+        block[rows, rows + start] = -np.inf  # A problem is not related to itself
+
+        candidates = np.argpartition(block, -k, axis=1)[:, -k:]
+        candidate_scores = np.take_along_axis(block, candidates, axis=1)
+        # Best first; equal scores keep the lower row (the lower LeetCode number)
+        order = np.lexsort((candidates, -candidate_scores), axis=1)
+        best = np.take_along_axis(candidates, order, axis=1)
+        best_scores = np.take_along_axis(candidate_scores, order, axis=1)
+
+        keep = best_scores >= max(min_score, np.finfo(np.float32).tiny)
+        indices[start:stop] = np.where(keep, best, -1)
+        scores[start:stop] = np.where(keep, best_scores, 0.0)
+
+    return indices, scores
+
+
+def related_lists(rows: list[dict], indices, scores) -> dict[int, list[tuple[int, float]]]:
+    """{leetcode_number: [(related leetcode_number, cosine), ...]} in rank order."""
+    numbers = [row["leetcode_number"] for row in rows]
+    return {
+        numbers[row]: [(numbers[column], round(float(score), 4))
+                       for column, score in zip(indices[row], scores[row]) if column >= 0]
+        for row in range(len(rows))
+    }
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_related(conn, related: dict[int, list[tuple[int, float]]]) -> int:
+    """Write every list in one UPDATE; returns the number of rows that changed."""
+    payload = [{"leetcode_number": number, "related": [neighbour for neighbour, _ in neighbours]}
+               for number, neighbours in related.items()]
+    with conn.transaction():
+        cursor = conn.execute(BULK_UPDATE_SQL, (json.dumps(payload),))
+        return cursor.rowcount
+
+
+def save_json(path: Path, rows: list[dict], related: dict, vocabulary_size: int) -> None:
+    titles = {row["leetcode_number"]: row["title"] for row in rows}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "problems": len(rows),
+        "vocabulary": vocabulary_size,
+        "related": {
+            str(number): [{"number": neighbour, "title": titles[neighbour], "score": score}
+                          for neighbour, score in neighbours]
+            for number, neighbours in related.items()
+        },
+    }, indent=2, ensure_ascii=False))
+
+
+def print_related(rows: list[dict], related: dict, titles_to_show: list[str]) -> None:
+    titles = {row["leetcode_number"]: row["title"] for row in rows}
+    by_title = {title.lower(): number for number, title in titles.items()}
+    for title in titles_to_show:
+        number = by_title.get(title.lower())
+        if number is None:
+            print(f"   ⚠️  No problem titled {title!r}")
+            continue
+        print(f"\n🔗 {number}. {titles[number]}")
+        for neighbour, score in related[number]:
+            print(f"   {score:.3f}  {neighbour}. {titles[neighbour]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute related problems with TF-IDF cosine similarity")
+    parser.add_argument("-k", type=int, default=DEFAULT_K, help=f"Related problems per problem (default: {DEFAULT_K})")
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE,
+                        help=f"Drop neighbours below this cosine similarity (default: {DEFAULT_MIN_SCORE})")
+    parser.add_argument("--memory-mb", type=float, default=DEFAULT_MEMORY_MB,
+                        help=f"Memory for one block of scores, sets the block size (default: {DEFAULT_MEMORY_MB})")
+    parser.add_argument("--dry-run", action="store_true", help="Compute without writing to the database")
+    parser.add_argument("--from-seed", action="store_true",
+                        help="Use seed_data/blind_problems.json instead of the database (implies --dry-run)")
+    parser.add_argument("--json-out", type=Path, default=OUTPUT_PATH,
+                        help=f"Where to write the lists with scores (default: {OUTPUT_PATH})")
+    parser.add_argument("--show", action="append", default=[], metavar="TITLE",
+                        help="Print the related problems of this title (repeatable)")
+
+    args = parser.parse_args()
+    dry_run = args.dry_run or args.from_seed
+
+    print("=" * 60)
+    print("Related Problems (TF-IDF)")
+    print("=" * 60)
+
+    conn = None
+    try:
+        if args.from_seed:
+            rows = seed_rows()
+            print(f"\n🌱 {len(rows)} problems from the seed file")
+        else:
+            from migrate import connect
+
+            print("\n🔌 Connecting to the database...")
+            conn = connect()
+            with conn.transaction():
+                rows = fetch_rows(conn)
+            print(f"   blind_problems: {len(rows)} problems with a LeetCode number")
+
+        if len(rows) < 2:
+            print("\n⚠️  Need at least two problems; nothing to do")
+            return
+
+        started = time.perf_counter()
+        matrix, vocabulary = build_tfidf([weighted_terms(row) for row in rows])
+        vectorized = time.perf_counter()
+        block_size = block_rows(len(rows), args.memory_mb)
+        indices, scores = top_k_neighbours(matrix, args.k, block_size, args.min_score)
+        finished = time.perf_counter()
+
+        related = related_lists(rows, indices, scores)
+        save_json(args.json_out, rows, related, len(vocabulary))
+
+        density = matrix.nnz / max(1, matrix.shape[0] * matrix.shape[1])
+        empty = sum(1 for neighbours in related.values() if not neighbours)
+        print(f"\n📐 {matrix.shape[0]} x {matrix.shape[1]} TF-IDF matrix, {matrix.nnz} non-zeros ({density:.2%})")
+        print(f"   Vectorized in {(vectorized - started) * 1000:.1f} ms")
+        print(f"   Top {args.k} in {(finished - vectorized) * 1000:.1f} ms, "
+              f"{math.ceil(len(rows) / block_size)} block(s) of {block_size} rows")
+        if empty:
+            print(f"   ⚠️  {empty} problem(s) have no neighbour above {args.min_score}")
+        print(f"   💾 {args.json_out}")
+
+        print_related(rows, related, args.show)
+
+        if dry_run:
+            print("\n🏃 DRY RUN - nothing written to the database")
+            return
+
+        changed = write_related(conn, related)
+        print(f"\n✅ related_problems updated on {changed} row(s), {len(related) - changed} unchanged")
+        if changed:
+            from build_catalog_bundle import republish_after_write
+            republish_after_write(conn)
+
+        print("=" * 60)
+        print("Done!")
+        print("=" * 60)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
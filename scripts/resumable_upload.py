@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Resumable (TUS) uploads to Supabase Storage.
+
+Supabase Storage speaks the TUS 1.0.0 protocol at /storage/v1/upload/resumable.
+Instead of reading a whole image into memory and sending it in one request,
+this module streams the file from disk in fixed-size chunks and records the
+upload URL and confirmed offset in a small state file. If the connection drops,
+the next attempt (or the next run) asks the server for its offset and carries
+on from there instead of starting over.
+
+Usage:
+    python resumable_upload.py memories/141_linked_list_cycle_v2.png
+    python resumable_upload.py big.png --object-name originals/big.png
+    python resumable_upload.py big.png --endpoint http://127.0.0.1:1080/files  # local stand-in
+
+The local stand-in server lives in tus_stub_server.py.
+
+Environment variables (in .env.local or .env):
+    VITE_SUPABASE_URL=your_supabase_url
+    SUPABASE_SERVICE_ROLE_KEY=your_service_role_key
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+import argparse
+import http.client
+from pathlib import Path
+from urllib.parse import urlsplit, urljoin
+
+import tracing
+
+# Configuration
+TUS_VERSION = "1.0.0"
+# Supabase requires every chunk except the last to be exactly 6MB
+CHUNK_SIZE = 6 * 1024 * 1024
+STATE_DIR = Path(__file__).parent / ".upload_state"
+DEFAULT_BUCKET = "mnemonic-images"
+MAX_RETRIES = 5
+RETRY_BACKOFF_SECONDS = 1.0
+
+
+class TusUploadError(Exception):
+    """Raised when the server rejects an upload or retries are exhausted."""
+
+
+def get_tus_endpoint(supabase_url: str) -> str:
+    """Return the TUS endpoint for a Supabase project URL."""
+    return f"{supabase_url.rstrip('/')}/storage/v1/upload/resumable"
+
+
+def encode_metadata(metadata: dict[str, str]) -> str:
+    """Encode a dict as a TUS Upload-Metadata header value."""
+    return ",".join(
+        f"{key} {base64.b64encode(value.encode('utf-8')).decode('ascii')}"
+        for key, value in metadata.items()
+    )
+
+
+class ResumableUpload:
+    """
+    A single TUS upload of one file.
+
+    The upload URL returned by the server and the last offset it acknowledged
+    are persisted in STATE_DIR, keyed by endpoint, bucket, object name and the
+    file's size/mtime. A changed file therefore starts a fresh upload.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        filepath: Path,
+        object_name: str,
+        bucket: str = DEFAULT_BUCKET,
+        headers: dict[str, str] | None = None,
+        content_type: str = "image/png",
+        cache_control: str | None = None,
+        upsert: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        state_dir: Path = STATE_DIR,
+        max_retries: int = MAX_RETRIES,
+    ):
+        self.endpoint = endpoint
+        self.filepath = Path(filepath)
+        self.object_name = object_name
+        self.bucket = bucket
+        self.headers = dict(headers or {})
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.upsert = upsert
+        self.chunk_size = chunk_size
+        self.state_dir = Path(state_dir)
+        self.max_retries = max_retries
+
+        stat = self.filepath.stat()
+        self.file_size = stat.st_size
+        fingerprint = f"{endpoint}|{bucket}|{object_name}|{stat.st_size}|{stat.st_mtime_ns}"
+        self.state_path = self.state_dir / f"{hashlib.sha1(fingerprint.encode()).hexdigest()}.json"
+
+        self.upload_url = None
+        self.offset = 0
+        self._conn = None
+        self._conn_key = None
+
+    # ---------------------------------------------------------------
+    # State persistence
+    # ---------------------------------------------------------------
+
+    def _load_state(self) -> None:
+        if not self.state_path.exists():
+            return
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return
+        self.upload_url = state.get("upload_url")
+        self.offset = int(state.get("offset", 0))
+
+    def _save_state(self) -> None:
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({
+            "upload_url": self.upload_url,
+            "offset": self.offset,
+            "file": str(self.filepath),
+            "object_name": self.object_name,
+            "size": self.file_size,
+        }))
+        os.replace(tmp_path, self.state_path)
+
+    def _clear_state(self) -> None:
+        try:
+            self.state_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ---------------------------------------------------------------
+    # HTTP
+    # ---------------------------------------------------------------
+
+    def _request(self, method: str, url: str, headers: dict[str, str], body=None):
+        """Send a request over a kept-alive connection; returns (status, headers)."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        if self._conn is None or self._conn_key != key:
+            self._close()
+            conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            self._conn = conn_cls(parts.netloc, timeout=60)
+            self._conn_key = key
+
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        all_headers = {"Tus-Resumable": TUS_VERSION, **self.headers, **headers}
+        try:
+            self._conn.request(method, path, body=body, headers=all_headers)
+            response = self._conn.getresponse()
+            response.read()
+        except Exception:
+            self._close()
+            raise
+        return response.status, {k.lower(): v for k, v in response.getheaders()}
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._conn_key = None
+
+    def _create(self) -> None:
+        metadata = {
+            "bucketName": self.bucket,
+            "objectName": self.object_name,
+            "contentType": self.content_type,
+        }
+        if self.cache_control:
+            metadata["cacheControl"] = self.cache_control
+
+        headers = {
+            "Upload-Length": str(self.file_size),
+            "Upload-Metadata": encode_metadata(metadata),
+        }
+        if self.upsert:
+            headers["x-upsert"] = "true"
+
+        status, resp_headers = self._request("POST", self.endpoint, headers)
+        if status != 201 or "location" not in resp_headers:
+            raise TusUploadError(f"Create failed for {self.object_name}: HTTP {status}")
+
+        self.upload_url = urljoin(self.endpoint, resp_headers["location"])
+        self.offset = 0
+        self._save_state()
+
+    def _fetch_offset(self) -> bool:
+        """Ask the server where the upload stands. Returns False if it is gone."""
+        status, resp_headers = self._request("HEAD", self.upload_url, {})
+        if status in (404, 410) or "upload-offset" not in resp_headers:
+            return False
+        self.offset = int(resp_headers["upload-offset"])
+        self._save_state()
+        return True
+
+    def _send_chunks(self, f) -> None:
+        f.seek(self.offset)
+        while self.offset < self.file_size:
+            chunk = f.read(self.chunk_size)
+            headers = {
+                "Upload-Offset": str(self.offset),
+                "Content-Type": "application/offset+octet-stream",
+            }
+            with tracing.span("tus.patch", object=self.object_name, offset=self.offset, bytes=len(chunk)):
+                status, resp_headers = self._request("PATCH", self.upload_url, headers, body=chunk)
+            if status == 409:
+                # Offset mismatch: resync with the server and keep going
+                if not self._fetch_offset():
+                    raise TusUploadError(f"Upload for {self.object_name} expired on the server")
+                f.seek(self.offset)
+                continue
+            if status != 204:
+                raise TusUploadError(f"Chunk rejected for {self.object_name}: HTTP {status}")
+            self.offset = int(resp_headers.get("upload-offset", self.offset + len(chunk)))
+            self._save_state()
+
+    # ---------------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------------
+
+    def upload(self) -> None:
+        """Upload the file, resuming a previous attempt if one was recorded."""
+        self._load_state()
+        attempt = 0
+        failed_at = self.offset
+        try:
+            with open(self.filepath, "rb") as f:
+                while True:
+                    try:
+                        with tracing.span("tus.attempt", object=self.object_name, attempt=attempt + 1,
+                                          offset=self.offset):
+                            if self.upload_url is None or not self._fetch_offset():
+                                self._create()
+                            self._send_chunks(f)
+                        break
+                    except (OSError, http.client.HTTPException) as e:
+                        # Retries are for a connection that makes no progress; one
+                        # that keeps dropping while the offset advances starts over
+                        if self.offset > failed_at:
+                            attempt = 0
+                        failed_at = self.offset
+                        attempt += 1
+                        if attempt > self.max_retries:
+                            raise TusUploadError(
+                                f"Giving up on {self.object_name} after {self.max_retries} retries: {e}"
+                            ) from e
+                        delay = RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+                        print(f"  🔁 Connection lost at {self.offset}/{self.file_size} bytes, "
+                              f"retrying in {delay:.0f}s ({attempt}/{self.max_retries})")
+                        time.sleep(delay)
+        finally:
+            self._close()
+        self._clear_state()
+
+
+def upload_file_resumable(
+    filepath: Path,
+    object_name: str,
+    bucket: str = DEFAULT_BUCKET,
+    endpoint: str | None = None,
+    content_type: str = "image/png",
+    cache_control: str | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """
+    Upload a file to Supabase Storage with TUS, resuming any interrupted attempt.
+
+    The endpoint defaults to the project's resumable endpoint; credentials come
+    from the same environment variables as upload_mnemonics_to_supabase.py.
+    """
+    from upload_mnemonics_to_supabase import _get_env
+
+    url, key = _get_env()
+    if endpoint is None:
+        if not url:
+            raise ValueError("Missing VITE_SUPABASE_URL (or pass an explicit TUS endpoint)")
+        endpoint = get_tus_endpoint(url)
+
+    headers = {}
+    if key:
+        headers["Authorization"] = f"Bearer {key}"
+        headers["apikey"] = key
+
+    ResumableUpload(
+        endpoint=endpoint,
+        filepath=filepath,
+        object_name=object_name,
+        bucket=bucket,
+        headers=headers,
+        content_type=content_type,
+        cache_control=cache_control,
+        chunk_size=chunk_size,
+    ).upload()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumable TUS upload to Supabase Storage")
+    parser.add_argument("file", type=Path, help="File to upload")
+    parser.add_argument("--object-name", help="Object name in the bucket (default: file name)")
+    parser.add_argument("--bucket", default=DEFAULT_BUCKET, help=f"Bucket name (default: {DEFAULT_BUCKET})")
+    parser.add_argument("--endpoint", help="TUS endpoint (default: derived from VITE_SUPABASE_URL)")
+    parser.add_argument("--content-type", default="image/png", help="Content type (default: image/png)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help=f"Chunk size in bytes (default: {CHUNK_SIZE}, required by Supabase)")
+
+    args = parser.parse_args()
+
+    if not args.file.exists():
+        print(f"❌ File not found: {args.file}")
+        sys.exit(1)
+
+    object_name = args.object_name or args.file.name
+    print(f"📤 Uploading {args.file} -> {args.bucket}/{object_name}")
+    try:
+        upload_file_resumable(
+            args.file,
+            object_name,
+            bucket=args.bucket,
+            endpoint=args.endpoint,
+            content_type=args.content_type,
+            chunk_size=args.chunk_size,
+        )
+    except TusUploadError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    main()
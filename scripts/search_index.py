@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Offline full-text search over the problems' hints, definitions and notes.
+
+Finding a problem by technique ("two heaps", "union find") means reading
+detailed_hint, definition, key_idea and the NeetCode notes of every problem.
+build_index() puts one document per problem into an SQLite FTS5 table:
+
+    docs(title, pattern, key_idea, definition, detailed_hint, notes)
+        porter stemming, a prefix index for 3-character prefixes
+    manifest(doc_id PRIMARY KEY, key, number, sha256)   one row per document
+    meta(key PRIMARY KEY, value)                         source fingerprint
+
+Sources are joined on the LeetCode number: seed_data/blind_problems.json
+(key idea, hint, definition, pattern, topics), the prompt library (mnemonic
+hint and punchline) and the problem catalog (NeetCode notes, key pattern).
+Rebuilds are incremental: each document's SHA-256 is kept in the manifest and
+only new, changed or removed documents are written.
+
+Queries are ranked with BM25, weighting title and pattern matches above hits
+deep in a hint; the last word is matched as a prefix, so partial input works:
+
+    from search_index import get_index
+    for result in get_index().search("union fi"):
+        print(result.number, result.title, result.snippet)
+
+Usage:
+    python search_index.py build                      # Incremental (re)build
+    python search_index.py query "two heaps"
+    python search_index.py query "sliding window" --limit 5
+    python search_index.py query 'definition:trie NOT prefix' --raw   # FTS5 syntax
+    python search_index.py stats                      # Size, documents and query timings
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+SCRIPT_DIR = Path(__file__).parent
+INDEX_PATH = SCRIPT_DIR / ".cache" / "search_index.sqlite"
+SEED_DATA_PATH = SCRIPT_DIR / "seed_data" / "blind_problems.json"
+INDEX_VERSION = 1
+
+FIELDS = ["title", "pattern", "key_idea", "definition", "detailed_hint", "notes"]
+# BM25 weight per field, in FIELDS order
+FIELD_WEIGHTS = [10.0, 6.0, 4.0, 2.0, 1.0, 1.5]
+SNIPPET_TOKENS = 12
+
+SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    {', '.join(FIELDS)},
+    tokenize = 'porter unicode61 remove_diacritics 2',
+    prefix = '3'
+);
+CREATE TABLE IF NOT EXISTS manifest (
+    doc_id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    number INTEGER,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+"""
+
+SAMPLE_QUERIES = ["two heaps", "sliding window", "union find", "memoization", "binary sea", "he", "xor"]
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchResult(NamedTuple):
+    number: int | None
+    title: str
+    score: float     # BM25; lower is better
+    snippet: str     # Best-matching passage, matches in [brackets]
+
+
+# =============================================================================
+# DOCUMENTS
+# =============================================================================
+
+def source_files() -> list[Path]:
+    from problem_catalog import SOURCE_FILES
+    return [SEED_DATA_PATH, Path(__file__), *SOURCE_FILES]
+
+
+def source_fingerprint() -> str:
+    """Size and mtime of every source file; cheap enough to check on every open."""
+    parts = [f"v{INDEX_VERSION}"]
+    for path in source_files():
+        try:
+            stat = path.stat()
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{path.name}:missing")
+    return "|".join(parts)
+
+
+def _join(*texts) -> str:
+    """Non-empty texts, each once, as paragraphs."""
+    seen = []
+    for text in texts:
+        text = (text or "").strip()
+        if text and text not in seen:
+            seen.append(text)
+    return "\n\n".join(seen)
+
+
+def collect_documents() -> dict[str, dict]:
+    """{key: {"number", **FIELDS}} for every problem in any source."""
+    from generate_seed_sql import load_seed_data
+    from problem_catalog import get_catalog
+    from prompt_library import PROMPTS
+
+    catalog = get_catalog()
+    seeds = {}
+    documents = {}
+    for row in load_seed_data(SEED_DATA_PATH):
+        number = int(row["leetcode_number"]) if row.get("leetcode_number") else None
+        if number is None:
+            documents[f"title:{row['title']}"] = {"number": None, "title": row["title"], "seed": row}
+        else:
+            seeds[number] = row
+
+    for number in sorted(set(catalog.numbers()) | set(seeds) | set(PROMPTS)):
+        record = catalog.get(number) or {}
+        seed = seeds.get(number, {})
+        prompt = PROMPTS.get(number, {})
+        documents[f"number:{number}"] = {
+            "number": number,
+            "title": seed.get("title") or record.get("title") or prompt.get("title"),
+            "seed": seed, "record": record, "prompt": prompt,
+        }
+
+    for document in documents.values():
+        seed, record, prompt = (document.pop(source, {}) for source in ("seed", "record", "prompt"))
+        topics = seed.get("topics") or record.get("topics") or []
+        document.update({
+            "pattern": _join(seed.get("pattern"), record.get("pattern"), record.get("key_pattern"), ", ".join(topics)),
+            "key_idea": _join(seed.get("key_idea"), record.get("key_idea"), prompt.get("punchline")),
+            "definition": _join(seed.get("definition")),
+            "detailed_hint": _join(seed.get("detailed_hint"), prompt.get("detailed_hint")),
+            "notes": _join(record.get("notes")),
+        })
+    return documents
+
+
+def document_hash(document: dict) -> str:
+    canonical = json.dumps([document["number"], *(document[field] for field in FIELDS)], ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def build_index(path: Path = INDEX_PATH, full: bool = False) -> dict:
+    """
+    Bring the index at `path` up to date with the sources.
+
+    Returns:
+        Build stats: documents, added, updated, removed, unchanged
+    """
+    path = Path(path)
+    if full:
+        path.unlink(missing_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    documents = collect_documents()
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SCHEMA)
+        manifest = {key: (doc_id, sha256) for doc_id, key, sha256
+                    in conn.execute("SELECT doc_id, key, sha256 FROM manifest")}
+        stats = {"documents": len(documents), "added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        with conn:
+            for key, (doc_id, _) in manifest.items():
+                if key not in documents:
+                    conn.execute("DELETE FROM docs WHERE rowid = ?", (doc_id,))
+                    conn.execute("DELETE FROM manifest WHERE doc_id = ?", (doc_id,))
+                    stats["removed"] += 1
+
+            for key, document in documents.items():
+                sha256 = document_hash(document)
+                values = [document[field] for field in FIELDS]
+                if key not in manifest:
+                    doc_id = conn.execute(f"INSERT INTO docs ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))})",
+                                          values).lastrowid
+                    conn.execute("INSERT INTO manifest VALUES (?, ?, ?, ?)", (doc_id, key, document["number"], sha256))
+                    stats["added"] += 1
+                elif manifest[key][1] != sha256:
+                    doc_id = manifest[key][0]
+                    conn.execute(f"UPDATE docs SET {', '.join(f'{field} = ?' for field in FIELDS)} WHERE rowid = ?",
+                                 [*values, doc_id])
+                    conn.execute("UPDATE manifest SET number = ?, sha256 = ? WHERE doc_id = ?",
+                                 (document["number"], sha256, doc_id))
+                    stats["updated"] += 1
+                else:
+                    stats["unchanged"] += 1
+
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+                ("fingerprint", source_fingerprint()),
+                ("stats", json.dumps(stats)),
+            ])
+
+        if stats["added"] or stats["updated"] or stats["removed"]:
+            # Merge the FTS segments and drop free pages: smaller file, faster queries
+            conn.execute("INSERT INTO docs(docs) VALUES ('optimize')")
+            conn.commit()
+            conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return stats
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+def to_match_query(text: str, prefix: bool = True) -> str | None:
+    """
+    Plain text -> FTS5 MATCH expression: every word must match (as a quoted
+    term, so FTS5 operators in user input are inert), the last one as a prefix.
+    """
+    tokens = TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    if prefix:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """Read-only view of a built index; the connection opens on first query."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = Path(path)
+        self._conn = None
+        weights = ", ".join(str(weight) for weight in FIELD_WEIGHTS)
+        self._sql = (
+            f"SELECT manifest.number, docs.title, bm25(docs, {weights}) AS score, "
+            f"snippet(docs, -1, '[', ']', '…', {SNIPPET_TOKENS}) "
+            f"FROM docs JOIN manifest ON manifest.doc_id = docs.rowid "
+            f"WHERE docs MATCH ? ORDER BY score LIMIT ?"
+        )
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def search(self, query: str, limit: int = 10, raw: bool = False, prefix: bool = True) -> list[SearchResult]:
+        """
+        Problems matching `query`, best first.
+
+        With raw=True the query is passed to FTS5 as-is (column filters,
+        NEAR, OR/NOT, "phrases", prefix*); otherwise see to_match_query().
+        """
+        match = query if raw else to_match_query(query, prefix)
+        if not match:
+            return []
+        return [SearchResult(*row) for row in self.conn.execute(self._sql, (match, limit))]
+
+
+_index = None
+
+
+def get_index(path: Path = INDEX_PATH, rebuild_if_stale: bool = True) -> SearchIndex:
+    """Shared index for this process, (re)built first if a source file changed."""
+    global _index
+    if _index is not None and _index.path == Path(path):
+        return _index
+
+    index = SearchIndex(path)
+    if rebuild_if_stale:
+        stale = not Path(path).exists()
+        if not stale:
+            try:
+                stale = index.meta("fingerprint") != source_fingerprint()
+            except sqlite3.DatabaseError:
+                stale = True
+        if stale:
+            index.close()
+            build_index(Path(path))
+
+    _index = index
+    return index
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the full-text problem search index")
+    parser.add_argument("--path", type=Path, default=INDEX_PATH, help=f"Index file (default: {INDEX_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Bring the index up to date with its sources")
+    build.add_argument("--full", action="store_true", help="Rebuild from scratch")
+    query = sub.add_parser("query", help="Search hints, definitions, key ideas and notes")
+    query.add_argument("text", nargs="+")
+    query.add_argument("--limit", type=int, default=10, help="Results to show (default: 10)")
+    query.add_argument("--raw", action="store_true", help="Pass the query to FTS5 unchanged")
+    query.add_argument("--exact", action="store_true", help="Do not prefix-match the last word")
+    sub.add_parser("stats", help="Show index size, document count and sample query timings")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        stats = build_index(args.path, full=args.full)
+        print(f"✅ {args.path}: {stats['documents']} documents "
+              f"(+{stats['added']} ~{stats['updated']} -{stats['removed']}, {stats['unchanged']} unchanged) "
+              f"in {time.perf_counter() - start:.2f}s, {args.path.stat().st_size / 1024:.0f} KB")
+        return
+
+    index = get_index(args.path)
+
+    if args.command == "stats":
+        print(f"🔎 {args.path}")
+        print(f"  Documents: {index.conn.execute('SELECT COUNT(*) FROM manifest').fetchone()[0]}")
+        print(f"  Size:      {args.path.stat().st_size / 1024:.1f} KB")
+        for sample in SAMPLE_QUERIES:
+            index.search(sample)  # Warm the page cache
+            start = time.perf_counter()
+            runs = 200
+            for _ in range(runs):
+                results = index.search(sample)
+            elapsed_ms = (time.perf_counter() - start) / runs * 1000
+            print(f"  {sample!r:<20} {len(results):>3} results  {elapsed_ms:.3f} ms")
+        return
+
+    text = " ".join(args.text)
+    start = time.perf_counter()
+    try:
+        results = index.search(text, limit=args.limit, raw=args.raw, prefix=not args.exact)
+    except sqlite3.OperationalError as e:
+        print(f"❌ Invalid query: {e}")
+        sys.exit(1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if not results:
+        print(f"No matches for {text!r} ({elapsed_ms:.2f} ms)")
+        sys.exit(1)
+    print(f"{len(results)} results for {text!r} ({elapsed_ms:.2f} ms)\n")
+    for result in results:
+        number = f"#{result.number}" if result.number is not None else "-"
+        print(f"{number:>6}  {result.title}  ({result.score:.2f})")
+        print(f"        {' '.join(result.snippet.split())}")
+
+
+if __name__ == "__main__":
+    main()
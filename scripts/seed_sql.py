@@ -0,0 +1,265 @@
+"""
+Reader for the seed SQL files at the repo root.
+
+The seed files only use a small subset of SQL, so they are tokenized here
+rather than pulled in through a SQL parser dependency:
+
+    INSERT INTO table (col, ...) VALUES (literal, ...)[, (literal, ...)] [ON CONFLICT ...];
+    UPDATE table SET col = literal[, col = literal] WHERE col = literal;
+    UPDATE table AS t SET col = v.col FROM (VALUES (literal, ...), ...) AS v(col, ...)
+        WHERE t.key = v.key;
+
+Literals follow PostgreSQL rules (standard_conforming_strings on):
+
+    'text'    '' is a quote, backslashes are literal
+    E'text'   '' or \\' is a quote, \\n \\t \\r \\b \\f \\\\ \\xHH are escapes
+    42, 1.5, NULL, TRUE, FALSE
+
+Example:
+    rows = parse_inserts("supabase-seed-blind-problems.sql")
+    rows[0]["title"], rows[0]["leetcode_number"]     # ('Two Sum', 1)
+"""
+
+import re
+from pathlib import Path
+
+TOKEN_RE = re.compile(r"""
+      (?P<space>\s+)
+    | (?P<comment>--[^\n]*)
+    | (?P<estring>[Ee]'(?:[^'\\]|\\.|'')*')
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<number>-?\d+(?:\.\d+)?)
+    | (?P<word>[A-Za-z_][A-Za-z0-9_.]*)
+    | (?P<punct>[(),=;*])
+""", re.VERBOSE | re.DOTALL)
+
+E_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+KEYWORD_LITERALS = {"NULL": None, "TRUE": True, "FALSE": False}
+
+
+class SeedSQLError(ValueError):
+    """The SQL uses something outside the subset the seed files use."""
+
+
+def _unescape_e_string(body: str) -> str:
+    def replace(match):
+        text = match.group(0)
+        if text == "''":
+            return "'"
+        if len(text) > 2:
+            return chr(int(text[2:], 16))
+        return E_ESCAPES.get(text[1], text[1])
+    return re.sub(r"''|\\x[0-9A-Fa-f]{1,2}|\\.", replace, body, flags=re.DOTALL)
+
+
+def tokenize(sql: str) -> list[tuple[str, object]]:
+    """
+    Split SQL into (kind, value) tokens, dropping whitespace and comments.
+
+    kind is "literal" (value already decoded), "word" (upper-cased) or "punct".
+    """
+    tokens = []
+    position = 0
+    while position < len(sql):
+        match = TOKEN_RE.match(sql, position)
+        if not match:
+            line = sql.count("\n", 0, position) + 1
+            raise SeedSQLError(f"Unexpected character {sql[position]!r} on line {line}")
+        position = match.end()
+        kind, text = match.lastgroup, match.group()
+        if kind in ("space", "comment"):
+            continue
+        if kind == "estring":
+            tokens.append(("literal", _unescape_e_string(text[2:-1])))
+        elif kind == "string":
+            tokens.append(("literal", text[1:-1].replace("''", "'")))
+        elif kind == "number":
+            tokens.append(("literal", float(text) if "." in text else int(text)))
+        elif kind == "word" and text.upper() in KEYWORD_LITERALS:
+            tokens.append(("literal", KEYWORD_LITERALS[text.upper()]))
+        elif kind == "word":
+            tokens.append(("word", text.upper()))
+        else:
+            tokens.append(("punct", text))
+    return tokens
+
+
+def iter_statements(sql: str):
+    """Yield each statement as a token list (without the trailing semicolon)."""
+    statement = []
+    for token in tokenize(sql):
+        if token == ("punct", ";"):
+            if statement:
+                yield statement
+            statement = []
+        else:
+            statement.append(token)
+    if statement:
+        yield statement
+
+
+class _Cursor:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        token = self.peek()
+        if token[0] is None or (kind and token[0] != kind) or (value is not None and token[1] != value):
+            raise SeedSQLError(f"Expected {value or kind}, found {token[1]!r}")
+        self.index += 1
+        return token[1]
+
+    def accept(self, kind, value):
+        if self.peek() == (kind, value):
+            self.index += 1
+            return True
+        return False
+
+    def parenthesized(self, kind):
+        self.take("punct", "(")
+        items = [self.take(kind)]
+        while self.accept("punct", ","):
+            items.append(self.take(kind))
+        self.take("punct", ")")
+        return items
+
+
+def _column_name(word: str) -> str:
+    return word.lower()
+
+
+def parse_insert(tokens) -> tuple[str, list[dict]]:
+    """Parse one INSERT statement into (table, [row dict, ...])."""
+    cursor = _Cursor(tokens)
+    cursor.take("word", "INSERT")
+    cursor.take("word", "INTO")
+    table = cursor.take("word").lower()
+    columns = [_column_name(c) for c in cursor.parenthesized("word")]
+    cursor.take("word", "VALUES")
+
+    rows = []
+    while True:
+        values = cursor.parenthesized("literal")
+        if len(values) != len(columns):
+            raise SeedSQLError(f"{table}: {len(columns)} columns but {len(values)} values")
+        rows.append(dict(zip(columns, values)))
+        if not cursor.accept("punct", ","):
+            break
+    # ON CONFLICT ... is the upsert policy, not data
+    return table, rows
+
+
+def parse_update(tokens) -> tuple[str, dict, tuple[str, object]]:
+    """Parse one simple UPDATE into (table, {column: value}, (where_column, where_value))."""
+    cursor = _Cursor(tokens)
+    cursor.take("word", "UPDATE")
+    table = cursor.take("word").lower()
+    cursor.take("word", "SET")
+
+    assignments = {}
+    while True:
+        column = _column_name(cursor.take("word"))
+        cursor.take("punct", "=")
+        assignments[column] = cursor.take("literal")
+        if not cursor.accept("punct", ","):
+            break
+
+    cursor.take("word", "WHERE")
+    where_column = _column_name(cursor.take("word"))
+    cursor.take("punct", "=")
+    where_value = cursor.take("literal")
+    if cursor.peek()[0] is not None:
+        raise SeedSQLError(f"{table}: only single-column WHERE clauses are supported")
+    return table, assignments, (where_column, where_value)
+
+
+def parse_update_from_values(tokens) -> tuple[str, list[tuple[dict, tuple[str, object]]]]:
+    """
+    Parse a batched UPDATE ... FROM (VALUES ...) into
+    (table, [({column: value}, (where_column, where_value)), ...]).
+    """
+    cursor = _Cursor(tokens)
+    cursor.take("word", "UPDATE")
+    table = cursor.take("word").lower()
+    cursor.accept("word", "AS")
+    target = cursor.take("word").lower()
+    cursor.take("word", "SET")
+
+    assignments = {}  # target column -> values column
+    while True:
+        column = _column_name(cursor.take("word"))
+        cursor.take("punct", "=")
+        assignments[column] = _column_name(cursor.take("word")).split(".")[-1]
+        if not cursor.accept("punct", ","):
+            break
+
+    cursor.take("word", "FROM")
+    cursor.take("punct", "(")
+    cursor.take("word", "VALUES")
+    tuples = [cursor.parenthesized("literal")]
+    while cursor.accept("punct", ","):
+        tuples.append(cursor.parenthesized("literal"))
+    cursor.take("punct", ")")
+    cursor.accept("word", "AS")
+    source = cursor.take("word").lower()
+    value_columns = [_column_name(c) for c in cursor.parenthesized("word")]
+
+    cursor.take("word", "WHERE")
+    left = _column_name(cursor.take("word"))
+    cursor.take("punct", "=")
+    right = _column_name(cursor.take("word"))
+    if not (left.startswith(f"{target}.") and right.startswith(f"{source}.")):
+        raise SeedSQLError(f"{table}: expected WHERE {target}.<key> = {source}.<key>")
+    where_column, key_column = left.split(".", 1)[1], right.split(".", 1)[1]
+
+    rows = []
+    for values in tuples:
+        if len(values) != len(value_columns):
+            raise SeedSQLError(f"{table}: {len(value_columns)} columns but {len(values)} values")
+        row = dict(zip(value_columns, values))
+        rows.append(({column: row[name] for column, name in assignments.items()},
+                     (where_column, row[key_column])))
+    return table, rows
+
+
+def _read(path) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def parse_inserts(path, table: str = "public.blind_problems") -> list[dict]:
+    """Every row inserted into `table` by the file, in file order."""
+    rows = []
+    for tokens in iter_statements(_read(path)):
+        if tokens[0] == ("word", "INSERT"):
+            statement_table, statement_rows = parse_insert(tokens)
+            if statement_table == table:
+                rows.extend(statement_rows)
+    return rows
+
+
+def parse_updates(path, table: str = "public.blind_problems", key: str = "title") -> dict[object, dict]:
+    """
+    Collect the UPDATE ... WHERE <key> = ... statements of a file.
+
+    Returns:
+        {key value: {column: value}} (later statements win)
+    """
+    updates = {}
+    for tokens in iter_statements(_read(path)):
+        if tokens[0] != ("word", "UPDATE"):
+            continue
+        if ("word", "FROM") in tokens:
+            statement_table, rows = parse_update_from_values(tokens)
+        else:
+            statement_table, assignments, where = parse_update(tokens)
+            rows = [(assignments, where)]
+        if statement_table != table:
+            continue
+        for assignments, (where_column, where_value) in rows:
+            if where_column == key:
+                updates.setdefault(where_value, {}).update(assignments)
+    return updates
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Simulate the spaced-repetition study plan for thousands of users at once.
+
+Replays the rules of buildSpacedRepetitionQueue / updateProgressAfterAttempt
+(see spaced_repetition.py) day by day for a synthetic population, so the
+user_study_settings defaults can be tuned before they reach real users:
+
+    - Due reviews first, most overdue first, up to daily_cap
+    - Then new problems (easy -> hard), ceil(remaining / (days left - 2)) per day
+    - Teaching score >= 75: 1 review, >= 70: 2 reviews, below: relearn
+    - Reviews are due the next day; a failed review (< 70) is due again the next day
+
+Each user's state is a row of users x problems arrays, advanced one day at a
+time (a day depends on the one before it); the per-day results are kept as
+users x days arrays. Scores are drawn per attempt from a normal distribution
+around the user's skill, shifted by problem difficulty and by practice.
+
+Relearn problems (teaching score < 70) never enter the queue in the app; the
+user has to re-attempt them from the grid. --relearn-rate is the chance per
+day that a user who studied does that for each such problem.
+
+Usage:
+    python simulate_spaced_repetition.py                          # 10,000 users, default settings
+    python simulate_spaced_repetition.py --users 50000 --days 21
+    python simulate_spaced_repetition.py --daily-cap 10 15 20 --target-days 10 14   # Sweep
+    python simulate_spaced_repetition.py --attendance 0.7 --skill-mean 72
+    python simulate_spaced_repetition.py --json-out simulation.json
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from typing import NamedTuple
+
+import spaced_repetition as rules
+from generate_seed_sql import load_seed_data
+
+DEFAULT_USERS = 10_000
+DEFAULT_CHUNK_SIZE = 10_000  # Users simulated together; bounds memory at ~chunk x problems x 10 bytes
+NEVER = 32_767  # next_review day for problems that are not in review (int16 max)
+
+
+class Population(NamedTuple):
+    """How the simulated users behave."""
+    skill_mean: float = 76.0       # Mean of the per-user average teaching score
+    skill_sd: float = 6.0          # Spread of that average across users
+    attempt_sd: float = 8.0        # Spread of a single attempt around the user's average
+    practice_gain: float = 3.0     # Score gained per earlier attempt of the same problem
+    attendance: float = 0.85       # Chance a user studies on a given day (and finishes the queue)
+    relearn_rate: float = 0.5      # Chance per study day of re-attempting each relearn problem
+    difficulty_offsets: tuple = (("easy", 6.0), ("medium", 0.0), ("hard", -8.0))
+
+
+class StudySettings(NamedTuple):
+    """One row of user_study_settings."""
+    target_days: int = rules.DEFAULT_TARGET_DAYS
+    daily_cap: int = rules.DEFAULT_DAILY_CAP
+    easy_bonus: int = 0  # Production ignores easy_bonus; set it to see what applying it would do
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        print("❌ numpy package not installed. Install with: pip install numpy")
+        sys.exit(1)
+    return numpy
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+
+def _simulate_chunk(np, rng, n_users: int, difficulties: list[str], settings: StudySettings,
+                    population: Population, days: int) -> dict:
+    """Simulate `n_users` users; returns {metric: users x days array}."""
+    n_problems = len(difficulties)
+    offsets = dict(population.difficulty_offsets)
+    offset = np.array([offsets[d] for d in difficulties], dtype=np.float32)
+    if settings.easy_bonus:
+        offset += np.array([settings.easy_bonus if d == "easy" else 0 for d in difficulties], dtype=np.float32)
+    skill = rng.normal(population.skill_mean, population.skill_sd, n_users).astype(np.float32)
+    gain = np.float32(population.practice_gain)
+
+    shape = (n_users, n_problems)
+    introduced = np.zeros(shape, dtype=bool)
+    mastered = np.zeros(shape, dtype=bool)
+    needed = np.zeros(shape, dtype=np.int8)
+    completed = np.zeros(shape, dtype=np.int8)
+    attempts = np.zeros(shape, dtype=np.int8)
+    next_review = np.full(shape, NEVER, dtype=np.int16)
+
+    metrics = {name: np.zeros((n_users, days), dtype=np.int16) for name in (
+        "queue", "reviews", "new", "backlog", "relearn_attempts", "introduced", "mastered", "relearn")}
+
+    for day in range(days):
+        studied = rng.random(n_users) < population.attendance
+
+        # Due reviews (fetchDueReviews), most overdue first, capped
+        due = (next_review <= day) & (completed < needed) & ~mastered
+        due_count = due.sum(axis=1)
+        review_pick = due.copy()
+        over = np.flatnonzero(due_count > settings.daily_cap)
+        if over.size:
+            # Only users with more due reviews than the cap need ranking
+            order = np.argsort(np.where(due[over], next_review[over], NEVER), axis=1, kind="stable")
+            review_pick[over[:, None], order[:, settings.daily_cap:]] = False
+        reviews = np.minimum(due_count, settings.daily_cap)
+
+        # New problems: columns are already in introduction order
+        remaining_new = n_problems - introduced.sum(axis=1)
+        pace = np.ceil(remaining_new / max(1, rules.days_left(settings.target_days, day + 1) - rules.BUFFER_DAYS))
+        slots = np.minimum(pace, settings.daily_cap - reviews)
+        unseen = ~introduced
+        new_pick = unseen & (np.cumsum(unseen, axis=1) <= slots[:, None])
+        queued_new = new_pick.sum(axis=1)
+
+        relearn = introduced & (needed == 0) & ~mastered
+        relearn_pick = relearn & studied[:, None]
+        if population.relearn_rate < 1:
+            relearn_pick &= rng.random(shape, dtype=np.float32) < population.relearn_rate
+
+        review_pick &= studied[:, None]
+        teach = (new_pick & studied[:, None]) | relearn_pick
+        score = rng.standard_normal(shape, dtype=np.float32)
+        score *= np.float32(population.attempt_sd)
+        score += skill[:, None]
+        score += offset
+        score += gain * attempts
+        passing = score >= rules.SCORE_PASSED
+
+        # Teaching sessions (first attempt or relearn): 2 reviews if passed, 1 if excellent, 0 = relearn
+        teach_needed = passing.astype(np.int8) * 2 - (score >= rules.SCORE_EXCELLENT)
+        np.putmask(needed, teach, teach_needed)
+        np.putmask(completed, teach, 0)
+        np.putmask(next_review, teach, np.where(teach_needed > 0, day + 1, NEVER).astype(np.int16))
+        introduced |= teach
+
+        # Reviews: a pass counts, a fail is due again tomorrow either way
+        passed = review_pick & passing
+        completed += passed
+        mastered |= passed & (completed >= needed)
+        np.putmask(next_review, review_pick, day + 1)
+        np.putmask(next_review, mastered, NEVER)
+
+        attempts += teach | review_pick
+
+        metrics["queue"][:, day] = reviews + queued_new
+        metrics["reviews"][:, day] = reviews
+        metrics["new"][:, day] = queued_new
+        metrics["backlog"][:, day] = due_count - np.where(studied, reviews, 0)
+        metrics["relearn_attempts"][:, day] = relearn_pick.sum(axis=1)
+        metrics["introduced"][:, day] = introduced.sum(axis=1)
+        metrics["mastered"][:, day] = mastered.sum(axis=1)
+        metrics["relearn"][:, day] = (introduced & (needed == 0) & ~mastered).sum(axis=1)
+
+    return metrics
+
+
+def simulate(problems: list[dict], settings: StudySettings, population: Population = Population(),
+             users: int = DEFAULT_USERS, days: int | None = None, seed: int = 0,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Simulate `users` users starting the plan on the same day.
+
+    Returns:
+        {metric: users x days int16 array} for queue, reviews, new, backlog
+        (due reviews left undone at the end of the day), relearn_attempts,
+        introduced, mastered and relearn (problems waiting to be re-attempted).
+    """
+    np = _import_numpy()
+    days = days or settings.target_days * 2
+    difficulties = [problem["difficulty"] for problem in rules.introduction_order(problems)]
+    rng = np.random.default_rng(seed)
+
+    chunks = [
+        _simulate_chunk(np, rng, min(chunk_size, users - start), difficulties, settings, population, days)
+        for start in range(0, users, chunk_size)
+    ]
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def summarize(metrics: dict, settings: StudySettings, n_problems: int) -> dict:
+    """Per-day curves and headline numbers from simulate() output."""
+    np = _import_numpy()
+
+    queue = metrics["queue"]
+    n_users, days = queue.shape
+    all_mastered = metrics["mastered"] >= n_problems
+    finished = all_mastered.any(axis=1)
+    finish_day = np.where(finished, all_mastered.argmax(axis=1) + 1, -1)
+    target = min(settings.target_days, days) - 1
+
+    per_day = [{
+        "day": day + 1,
+        "queue_mean": round(float(queue[:, day].mean()), 2),
+        "queue_p90": int(np.percentile(queue[:, day], 90)),
+        "queue_max": int(queue[:, day].max()),
+        "at_cap_pct": round(100 * float((queue[:, day] >= settings.daily_cap).mean()), 1),
+        "reviews_mean": round(float(metrics["reviews"][:, day].mean()), 2),
+        "new_mean": round(float(metrics["new"][:, day].mean()), 2),
+        "backlog_mean": round(float(metrics["backlog"][:, day].mean()), 2),
+        "backlog_p90": int(np.percentile(metrics["backlog"][:, day], 90)),
+        "relearn_mean": round(float(metrics["relearn"][:, day].mean()), 2),
+        "relearn_attempts_mean": round(float(metrics["relearn_attempts"][:, day].mean()), 2),
+        "introduced_pct": round(100 * float(metrics["introduced"][:, day].mean()) / n_problems, 1),
+        "mastered_pct": round(100 * float(metrics["mastered"][:, day].mean()) / n_problems, 1),
+        "users_done_pct": round(100 * float(all_mastered[:, day].mean()), 1),
+    } for day in range(days)]
+
+    return {
+        "settings": settings._asdict(),
+        "users": n_users,
+        "days": days,
+        "peak_queue_p99": int(np.percentile(queue.max(axis=1), 99)),
+        "at_cap_user_days_pct": round(100 * float((queue >= settings.daily_cap).mean()), 1),
+        "backlog_at_target_mean": round(float(metrics["backlog"][:, target].mean()), 2),
+        "mastered_at_target_pct": per_day[target]["mastered_pct"],
+        "done_by_target_pct": per_day[target]["users_done_pct"],
+        "done_by_end_pct": round(100 * float(finished.mean()), 1),
+        "finish_day_median": float(np.median(finish_day[finished])) if finished.any() else None,
+        "per_day": per_day,
+    }
+
+
+def print_summary(summary: dict) -> None:
+    settings = summary["settings"]
+    print(f"\n📅 target_days={settings['target_days']}  daily_cap={settings['daily_cap']}  "
+          f"easy_bonus={settings['easy_bonus']}  ({summary['users']:,} users)\n")
+    print(f"  {'day':>3}  {'queue':>6} {'p90':>4} {'max':>4} {'@cap':>6}  {'rev':>5} {'new':>5}  "
+          f"{'backlog':>7} {'p90':>4}  {'relearn':>7}  {'seen':>6} {'mastered':>8} {'done':>6}")
+    for row in summary["per_day"]:
+        marker = " ◀ target" if row["day"] == settings["target_days"] else ""
+        print(f"  {row['day']:>3}  {row['queue_mean']:>6.1f} {row['queue_p90']:>4} {row['queue_max']:>4} "
+              f"{row['at_cap_pct']:>5.1f}%  {row['reviews_mean']:>5.1f} {row['new_mean']:>5.1f}  "
+              f"{row['backlog_mean']:>7.1f} {row['backlog_p90']:>4}  {row['relearn_mean']:>7.1f}  "
+              f"{row['introduced_pct']:>5.1f}% {row['mastered_pct']:>7.1f}% {row['users_done_pct']:>5.1f}%{marker}")
+    median = summary["finish_day_median"]
+    print(f"\n  Done by target day: {summary['done_by_target_pct']}% of users "
+          f"({summary['done_by_end_pct']}% by day {summary['days']}, "
+          f"median day {median if median is not None else '-'})")
+
+
+def print_sweep(summaries: list[dict]) -> None:
+    print(f"\n  {'target':>6} {'cap':>4}  {'peak p99':>8} {'@cap':>6}  {'backlog@T':>9}  "
+          f"{'mastered@T':>10} {'done@T':>7} {'median day':>10}")
+    for s in summaries:
+        median = s["finish_day_median"]
+        print(f"  {s['settings']['target_days']:>6} {s['settings']['daily_cap']:>4}  {s['peak_queue_p99']:>8} "
+              f"{s['at_cap_user_days_pct']:>5.1f}%  {s['backlog_at_target_mean']:>9.1f}  "
+              f"{s['mastered_at_target_pct']:>9.1f}% {s['done_by_target_pct']:>6.1f}% "
+              f"{median if median is not None else '-':>10}")
+
+
+def main():
+    defaults = Population()
+    parser = argparse.ArgumentParser(description="Simulate the spaced-repetition plan for many users")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, help=f"Simulated users (default: {DEFAULT_USERS})")
+    parser.add_argument("--days", type=int, help="Days to simulate (default: twice the target)")
+    parser.add_argument("--target-days", type=int, nargs="+", default=[rules.DEFAULT_TARGET_DAYS],
+                        help="user_study_settings.target_days (several values = sweep)")
+    parser.add_argument("--daily-cap", type=int, nargs="+", default=[rules.DEFAULT_DAILY_CAP],
+                        help="user_study_settings.daily_cap (several values = sweep)")
+    parser.add_argument("--easy-bonus", type=int, default=0,
+                        help="Add this to easy problems' scores (production does not apply easy_bonus)")
+    parser.add_argument("--skill-mean", type=float, default=defaults.skill_mean)
+    parser.add_argument("--skill-sd", type=float, default=defaults.skill_sd)
+    parser.add_argument("--attempt-sd", type=float, default=defaults.attempt_sd)
+    parser.add_argument("--practice-gain", type=float, default=defaults.practice_gain)
+    parser.add_argument("--attendance", type=float, default=defaults.attendance,
+                        help="Chance a user studies on a given day")
+    parser.add_argument("--relearn-rate", type=float, default=defaults.relearn_rate,
+                        help="Chance per study day of re-attempting each relearn problem")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Users simulated together")
+    parser.add_argument("--json-out", help="Write the summaries to this JSON file")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Spaced Repetition Simulator")
+    print("=" * 60)
+
+    problems = load_seed_data()
+    population = Population(skill_mean=args.skill_mean, skill_sd=args.skill_sd, attempt_sd=args.attempt_sd,
+                            practice_gain=args.practice_gain, attendance=args.attendance,
+                            relearn_rate=args.relearn_rate)
+    grid = [StudySettings(target_days, daily_cap, args.easy_bonus)
+            for target_days, daily_cap in itertools.product(args.target_days, args.daily_cap)]
+
+    summaries = []
+    for settings in grid:
+        started = time.perf_counter()
+        metrics = simulate(problems, settings, population, args.users, args.days, args.seed, args.chunk_size)
+        elapsed = time.perf_counter() - started
+        summary = summarize(metrics, settings, len(problems))
+        summary["seconds"] = round(elapsed, 3)
+        summaries.append(summary)
+        if len(grid) == 1:
+            print_summary(summary)
+        print(f"\n  ⏱️  {args.users:,} users x {len(problems)} problems x {summary['days']} days "
+              f"in {elapsed:.2f}s (target_days={settings.target_days}, daily_cap={settings.daily_cap})")
+
+    if len(grid) > 1:
+        print_sweep(summaries)
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({"population": population._asdict(), "summaries": summaries}, f, indent=2)
+        print(f"\n💾 Summaries written to {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
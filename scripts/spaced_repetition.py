@@ -0,0 +1,116 @@
+"""
+Spaced-repetition scheduling rules, mirrored from services/spacedRepetitionService.ts.
+
+The app is the source of truth; this module restates its rules for the Python
+tooling (the simulator and batch jobs) so they schedule exactly like the
+home view does. Keep the two in step when the service changes.
+
+    calculateReviewsNeeded    -> calculate_reviews_needed
+    getScoreTier              -> score_tier
+    determineStatus           -> determine_status
+    buildSpacedRepetitionQueue pacing -> days_left / new_per_day
+    buildSpacedRepetitionQueue (default mode: no topic filter) -> build_queue
+"""
+
+import math
+from datetime import datetime
+
+# Score thresholds (SCORE_THRESHOLDS in the service)
+SCORE_EXCELLENT = 75  # 1 review required
+SCORE_PASSED = 70     # 2 reviews required; below this the problem must be relearned
+
+# user_study_settings defaults (DEFAULT_SETTINGS in the service)
+DEFAULT_TARGET_DAYS = 10
+DEFAULT_DAILY_CAP = 15
+DEFAULT_EASY_BONUS = 10  # Stored per user but not applied: difficulty adjustments were removed
+
+# New problems are scheduled as if the plan ended this many days early,
+# leaving the last days for reviews
+BUFFER_DAYS = 2
+
+# New problems are introduced easy -> hard, by title within a difficulty
+DIFFICULTY_ORDER = {"easy": 0, "medium": 1, "hard": 2}
+
+
+def calculate_reviews_needed(score: float) -> int:
+    """Reviews required after a teaching session (0 = relearn, not queued)."""
+    if score >= SCORE_EXCELLENT:
+        return 1
+    if score >= SCORE_PASSED:
+        return 2
+    return 0
+
+
+def score_tier(score: float) -> str:
+    if score >= SCORE_EXCELLENT:
+        return "excellent"
+    if score >= SCORE_PASSED:
+        return "passed"
+    return "relearn"
+
+
+def determine_status(reviews_completed: int, reviews_needed: int) -> str:
+    if reviews_needed == 0:
+        return "learning"  # Relearn
+    if reviews_completed >= reviews_needed:
+        return "mastered"
+    return "learning"
+
+
+def days_left(target_days: int, days_passed: int) -> int:
+    """Days remaining in the plan, counting today (days_passed is 1 on the start date)."""
+    return max(1, target_days - days_passed + 1)
+
+
+def new_per_day(remaining_new: int, target_days: int, days_passed: int) -> int:
+    """New problems to introduce today so the rest fit before the review buffer."""
+    effective_days_left = max(1, days_left(target_days, days_passed) - BUFFER_DAYS)
+    return math.ceil(remaining_new / effective_days_left)
+
+
+def introduction_order(problems: list[dict], sort_titles: bool = True) -> list[dict]:
+    """
+    Problems in the order the queue introduces them (fetchLeetcodeProblems sorts by title).
+
+    Pass sort_titles=False for rows that already come in the database's title
+    order, whose collation can differ from Python's string order.
+    """
+    by_title = sorted(problems, key=lambda problem: problem["title"]) if sort_titles else problems
+    return sorted(by_title, key=lambda problem: DIFFICULTY_ORDER[problem["difficulty"]])
+
+
+def is_due(progress: dict, due_before: datetime) -> bool:
+    """fetchDueReviews: scheduled before the cutoff, not mastered, reviews still needed."""
+    return (progress["next_review_at"] is not None
+            and progress["next_review_at"] < due_before
+            and progress["status"] not in ("mastered", "graduated")
+            and progress["reviews_completed"] < progress["reviews_needed"])
+
+
+def build_queue(problems: list[dict], progress: list[dict], target_days: int, daily_cap: int,
+                days_passed: int, due_before: datetime) -> tuple[list[str], list[str]]:
+    """
+    One user's daily queue, as buildSpacedRepetitionQueue builds it with no filters.
+
+    Args:
+        problems: {"title", "difficulty"} dicts in introduction_order()
+        progress: the user's user_problem_progress rows (problem_title, status,
+            reviews_needed, reviews_completed, next_review_at)
+        days_passed: calendar days since the plan's start date, 1 on the start date
+        due_before: reviews scheduled before this moment are due
+
+    Returns:
+        (review titles, new titles): due reviews, most overdue first, then new problems
+    """
+    titles = {problem["title"] for problem in problems}
+    due = sorted(
+        (row for row in progress if row["problem_title"] in titles and is_due(row, due_before)),
+        key=lambda row: (row["next_review_at"], row["problem_title"]),
+    )
+    reviews = [row["problem_title"] for row in due[:daily_cap]]
+
+    started = {row["problem_title"] for row in progress}
+    introduced = sum(1 for row in progress if row["problem_title"] in titles and row["status"] != "new")
+    slots = min(new_per_day(len(problems) - introduced, target_days, days_passed), daily_cap - len(reviews))
+    new = [problem["title"] for problem in problems if problem["title"] not in started][:max(0, slots)]
+    return reviews, new
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Sync blind_problems with scripts/seed_data/blind_problems.json, writing only what changed.
+
+Re-running a seed file rewrites every row, taking a row lock and leaving a dead
+tuple for each of them even when nothing changed. This tool instead:
+
+1. Fetches an md5 of every seed column of every row in ONE query
+2. Compares them with the md5s of the desired values locally
+3. Writes only the changed cells: one multi-row INSERT for missing problems and
+   one UPDATE ... FROM (VALUES ...) for changed ones, in one transaction
+
+so a one-hint edit costs one row update. After applying, the catalog bundle is
+republished (build_catalog_bundle.py) so the app does not keep serving old rows.
+
+Usage:
+    python sync_seed_data.py --dry-run                 # Show which rows/columns would change
+    python sync_seed_data.py --dry-run --diff          # ...with a text diff of each change
+    python sync_seed_data.py                           # Apply
+    python sync_seed_data.py --columns detailed_hint definition
+    python sync_seed_data.py --sql-out changes.sql     # Write the statements instead of applying
+
+Needs DATABASE_URL, see migrate.py.
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+
+from generate_seed_sql import (
+    INSERT_COLUMNS,
+    JSON_COLUMNS,
+    TABLE,
+    UPDATE_COLUMNS,
+    column_value,
+    load_seed_data,
+    sql_literal,
+)
+from migrate import connect
+
+SEED_COLUMNS = INSERT_COLUMNS + list(UPDATE_COLUMNS)
+# Columns whose SQL type is not text; VALUES literals are cast back to it
+COLUMN_CASTS = {**{column: "jsonb" for column in JSON_COLUMNS}, "leetcode_number": "integer"}
+
+
+def value_hash(column: str, value) -> str | None:
+    """md5 of a desired value, computed the way fetch_current_hashes() does server-side."""
+    value = column_value({column: value}, column)
+    if value is None:
+        return None
+    if column in JSON_COLUMNS:
+        # jsonb::text renders arrays as ["a", "b"], same as json.dumps defaults
+        value = json.dumps(json.loads(value), ensure_ascii=False)
+    return hashlib.md5(str(value).encode("utf-8")).hexdigest()
+
+
+def fetch_current_hashes(conn, columns: list[str]) -> dict[str, dict[str, str | None]]:
+    """
+    One query: {title: {column: md5 of the current value (None if NULL)}}.
+
+    Only hashes cross the wire, so the cost does not depend on hint length.
+    """
+    selects = ", ".join(f"md5({column}::text)" for column in columns)
+    rows = conn.execute(f"SELECT title, {selects} FROM {TABLE}").fetchall()
+    return {row[0]: dict(zip(columns, row[1:])) for row in rows}
+
+
+def fetch_current_values(conn, titles: list[str], columns: list[str]) -> dict[str, dict]:
+    """Full current values of a few rows (for --diff only)."""
+    if not titles:
+        return {}
+    rows = conn.execute(
+        f"SELECT title, {', '.join(f'{c}::text' for c in columns)} FROM {TABLE} WHERE title = ANY(%s)",
+        (titles,),
+    ).fetchall()
+    return {row[0]: dict(zip(columns, row[1:])) for row in rows}
+
+
+def diff_seed_data(desired: list[dict], current: dict[str, dict], columns: list[str]) -> dict:
+    """
+    Compare desired rows with current hashes.
+
+    Returns:
+        {"insert": [row, ...],
+         "update": [(row, [changed column, ...]), ...],
+         "unchanged": int,
+         "extra": [titles in the table but not in the data]}
+    """
+    plan = {"insert": [], "update": [], "unchanged": 0, "extra": []}
+    for row in desired:
+        hashes = current.get(row["title"])
+        if hashes is None:
+            plan["insert"].append(row)
+            continue
+        changed = [
+            column for column in columns
+            # NULL in the data never clears a column (same as the seed files)
+            if row.get(column) is not None and value_hash(column, row[column]) != hashes[column]
+        ]
+        if changed:
+            plan["update"].append((row, changed))
+        else:
+            plan["unchanged"] += 1
+
+    titles = {row["title"] for row in desired}
+    plan["extra"] = sorted(title for title in current if title not in titles)
+    return plan
+
+
+def build_update_sql(updates: list[tuple[dict, list[str]]]) -> str | None:
+    """
+    One UPDATE ... FROM (VALUES ...) for every changed row.
+
+    Each changed column travels with a flag, so cells that did not change in a
+    given row keep their current value even if another row changes that column.
+    """
+    if not updates:
+        return None
+    columns = [c for c in SEED_COLUMNS if any(c in changed for _, changed in updates)]
+    value_columns = ["title"] + [name for c in columns for name in (c, f"set_{c}")]
+
+    tuples = []
+    for row, changed in updates:
+        values = [row["title"]]
+        for column in columns:
+            values += [column_value(row, column) if column in changed else None, column in changed]
+        tuples.append("    (" + ", ".join(sql_literal(v) for v in values) + ")")
+
+    def new_value(column):
+        cast = f"::{COLUMN_CASTS[column]}" if column in COLUMN_CASTS else ""
+        return f"CASE WHEN v.set_{column} THEN v.{column}{cast} ELSE bp.{column} END"
+
+    assignments = ",\n    ".join(f"{column} = {new_value(column)}" for column in columns)
+    return (
+        f"UPDATE {TABLE} AS bp\nSET {assignments}\n"
+        f"FROM (VALUES\n" + ",\n".join(tuples) + f"\n) AS v({', '.join(value_columns)})\n"
+        f"WHERE bp.title = v.title;\n"
+    )
+
+
+def build_insert_sql(rows: list[dict]) -> str | None:
+    """One multi-row upsert for problems missing from the table."""
+    if not rows:
+        return None
+    # Seed columns added by later migrations ride along in the same statement
+    extra = [column for column in UPDATE_COLUMNS if any(row.get(column) is not None for row in rows)]
+    values = ",\n".join(
+        "    (" + ", ".join(sql_literal(column_value(row, c)) for c in INSERT_COLUMNS + extra) + ")"
+        for row in rows
+    )
+    updates = ",\n".join(f"    {c} = EXCLUDED.{c}" for c in INSERT_COLUMNS[1:] + extra)
+    return (
+        f"INSERT INTO {TABLE} ({', '.join(INSERT_COLUMNS + extra)})\n"
+        f"VALUES\n{values}\n"
+        f"ON CONFLICT (title) DO UPDATE SET\n{updates};\n"
+    )
+
+
+def print_plan(plan: dict, current_values: dict | None = None) -> None:
+    for row in plan["insert"]:
+        print(f"  ➕ insert  {row['title']}")
+    for row, changed in plan["update"]:
+        print(f"  ✏️  update  {row['title']}: {', '.join(changed)}")
+        if current_values is None:
+            continue
+        old_row = current_values.get(row["title"], {})
+        for column in changed:
+            new = column_value(row, column)
+            new = str(new) if new is not None else ""
+            old = old_row.get(column) or ""
+            for line in difflib.unified_diff(old.splitlines(), new.splitlines(),
+                                             f"{column} (database)", f"{column} (seed data)", lineterm="", n=1):
+                print(f"        {line}")
+    for title in plan["extra"]:
+        print(f"  ⚠️  extra   {title} (in the table, not in the seed data; left alone)")
+    print(f"\n  Sync: {len(plan['insert'])} insert, {len(plan['update'])} update "
+          f"({sum(len(c) for _, c in plan['update'])} cells), {plan['unchanged']} unchanged")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write only the blind_problems rows whose seed data changed")
+    parser.add_argument("--database-url", help="Postgres URL (default: $DATABASE_URL)")
+    parser.add_argument("--columns", nargs="+", choices=SEED_COLUMNS[1:],
+                        help="Only compare these columns (default: every seed column)")
+    parser.add_argument("--dry-run", action="store_true", help="Show the changes without applying them")
+    parser.add_argument("--diff", action="store_true", help="With --dry-run, show a text diff of each change")
+    parser.add_argument("--sql-out", help="Write the statements to this file instead of applying them")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Seed Data Sync (changed rows only)")
+    print("=" * 60)
+
+    columns = args.columns or SEED_COLUMNS[1:]
+    desired = load_seed_data()
+
+    conn = connect(args.database_url)
+    conn.autocommit = True  # The writes get their own transaction below
+    try:
+        print(f"\n🔍 Comparing {len(desired)} problems x {len(columns)} columns...\n")
+        plan = diff_seed_data(desired, fetch_current_hashes(conn, columns), columns)
+
+        current_values = None
+        if args.dry_run and args.diff:
+            current_values = fetch_current_values(conn, [row["title"] for row, _ in plan["update"]], columns)
+        print_plan(plan, current_values)
+
+        statements = [s for s in (build_insert_sql(plan["insert"]), build_update_sql(plan["update"])) if s]
+        if not statements:
+            print("\n  ✓ Nothing to write")
+            return
+        if args.sql_out:
+            with open(args.sql_out, "w", encoding="utf-8") as f:
+                f.write("BEGIN;\n\n" + "\n".join(statements) + "\nCOMMIT;\n")
+            print(f"\n💾 Statements written to {args.sql_out}")
+            return
+        if args.dry_run:
+            print("\n🔍 DRY RUN - nothing written")
+            return
+
+        with conn.transaction():
+            for statement in statements:
+                conn.execute(statement)
+        print(f"\n✅ Applied in {len(statements)} statement(s)")
+
+        from build_catalog_bundle import republish_after_write
+        republish_after_write(conn)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Synthetic scale data for benchmarking the Python tooling.
+
+The real inputs are small (75 questions, a few dozen images), so scaling
+problems only show up with generated data of the same shape: NeetCode-sheet
+CSVs, prompt libraries shaped like prompt_library.PROMPTS, and memories
+folders of versioned PNG stubs.
+"""
+
+import csv
+import random
+from pathlib import Path
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+CSV_CATEGORIES = [
+    "Arrays", "Binary", "Dynamic Programming", "Graph", "Interval",
+    "Linked List", "Matrix", "String", "Tree", "Heap",
+]
+
+NOTE_FRAGMENTS = [
+    "use hash map to check for the complement",
+    "sliding window over the string, shrink when invalid",
+    "two pointers, left/right at both ends",
+    "dfs from every unvisited cell, mark visited in-place",
+    "bfs level by level with a queue",
+    "dynamic programming: compute best answer for each prefix",
+    "binary search on the sorted half",
+    "min heap of size k keeps the largest elements",
+    "topological sort using indegree counts",
+    "xor all values so duplicates cancel out",
+    "prefix and suffix products in two passes",
+    "recursion with memoization to avoid recomputation",
+    "greedy: always extend the furthest reachable index",
+    "union find to merge connected components",
+    "trie of words, walk characters while searching",
+    "stack of open brackets, pop on close",
+]
+
+
+def write_synthetic_csv(path: Path, count: int, seed: int = 0) -> Path:
+    """
+    Write a NeetCode-sheet-shaped CSV with `count` unique questions.
+
+    Matches the layout parse_leetcode_csv() expects: a banner row, the
+    "Video Solution" header, then one row per question.
+    """
+    rng = random.Random(seed)
+    path = Path(path)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["A BETTER VERSION ->>", "https://neetcode.io/", "", "", ""])
+        writer.writerow(["Video Solution", "Category", "Name", "Link", "Notes"])
+        for i in range(1, count + 1):
+            slug = f"synthetic-problem-{i}"
+            notes = ", ".join(rng.sample(NOTE_FRAGMENTS, rng.randint(1, 4))) + ";"
+            writer.writerow([
+                f"https://youtu.be/synthetic{i:05d}",
+                rng.choice(CSV_CATEGORIES),
+                f"Synthetic Problem {i}",
+                f"https://leetcode.com/problems/{slug}/",
+                notes,
+            ])
+    return path
+
+
+def synthetic_filename(number: int, version: int = 1) -> str:
+    """Memories filename for a synthetic problem: 0141_synthetic_problem.png, then _v2, _v3..."""
+    suffix = f"_v{version}" if version > 1 else ""
+    return f"{number:04d}_synthetic_problem{suffix}.png"
+
+
+def synthetic_prompts(count: int, seed: int = 0) -> dict[int, dict]:
+    """A prompt library shaped like prompt_library.PROMPTS with `count` problems."""
+    rng = random.Random(seed)
+    prompts = {}
+    for number in range(1, count + 1):
+        paragraphs = [
+            " ".join(fragment.capitalize() + "." for fragment in rng.sample(NOTE_FRAGMENTS, 3))
+            for _ in range(rng.randint(2, 5))
+        ]
+        prompts[number] = {
+            "title": f"Synthetic Problem {number}",
+            "filename": synthetic_filename(number),
+            "punchline": rng.choice(NOTE_FRAGMENTS).capitalize() + "!",
+            "detailed_hint": "\n\n".join(paragraphs),
+        }
+    return prompts
+
+
+def write_synthetic_images(memories_dir: Path, count: int, image_bytes: int,
+                           max_versions: int = 3, seed: int = 0) -> None:
+    """Write `count` problems' worth of PNG stubs with 1..max_versions versions each."""
+    rng = random.Random(seed)
+    memories_dir.mkdir(parents=True, exist_ok=True)
+    for number in range(1, count + 1):
+        for version in range(1, rng.randint(1, max_versions) + 1):
+            body = rng.randbytes(max(image_bytes - len(PNG_HEADER), 0))
+            (memories_dir / synthetic_filename(number, version)).write_bytes(PNG_HEADER + body)
+
+
+def write_synthetic_memories(memories_dir: Path, file_count: int, max_versions: int = 3,
+                             seed: int = 0) -> int:
+    """
+    Fill a memories folder with exactly `file_count` header-only PNG stubs.
+
+    Problems get 1..max_versions versions each, so only the filenames vary;
+    use write_synthetic_images() when image sizes matter. Returns the number
+    of problems written.
+    """
+    rng = random.Random(seed)
+    memories_dir.mkdir(parents=True, exist_ok=True)
+    written = number = 0
+    while written < file_count:
+        number += 1
+        for version in range(1, min(rng.randint(1, max_versions), file_count - written) + 1):
+            (memories_dir / synthetic_filename(number, version)).write_bytes(PNG_HEADER)
+            written += 1
+    return number
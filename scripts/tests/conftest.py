@@ -0,0 +1,12 @@
+"""
+Tests for the scripts. They import each other as top-level modules, so the
+scripts directory goes on sys.path first. Run from the repository root:
+
+    python -m pytest scripts/tests
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPT_DIR))
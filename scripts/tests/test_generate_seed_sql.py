@@ -0,0 +1,37 @@
+"""Literal rendering in generate_seed_sql, checked by parsing it back with seed_sql."""
+
+import pytest
+
+import seed_sql
+from generate_seed_sql import sql_literal
+
+
+def parse_literal(literal: str):
+    [(kind, value)] = seed_sql.tokenize(literal)
+    assert kind == "literal"
+    return value
+
+
+def test_nul_is_rejected():
+    with pytest.raises(ValueError, match="NUL"):
+        sql_literal("before\x00after")
+
+
+@pytest.mark.parametrize("char", [chr(code) for code in range(1, 0x20)])
+def test_control_characters_round_trip(char):
+    value = f"a{char}b'\\c1"
+    literal = sql_literal(value)
+
+    assert parse_literal(literal) == value
+    if char != "\n":
+        # No raw control byte in the file: each one is escaped in an E'' literal
+        assert literal.startswith("E'")
+        assert char not in literal
+
+
+def test_escapes():
+    assert sql_literal("x\x01y") == "E'x\\x01y'"
+    assert sql_literal("tab\there") == "E'tab\\there'"
+    assert sql_literal("it's\nfine") == "'it''s\nfine'"
+    # A hex digit right after \x01 is not read as part of the escape
+    assert parse_literal(sql_literal("\x01f")) == "\x01f"
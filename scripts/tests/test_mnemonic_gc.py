@@ -0,0 +1,21 @@
+"""Retention order of mnemonic versions."""
+
+import mnemonic_gc
+from upload_mnemonics_to_supabase import parse_filename
+
+
+def test_same_version_copies_are_ordered_by_write_time():
+    # Two --immutable uploads of v2: the hash text sorts the older one last
+    older, newer = "141_cycle_v2.ffff000000000000.png", "141_cycle_v2.0000ffffffffffff.png"
+    written_at = {
+        "141_cycle_v1.png": "2026-01-01T00:00:00.000000Z",
+        older: "2026-02-01T00:00:00.000000Z",
+        newer: "2026-03-01T00:00:00.000000Z",
+    }
+
+    versions = mnemonic_gc.group_versions(written_at, parse_filename, written_at)[141]
+
+    assert [name for _, name in versions] == [newer, older, "141_cycle_v1.png"]
+    assert mnemonic_gc.select_superseded(written_at, parse_filename, 1, written_at=written_at) == [
+        "141_cycle_v1.png", older,
+    ]
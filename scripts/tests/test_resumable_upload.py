@@ -0,0 +1,69 @@
+"""Resumable uploads against tus_stub_server.py dropping connections on purpose."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import resumable_upload
+
+STUB_SERVER = Path(resumable_upload.__file__).parent / "tus_stub_server.py"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def flaky_server(tmp_path):
+    """tus_stub_server.py in its own process, dropping every 3rd PATCH halfway through."""
+    port = free_port()
+    storage_dir = tmp_path / "storage"
+    process = subprocess.Popen(
+        [sys.executable, str(STUB_SERVER),
+         "--port", str(port), "--storage-dir", str(storage_dir), "--fail-every", "3"],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("tus_stub_server.py did not start")
+                time.sleep(0.05)
+        yield f"http://127.0.0.1:{port}/files", storage_dir
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def test_upload_survives_repeated_drops(flaky_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(resumable_upload, "RETRY_BACKOFF_SECONDS", 0)
+    endpoint, storage_dir = flaky_server
+    source = tmp_path / "image.png"
+    source.write_bytes(os.urandom(64 * 1024 + 123))
+
+    # 17 chunks with every 3rd PATCH dropped fails far more often than
+    # max_retries, but each failure comes after progress, so it never gives up
+    upload = resumable_upload.ResumableUpload(
+        endpoint=endpoint,
+        filepath=source,
+        object_name="nested/image.png",
+        bucket="mnemonic-images",
+        chunk_size=4096,
+        state_dir=tmp_path / "state",
+        max_retries=2,
+    )
+    upload.upload()
+
+    assert (storage_dir / "mnemonic-images" / "nested" / "image.png").read_bytes() == source.read_bytes()
+    assert not upload.state_path.exists()
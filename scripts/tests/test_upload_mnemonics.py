@@ -0,0 +1,60 @@
+"""--bulk-db URL writes when set_mnemonic_image_urls() fails."""
+
+import upload_mnemonics_to_supabase as uploader
+from fake_supabase import FakeSupabase
+
+
+def make_client(rpc_failures: int) -> FakeSupabase:
+    """A client whose first rpc_failures RPC calls fail."""
+    calls = []
+
+    def fail_on(operation, detail):
+        if operation.startswith("rpc."):
+            calls.append(operation)
+            return len(calls) <= rpc_failures
+        return False
+
+    client = FakeSupabase(latency=0, fail_on=fail_on)
+    client.seed_table("blind_problems", [{"leetcode_number": n, "mnemonic_image_url": None} for n in range(1, 6)])
+    return client
+
+
+def urls_in(client: FakeSupabase) -> dict:
+    return {row["leetcode_number"]: row["mnemonic_image_url"] for row in client.tables["blind_problems"]}
+
+
+def test_failed_rpc_is_retried(monkeypatch):
+    monkeypatch.setattr(uploader, "BULK_DB_RETRY_BACKOFF_SECONDS", 0)
+    client = make_client(rpc_failures=uploader.BULK_DB_MAX_RETRIES)
+    urls = {n: f"https://cdn/{n}.png" for n in range(1, 6)}
+
+    assert uploader.write_deferred_urls(client, urls) == set()
+    assert urls_in(client) == urls
+    assert client.stats["table.update"] == 0
+
+
+def test_batch_falls_back_to_row_updates(monkeypatch):
+    monkeypatch.setattr(uploader, "BULK_DB_RETRY_BACKOFF_SECONDS", 0)
+    # Every retry of the first batch fails; the second batch goes through
+    client = make_client(rpc_failures=uploader.BULK_DB_MAX_RETRIES + 1)
+    urls = {n: f"https://cdn/{n}.png" for n in range(1, 6)}
+
+    assert uploader.write_deferred_urls(client, urls, batch_size=3) == set()
+    assert urls_in(client) == urls
+    assert client.stats["table.update"] == 3
+
+
+def test_upload_only_skips_repoints(tmp_path, monkeypatch):
+    from mnemonic_sync_plan import REPOINT, UPLOAD
+
+    monkeypatch.setattr(uploader, "MEMORIES_DIR", tmp_path)
+    (tmp_path / "001_two_sum_v2.png").write_bytes(b"png")
+    client = make_client(rpc_failures=0)
+    plan = {"actions": [
+        {"action": UPLOAD, "problem": 1, "filename": "001_two_sum_v2.png", "url": None, "update_url": True},
+        {"action": REPOINT, "problem": 2, "filename": "002_add_two_numbers.png",
+         "url": "https://cdn/2.png", "update_url": True},
+    ]}
+
+    assert uploader.execute_plan(client, plan, upload_only=True) == (1, 1)
+    assert urls_in(client)[2] is None
@@ -0,0 +1,199 @@
+"""
+Lightweight tracing for the scripts, saved as Chrome trace / Perfetto JSON.
+
+Spans are timed with perf_counter_ns and recorded per thread, so a whole
+batch - including concurrent uploads - shows up on one timeline:
+
+    import tracing
+
+    with tracing.span("upload_image", problem=141, bytes=len(data)) as span:
+        ...
+        span.set(attempt=2)
+
+    tracing.enable()
+    ...
+    tracing.save("trace.json")  # Open in https://ui.perfetto.dev or chrome://tracing
+
+Scripts expose this as --trace FILE (see add_argument / start_from_args), or
+set MICDROP_TRACE=FILE in the environment. When tracing is off, span() hands
+back one shared no-op object, so an instrumented call costs a global check.
+"""
+
+import atexit
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+TRACE_ENV_VAR = "MICDROP_TRACE"
+CATEGORY = "micdrop"
+
+_events: list | None = None  # None = tracing off
+_origin_ns = 0
+_threads: dict[int, tuple[int, str]] = {}
+
+
+class Span:
+    """A timed region; recorded when the with-block exits."""
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = f"{exc_type.__name__}: {exc}"
+        events = _events
+        if events is not None:
+            # list.append is atomic, so worker threads need no lock
+            events.append((self.name, self.start, end, _thread_id(), self.args))
+        return False
+
+    def set(self, **attrs) -> None:
+        """Add attributes known only partway through the span (bytes, attempt, ...)."""
+        self.args.update(attrs)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+def _thread_id() -> int:
+    ident = threading.get_ident()
+    entry = _threads.get(ident)
+    if entry is None:
+        entry = _threads.setdefault(ident, (len(_threads) + 1, threading.current_thread().name))
+    return entry[0]
+
+
+def span(name: str, **attrs):
+    """Context manager timing `name` with `attrs` as its arguments (no-op when tracing is off)."""
+    if _events is None:
+        return _NOOP
+    return Span(name, attrs)
+
+
+def traced(name: str | None = None, args: tuple[str, ...] = ()):
+    """
+    Decorator: run the function inside a span (named after it by default).
+
+    `args` names parameters to record as span attributes, e.g.
+    @traced(args=("leetcode_number",)).
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+        signature = inspect.signature(func) if args else None
+
+        @wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            if _events is None:
+                return func(*call_args, **call_kwargs)
+            attrs = {}
+            if signature is not None:
+                bound = signature.bind(*call_args, **call_kwargs)
+                bound.apply_defaults()
+                attrs = {arg: bound.arguments.get(arg) for arg in args}
+            with Span(span_name, attrs):
+                return func(*call_args, **call_kwargs)
+        return wrapper
+    return decorator
+
+
+def enable() -> None:
+    """Start recording spans (clears anything recorded before)."""
+    global _events, _origin_ns
+    _origin_ns = time.perf_counter_ns()
+    _threads.clear()
+    _events = []
+
+
+def disable() -> None:
+    global _events
+    _events = None
+
+
+def is_enabled() -> bool:
+    return _events is not None
+
+
+def to_chrome_trace(process_name: str | None = None) -> dict:
+    """The recorded spans in Chrome's Trace Event Format (complete "X" events, microseconds)."""
+    pid = os.getpid()
+    events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+               "args": {"name": process_name or Path(sys.argv[0]).stem or "python"}}]
+    events += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+               for tid, thread_name in list(_threads.values())]
+    for name, start, end, tid, args in list(_events or ()):
+        events.append({
+            "name": name, "cat": CATEGORY, "ph": "X", "pid": pid, "tid": tid,
+            "ts": (start - _origin_ns) / 1000, "dur": (end - start) / 1000, "args": args,
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def save(path, process_name: str | None = None) -> int:
+    """Write the trace JSON; returns the number of spans."""
+    trace = to_chrome_trace(process_name)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(trace, default=str))
+    return sum(1 for event in trace["traceEvents"] if event["ph"] == "X")
+
+
+def summarize() -> list[tuple[str, int, float, float]]:
+    """(name, count, total ms, max ms) per span name, slowest total first."""
+    totals: dict[str, list] = {}
+    for name, start, end, _, _ in list(_events or ()):
+        entry = totals.setdefault(name, [0, 0, 0])
+        entry[0] += 1
+        entry[1] += end - start
+        entry[2] = max(entry[2], end - start)
+    return sorted(((name, count, total / 1e6, longest / 1e6) for name, (count, total, longest) in totals.items()),
+                  key=lambda row: -row[2])
+
+
+def add_argument(parser) -> None:
+    """Add the --trace FILE option to a script's argument parser."""
+    parser.add_argument("--trace", type=Path, metavar="FILE",
+                        help=f"Record spans to a Chrome/Perfetto trace JSON file (or set ${TRACE_ENV_VAR})")
+
+
+def start_from_args(args) -> Path | None:
+    """Enable tracing if --trace or $MICDROP_TRACE asks for it; the trace is saved at exit."""
+    path = getattr(args, "trace", None) or os.getenv(TRACE_ENV_VAR)
+    if not path:
+        return None
+    path = Path(path)
+    enable()
+
+    def finish():
+        count = save(path)
+        print(f"\n🧵 Trace: {count} spans written to {path} (open in https://ui.perfetto.dev)")
+        for name, calls, total_ms, max_ms in summarize()[:8]:
+            print(f"   {name:<28} {calls:>5}x  {total_ms:>10.1f} ms total  {max_ms:>8.1f} ms max")
+
+    atexit.register(finish)
+    return path
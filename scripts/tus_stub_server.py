@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for Supabase Storage's TUS (resumable upload) endpoint.
+
+Implements the subset of TUS 1.0.0 that resumable_upload.py uses (creation,
+HEAD offset lookup, PATCH chunks, termination) and writes finished objects to
+a local directory laid out as <storage-dir>/<bucket>/<object>. It can drop
+connections on purpose to exercise resume logic without a flaky network.
+
+Usage:
+    python tus_stub_server.py                                 # Serve on 127.0.0.1:1080
+    python tus_stub_server.py --port 8080 --storage-dir /tmp/tus
+    python tus_stub_server.py --fail-every 3                  # Drop every 3rd PATCH mid-request
+
+Then point the uploader at it:
+    python resumable_upload.py big.png --endpoint http://127.0.0.1:1080/files
+
+In-process use:
+    server = start_stub_server(storage_dir)
+    ...
+    server.shutdown()
+"""
+
+import base64
+import argparse
+import threading
+import uuid
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TUS_VERSION = "1.0.0"
+UPLOAD_PATH = "/files"
+
+
+def decode_metadata(header: str) -> dict[str, str]:
+    """Decode a TUS Upload-Metadata header value."""
+    metadata = {}
+    for pair in filter(None, (p.strip() for p in header.split(","))):
+        key, _, value = pair.partition(" ")
+        metadata[key] = base64.b64decode(value).decode("utf-8") if value else ""
+    return metadata
+
+
+class TusStubServer(ThreadingHTTPServer):
+    """HTTP server holding the state of in-progress uploads."""
+
+    daemon_threads = True
+
+    def __init__(self, address, storage_dir: Path, fail_every: int = 0):
+        super().__init__(address, TusRequestHandler)
+        self.storage_dir = Path(storage_dir)
+        self.fail_every = fail_every
+        self.uploads = {}  # {upload_id: {"length", "offset", "metadata", "path"}}
+        self.patch_count = 0
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{UPLOAD_PATH}"
+
+    def object_path(self, bucket: str, object_name: str) -> Path:
+        return self.storage_dir / bucket / object_name
+
+
+class TusRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # Keep test output quiet
+
+    def _reply(self, status: int, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Tus-Resumable", TUS_VERSION)
+        self.send_header("Content-Length", "0")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+
+    def _upload_id(self) -> str | None:
+        prefix = f"{UPLOAD_PATH}/"
+        if not self.path.startswith(prefix):
+            return None
+        return self.path[len(prefix):] or None
+
+    def do_OPTIONS(self):
+        self._reply(204, {
+            "Tus-Version": TUS_VERSION,
+            "Tus-Extension": "creation,termination",
+        })
+
+    def do_POST(self):
+        if self.path.rstrip("/") != UPLOAD_PATH:
+            return self._reply(404)
+        try:
+            length = int(self.headers["Upload-Length"])
+        except (TypeError, ValueError):
+            return self._reply(400)
+
+        metadata = decode_metadata(self.headers.get("Upload-Metadata", ""))
+        bucket = metadata.get("bucketName", "default")
+        object_name = metadata.get("objectName") or uuid.uuid4().hex
+
+        target = self.server.object_path(bucket, object_name)
+        if target.exists() and self.headers.get("x-upsert") != "true":
+            return self._reply(409)
+
+        upload_id = uuid.uuid4().hex
+        partial = self.server.storage_dir / ".partial" / upload_id
+        partial.parent.mkdir(parents=True, exist_ok=True)
+        partial.write_bytes(b"")
+
+        with self.server.lock:
+            self.server.uploads[upload_id] = {
+                "length": length,
+                "offset": 0,
+                "metadata": metadata,
+                "partial": partial,
+                "target": target,
+            }
+        self._reply(201, {"Location": f"{UPLOAD_PATH}/{upload_id}"})
+
+    def do_HEAD(self):
+        upload = self.server.uploads.get(self._upload_id())
+        if upload is None:
+            return self._reply(404)
+        self._reply(200, {
+            "Upload-Offset": str(upload["offset"]),
+            "Upload-Length": str(upload["length"]),
+            "Cache-Control": "no-store",
+        })
+
+    def do_PATCH(self):
+        upload = self.server.uploads.get(self._upload_id())
+        length = int(self.headers.get("Content-Length", 0))
+        if upload is None:
+            self.rfile.read(length)
+            return self._reply(404)
+        if self.headers.get("Content-Type") != "application/offset+octet-stream":
+            self.rfile.read(length)
+            return self._reply(415)
+        if int(self.headers.get("Upload-Offset", -1)) != upload["offset"]:
+            self.rfile.read(length)
+            return self._reply(409)
+
+        with self.server.lock:
+            self.server.patch_count += 1
+            drop = self.server.fail_every and self.server.patch_count % self.server.fail_every == 0
+
+        if drop:
+            # Accept half the chunk, then hang up without answering
+            data = self.rfile.read(length // 2)
+            with open(upload["partial"], "ab") as f:
+                f.write(data)
+            upload["offset"] += len(data)
+            self.close_connection = True
+            return
+
+        data = self.rfile.read(length)
+        with open(upload["partial"], "ab") as f:
+            f.write(data)
+        upload["offset"] += len(data)
+
+        if upload["offset"] >= upload["length"]:
+            upload["target"].parent.mkdir(parents=True, exist_ok=True)
+            upload["partial"].replace(upload["target"])
+
+        self._reply(204, {"Upload-Offset": str(upload["offset"])})
+
+    def do_DELETE(self):
+        upload_id = self._upload_id()
+        with self.server.lock:
+            upload = self.server.uploads.pop(upload_id, None)
+        if upload is None:
+            return self._reply(404)
+        upload["partial"].unlink(missing_ok=True)
+        self._reply(204)
+
+
+def start_stub_server(storage_dir: Path, host: str = "127.0.0.1", port: int = 0,
+                      fail_every: int = 0) -> TusStubServer:
+    """Start the stand-in server on a background thread (port 0 picks a free port)."""
+    server = TusStubServer((host, port), storage_dir, fail_every=fail_every)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local TUS stand-in for Supabase Storage")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=1080, help="Port (default: 1080)")
+    parser.add_argument("--storage-dir", type=Path, default=Path("tus_storage"),
+                        help="Where finished objects are written (default: ./tus_storage)")
+    parser.add_argument("--fail-every", type=int, default=0,
+                        help="Drop every Nth PATCH request halfway through (default: never)")
+
+    args = parser.parse_args()
+
+    server = TusStubServer((args.host, args.port), args.storage_dir, fail_every=args.fail_every)
+    print(f"🧪 TUS stand-in listening on {server.endpoint}")
+    print(f"   Objects written to: {args.storage_dir.resolve()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,24 @@ Upload mnemonic images to Supabase Storage and update blind_problems table.
 This script:
 1. Finds all images in the memories folder
 2. Identifies the LATEST version of each image (e.g., _v3 over _v2 over base)
-3. Uploads them to Supabase Storage bucket 'mnemonic-images'
-4. Updates the blind_problems table with the public URL
+3. Plans the sync against what is already published (see mnemonic_sync_plan.py)
+4. Uploads only new/changed images to Supabase Storage bucket 'mnemonic-images'
+5. Points the blind_problems table at the public URL where it differs
 
 Usage:
-    python upload_mnemonics_to_supabase.py                 # Upload all latest images
-    python upload_mnemonics_to_supabase.py --dry-run      # Preview what would be uploaded
+    python upload_mnemonics_to_supabase.py                 # Sync all latest images
+    python upload_mnemonics_to_supabase.py --dry-run      # Show the exact plan without changing anything
+    python upload_mnemonics_to_supabase.py --dry-run --plan-out plan.json  # Save the plan for review
+    python upload_mnemonics_to_supabase.py --apply-plan plan.json          # Run a reviewed plan
+    python upload_mnemonics_to_supabase.py --force        # Re-upload everything, even unchanged images
+    python upload_mnemonics_to_supabase.py --workers 8 --bulk-db  # Concurrent uploads, one bulk URL update
+    python upload_mnemonics_to_supabase.py --immutable    # Content-hashed names, cacheable for a year
+    python upload_mnemonics_to_supabase.py --gc --dry-run # Show superseded versions that would be deleted
+    python upload_mnemonics_to_supabase.py --gc --keep 2 --archive-local ../memories_archive
     python upload_mnemonics_to_supabase.py --problem 141  # Upload specific problem
+    python upload_mnemonics_to_supabase.py --resumable    # Chunked TUS uploads that survive dropped connections
+    python upload_mnemonics_to_supabase.py --workers 8 --trace trace.json  # Timeline of every upload/DB call
+    python upload_mnemonics_to_supabase.py --workers 8 --profile-memory --memory-limit 256  # Memory report, 256 MB ceiling
 
 Prerequisites:
     pip install supabase python-dotenv
@@ -25,12 +36,27 @@ Environment variables (in .env.local or .env):
 import os
 import re
 import sys
+import time
+import hashlib
 import argparse
 from pathlib import Path
 
+from problem_catalog import get_catalog
+import tracing
+import memory_profile
+
 # Configuration
 MEMORIES_DIR = Path(__file__).parent.parent / "memories"
 BUCKET_NAME = "mnemonic-images"
+# Content-hashed (--immutable) objects never change, so caches may keep them for a year
+IMMUTABLE_CACHE_SECONDS = 31536000
+CONTENT_HASH_LENGTH = 16
+# --bulk-db: rows per set_mnemonic_image_urls() call, and retries of a failed
+# call (backoff doubling from BULK_DB_RETRY_BACKOFF_SECONDS) before that
+# batch falls back to one UPDATE per row
+BULK_DB_BATCH_SIZE = 500
+BULK_DB_MAX_RETRIES = 3
+BULK_DB_RETRY_BACKOFF_SECONDS = 0.5
 
 # Lazy imports - only load heavy dependencies when needed
 _supabase_client = None
@@ -83,6 +109,7 @@ def parse_filename(filename: str) -> tuple[int, int, str]:
         003_longest_substring_v2.png -> (3, 2, "003_longest_substring_v2.png")
         003_longest_substring_v3.png -> (3, 3, "003_longest_substring_v3.png")
         141_linked_list_detection_v2.png -> (141, 2, "141_linked_list_detection_v2.png")
+        141_linked_list_detection_v2.3f9a0c1e2b4d5f60.png -> (141, 2, ...)
     
     Returns:
         (problem_number, version, filename)
@@ -94,8 +121,9 @@ def parse_filename(filename: str) -> tuple[int, int, str]:
     
     problem_number = int(match.group(1))
     
-    # Extract version if present (e.g., "_v2", "_v3")
-    version_match = re.search(r'_v(\d+)\.png$', filename)
+    # Extract version if present (e.g., "_v2", "_v3"), also in content-hashed
+    # object names like "141_linked_list_cycle_v2.3f9a0c1e2b4d5f60.png"
+    version_match = re.search(r'_v(\d+)(?:\.[0-9a-f]{%d})?\.png$' % CONTENT_HASH_LENGTH, filename)
     version = int(version_match.group(1)) if version_match else 0
     
     return (problem_number, version, filename)
@@ -134,56 +162,113 @@ def get_latest_images() -> dict[int, str]:
     return latest
 
 
-def upload_image(supabase, filename: str, dry_run: bool = False) -> str | None:
+def content_hashed_name(filename: str) -> str:
+    """
+    Immutable object name for a local image: the filename with a short
+    SHA-256 of its content inserted before the extension.
+    
+    Example:
+        141_linked_list_cycle_v2.png -> 141_linked_list_cycle_v2.3f9a0c1e2b4d5f60.png
+    """
+    digest = hashlib.sha256()
+    with open(MEMORIES_DIR / filename, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    base, ext = os.path.splitext(filename)
+    return f"{base}.{digest.hexdigest()[:CONTENT_HASH_LENGTH]}{ext}"
+
+
+@tracing.traced(args=("filename", "object_name", "resumable", "immutable"))
+def upload_image(supabase, filename: str, dry_run: bool = False, resumable: bool = False,
+                 object_name: str | None = None, immutable: bool = False) -> str | None:
     """
     Upload an image to Supabase Storage.
     
+    With resumable=True the file is streamed from disk in chunks over TUS
+    (see resumable_upload.py), so it is never fully held in memory and an
+    interrupted upload picks up where it left off.
+    
+    With immutable=True the image is stored under object_name (its
+    content-hashed name) with a one-year cache lifetime. Content-addressed
+    objects never change, so nothing is removed first.
+    
     Returns:
         Public URL of the uploaded image, or None if dry run.
     """
     filepath = MEMORIES_DIR / filename
+    object_name = object_name or filename
     
     if not filepath.exists():
         print(f"❌ File not found: {filepath}")
         return None
     
     if dry_run:
-        print(f"  📁 Would upload: {filename}")
-        return f"https://example.com/{BUCKET_NAME}/{filename}"
+        print(f"  📁 Would upload: {object_name}")
+        return f"https://example.com/{BUCKET_NAME}/{object_name}"
+    
+    cache_control = str(IMMUTABLE_CACHE_SECONDS) if immutable else None
+    
+    if resumable:
+        from resumable_upload import upload_file_resumable, TusUploadError
+        try:
+            with tracing.span("tus.upload", object=object_name, bytes=filepath.stat().st_size):
+                upload_file_resumable(filepath, object_name, bucket=BUCKET_NAME, cache_control=cache_control)
+            public_url = supabase.storage.from_(BUCKET_NAME).get_public_url(object_name)
+            print(f"  ✅ Uploaded (resumable): {object_name}")
+            return public_url
+        except (TusUploadError, OSError) as e:
+            print(f"  ❌ Failed to upload {object_name}: {e}")
+            return None
     
     # Read the image
-    with open(filepath, "rb") as f:
-        file_data = f.read()
+    with tracing.span("read", file=filename) as span:
+        with open(filepath, "rb") as f:
+            file_data = f.read()
+        span.set(bytes=len(file_data))
+    memory_profile.checkpoint(f"read {filename}")
     
     # Upload to Supabase Storage (upsert to overwrite if exists)
     try:
-        # First try to remove existing file (ignore errors if doesn't exist)
-        try:
-            supabase.storage.from_(BUCKET_NAME).remove([filename])
-        except Exception:
-            pass
+        file_options = {"content-type": "image/png"}
+        if immutable:
+            # Same name always means same bytes, so an upsert is safe and idempotent
+            file_options["cache-control"] = cache_control
+            file_options["upsert"] = "true"
+        else:
+            # First try to remove existing file (ignore errors if doesn't exist)
+            try:
+                with tracing.span("storage.remove", object=object_name):
+                    supabase.storage.from_(BUCKET_NAME).remove([object_name])
+            except Exception:
+                pass
         
         # Upload the file
-        supabase.storage.from_(BUCKET_NAME).upload(
-            path=filename,
-            file=file_data,
-            file_options={"content-type": "image/png"}
-        )
+        with tracing.span("storage.upload", object=object_name, bytes=len(file_data)):
+            supabase.storage.from_(BUCKET_NAME).upload(
+                path=object_name,
+                file=file_data,
+                file_options=file_options
+            )
         
         # Get public URL
-        public_url = supabase.storage.from_(BUCKET_NAME).get_public_url(filename)
-        print(f"  ✅ Uploaded: {filename}")
+        public_url = supabase.storage.from_(BUCKET_NAME).get_public_url(object_name)
+        print(f"  ✅ Uploaded: {object_name}")
         return public_url
         
     except Exception as e:
-        print(f"  ❌ Failed to upload {filename}: {e}")
+        print(f"  ❌ Failed to upload {object_name}: {e}")
         return None
 
 
-def update_problem_url(supabase, leetcode_number: int, image_url: str, dry_run: bool = False) -> bool:
+@tracing.traced(args=("leetcode_number", "check_exists"))
+def update_problem_url(supabase, leetcode_number: int, image_url: str, dry_run: bool = False,
+                       check_exists: bool = True) -> bool:
     """
     Update the blind_problems table with the mnemonic image URL.
     
+    check_exists=False skips the existence query (the sync planner has
+    already confirmed the row exists).
+    
     Returns:
         True if successful, False otherwise.
     """
@@ -192,21 +277,24 @@ def update_problem_url(supabase, leetcode_number: int, image_url: str, dry_run:
         return True
     
     try:
-        # First check if the problem exists
-        check = supabase.table("blind_problems").select("leetcode_number, title").eq("leetcode_number", leetcode_number).execute()
-        
-        print(f"  🔍 DEBUG: Query result for #{leetcode_number}: {check.data}")
-        
-        if not check.data or len(check.data) == 0:
-            print(f"  ⚠️  No problem found with leetcode_number={leetcode_number}")
-            return False
-        
-        print(f"  ✓ Found: {check.data[0].get('title', 'Unknown')}")
+        if check_exists:
+            # First check if the problem exists
+            with tracing.span("blind_problems.select", problem=leetcode_number):
+                check = supabase.table("blind_problems").select("leetcode_number, title").eq("leetcode_number", leetcode_number).execute()
+            
+            print(f"  🔍 DEBUG: Query result for #{leetcode_number}: {check.data}")
+            
+            if not check.data or len(check.data) == 0:
+                print(f"  ⚠️  No problem found with leetcode_number={leetcode_number}")
+                return False
+            
+            print(f"  ✓ Found: {check.data[0].get('title', 'Unknown')}")
         
         # Update the record
-        result = supabase.table("blind_problems").update(
-            {"mnemonic_image_url": image_url}
-        ).eq("leetcode_number", leetcode_number).execute()
+        with tracing.span("blind_problems.update", problem=leetcode_number):
+            result = supabase.table("blind_problems").update(
+                {"mnemonic_image_url": image_url}
+            ).eq("leetcode_number", leetcode_number).execute()
         
         # Update doesn't return data by default, just check if it didn't error
         print(f"  📝 Updated problem #{leetcode_number}")
@@ -227,15 +315,198 @@ def get_public_url_for_filename(supabase, filename: str) -> str:
     return supabase.storage.from_(BUCKET_NAME).get_public_url(filename)
 
 
+@tracing.traced(args=("force", "immutable"))
+def plan_sync(supabase, latest_images: dict[int, str], force: bool = False, immutable: bool = False) -> dict:
+    """
+    Build a sync plan from one bucket listing and one blind_problems select.
+    
+    With immutable=True each image is planned under its content-hashed
+    object name (see content_hashed_name()).
+    """
+    from mnemonic_sync_plan import build_plan, fetch_bucket_listing, fetch_problem_urls
+    
+    listing = fetch_bucket_listing(supabase, BUCKET_NAME)
+    problem_urls = fetch_problem_urls(supabase)
+    return build_plan(
+        latest_images,
+        MEMORIES_DIR,
+        listing,
+        problem_urls,
+        public_url=lambda name: get_public_url_for_filename(supabase, name),
+        bucket=BUCKET_NAME,
+        force=force,
+        object_name=content_hashed_name if immutable else None,
+    )
+
+
+def bulk_update_problem_urls(supabase, urls: dict[int, str]) -> int:
+    """
+    Point many problems at new mnemonic URLs in a single call.
+    
+    Uses the set_mnemonic_image_urls() function from
+    supabase-add-bulk-mnemonic-urls.sql, which only writes rows whose URL
+    actually changes.
+    
+    Returns:
+        Number of rows updated.
+    """
+    payload = [{"leetcode_number": n, "url": url} for n, url in sorted(urls.items())]
+    with tracing.span("bulk_update_problem_urls", rows=len(payload)):
+        result = supabase.rpc("set_mnemonic_image_urls", {"updates": payload}).execute()
+    return result.data or 0
+
+
+def write_deferred_urls(supabase, urls: dict[int, str], batch_size: int = BULK_DB_BATCH_SIZE) -> set[int]:
+    """
+    Write --bulk-db URL changes in batches of one RPC call each.
+    
+    A failed call is retried with backoff; a batch whose retries are all
+    used up is written one UPDATE per row instead, so one bad call costs a
+    slower batch rather than every URL in it.
+    
+    Returns:
+        Problem numbers whose URL could not be written.
+    """
+    numbers = sorted(urls)
+    failed = set()
+    for start in range(0, len(numbers), batch_size):
+        batch = {n: urls[n] for n in numbers[start:start + batch_size]}
+        for attempt in range(BULK_DB_MAX_RETRIES + 1):
+            try:
+                updated = bulk_update_problem_urls(supabase, batch)
+                print(f"  📝 Bulk-updated {updated} problem URLs")
+                break
+            except Exception as e:
+                if attempt == BULK_DB_MAX_RETRIES:
+                    print(f"  ⚠️  Bulk URL update failed {attempt + 1} times ({e}); "
+                          f"updating {len(batch)} problems one by one")
+                    failed.update(
+                        n for n, url in batch.items()
+                        if not update_problem_url(supabase, n, url, check_exists=False)
+                    )
+                    break
+                delay = BULK_DB_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+                print(f"  🔁 Bulk URL update failed ({e}), retrying in {delay:.1f}s "
+                      f"({attempt + 1}/{BULK_DB_MAX_RETRIES})")
+                time.sleep(delay)
+    return failed
+
+
+def _apply_action(supabase, action: dict, upload_only: bool, resumable: bool, defer_url: bool,
+                  immutable: bool = False):
+    """
+    Run one plan action.
+    
+    Returns:
+        (ok, deferred) where deferred is the URL still to be written when
+        defer_url is set, else None.
+    """
+    from mnemonic_sync_plan import UPLOAD
+    
+    problem_number = action["problem"]
+    filename = action["filename"]
+    print(f"Problem #{problem_number}: {filename} ({action['action']})")
+    
+    image_url = action["url"]
+    if action["action"] == UPLOAD:
+        image_url = upload_image(supabase, filename, resumable=resumable,
+                                 object_name=action.get("object"), immutable=immutable)
+        if not image_url:
+            return False, None
+    
+    if not action["update_url"] or upload_only:
+        return True, None
+    if defer_url:
+        return True, image_url
+    return update_problem_url(supabase, problem_number, image_url, check_exists=False), None
+
+
+def execute_plan(supabase, plan: dict, upload_only: bool = False, resumable: bool = False,
+                 workers: int = 1, bulk_db: bool = False) -> tuple[int, int]:
+    """
+    Run the upload and repoint actions of a plan.
+    
+    Args:
+        workers: number of actions to run concurrently (1 = serial; fewer
+            near a --memory-limit ceiling)
+        bulk_db: collect URL changes and write them with one RPC call per
+            BULK_DB_BATCH_SIZE rows at the end instead of one UPDATE per
+            problem (see write_deferred_urls())
+    
+    Returns:
+        (succeeded, attempted) counts of actions that needed work. With
+        upload_only, REPOINT actions (database writes only) are reported
+        as skipped and counted in neither.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from mnemonic_sync_plan import UPLOAD, REPOINT
+    
+    pending = [a for a in plan["actions"] if a["action"] in (UPLOAD, REPOINT)]
+    if upload_only:
+        for action in pending:
+            if action["action"] == REPOINT:
+                print(f"Problem #{action['problem']}: {action['filename']} (repoint skipped, --upload-only)")
+        pending = [a for a in pending if a["action"] == UPLOAD]
+    limiter = memory_profile.limiter(workers)
+    
+    def run(action):
+        try:
+            with limiter, memory_profile.item(f"#{action['problem']}"), \
+                    tracing.span("sync_problem", problem=action["problem"], action=action["action"]):
+                return _apply_action(supabase, action, upload_only, resumable, defer_url=bulk_db,
+                                     immutable=plan.get("immutable", False))
+        except Exception as e:
+            print(f"  ❌ #{action['problem']} failed: {e}")
+            return False, None
+    
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run, pending))
+    else:
+        results = [run(action) for action in pending]
+    
+    deferred = {
+        action["problem"]: url
+        for action, (ok, url) in zip(pending, results)
+        if ok and url
+    }
+    if deferred:
+        failed = write_deferred_urls(supabase, deferred)
+        results = [
+            (False, None) if url and action["problem"] in failed else (ok, url)
+            for action, (ok, url) in zip(pending, results)
+        ]
+    
+    success_count = sum(1 for ok, _ in results if ok)
+    return success_count, len(pending)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Upload mnemonic images to Supabase")
-    parser.add_argument("--dry-run", action="store_true", help="Preview without uploading")
+    parser.add_argument("--dry-run", action="store_true", help="Plan against remote state without changing anything")
     parser.add_argument("--problem", type=int, help="Upload specific problem number only")
     parser.add_argument("--upload-only", action="store_true", help="Upload to storage only, don't update table")
     parser.add_argument("--update-urls-only", action="store_true", help="Update database URLs only (skip upload, assumes images exist in storage)")
     parser.add_argument("--list", action="store_true", help="List latest images without uploading")
+    parser.add_argument("--resumable", action="store_true", help="Use chunked, resumable TUS uploads (streams from disk)")
+    parser.add_argument("--immutable", action="store_true",
+                        help="Store images under content-hashed names with a one-year cache lifetime")
+    parser.add_argument("--force", action="store_true", help="Upload every latest image even if the bucket copy is identical")
+    parser.add_argument("--plan-out", type=Path, help="Write the sync plan to a JSON file for review")
+    parser.add_argument("--apply-plan", type=Path, help="Apply a previously saved plan instead of planning again")
+    parser.add_argument("--workers", type=int, default=1, help="Number of concurrent uploads (default: 1)")
+    parser.add_argument("--gc", action="store_true", help="Delete superseded image versions from the bucket")
+    parser.add_argument("--keep", type=int, default=1, help="Versions to keep per problem when collecting (default: 1)")
+    parser.add_argument("--prune-local", action="store_true", help="With --gc, also delete superseded local versions")
+    parser.add_argument("--archive-local", type=Path, help="With --gc, move superseded local versions here instead")
+    parser.add_argument("--bulk-db", action="store_true",
+                        help="Write all URL changes in one call (needs supabase-add-bulk-mnemonic-urls.sql)")
+    tracing.add_argument(parser)
+    memory_profile.add_arguments(parser)
     
     args = parser.parse_args()
+    tracing.start_from_args(args)
+    memory_profile.start_from_args(args)
     
     print("=" * 60)
     print("Mnemonic Image Uploader for Supabase")
@@ -243,13 +514,22 @@ def main():
     
     # Get latest images
     print("\n🔍 Scanning memories folder...")
-    latest_images = get_latest_images()
+    with memory_profile.stage("scan"):
+        latest_images = get_latest_images()
+    
+    if args.gc:
+        run_gc(keep=args.keep, prune_local=args.prune_local, archive_dir=args.archive_local,
+               dry_run=args.dry_run)
+        return
     
     if args.list:
         print(f"\n📋 Latest images ({len(latest_images)} problems):\n")
+        catalog = get_catalog()
         for problem_number in sorted(latest_images.keys()):
             filename = latest_images[problem_number]
-            print(f"  #{problem_number:3d}: {filename}")
+            record = catalog.get(problem_number)
+            title = f"  ({record['title']})" if record else ""
+            print(f"  #{problem_number:3d}: {filename}{title}")
         return
     
     # Filter to specific problem if requested
@@ -259,55 +539,151 @@ def main():
             return
         latest_images = {args.problem: latest_images[args.problem]}
     
+    if args.update_urls_only:
+        update_urls_only(latest_images, dry_run=args.dry_run)
+        return
+    
+    from mnemonic_sync_plan import filter_plan, load_plan, print_plan, save_plan
+    
+    print("\n🔌 Connecting to Supabase...")
+    supabase = get_supabase_client()
+    
+    if args.apply_plan:
+        print(f"\n📄 Loading plan: {args.apply_plan}")
+        plan = load_plan(args.apply_plan)
+    else:
+        print("\n🧭 Planning against bucket and blind_problems...")
+        with memory_profile.stage("plan"):
+            plan = plan_sync(supabase, latest_images, force=args.force, immutable=args.immutable)
+    
+    if args.problem:
+        plan = filter_plan(plan, {args.problem})
+    
+    print()
+    print_plan(plan)
+    
+    if args.plan_out:
+        save_plan(plan, args.plan_out)
+        print(f"\n💾 Plan written to {args.plan_out}")
+    
     if args.dry_run:
-        print("\n🏃 DRY RUN - No changes will be made\n")
+        print("\n🏃 DRY RUN - No changes were made")
+        return
     
-    if args.update_urls_only:
-        print("\n📝 UPDATE URLS ONLY - Skipping upload, updating database with existing storage URLs\n")
+    print("\n📤 Applying plan...\n")
+    with memory_profile.stage("execute"):
+        success_count, attempted = execute_plan(
+            supabase, plan, upload_only=args.upload_only, resumable=args.resumable,
+            workers=args.workers, bulk_db=args.bulk_db,
+        )
+    
+    skipped_repoints = plan["summary"]["repoint"] if args.upload_only else 0
+    print("=" * 60)
+    print(f"Done! Applied {success_count}/{attempted} changes "
+          f"({plan['summary']['skip']} already up to date"
+          + (f", {skipped_repoints} repoint(s) skipped by --upload-only" if skipped_repoints else "") + ").")
+    print("=" * 60)
+    if success_count and not args.upload_only:
+        from build_catalog_bundle import republish_after_write
+        republish_after_write(supabase=supabase)
+
+
+def run_gc(keep: int = 1, prune_local: bool = False, archive_dir: Path | None = None,
+           dry_run: bool = False) -> None:
+    """
+    Delete superseded mnemonic versions from the bucket (and optionally locally).
+    
+    Keeps the latest `keep` versions of each problem plus anything
+    blind_problems or the published catalog bundle still points at (clients
+    may hold the bundle after the table has moved on). See mnemonic_gc.py for
+    the policy.
+    """
+    import mnemonic_gc
+    from build_catalog_bundle import published_image_urls
+    from mnemonic_sync_plan import fetch_bucket_listing, fetch_problem_urls
+    
+    print(f"\n🧹 GARBAGE COLLECTION - keeping latest {keep} version(s) per problem\n")
+    print("🔌 Connecting to Supabase...")
+    supabase = get_supabase_client()
+    
+    listing = fetch_bucket_listing(supabase, BUCKET_NAME)
+    problem_urls = fetch_problem_urls(supabase)
+    bundle_urls = published_image_urls(supabase)
+    protected = mnemonic_gc.referenced_objects(
+        listing, [*problem_urls.values(), *bundle_urls], lambda name: get_public_url_for_filename(supabase, name)
+    )
+    
+    remote = mnemonic_gc.select_superseded(
+        listing, parse_filename, keep, protected,
+        written_at={name: entry["updated_at"] for name, entry in listing.items()},
+    )
+    remote_bytes = sum(listing[name]["size"] or 0 for name in remote)
+    print(f"\n☁️  Bucket: {len(listing)} objects, {len(protected)} referenced by blind_problems or the catalog bundle, "
+          f"{len(remote)} superseded ({remote_bytes / 1024 / 1024:.1f} MB)")
+    for name in remote:
+        print(f"  🗑️  {name}")
+    
+    local = []
+    if prune_local or archive_dir:
+        local_files = list(MEMORIES_DIR.glob("*.png"))
+        local_names = [p.name for p in local_files]
+        local = mnemonic_gc.select_superseded(
+            local_names, parse_filename, keep, protected,
+            written_at={p.name: mnemonic_gc.mtime_timestamp(p) for p in local_files},
+        )
+        action = f"archive to {archive_dir}" if archive_dir else "delete"
+        print(f"\n💾 Local: {len(local_names)} files, {len(local)} superseded ({action})")
+        for name in local:
+            print(f"  🗑️  {name}")
+    
+    if dry_run:
+        print("\n🏃 DRY RUN - No changes were made")
+        return
+    
+    removed = mnemonic_gc.remove_objects(supabase, BUCKET_NAME, remote) if remote else 0
+    pruned = mnemonic_gc.prune_local(MEMORIES_DIR, local, archive_dir) if local else 0
     
-    # Initialize Supabase client
-    if not args.dry_run:
+    print("=" * 60)
+    print(f"Done! Removed {removed} bucket objects, pruned {pruned} local files.")
+    print("=" * 60)
+
+
+def update_urls_only(latest_images: dict[int, str], dry_run: bool = False) -> None:
+    """Point blind_problems at existing storage URLs without uploading anything."""
+    print("\n📝 UPDATE URLS ONLY - Skipping upload, updating database with existing storage URLs\n")
+    
+    if dry_run:
+        print("\n🏃 DRY RUN - No changes will be made\n")
+        supabase = None
+    else:
         print("\n🔌 Connecting to Supabase...")
         supabase = get_supabase_client()
-    else:
-        supabase = None
     
-    # Process images
-    action = "Updating URLs for" if args.update_urls_only else "Processing"
-    print(f"\n📤 {action} {len(latest_images)} images...\n")
+    print(f"\n📤 Updating URLs for {len(latest_images)} images...\n")
     
     success_count = 0
     for problem_number in sorted(latest_images.keys()):
         filename = latest_images[problem_number]
         print(f"Problem #{problem_number}: {filename}")
         
-        if args.update_urls_only:
-            # Skip upload, just get existing URL and update database
-            if args.dry_run:
-                image_url = f"https://example.com/{BUCKET_NAME}/{filename}"
-                print(f"  📎 Would use URL: {image_url}")
-            else:
-                image_url = get_public_url_for_filename(supabase, filename)
-                print(f"  📎 Using existing URL")
-            
-            if update_problem_url(supabase, problem_number, image_url, dry_run=args.dry_run):
-                success_count += 1
+        if dry_run:
+            image_url = f"https://example.com/{BUCKET_NAME}/{filename}"
+            print(f"  📎 Would use URL: {image_url}")
         else:
-            # Upload image
-            image_url = upload_image(supabase, filename, dry_run=args.dry_run)
-            
-            if image_url and not args.upload_only:
-                # Update database
-                if update_problem_url(supabase, problem_number, image_url, dry_run=args.dry_run):
-                    success_count += 1
-            elif image_url:
-                success_count += 1
+            image_url = get_public_url_for_filename(supabase, filename)
+            print(f"  📎 Using existing URL")
+        
+        if update_problem_url(supabase, problem_number, image_url, dry_run=dry_run):
+            success_count += 1
         
         print()
     
     print("=" * 60)
     print(f"Done! Processed {success_count}/{len(latest_images)} images.")
     print("=" * 60)
+    if success_count and not dry_run:
+        from build_catalog_bundle import republish_after_write
+        republish_after_write(supabase=supabase)
 
 
 if __name__ == "__main__":
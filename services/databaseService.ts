@@ -290,10 +290,63 @@ export const fetchSystemCodingQuestionByTitle = async (userId: string, title: st
     };
 };
 
+// ========== STATIC CATALOG BUNDLE ==========
+
+// Published by scripts/build_catalog_bundle.py: a small pointer naming the
+// current content-hashed bundle, which is cached immutably
+const CATALOG_BUCKET = 'mnemonic-images';
+const CATALOG_POINTER = 'catalog/latest.json';
+
+let catalogBundlePromise: Promise<Problem[] | null> | null = null;
+
+const fetchStorageObject = async (path: string): Promise<Response> => {
+    const { data } = supabase.storage.from(CATALOG_BUCKET).getPublicUrl(path);
+    const response = await fetch(data.publicUrl);
+    if (!response.ok) {
+        throw new Error(`${path}: HTTP ${response.status}`);
+    }
+    return response;
+};
+
+/**
+ * Load every blind problem from the static catalog bundle (no database query).
+ * Fetched once per session; resolves to null if no bundle has been published.
+ * The pointer is trusted: scripts/build_catalog_bundle.py republishes it after
+ * every job that writes blind_problems.
+ */
+export const fetchCatalogBundle = (): Promise<Problem[] | null> => {
+    if (!catalogBundlePromise) {
+        catalogBundlePromise = (async () => {
+            const pointer = await (await fetchStorageObject(CATALOG_POINTER)).json();
+            const objects: Record<string, string> = pointer.objects;
+
+            let bundle;
+            if (objects.gzip && typeof DecompressionStream !== 'undefined') {
+                const response = await fetchStorageObject(objects.gzip);
+                const stream = response.body!.pipeThrough(new DecompressionStream('gzip'));
+                bundle = await new Response(stream).json();
+            } else {
+                bundle = await (await fetchStorageObject(objects.json)).json();
+            }
+            return (bundle.problems as any[]).map(mapDbProblemToProblem);
+        })().catch(error => {
+            console.warn('Catalog bundle unavailable, falling back to the database:', error);
+            return null;
+        });
+    }
+    return catalogBundlePromise;
+};
+
 /**
- * Fetch all blind problems (for stats/admin purposes)
+ * Fetch all blind problems (for stats/admin purposes), from the static
+ * catalog bundle when one is published
  */
 export const fetchLeetcodeProblems = async (): Promise<Problem[]> => {
+    const bundled = await fetchCatalogBundle();
+    if (bundled) {
+        return bundled;
+    }
+
     const { data, error } = await supabase
         .from('blind_problems')
         .select('*')
@@ -346,7 +399,8 @@ const mapDbProblemToProblem = (row: any): Problem => ({
     difficulty: row.difficulty as 'easy' | 'medium' | 'hard',
     problemGroup: row.problem_group || undefined,
     leetcodeNumber: row.leetcode_number || undefined,
-    mnemonicImageUrl: row.mnemonic_image_url || undefined
+    mnemonicImageUrl: row.mnemonic_image_url || undefined,
+    relatedProblems: row.related_problems || undefined
 });
 
 // ========== PROGRESSIVE QUEUE BUILDING ==========
@@ -761,6 +815,53 @@ export const getProgressStats = async (userId: string): Promise<{
     };
 };
 
+// ========== SPACED REPETITION: PRECOMPUTED QUEUES ==========
+
+import { PrecomputedReviewQueue } from '../types/database';
+
+/**
+ * Fetch the user's queue precomputed by the nightly job for the given day
+ * (one primary-key lookup on user_review_queues).
+ *
+ * Returns null if there is no queue for that day, e.g. the user signed up
+ * after the last run; build it live with buildSpacedRepetitionQueue then.
+ *
+ * Not called by the app yet. buildSpacedRepetitionQueue also applies the
+ * spot's topic filter and review/new-only flags, which the nightly queue
+ * does not know about; using this queue there is a separate client change.
+ */
+export const fetchPrecomputedReviewQueue = async (
+    userId: string,
+    queueDate: string  // YYYY-MM-DD
+): Promise<PrecomputedReviewQueue | null> => {
+    const { data, error } = await supabase
+        .from('user_review_queues')
+        .select('*')
+        .eq('user_id', userId)
+        .eq('queue_date', queueDate)
+        .single();
+
+    if (error) {
+        if (error.code === 'PGRST116') {
+            return null; // Not computed for that day
+        }
+        console.error('Error fetching precomputed review queue:', error);
+        return null;
+    }
+
+    return {
+        userId: data.user_id,
+        queueDate: data.queue_date,
+        reviewTitles: data.review_titles || [],
+        newTitles: data.new_titles || [],
+        dueToday: data.due_today,
+        dueTomorrow: data.due_tomorrow,
+        learningCount: data.learning_count,
+        masteredCount: data.mastered_count,
+        computedAt: new Date(data.computed_at)
+    };
+};
+
 // ========== DAILY ACTIVITY TRACKING ==========
 
 import { UserDailyActivity, DailyActivitySummary } from '../types/database';
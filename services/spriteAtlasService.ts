@@ -0,0 +1,72 @@
+/**
+ * Sprite Atlas Service
+ *
+ * Mnemonic thumbnails for the progress grid and spot cards, packed into a few
+ * WebP atlases by scripts/build_sprite_atlas.py. One small JSON map says where
+ * each problem's thumbnail sits, so a whole grid renders from one or two
+ * image requests instead of one per problem.
+ *
+ * No view calls this yet: the progress grid (getProgressGrid) and the spot
+ * cards do not render per-problem thumbnails today. Showing them there is a
+ * separate UI change that builds on loadSpriteAtlasMap and getThumbnailStyle.
+ */
+
+import type { CSSProperties } from 'react';
+import { supabase } from '../config/supabase';
+
+const BUCKET_NAME = 'mnemonic-images';
+const MAP_OBJECT = 'sprites/sprite-atlas.json';
+
+export interface SpriteAtlasMap {
+    version: number;
+    thumb: { width: number; height: number };
+    atlases: { object: string; width: number; height: number }[];
+    problems: Record<string, { atlas: number; x: number; y: number }>;
+}
+
+let atlasMapPromise: Promise<SpriteAtlasMap | null> | null = null;
+
+/**
+ * Fetch the atlas map once per session (null if it has not been built yet)
+ */
+export function loadSpriteAtlasMap(): Promise<SpriteAtlasMap | null> {
+    if (!atlasMapPromise) {
+        const { data } = supabase.storage.from(BUCKET_NAME).getPublicUrl(MAP_OBJECT);
+        atlasMapPromise = fetch(data.publicUrl)
+            .then(response => (response.ok ? response.json() as Promise<SpriteAtlasMap> : null))
+            .catch(error => {
+                console.error('Error loading sprite atlas map:', error);
+                return null;
+            });
+    }
+    return atlasMapPromise;
+}
+
+/**
+ * Style that shows one problem's thumbnail as a background sprite, scaled to
+ * `width` pixels wide. Returns null when the problem has no thumbnail, so the
+ * caller can fall back to mnemonicImageUrl.
+ */
+export function getThumbnailStyle(
+    atlasMap: SpriteAtlasMap,
+    leetcodeNumber: number | undefined,
+    width: number = atlasMap.thumb.width
+): CSSProperties | null {
+    const entry = leetcodeNumber !== undefined ? atlasMap.problems[String(leetcodeNumber)] : undefined;
+    if (!entry) {
+        return null;
+    }
+
+    const atlas = atlasMap.atlases[entry.atlas];
+    const scale = width / atlasMap.thumb.width;
+    const { data } = supabase.storage.from(BUCKET_NAME).getPublicUrl(atlas.object);
+
+    return {
+        width,
+        height: atlasMap.thumb.height * scale,
+        backgroundImage: `url(${data.publicUrl})`,
+        backgroundPosition: `-${entry.x * scale}px -${entry.y * scale}px`,
+        backgroundSize: `${atlas.width * scale}px ${atlas.height * scale}px`,
+        backgroundRepeat: 'no-repeat'
+    };
+}
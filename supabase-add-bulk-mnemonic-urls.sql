@@ -0,0 +1,25 @@
+-- Bulk mnemonic URL updates for the uploader's --bulk-db mode
+-- Run this AFTER running supabase-add-mnemonic-images.sql
+-- Run this SQL in your Supabase SQL Editor
+
+-- Sets mnemonic_image_url for many problems in one statement.
+-- updates: JSON array of {"leetcode_number": 141, "url": "https://..."}
+-- Only rows whose URL actually changes are written; returns that count.
+CREATE OR REPLACE FUNCTION public.set_mnemonic_image_urls(updates JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH changed AS (
+        UPDATE public.blind_problems AS bp
+        SET mnemonic_image_url = u.url
+        FROM jsonb_to_recordset(updates) AS u(leetcode_number INTEGER, url TEXT)
+        WHERE bp.leetcode_number = u.leetcode_number
+          AND bp.mnemonic_image_url IS DISTINCT FROM u.url
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM changed;
+$$;
+
+-- Only the service role (used by scripts/upload_mnemonics_to_supabase.py) may call it
+REVOKE ALL ON FUNCTION public.set_mnemonic_image_urls(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.set_mnemonic_image_urls(JSONB) TO service_role;
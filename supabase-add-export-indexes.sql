@@ -0,0 +1,20 @@
+-- Indexes for the incremental analytics export (scripts/export_analytics.py)
+-- The export reads each table in (watermark, id) order starting after the last
+-- exported row; these indexes make every page an index range scan.
+--
+-- Requires supabase-add-spaced-repetition.sql and supabase-add-report-date.sql
+
+CREATE INDEX IF NOT EXISTS idx_user_problem_progress_updated_at_id
+    ON user_problem_progress(updated_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_saved_reports_report_date_id
+    ON public.saved_reports(report_date, id);
+
+-- user_daily_activity was created outside these migration files; index it when present
+DO $$
+BEGIN
+    IF to_regclass('public.user_daily_activity') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_user_daily_activity_updated_at_id
+            ON public.user_daily_activity(updated_at, id);
+    END IF;
+END $$;
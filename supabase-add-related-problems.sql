@@ -0,0 +1,8 @@
+-- Add related_problems column to blind_problems table
+-- Filled by scripts/related_problems.py: the LeetCode numbers of the most similar
+-- problems (TF-IDF cosine over pattern, key idea, detailed hint and topics), best first
+
+ALTER TABLE public.blind_problems
+ADD COLUMN IF NOT EXISTS related_problems INTEGER[];
+
+COMMENT ON COLUMN public.blind_problems.related_problems IS 'LeetCode numbers of the most similar problems, most similar first (precomputed by scripts/related_problems.py)';
@@ -0,0 +1,36 @@
+-- Precomputed Daily Review Queues
+-- Written nightly by scripts/precompute_review_queues.py from user_problem_progress
+-- and user_study_settings, using the rules of buildSpacedRepetitionQueue.
+-- One row per user, so the app reads its queue with one primary-key lookup:
+--
+--     SELECT * FROM user_review_queues WHERE user_id = auth.uid() AND queue_date = <today>;
+--
+-- Requires supabase-add-spaced-repetition.sql
+
+-- ============================================
+-- Table: user_review_queues
+-- ============================================
+CREATE TABLE IF NOT EXISTS user_review_queues (
+    user_id UUID PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+    queue_date DATE NOT NULL,                      -- Day the queue was computed for
+    review_titles TEXT[] NOT NULL DEFAULT '{}',    -- Due reviews, most overdue first, capped at daily_cap
+    new_titles TEXT[] NOT NULL DEFAULT '{}',       -- New problems (easy -> hard) filling the rest
+    due_today INT NOT NULL DEFAULT 0,              -- All due reviews (can exceed daily_cap)
+    due_tomorrow INT NOT NULL DEFAULT 0,
+    learning_count INT NOT NULL DEFAULT 0,
+    mastered_count INT NOT NULL DEFAULT 0,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Enable RLS
+ALTER TABLE user_review_queues ENABLE ROW LEVEL SECURITY;
+
+-- Users can only read their own queue; the batch job writes with the service role
+DROP POLICY IF EXISTS "Users can view their own review queue" ON user_review_queues;
+CREATE POLICY "Users can view their own review queue"
+    ON user_review_queues FOR SELECT
+    USING (auth.uid() = user_id);
+
+-- The job reads user_problem_progress in (user_id, problem_title) order, which is
+-- served by the UNIQUE(user_id, problem_title) index, and user_study_settings by
+-- its primary key, so no other index is needed.
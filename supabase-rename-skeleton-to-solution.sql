@@ -0,0 +1,16 @@
+-- Rename blind_problems.skeleton to solution
+-- supabase-blind-problems.sql creates a `skeleton` column, but the seed data and the
+-- app (types/database.ts) use `solution`. Safe to run on databases that already have it.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'blind_problems' AND column_name = 'skeleton'
+    ) AND NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'blind_problems' AND column_name = 'solution'
+    ) THEN
+        ALTER TABLE public.blind_problems RENAME COLUMN skeleton TO solution;
+    END IF;
+END $$;
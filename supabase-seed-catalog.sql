@@ -0,0 +1,3154 @@
+-- Blind75 Problems Seed Data (batched)
+-- GENERATED by scripts/generate_seed_sql.py from scripts/seed_data/blind_problems.json.
+-- Do not edit by hand: edit the JSON and re-run the generator.
+--
+-- Run this AFTER supabase-blind-problems.sql and the add-column migrations
+-- (supabase-add-detailed-hint.sql, supabase-add-definition.sql, supabase-add-problem-group.sql).
+-- The upsert leaves columns it does not list (e.g. mnemonic_image_url) untouched.
+-- 75 problems in 6 statements.
+
+BEGIN;
+
+-- Problems 1-25
+INSERT INTO public.blind_problems (title, prompt, example, constraints, pattern, key_idea, solution, time_complexity, space_complexity, steps, expected_edge_cases, topics, difficulty, leetcode_number)
+VALUES
+    (
+        'Two Sum',
+        'Given an array of integers nums and an integer target, return indices of the two numbers such that they add up to target. You may assume that each input would have exactly one solution, and you may not use the same element twice. You can return the answer in any order.',
+        'Input: nums = [2,7,11,15], target = 9
+Output: [0,1]
+Explanation: Because nums[0] + nums[1] == 9, we return [0, 1].',
+        '["2 <= nums.length <= 10^4", "-10^9 <= nums[i] <= 10^9", "-10^9 <= target <= 10^9", "Only one valid answer exists"]',
+        'Hash Map',
+        'Use a hash map to store seen values and their indices. For each number, check if (target - num) exists in the map.',
+        E'def twoSum(nums: List[int], target: int) -> List[int]:\\n    seen = {}\\n    for i, num in enumerate(nums):\\n        # Check if complement exists\\n        # Add current num to seen\\n        pass',
+        'O(n)',
+        'O(n)',
+        '["Create empty hash map to store {value: index}", "Iterate through array with index", "Calculate complement = target - current number", "If complement in map, return [map[complement], current_index]", "Otherwise, add current number and index to map"]',
+        '["Empty array", "Single element array", "Negative numbers", "Target is zero", "Same number used twice (not allowed)", "Numbers at beginning vs end of array"]',
+        '["Array", "Hash Table"]',
+        'easy',
+        1
+    ),
+    (
+        'Best Time to Buy and Sell Stock',
+        'You are given an array prices where prices[i] is the price of a given stock on the ith day. You want to maximize your profit by choosing a single day to buy one stock and choosing a different day in the future to sell that stock. Return the maximum profit you can achieve from this transaction. If you cannot achieve any profit, return 0.',
+        'Input: prices = [7,1,5,3,6,4]
+Output: 5
+Explanation: Buy on day 2 (price = 1) and sell on day 5 (price = 6), profit = 6-1 = 5.',
+        '["1 <= prices.length <= 10^5", "0 <= prices[i] <= 10^4"]',
+        'Two Pointers',
+        'Use two pointers: left (buy day) and right (sell day). If profitable, update max_profit. If not profitable, move left to right (found a new minimum). Always advance right.',
+        'def maxProfit(prices: List[int]) -> int:
+    left, right = 0, 1
+    max_profit = 0
+
+    while right < len(prices):
+        # if profitable
+        if prices[left] < prices[right]:
+            # update profit
+            profit = prices[right] - prices[left]
+            # update max_profit
+            max_profit = max(max_profit, profit)
+        else:
+            # update left pointer
+            left = right
+        # update right pointer
+        right += 1
+    
+    return max_profit',
+        'O(n)',
+        'O(1)',
+        '["Initialize left=0 (buy), right=1 (sell), max_profit=0", "While right < len(prices)", "If prices[left] < prices[right]: calculate profit, update max_profit", "Else: move left to right (found new minimum buy price)", "Always increment right pointer"]',
+        '["Prices always decreasing (return 0)", "Prices always increasing", "Single day (no transaction possible)", "All same prices", "Minimum at end of array"]',
+        '["Array", "Two Pointers"]',
+        'easy',
+        121
+    ),
+    (
+        'Contains Duplicate',
+        'Given an integer array nums, return true if any value appears at least twice in the array, and return false if every element is distinct.',
+        'Input: nums = [1,2,3,1]
+Output: true
+Explanation: The element 1 appears twice.',
+        '["1 <= nums.length <= 10^5", "-10^9 <= nums[i] <= 10^9"]',
+        'Hash Set',
+        'Use a hash set to track seen numbers. If we encounter a number already in the set, we have a duplicate.',
+        E'def containsDuplicate(nums: List[int]) -> bool:\\n    seen = set()\\n    for num in nums:\\n        # Check if duplicate, add to seen\\n        pass\\n    return False',
+        'O(n)',
+        'O(n)',
+        '["Create empty hash set", "Iterate through array", "If current number in set, return True", "Add current number to set", "Return False after loop completes"]',
+        '["Empty array", "Single element", "All duplicates", "No duplicates", "Duplicate at beginning vs end"]',
+        '["Array", "Hash Table", "Sorting"]',
+        'easy',
+        217
+    ),
+    (
+        'Product of Array Except Self',
+        'Given an integer array nums, return an array answer such that answer[i] is equal to the product of all the elements of nums except nums[i]. The algorithm must run in O(n) time and without using the division operation.',
+        'Input: nums = [1,2,3,4]
+Output: [24,12,8,6]
+Explanation: For index 0: 2*3*4=24, index 1: 1*3*4=12, etc.',
+        '["2 <= nums.length <= 10^5", "-30 <= nums[i] <= 30", "The product of any prefix or suffix is guaranteed to fit in a 32-bit integer"]',
+        'Prefix/Suffix Products',
+        'Make two passes: first to compute prefix products (left to right), then suffix products (right to left). Result at each index is prefix * suffix.',
+        E'def productExceptSelf(nums: List[int]) -> List[int]:\\n    n = len(nums)\\n    result = [1] * n\\n    # First pass: prefix products\\n    # Second pass: suffix products\\n    return result',
+        'O(n)',
+        'O(1)',
+        '["Initialize result array with 1s", "First pass left-to-right: multiply by running prefix product", "Second pass right-to-left: multiply by running suffix product", "Each position gets product of all elements except itself"]',
+        '["Array with zeros", "Array with single zero", "Array with multiple zeros", "Negative numbers", "Array of length 2"]',
+        '["Array", "Prefix Sum"]',
+        'medium',
+        238
+    ),
+    (
+        'Maximum Subarray',
+        'Given an integer array nums, find the subarray with the largest sum, and return its sum.',
+        'Input: nums = [-2,1,-3,4,-1,2,1,-5,4]
+Output: 6
+Explanation: The subarray [4,-1,2,1] has the largest sum 6.',
+        '["1 <= nums.length <= 10^5", "-10^4 <= nums[i] <= 10^4"]',
+        'Dynamic Programming (Kadane''s Algorithm)',
+        'At each position, decide whether to extend the previous subarray or start fresh. The previous subarray is only worth keeping if its sum is positive.',
+        E'def maxSubArray(nums: List[int]) -> int:\\n    max_sum = nums[0]\\n    current_sum = 0\\n    for num in nums:\\n        # Reset if current_sum negative\\n        # Update max_sum\\n        pass\\n    return max_sum',
+        'O(n)',
+        'O(1)',
+        '["Initialize max_sum to first element, current_sum to 0", "For each number in array", "If current_sum is negative, reset to 0", "Add current number to current_sum", "Update max_sum if current_sum is larger"]',
+        '["All negative numbers", "Single element", "All positive numbers", "Alternating positive/negative", "Maximum at beginning/middle/end"]',
+        '["Array", "Dynamic Programming", "Divide and Conquer"]',
+        'medium',
+        53
+    ),
+    (
+        'Maximum Product Subarray',
+        'Given an integer array nums, find a subarray that has the largest product, and return the product.',
+        'Input: nums = [2,3,-2,4]
+Output: 6
+Explanation: [2,3] has the largest product 6.',
+        '["1 <= nums.length <= 2 * 10^4", "-10 <= nums[i] <= 10", "The product of any prefix or suffix is guaranteed to fit in a 32-bit integer"]',
+        'Dynamic Programming',
+        'Track both max and min products at each position because a negative number can flip min to max. The min is important for handling negative numbers.',
+        E'def maxProduct(nums: List[int]) -> int:\\n    result = max(nums)\\n    cur_min, cur_max = 1, 1\\n    for num in nums:\\n        # Track both min and max products\\n        pass\\n    return result',
+        'O(n)',
+        'O(1)',
+        '["Initialize result to max element in array", "Track current min and max products (both start at 1)", "For each number, compute new min and max considering: num, num*cur_max, num*cur_min", "Update result if cur_max is larger", "Handle zeros by resetting min/max to 1"]',
+        '["Array with zeros", "All negative numbers", "Single negative number", "Alternating signs", "Contains zero in middle"]',
+        '["Array", "Dynamic Programming"]',
+        'medium',
+        152
+    ),
+    (
+        'Find Minimum in Rotated Sorted Array',
+        'Suppose an array of length n sorted in ascending order is rotated between 1 and n times. Given the sorted rotated array nums of unique elements, return the minimum element of this array. You must write an algorithm that runs in O(log n) time.',
+        'Input: nums = [3,4,5,1,2]
+Output: 1
+Explanation: The original array was [1,2,3,4,5] rotated 3 times.',
+        '["n == nums.length", "1 <= n <= 5000", "-5000 <= nums[i] <= 5000", "All integers are unique", "nums is sorted and rotated between 1 and n times"]',
+        'Binary Search',
+        'Use binary search to find the pivot point. If mid element is greater than right element, minimum is in right half. Otherwise, it''s in left half (including mid).',
+        E'def findMin(nums: List[int]) -> int:\\n    left, right = 0, len(nums) - 1\\n    while left < right:\\n        mid = (left + right) // 2\\n        # Compare mid with right to find pivot\\n        pass\\n    return nums[left]',
+        'O(log n)',
+        'O(1)',
+        '["Initialize left and right pointers", "While left < right, find mid", "If nums[mid] > nums[right], minimum is in right half (left = mid + 1)", "Otherwise, minimum is in left half including mid (right = mid)", "Return nums[left] when loop ends"]',
+        '["Array not rotated (already sorted)", "Array rotated n times (same as original)", "Single element", "Two elements", "Minimum at beginning/end/middle"]',
+        '["Array", "Binary Search"]',
+        'medium',
+        153
+    ),
+    (
+        'Search in Rotated Sorted Array',
+        'Given the array nums after rotation and an integer target, return the index of target if it is in nums, or -1 if it is not in nums. You must write an algorithm with O(log n) runtime complexity.',
+        'Input: nums = [4,5,6,7,0,1,2], target = 0
+Output: 4',
+        '["1 <= nums.length <= 5000", "-10^4 <= nums[i] <= 10^4", "All values are unique", "nums is an ascending array that is possibly rotated", "-10^4 <= target <= 10^4"]',
+        'Binary Search',
+        'Determine which half is sorted, then check if target lies within that sorted range. If yes, search there; otherwise, search the other half.',
+        E'def search(nums: List[int], target: int) -> int:\\n    left, right = 0, len(nums) - 1\\n    while left <= right:\\n        mid = (left + right) // 2\\n        # Check if found, determine sorted half, narrow search\\n        pass\\n    return -1',
+        'O(log n)',
+        'O(1)',
+        '["Initialize left and right pointers", "Find mid element", "If mid equals target, return mid", "Determine if left half is sorted (nums[left] <= nums[mid])", "If target in sorted left range, search left; else search right", "If right half is sorted, apply same logic", "Return -1 if not found"]',
+        '["Target not in array", "Target at pivot point", "Array not rotated", "Single element array", "Target at beginning/end"]',
+        '["Array", "Binary Search"]',
+        'medium',
+        33
+    ),
+    (
+        '3Sum',
+        'Given an integer array nums, return all the triplets [nums[i], nums[j], nums[k]] such that i != j, i != k, and j != k, and nums[i] + nums[j] + nums[k] == 0. Notice that the solution set must not contain duplicate triplets.',
+        'Input: nums = [-1,0,1,2,-1,-4]
+Output: [[-1,-1,2],[-1,0,1]]
+Explanation: The distinct triplets that sum to zero.',
+        '["3 <= nums.length <= 3000", "-10^5 <= nums[i] <= 10^5"]',
+        'Two Pointers',
+        'Sort the array first. For each element, use two pointers to find pairs that sum to its negative. Skip duplicates to avoid duplicate triplets.',
+        E'def threeSum(nums: List[int]) -> List[List[int]]:\\n    nums.sort()\\n    result = []\\n    for i in range(len(nums) - 2):\\n        # Skip duplicates, use two pointers\\n        pass\\n    return result',
+        'O(n²)',
+        'O(1)',
+        '["Sort the array", "For each element at index i (skip if duplicate of previous)", "Set left = i+1, right = len-1", "While left < right, calculate sum", "If sum == 0, add triplet, move both pointers, skip duplicates", "If sum < 0, move left pointer right", "If sum > 0, move right pointer left"]',
+        '["All zeros", "No valid triplets", "All negative or all positive", "Duplicate numbers", "Exactly one triplet"]',
+        '["Array", "Two Pointers", "Sorting"]',
+        'medium',
+        15
+    ),
+    (
+        'Container With Most Water',
+        'You are given an integer array height of length n. There are n vertical lines drawn such that the two endpoints of the ith line are (i, 0) and (i, height[i]). Find two lines that together with the x-axis form a container, such that the container contains the most water. Return the maximum amount of water a container can store.',
+        'Input: height = [1,8,6,2,5,4,8,3,7]
+Output: 49
+Explanation: The max area is between index 1 and 8, with height 7 and width 7.',
+        '["n == height.length", "2 <= n <= 10^5", "0 <= height[i] <= 10^4"]',
+        'Two Pointers',
+        'Start with widest container (pointers at both ends). Move the pointer with smaller height inward, as keeping it can only decrease area.',
+        E'def maxArea(height: List[int]) -> int:\\n    left, right = 0, len(height) - 1\\n    max_water = 0\\n    while left < right:\\n        # Calculate area, move shorter pointer\\n        pass\\n    return max_water',
+        'O(n)',
+        'O(1)',
+        '["Initialize left=0, right=len-1, max_water=0", "While left < right", "Calculate area = min(height[left], height[right]) * (right - left)", "Update max_water if area is larger", "Move the pointer with smaller height inward"]',
+        '["All same heights", "Increasing heights", "Decreasing heights", "Maximum at ends vs middle", "Only two elements"]',
+        '["Array", "Two Pointers", "Greedy"]',
+        'medium',
+        11
+    ),
+    (
+        'Sum of Two Integers',
+        'Given two integers a and b, return the sum of the two integers without using the operators + and -.',
+        'Input: a = 1, b = 2
+Output: 3',
+        '["-1000 <= a, b <= 1000"]',
+        'Bit Manipulation',
+        'XOR gives sum without carry. AND shifted left gives carry. Repeat until no carry remains.',
+        E'def getSum(a: int, b: int) -> int:\\n    while b != 0:\\n        # XOR for sum without carry\\n        # AND << 1 for carry\\n        pass\\n    return a',
+        'O(1)',
+        'O(1)',
+        '["Use XOR (^) to add bits without considering carry", "Use AND (&) to find carry bits", "Shift carry left by 1", "Repeat until carry is 0", "Handle negative numbers with masking in some languages"]',
+        '["Both positive", "Both negative", "One positive one negative", "Zero and non-zero", "Overflow cases"]',
+        '["Math", "Bit Manipulation"]',
+        'medium',
+        371
+    ),
+    (
+        'Number of 1 Bits',
+        'Write a function that takes the binary representation of an unsigned integer and returns the number of ''1'' bits it has (also known as the Hamming weight).',
+        'Input: n = 00000000000000000000000000001011
+Output: 3
+Explanation: The input has three ''1'' bits.',
+        '["The input must be a binary string of length 32"]',
+        'Bit Manipulation',
+        'Use n & (n-1) to clear the lowest set bit. Count how many times until n becomes 0. Alternative: check each bit with n & 1 and right shift.',
+        E'def hammingWeight(n: int) -> int:\\n    count = 0\\n    while n:\\n        n &= (n - 1)  # Clear lowest set bit\\n        count += 1\\n    return count',
+        'O(1)',
+        'O(1)',
+        '["Initialize count to 0", "While n is not 0", "Apply n = n & (n-1) to remove lowest 1 bit", "Increment count", "Return count"]',
+        '["All zeros", "All ones", "Single 1 bit", "Alternating bits", "Power of 2"]',
+        '["Divide and Conquer", "Bit Manipulation"]',
+        'easy',
+        191
+    ),
+    (
+        'Counting Bits',
+        'Given an integer n, return an array ans of length n + 1 such that for each i (0 <= i <= n), ans[i] is the number of 1''s in the binary representation of i.',
+        'Input: n = 5
+Output: [0,1,1,2,1,2]
+Explanation: 0=0, 1=1, 2=10, 3=11, 4=100, 5=101',
+        '["0 <= n <= 10^5"]',
+        'Dynamic Programming with Bit Manipulation',
+        'Use DP: ans[i] = ans[i >> 1] + (i & 1). The number of 1s in i equals the count in i/2 plus whether i is odd.',
+        E'def countBits(n: int) -> List[int]:\\n    ans = [0] * (n + 1)\\n    for i in range(1, n + 1):\\n        ans[i] = ans[i >> 1] + (i & 1)\\n    return ans',
+        'O(n)',
+        'O(n)',
+        '["Initialize ans array of size n+1 with zeros", "For i from 1 to n", "ans[i] = ans[i >> 1] + (i & 1)", "i >> 1 is i/2, i & 1 checks if odd", "Return ans array"]',
+        '["n = 0", "n = 1", "Powers of 2", "Large n"]',
+        '["Dynamic Programming", "Bit Manipulation"]',
+        'easy',
+        338
+    ),
+    (
+        'Missing Number',
+        'Given an array nums containing n distinct numbers in the range [0, n], return the only number in the range that is missing from the array.',
+        'Input: nums = [3,0,1]
+Output: 2
+Explanation: n = 3 since there are 3 numbers, so all numbers are in range [0,3]. 2 is missing.',
+        '["n == nums.length", "1 <= n <= 10^4", "0 <= nums[i] <= n", "All the numbers of nums are unique"]',
+        'Bit Manipulation / Math',
+        'XOR all indices and all values. The result is the missing number since all paired values cancel out. Alternatively: expected_sum - actual_sum.',
+        E'def missingNumber(nums: List[int]) -> int:\\n    n = len(nums)\\n    # Method 1: XOR\\n    # Method 2: Sum formula n*(n+1)/2 - sum(nums)\\n    return n * (n + 1) // 2 - sum(nums)',
+        'O(n)',
+        'O(1)',
+        '["Calculate expected sum: n * (n + 1) / 2", "Calculate actual sum of array", "Return expected - actual", "Alternative: XOR all indices (0 to n) with all values"]',
+        '["Missing 0", "Missing n (largest)", "Missing middle number", "Single element array", "Large array"]',
+        '["Array", "Hash Table", "Math", "Bit Manipulation", "Sorting"]',
+        'easy',
+        268
+    ),
+    (
+        'Reverse Bits',
+        'Reverse bits of a given 32 bits unsigned integer.',
+        'Input: n = 00000010100101000001111010011100
+Output: 964176192 (00111001011110000010100101000000)
+Explanation: The input represents 43261596, reversed it becomes 964176192.',
+        '["The input must be a binary string of length 32"]',
+        'Bit Manipulation',
+        'Extract each bit from right to left, build result from left to right by shifting result left and ORing with extracted bit.',
+        E'def reverseBits(n: int) -> int:\\n    result = 0\\n    for i in range(32):\\n        result = (result << 1) | (n & 1)\\n        n >>= 1\\n    return result',
+        'O(1)',
+        'O(1)',
+        '["Initialize result to 0", "Loop 32 times (for each bit)", "Shift result left by 1", "OR result with (n & 1) to add rightmost bit", "Shift n right by 1", "Return result"]',
+        '["All zeros", "All ones", "Single 1 bit", "Alternating bits", "Palindromic bit pattern"]',
+        '["Divide and Conquer", "Bit Manipulation"]',
+        'easy',
+        190
+    ),
+    (
+        'Climbing Stairs',
+        'You are climbing a staircase. It takes n steps to reach the top. Each time you can either climb 1 or 2 steps. In how many distinct ways can you climb to the top?',
+        'Input: n = 3
+Output: 3
+Explanation: There are three ways: 1+1+1, 1+2, 2+1.',
+        '["1 <= n <= 45"]',
+        'Dynamic Programming with Memoization',
+        'To reach step n, you can come from step n-1 or n-2. So ways(n) = ways(n-1) + ways(n-2). Use memoization to cache results and avoid recomputing. This is the Fibonacci sequence.',
+        E'def climbStairs(n: int) -> int:\\n    memo = {}\\n    def dp(i):\\n        if i <= 2:\\n            return i\\n        if i in memo:\\n            return memo[i]\\n        memo[i] = dp(i - 1) + dp(i - 2)\\n        return memo[i]\\n    return dp(n)',
+        'O(n)',
+        'O(n)',
+        '["Create a memo dictionary to cache results", "Define recursive dp(i) function", "Base cases: 1 step = 1 way, 2 steps = 2 ways", "If i already in memo, return cached value", "Otherwise compute dp(i-1) + dp(i-2), store in memo, and return"]',
+        '["n = 1", "n = 2", "Large n near limit"]',
+        '["Math", "Dynamic Programming", "Memoization"]',
+        'easy',
+        70
+    ),
+    (
+        'Coin Change',
+        'You are given an integer array coins representing coins of different denominations and an integer amount representing a total amount of money. Return the fewest number of coins needed to make up that amount. If that amount cannot be made up by any combination, return -1.',
+        'Input: coins = [1,2,5], amount = 11
+Output: 3
+Explanation: 11 = 5 + 5 + 1',
+        '["1 <= coins.length <= 12", "1 <= coins[i] <= 2^31 - 1", "0 <= amount <= 10^4"]',
+        'Dynamic Programming (Bottom-Up)',
+        'Build up from amount 0 to target. For each amount, try each coin and take minimum coins needed. dp[i] = min(dp[i], dp[i-coin] + 1) for each coin.',
+        E'def coinChange(coins: List[int], amount: int) -> int:\\n    dp = [float("inf")] * (amount + 1)\\n    dp[0] = 0\\n    for i in range(1, amount + 1):\\n        for coin in coins:\\n            if coin <= i:\\n                dp[i] = min(dp[i], dp[i - coin] + 1)\\n    return dp[amount] if dp[amount] != float("inf") else -1',
+        'O(amount * n)',
+        'O(amount)',
+        '["Initialize dp array of size amount+1 with infinity", "dp[0] = 0 (0 coins for amount 0)", "For each amount from 1 to target", "For each coin, if coin <= amount, update dp[amount] = min(dp[amount], dp[amount-coin] + 1)", "Return dp[amount] or -1 if still infinity"]',
+        '["Amount is 0", "Single coin equals amount", "No valid combination", "Coins larger than amount", "Need to use same coin multiple times"]',
+        '["Array", "Dynamic Programming", "Breadth-First Search"]',
+        'medium',
+        322
+    ),
+    (
+        'Longest Increasing Subsequence',
+        'Given an integer array nums, return the length of the longest strictly increasing subsequence.',
+        'Input: nums = [10,9,2,5,3,7,101,18]
+Output: 4
+Explanation: The longest increasing subsequence is [2,3,7,101].',
+        '["1 <= nums.length <= 2500", "-10^4 <= nums[i] <= 10^4"]',
+        'Dynamic Programming',
+        'dp[i] = length of LIS ending at index i. For each i, check all j < i where nums[j] < nums[i] and take max(dp[j]) + 1.',
+        E'def lengthOfLIS(nums: List[int]) -> int:\\n    dp = [1] * len(nums)\\n    for i in range(1, len(nums)):\\n        for j in range(i):\\n            if nums[j] < nums[i]:\\n                dp[i] = max(dp[i], dp[j] + 1)\\n    return max(dp)',
+        'O(n²)',
+        'O(n)',
+        '["Initialize dp array with all 1s (each element is LIS of length 1)", "For each index i from 1 to n-1", "For each j from 0 to i-1", "If nums[j] < nums[i], dp[i] = max(dp[i], dp[j] + 1)", "Return max value in dp array"]',
+        '["Single element", "Already sorted ascending", "Already sorted descending", "All same elements", "LIS at beginning/middle/end"]',
+        '["Array", "Binary Search", "Dynamic Programming"]',
+        'medium',
+        300
+    ),
+    (
+        'Longest Common Subsequence',
+        'Given two strings text1 and text2, return the length of their longest common subsequence. If there is no common subsequence, return 0.',
+        'Input: text1 = "abcde", text2 = "ace"
+Output: 3
+Explanation: The longest common subsequence is "ace" with length 3.',
+        '["1 <= text1.length, text2.length <= 1000", "text1 and text2 consist of only lowercase English characters"]',
+        'Dynamic Programming (2D)',
+        'If chars match, LCS = 1 + LCS of remaining. If not, LCS = max of LCS excluding one char from either string. Use 2D dp table.',
+        E'def longestCommonSubsequence(text1: str, text2: str) -> int:\\n    dp = [[0] * (len(text2) + 1) for _ in range(len(text1) + 1)]\\n    for i in range(1, len(text1) + 1):\\n        for j in range(1, len(text2) + 1):\\n            if text1[i-1] == text2[j-1]:\\n                dp[i][j] = dp[i-1][j-1] + 1\\n            else:\\n                dp[i][j] = max(dp[i-1][j], dp[i][j-1])\\n    return dp[-1][-1]',
+        'O(m * n)',
+        'O(m * n)',
+        '["Create 2D dp table of size (m+1) x (n+1)", "dp[i][j] represents LCS of text1[0:i] and text2[0:j]", "If text1[i-1] == text2[j-1]: dp[i][j] = dp[i-1][j-1] + 1", "Else: dp[i][j] = max(dp[i-1][j], dp[i][j-1])", "Return dp[m][n]"]',
+        '["Empty string", "Identical strings", "No common characters", "One string is subsequence of other", "Single character strings"]',
+        '["String", "Dynamic Programming"]',
+        'medium',
+        1143
+    ),
+    (
+        'Word Break',
+        'Given a string s and a dictionary of strings wordDict, return true if s can be segmented into a space-separated sequence of one or more dictionary words.',
+        'Input: s = "leetcode", wordDict = ["leet","code"]
+Output: true
+Explanation: "leetcode" can be segmented as "leet code".',
+        '["1 <= s.length <= 300", "1 <= wordDict.length <= 1000", "1 <= wordDict[i].length <= 20", "s and wordDict[i] consist of only lowercase English letters", "All strings in wordDict are unique"]',
+        'Dynamic Programming',
+        'dp[i] = True if s[0:i] can be segmented. For each position, check if any word in dict ends at that position and dp[start of word] is True.',
+        E'def wordBreak(s: str, wordDict: List[str]) -> bool:\\n    dp = [False] * (len(s) + 1)\\n    dp[0] = True\\n    for i in range(1, len(s) + 1):\\n        for word in wordDict:\\n            if i >= len(word) and dp[i - len(word)] and s[i - len(word):i] == word:\\n                dp[i] = True\\n                break\\n    return dp[-1]',
+        'O(n * m * k)',
+        'O(n)',
+        '["dp[0] = True (empty string can be segmented)", "For each position i from 1 to len(s)", "For each word in dictionary", "If word fits and dp[i - len(word)] is True and substring matches word", "Set dp[i] = True", "Return dp[len(s)]"]',
+        '["Single word in dict matches entire string", "No valid segmentation", "Multiple ways to segment", "Repeating words needed", "Word is prefix of another word"]',
+        '["Hash Table", "String", "Dynamic Programming", "Trie", "Memoization"]',
+        'medium',
+        139
+    ),
+    (
+        'Combination Sum',
+        'Given an array of distinct integers candidates and a target integer target, return a list of all unique combinations of candidates where the chosen numbers sum to target. You may return the combinations in any order. The same number may be chosen an unlimited number of times.',
+        'Input: candidates = [2,3,6,7], target = 7
+Output: [[2,2,3],[7]]
+Explanation: 2 + 2 + 3 = 7 and 7 = 7.',
+        '["1 <= candidates.length <= 30", "2 <= candidates[i] <= 40", "All elements are distinct", "1 <= target <= 40"]',
+        'Backtracking',
+        'Use DFS/backtracking. At each step, either include current candidate (can reuse) or move to next candidate. Prune when sum exceeds target.',
+        E'def combinationSum(candidates: List[int], target: int) -> List[List[int]]:\\n    result = []\\n    def backtrack(start, path, remaining):\\n        if remaining == 0:\\n            result.append(path[:])\\n            return\\n        for i in range(start, len(candidates)):\\n            if candidates[i] <= remaining:\\n                path.append(candidates[i])\\n                backtrack(i, path, remaining - candidates[i])\\n                path.pop()\\n    backtrack(0, [], target)\\n    return result',
+        'O(n^(t/m))',
+        'O(t/m)',
+        '["Start backtracking with empty path and full target", "If remaining == 0, add current path to result", "For each candidate from start index", "If candidate <= remaining, add to path and recurse (same index for reuse)", "After recursion, remove last element (backtrack)"]',
+        '["Single candidate equals target", "No valid combination", "Target smaller than all candidates", "Need multiple of same number", "Large target with small candidates"]',
+        '["Array", "Backtracking"]',
+        'medium',
+        39
+    ),
+    (
+        'House Robber',
+        'You are a professional robber planning to rob houses along a street. Each house has a certain amount of money stashed. Adjacent houses have security systems connected - if two adjacent houses are broken into on the same night, the police will be alerted. Given an integer array nums representing the amount of money of each house, return the maximum amount of money you can rob without alerting the police.',
+        'Input: nums = [1,2,3,1]
+Output: 4
+Explanation: Rob house 1 (money = 1) and then rob house 3 (money = 3). Total = 1 + 3 = 4.',
+        '["1 <= nums.length <= 100", "0 <= nums[i] <= 400"]',
+        'Dynamic Programming',
+        'At each house, choose max of: (1) rob this house + max from two houses back, or (2) skip this house and take max from previous house.',
+        E'def rob(nums: List[int]) -> int:\\n    if len(nums) == 1:\\n        return nums[0]\\n    prev2, prev1 = 0, 0\\n    for num in nums:\\n        temp = max(prev1, prev2 + num)\\n        prev2, prev1 = prev1, temp\\n    return prev1',
+        'O(n)',
+        'O(1)',
+        '["Track two values: max including prev house (prev1) and max excluding prev house (prev2)", "For each house, new max = max(prev1, prev2 + current)", "Update prev2 = prev1, prev1 = new max", "Return prev1"]',
+        '["Single house", "Two houses", "All same values", "Alternating high/low values", "Increasing values"]',
+        '["Array", "Dynamic Programming"]',
+        'medium',
+        198
+    ),
+    (
+        'House Robber II',
+        'You are a professional robber planning to rob houses arranged in a circle. Each house has a certain amount of money. Adjacent houses have security systems that will alert police if both are robbed. Given an integer array nums representing the amount of money in each house, return the maximum amount you can rob without alerting police.',
+        'Input: nums = [2,3,2]
+Output: 3
+Explanation: You cannot rob house 1 and house 3 (both are adjacent in a circle). Rob house 2 with money = 3.',
+        '["1 <= nums.length <= 100", "0 <= nums[i] <= 1000"]',
+        'Dynamic Programming',
+        'Since first and last houses are adjacent, we cannot rob both. Run House Robber on nums[0:n-1] and nums[1:n], take maximum.',
+        E'def rob(nums: List[int]) -> int:\\n    if len(nums) == 1:\\n        return nums[0]\\n    def rob_linear(houses):\\n        prev2, prev1 = 0, 0\\n        for h in houses:\\n            prev2, prev1 = prev1, max(prev1, prev2 + h)\\n        return prev1\\n    return max(rob_linear(nums[:-1]), rob_linear(nums[1:]))',
+        'O(n)',
+        'O(1)',
+        '["Handle single house case", "Create helper function for linear house robber", "Run helper on houses[0:n-1] (exclude last)", "Run helper on houses[1:n] (exclude first)", "Return max of both results"]',
+        '["Single house", "Two houses", "Three houses", "All same values", "First and last are highest"]',
+        '["Array", "Dynamic Programming"]',
+        'medium',
+        213
+    ),
+    (
+        'Decode Ways',
+        'A message containing letters from A-Z can be encoded into numbers using the mapping: A=1, B=2, ..., Z=26. Given a string s containing only digits, return the number of ways to decode it.',
+        'Input: s = "226"
+Output: 3
+Explanation: "226" can be decoded as "BZ" (2 26), "VF" (22 6), or "BBF" (2 2 6).',
+        '["1 <= s.length <= 100", "s contains only digits and may contain leading zeros"]',
+        'Dynamic Programming',
+        'dp[i] = ways to decode s[0:i]. At each position, check if single digit is valid (1-9) and if two digits are valid (10-26).',
+        E'def numDecodings(s: str) -> int:\\n    if not s or s[0] == "0":\\n        return 0\\n    dp = [0] * (len(s) + 1)\\n    dp[0], dp[1] = 1, 1\\n    for i in range(2, len(s) + 1):\\n        if s[i-1] != "0":\\n            dp[i] += dp[i-1]\\n        two_digit = int(s[i-2:i])\\n        if 10 <= two_digit <= 26:\\n            dp[i] += dp[i-2]\\n    return dp[-1]',
+        'O(n)',
+        'O(n)',
+        '["dp[0] = 1 (empty string), dp[1] = 1 if first char is not 0", "For each position i from 2 to n", "If current digit is not 0, add dp[i-1] (single digit decode)", "If two-digit number is 10-26, add dp[i-2] (two digit decode)", "Return dp[n]"]',
+        '["String starts with 0", "Contains 0 that cannot be decoded", "All single digit valid", "Contains 10 or 20", "Long string with many combinations"]',
+        '["String", "Dynamic Programming"]',
+        'medium',
+        91
+    ),
+    (
+        'Unique Paths',
+        'There is a robot on an m x n grid. The robot starts at the top-left corner and tries to move to the bottom-right corner. The robot can only move either down or right at any point. Given the dimensions m and n, return the number of possible unique paths.',
+        'Input: m = 3, n = 7
+Output: 28',
+        '["1 <= m, n <= 100"]',
+        'Dynamic Programming',
+        'dp[i][j] = number of ways to reach cell (i,j). Each cell can only be reached from above or left, so dp[i][j] = dp[i-1][j] + dp[i][j-1].',
+        E'def uniquePaths(m: int, n: int) -> int:\\n    dp = [1] * n  # First row is all 1s\\n    for i in range(1, m):\\n        for j in range(1, n):\\n            dp[j] += dp[j-1]\\n    return dp[-1]',
+        'O(m * n)',
+        'O(n)',
+        '["Initialize first row with all 1s (only one way to reach any cell in first row)", "For each subsequent row", "For each cell (except first column), paths = paths from above + paths from left", "First column stays 1 (only one way from start)", "Return dp[m-1][n-1]"]',
+        '["1x1 grid", "1xn grid (single row)", "mx1 grid (single column)", "2x2 grid", "Large m and n"]',
+        '["Math", "Dynamic Programming", "Combinatorics"]',
+        'medium',
+        62
+    )
+ON CONFLICT (title) DO UPDATE SET
+    prompt = EXCLUDED.prompt,
+    example = EXCLUDED.example,
+    constraints = EXCLUDED.constraints,
+    pattern = EXCLUDED.pattern,
+    key_idea = EXCLUDED.key_idea,
+    solution = EXCLUDED.solution,
+    time_complexity = EXCLUDED.time_complexity,
+    space_complexity = EXCLUDED.space_complexity,
+    steps = EXCLUDED.steps,
+    expected_edge_cases = EXCLUDED.expected_edge_cases,
+    topics = EXCLUDED.topics,
+    difficulty = EXCLUDED.difficulty,
+    leetcode_number = EXCLUDED.leetcode_number;
+
+-- Problems 26-50
+INSERT INTO public.blind_problems (title, prompt, example, constraints, pattern, key_idea, solution, time_complexity, space_complexity, steps, expected_edge_cases, topics, difficulty, leetcode_number)
+VALUES
+    (
+        'Jump Game',
+        'You are given an integer array nums. You are initially positioned at the array''s first index, and each element represents your maximum jump length at that position. Return true if you can reach the last index, or false otherwise.',
+        'Input: nums = [2,3,1,1,4]
+Output: true
+Explanation: Jump 1 step from index 0 to 1, then 3 steps to the last index.',
+        '["1 <= nums.length <= 10^4", "0 <= nums[i] <= 10^5"]',
+        'Greedy',
+        'Work backwards: track the leftmost position that can reach the goal. If a position can reach the current goal, it becomes the new goal.',
+        E'def canJump(nums: List[int]) -> bool:\\n    goal = len(nums) - 1\\n    for i in range(len(nums) - 2, -1, -1):\\n        if i + nums[i] >= goal:\\n            goal = i\\n    return goal == 0',
+        'O(n)',
+        'O(1)',
+        '["Set goal to last index", "Iterate backwards from second-to-last index", "If current index + jump length >= goal, update goal to current index", "After loop, return True if goal is 0"]',
+        '["Single element", "All zeros except first", "Last element is 0", "Can reach end in one jump", "Cannot reach end (stuck at 0)"]',
+        '["Array", "Dynamic Programming", "Greedy"]',
+        'medium',
+        55
+    ),
+    (
+        'Clone Graph',
+        'Given a reference of a node in a connected undirected graph, return a deep copy (clone) of the graph. Each node contains a value and a list of its neighbors.',
+        'Input: adjList = [[2,4],[1,3],[2,4],[1,3]]
+Output: [[2,4],[1,3],[2,4],[1,3]]
+Explanation: The graph has 4 nodes connected as shown.',
+        '["The number of nodes is in the range [0, 100]", "1 <= Node.val <= 100", "Node.val is unique for each node", "There are no repeated edges or self-loops", "The graph is connected"]',
+        'DFS/BFS with Hash Map',
+        'Use a hash map to track original->clone mappings. DFS/BFS through graph, creating clones and connecting neighbors.',
+        E'def cloneGraph(node: Node) -> Node:\\n    if not node:\\n        return None\\n    clones = {}\\n    def dfs(n):\\n        if n in clones:\\n            return clones[n]\\n        clone = Node(n.val)\\n        clones[n] = clone\\n        for neighbor in n.neighbors:\\n            clone.neighbors.append(dfs(neighbor))\\n        return clone\\n    return dfs(node)',
+        'O(V + E)',
+        'O(V)',
+        '["Handle empty graph", "Create hash map for original -> clone mapping", "DFS/BFS: if node already cloned, return clone", "Create new node, add to map immediately (before processing neighbors)", "Recursively clone all neighbors", "Return cloned start node"]',
+        '["Empty graph", "Single node with no neighbors", "Single node with self-loop", "Two connected nodes", "Fully connected graph"]',
+        '["Hash Table", "Depth-First Search", "Breadth-First Search", "Graph"]',
+        'medium',
+        133
+    ),
+    (
+        'Course Schedule',
+        'There are a total of numCourses courses you have to take, labeled from 0 to numCourses - 1. You are given an array prerequisites where prerequisites[i] = [ai, bi] indicates that you must take course bi first if you want to take course ai. Return true if you can finish all courses.',
+        'Input: numCourses = 2, prerequisites = [[1,0]]
+Output: true
+Explanation: You can take course 0 first, then take course 1.',
+        '["1 <= numCourses <= 2000", "0 <= prerequisites.length <= 5000", "prerequisites[i].length == 2", "0 <= ai, bi < numCourses", "All prerequisite pairs are unique"]',
+        'Topological Sort / Cycle Detection',
+        'Build adjacency list. Use DFS with 3 states: unvisited, visiting, visited. If we reach a "visiting" node during DFS, there is a cycle.',
+        E'def canFinish(numCourses: int, prerequisites: List[List[int]]) -> bool:\\n    graph = [[] for _ in range(numCourses)]\\n    for course, prereq in prerequisites:\\n        graph[course].append(prereq)\\n    # 0=unvisited, 1=visiting, 2=visited\\n    state = [0] * numCourses\\n    def hasCycle(course):\\n        if state[course] == 1: return True  # cycle\\n        if state[course] == 2: return False\\n        state[course] = 1\\n        for prereq in graph[course]:\\n            if hasCycle(prereq): return True\\n        state[course] = 2\\n        return False\\n    return not any(hasCycle(i) for i in range(numCourses))',
+        'O(V + E)',
+        'O(V + E)',
+        '["Build adjacency list from prerequisites", "Track 3 states: unvisited, visiting, visited", "DFS from each unvisited node", "If we encounter visiting node, cycle exists (return False)", "Mark node visited after all prereqs processed", "Return True if no cycle found"]',
+        '["No prerequisites", "Single course", "Linear chain of prerequisites", "Cycle exists", "Disconnected courses"]',
+        '["Depth-First Search", "Breadth-First Search", "Graph", "Topological Sort"]',
+        'medium',
+        207
+    ),
+    (
+        'Pacific Atlantic Water Flow',
+        'Given an m x n matrix of heights, the Pacific ocean touches the left and top edges, and the Atlantic ocean touches the right and bottom edges. Water can flow from a cell to adjacent cells (up, down, left, right) if the adjacent cell''s height is less than or equal to the current cell''s height. Return a list of coordinates where water can flow to both oceans.',
+        'Input: heights = [[1,2,2,3,5],[3,2,3,4,4],[2,4,5,3,1],[6,7,1,4,5],[5,1,1,2,4]]
+Output: [[0,4],[1,3],[1,4],[2,2],[3,0],[3,1],[4,0]]',
+        '["m == heights.length", "n == heights[i].length", "1 <= m, n <= 200", "0 <= heights[i][j] <= 10^5"]',
+        'Multi-source BFS/DFS',
+        'Instead of checking from each cell, start from ocean edges and work inward. Track which cells can reach each ocean. Return intersection.',
+        E'def pacificAtlantic(heights: List[List[int]]) -> List[List[int]]:\\n    m, n = len(heights), len(heights[0])\\n    pacific, atlantic = set(), set()\\n    def dfs(r, c, visited, prev_height):\\n        if (r,c) in visited or r<0 or c<0 or r>=m or c>=n or heights[r][c] < prev_height:\\n            return\\n        visited.add((r, c))\\n        for dr, dc in [(0,1),(0,-1),(1,0),(-1,0)]:\\n            dfs(r+dr, c+dc, visited, heights[r][c])\\n    # Start from ocean edges\\n    for c in range(n):\\n        dfs(0, c, pacific, 0)\\n        dfs(m-1, c, atlantic, 0)\\n    for r in range(m):\\n        dfs(r, 0, pacific, 0)\\n        dfs(r, n-1, atlantic, 0)\\n    return list(pacific & atlantic)',
+        'O(m * n)',
+        'O(m * n)',
+        '["Create sets to track cells reachable from each ocean", "DFS/BFS from Pacific edges (top row, left column) going uphill", "DFS/BFS from Atlantic edges (bottom row, right column) going uphill", "Find intersection of both sets", "Return cells that can reach both oceans"]',
+        '["1x1 grid", "Single row or column", "All same heights", "Strictly increasing/decreasing", "No cells reach both"]',
+        '["Array", "Depth-First Search", "Breadth-First Search", "Matrix"]',
+        'medium',
+        417
+    ),
+    (
+        'Number of Islands',
+        'Given an m x n 2D binary grid which represents a map of ''1''s (land) and ''0''s (water), return the number of islands. An island is surrounded by water and is formed by connecting adjacent lands horizontally or vertically.',
+        'Input: grid = [["1","1","1","1","0"],["1","1","0","1","0"],["1","1","0","0","0"],["0","0","0","0","0"]]
+Output: 1',
+        '["m == grid.length", "n == grid[i].length", "1 <= m, n <= 300", "grid[i][j] is ''0'' or ''1''"]',
+        'DFS/BFS Flood Fill',
+        'Iterate through grid. When finding a ''1'', increment count and use DFS/BFS to mark all connected ''1''s as visited (sink the island).',
+        E'def numIslands(grid: List[List[str]]) -> int:\\n    if not grid:\\n        return 0\\n    m, n = len(grid), len(grid[0])\\n    count = 0\\n    def dfs(r, c):\\n        if r<0 or c<0 or r>=m or c>=n or grid[r][c] != "1":\\n            return\\n        grid[r][c] = "0"  # Mark visited\\n        dfs(r+1, c); dfs(r-1, c); dfs(r, c+1); dfs(r, c-1)\\n    for r in range(m):\\n        for c in range(n):\\n            if grid[r][c] == "1":\\n                count += 1\\n                dfs(r, c)\\n    return count',
+        'O(m * n)',
+        'O(m * n)',
+        '["Iterate through each cell", "When finding ''1'', increment island count", "DFS/BFS to mark all connected ''1''s as ''0'' (visited)", "Continue iterating", "Return count"]',
+        '["Empty grid", "All water", "All land (one island)", "Single cell", "Many small islands", "Island touching all edges"]',
+        '["Array", "Depth-First Search", "Breadth-First Search", "Union Find", "Matrix"]',
+        'medium',
+        200
+    ),
+    (
+        'Longest Consecutive Sequence',
+        'Given an unsorted array of integers nums, return the length of the longest consecutive elements sequence. You must write an algorithm that runs in O(n) time.',
+        'Input: nums = [100,4,200,1,3,2]
+Output: 4
+Explanation: The longest consecutive sequence is [1, 2, 3, 4]. Its length is 4.',
+        '["0 <= nums.length <= 10^5", "-10^9 <= nums[i] <= 10^9"]',
+        'Hash Set',
+        'Add all numbers to a set. For each number, only start counting if num-1 is not in set (this is the start of a sequence). Count consecutive numbers.',
+        E'def longestConsecutive(nums: List[int]) -> int:\\n    num_set = set(nums)\\n    longest = 0\\n    for num in num_set:\\n        if num - 1 not in num_set:  # Start of sequence\\n            length = 1\\n            while num + length in num_set:\\n                length += 1\\n            longest = max(longest, length)\\n    return longest',
+        'O(n)',
+        'O(n)',
+        '["Add all numbers to a hash set", "For each number in set", "If num-1 not in set, this is start of a sequence", "Count consecutive numbers (num+1, num+2, ...)", "Update longest if current sequence is longer", "Return longest"]',
+        '["Empty array", "Single element", "No consecutive numbers", "All consecutive", "Duplicates in input", "Negative numbers"]',
+        '["Array", "Hash Table", "Union Find"]',
+        'medium',
+        128
+    ),
+    (
+        'Alien Dictionary',
+        'There is a new alien language that uses the English alphabet, but the order of letters is unknown. You are given a list of strings words from the alien language''s dictionary, where the strings are sorted lexicographically by the rules of this new language. Return a string of the unique letters in the new language sorted in lexicographically increasing order. If there is no valid order, return empty string.',
+        'Input: words = ["wrt","wrf","er","ett","rftt"]
+Output: "wertf"',
+        '["1 <= words.length <= 100", "1 <= words[i].length <= 100", "words[i] consists of only lowercase English letters"]',
+        'Topological Sort',
+        'Compare adjacent words to find ordering rules. Build a directed graph of character orderings. Topological sort the graph to find valid ordering.',
+        E'def alienOrder(words: List[str]) -> str:\\n    # Build adjacency list and in-degree count\\n    graph = {c: set() for word in words for c in word}\\n    in_degree = {c: 0 for c in graph}\\n    # Compare adjacent words\\n    for i in range(len(words) - 1):\\n        w1, w2 = words[i], words[i + 1]\\n        min_len = min(len(w1), len(w2))\\n        if len(w1) > len(w2) and w1[:min_len] == w2[:min_len]:\\n            return ""  # Invalid\\n        for j in range(min_len):\\n            if w1[j] != w2[j]:\\n                if w2[j] not in graph[w1[j]]:\\n                    graph[w1[j]].add(w2[j])\\n                    in_degree[w2[j]] += 1\\n                break\\n    # Topological sort (BFS)\\n    queue = [c for c in in_degree if in_degree[c] == 0]\\n    result = []\\n    while queue:\\n        c = queue.pop(0)\\n        result.append(c)\\n        for neighbor in graph[c]:\\n            in_degree[neighbor] -= 1\\n            if in_degree[neighbor] == 0:\\n                queue.append(neighbor)\\n    return "".join(result) if len(result) == len(graph) else ""',
+        'O(C)',
+        'O(1)',
+        '["Build graph with all unique characters", "Compare adjacent words to find first differing character", "Add edge from first char to second char", "Detect invalid case: longer word before shorter prefix", "Topological sort (BFS with in-degree)", "Return empty if cycle detected"]',
+        '["Single word", "Two words same length", "Prefix comes after full word (invalid)", "Cycle in ordering", "Multiple valid orderings"]',
+        '["Array", "String", "Depth-First Search", "Breadth-First Search", "Graph", "Topological Sort"]',
+        'hard',
+        269
+    ),
+    (
+        'Graph Valid Tree',
+        'Given n nodes labeled from 0 to n-1 and a list of undirected edges, write a function to check whether these edges make up a valid tree. A valid tree has exactly n-1 edges, is connected, and has no cycles.',
+        'Input: n = 5, edges = [[0,1],[0,2],[0,3],[1,4]]
+Output: true',
+        '["1 <= n <= 2000", "0 <= edges.length <= 5000", "edges[i].length == 2", "0 <= ai, bi < n", "ai != bi", "No duplicate edges"]',
+        'Union Find / DFS',
+        'A valid tree has exactly n-1 edges and is connected. Use Union Find: if union returns false (cycle), not a tree. Check if exactly one component.',
+        E'def validTree(n: int, edges: List[List[int]]) -> bool:\\n    if len(edges) != n - 1:\\n        return False\\n    parent = list(range(n))\\n    def find(x):\\n        if parent[x] != x:\\n            parent[x] = find(parent[x])\\n        return parent[x]\\n    def union(x, y):\\n        px, py = find(x), find(y)\\n        if px == py:\\n            return False  # Cycle\\n        parent[px] = py\\n        return True\\n    return all(union(a, b) for a, b in edges)',
+        'O(n * α(n))',
+        'O(n)',
+        '["Check if exactly n-1 edges (necessary for tree)", "Use Union Find with path compression", "For each edge, union the two nodes", "If union finds they already have same parent, cycle exists", "Return True if all unions succeed"]',
+        '["No edges (n=1)", "Single edge", "Not enough edges to connect", "Too many edges (cycle)", "Disconnected components"]',
+        '["Depth-First Search", "Breadth-First Search", "Union Find", "Graph"]',
+        'medium',
+        261
+    ),
+    (
+        'Number of Connected Components in an Undirected Graph',
+        'You have a graph of n nodes. You are given an integer n and an array edges where edges[i] = [ai, bi] indicates an undirected edge between nodes ai and bi. Return the number of connected components in the graph.',
+        'Input: n = 5, edges = [[0,1],[1,2],[3,4]]
+Output: 2
+Explanation: Components are {0,1,2} and {3,4}.',
+        '["1 <= n <= 2000", "1 <= edges.length <= 5000", "edges[i].length == 2", "0 <= ai, bi < n", "ai != bi", "No repeated edges"]',
+        'Union Find / DFS',
+        'Use Union Find: start with n components. Each successful union reduces count by 1. Or use DFS from each unvisited node, counting components.',
+        E'def countComponents(n: int, edges: List[List[int]]) -> int:\\n    parent = list(range(n))\\n    def find(x):\\n        if parent[x] != x:\\n            parent[x] = find(parent[x])\\n        return parent[x]\\n    def union(x, y):\\n        px, py = find(x), find(y)\\n        if px != py:\\n            parent[px] = py\\n            return True\\n        return False\\n    count = n\\n    for a, b in edges:\\n        if union(a, b):\\n            count -= 1\\n    return count',
+        'O(n * α(n))',
+        'O(n)',
+        '["Initialize parent array (each node is its own parent)", "Start with count = n (each node is its own component)", "For each edge, union the nodes", "If union successful (different parents), decrement count", "Return final count"]',
+        '["No edges (n components)", "Fully connected (1 component)", "Single node", "Multiple isolated nodes", "Linear chain"]',
+        '["Depth-First Search", "Breadth-First Search", "Union Find", "Graph"]',
+        'medium',
+        323
+    ),
+    (
+        'Insert Interval',
+        'You are given an array of non-overlapping intervals where intervals[i] = [starti, endi] represent the start and end of the ith interval. The intervals are sorted by starti. Insert newInterval into intervals such that intervals is still sorted and non-overlapping. Merge overlapping intervals if necessary.',
+        'Input: intervals = [[1,3],[6,9]], newInterval = [2,5]
+Output: [[1,5],[6,9]]
+Explanation: [2,5] overlaps with [1,3], merging to [1,5].',
+        '["0 <= intervals.length <= 10^4", "intervals[i].length == 2", "0 <= starti <= endi <= 10^5", "intervals is sorted by starti", "newInterval.length == 2"]',
+        'Interval Merging',
+        'Add all intervals that end before newInterval starts. Merge all overlapping intervals with newInterval. Add remaining intervals.',
+        E'def insert(intervals: List[List[int]], newInterval: List[int]) -> List[List[int]]:\\n    result = []\\n    i = 0\\n    # Add all intervals before newInterval\\n    while i < len(intervals) and intervals[i][1] < newInterval[0]:\\n        result.append(intervals[i])\\n        i += 1\\n    # Merge overlapping intervals\\n    while i < len(intervals) and intervals[i][0] <= newInterval[1]:\\n        newInterval = [min(newInterval[0], intervals[i][0]), max(newInterval[1], intervals[i][1])]\\n        i += 1\\n    result.append(newInterval)\\n    # Add remaining intervals\\n    result.extend(intervals[i:])\\n    return result',
+        'O(n)',
+        'O(n)',
+        '["Add all intervals that end before newInterval starts", "Merge all intervals that overlap with newInterval", "Update newInterval to span min start to max end", "Add merged newInterval to result", "Add all remaining intervals"]',
+        '["Empty intervals list", "No overlap (insert at beginning/middle/end)", "newInterval spans all intervals", "Single interval", "newInterval exactly matches an interval"]',
+        '["Array", "Interval"]',
+        'medium',
+        57
+    ),
+    (
+        'Merge Intervals',
+        'Given an array of intervals where intervals[i] = [starti, endi], merge all overlapping intervals and return an array of the non-overlapping intervals that cover all the intervals in the input.',
+        'Input: intervals = [[1,3],[2,6],[8,10],[15,18]]
+Output: [[1,6],[8,10],[15,18]]
+Explanation: [1,3] and [2,6] overlap, merge to [1,6].',
+        '["1 <= intervals.length <= 10^4", "intervals[i].length == 2", "0 <= starti <= endi <= 10^4"]',
+        'Interval Sorting and Merging',
+        'Sort intervals by start time. Iterate through: if current overlaps with last result interval, merge them. Otherwise, add current to result.',
+        E'def merge(intervals: List[List[int]]) -> List[List[int]]:\\n    intervals.sort(key=lambda x: x[0])\\n    result = [intervals[0]]\\n    for start, end in intervals[1:]:\\n        if start <= result[-1][1]:  # Overlap\\n            result[-1][1] = max(result[-1][1], end)\\n        else:\\n            result.append([start, end])\\n    return result',
+        'O(n log n)',
+        'O(n)',
+        '["Sort intervals by start time", "Initialize result with first interval", "For each remaining interval", "If it overlaps with last in result (start <= result[-1].end), merge by extending end", "Otherwise, add as new interval", "Return result"]',
+        '["Single interval", "No overlapping intervals", "All intervals overlap into one", "Intervals already sorted", "Intervals in reverse order"]',
+        '["Array", "Sorting"]',
+        'medium',
+        56
+    ),
+    (
+        'Non-overlapping Intervals',
+        'Given an array of intervals intervals where intervals[i] = [starti, endi], return the minimum number of intervals you need to remove to make the rest of the intervals non-overlapping.',
+        'Input: intervals = [[1,2],[2,3],[3,4],[1,3]]
+Output: 1
+Explanation: [1,3] can be removed and the rest are non-overlapping.',
+        '["1 <= intervals.length <= 10^5", "intervals[i].length == 2", "-5 * 10^4 <= starti < endi <= 5 * 10^4"]',
+        'Greedy',
+        'Sort by end time. Greedily keep intervals that end earliest. When overlap occurs, remove the one with later end time.',
+        E'def eraseOverlapIntervals(intervals: List[List[int]]) -> int:\\n    intervals.sort(key=lambda x: x[1])\\n    count = 0\\n    prev_end = float("-inf")\\n    for start, end in intervals:\\n        if start >= prev_end:\\n            prev_end = end\\n        else:\\n            count += 1\\n    return count',
+        'O(n log n)',
+        'O(1)',
+        '["Sort intervals by end time", "Track previous interval end", "For each interval", "If no overlap (start >= prev_end), update prev_end", "If overlap, increment removal count (keep the one ending earlier)", "Return count"]',
+        '["Single interval", "No overlaps", "All intervals overlap", "Intervals share endpoints", "Same start different ends"]',
+        '["Array", "Dynamic Programming", "Greedy", "Sorting"]',
+        'medium',
+        435
+    ),
+    (
+        'Meeting Rooms',
+        'Given an array of meeting time intervals where intervals[i] = [starti, endi], determine if a person could attend all meetings (i.e., no two meetings overlap).',
+        'Input: intervals = [[0,30],[5,10],[15,20]]
+Output: false
+Explanation: [0,30] overlaps with [5,10] and [15,20].',
+        '["0 <= intervals.length <= 10^4", "intervals[i].length == 2", "0 <= starti < endi <= 10^6"]',
+        'Sorting',
+        'Sort by start time. If any meeting starts before the previous one ends, there is overlap.',
+        E'def canAttendMeetings(intervals: List[List[int]]) -> bool:\\n    intervals.sort(key=lambda x: x[0])\\n    for i in range(1, len(intervals)):\\n        if intervals[i][0] < intervals[i-1][1]:\\n            return False\\n    return True',
+        'O(n log n)',
+        'O(1)',
+        '["Sort intervals by start time", "For each consecutive pair", "If current start < previous end, return False", "Return True if no overlaps found"]',
+        '["Empty array", "Single meeting", "Back-to-back meetings (no gap)", "Overlapping meetings", "All meetings at same time"]',
+        '["Array", "Sorting"]',
+        'easy',
+        252
+    ),
+    (
+        'Meeting Rooms II',
+        'Given an array of meeting time intervals where intervals[i] = [starti, endi], return the minimum number of conference rooms required.',
+        'Input: intervals = [[0,30],[5,10],[15,20]]
+Output: 2
+Explanation: We need 2 rooms: one for [0,30], one for [5,10] and [15,20].',
+        '["1 <= intervals.length <= 10^4", "0 <= starti < endi <= 10^6"]',
+        'Event Counting / Min Heap',
+        'Create separate sorted arrays of start and end times. Walk through events: each start adds a room, each end frees a room. Track max concurrent.',
+        E'def minMeetingRooms(intervals: List[List[int]]) -> int:\\n    starts = sorted([i[0] for i in intervals])\\n    ends = sorted([i[1] for i in intervals])\\n    rooms = max_rooms = 0\\n    s = e = 0\\n    while s < len(starts):\\n        if starts[s] < ends[e]:\\n            rooms += 1\\n            s += 1\\n        else:\\n            rooms -= 1\\n            e += 1\\n        max_rooms = max(max_rooms, rooms)\\n    return max_rooms',
+        'O(n log n)',
+        'O(n)',
+        '["Extract and sort all start times", "Extract and sort all end times", "Two pointers: one for starts, one for ends", "If start < end, need new room (rooms++)", "If start >= end, a room freed (rooms--)", "Track maximum rooms needed"]',
+        '["Single meeting", "No overlaps", "All overlap at same time", "Meetings in sequence", "One long meeting with many short overlapping"]',
+        '["Array", "Two Pointers", "Greedy", "Sorting", "Heap"]',
+        'medium',
+        253
+    ),
+    (
+        'Reverse Linked List',
+        'Given the head of a singly linked list, reverse the list and return the reversed list.',
+        'Input: head = [1,2,3,4,5]
+Output: [5,4,3,2,1]',
+        '["The number of nodes is in the range [0, 5000]", "-5000 <= Node.val <= 5000"]',
+        'Two Pointers',
+        'Iterate through list, reversing each link. Track previous and current nodes. After processing, previous becomes new head.',
+        E'def reverseList(head: ListNode) -> ListNode:\\n    prev, curr = None, head\\n    while curr:\\n        next_node = curr.next\\n        curr.next = prev\\n        prev = curr\\n        curr = next_node\\n    return prev',
+        'O(n)',
+        'O(1)',
+        '["Initialize prev = None, curr = head", "While curr is not None", "Save next node (curr.next)", "Reverse link: curr.next = prev", "Move prev and curr forward", "Return prev (new head)"]',
+        '["Empty list", "Single node", "Two nodes", "Long list"]',
+        '["Linked List", "Recursion"]',
+        'easy',
+        206
+    ),
+    (
+        'Linked List Cycle',
+        'Given head, the head of a linked list, determine if the linked list has a cycle in it. Return true if there is a cycle, false otherwise.',
+        'Input: head = [3,2,0,-4], pos = 1
+Output: true
+Explanation: There is a cycle where the tail connects to the 1st node (0-indexed).',
+        '["The number of nodes is in the range [0, 10^4]", "-10^5 <= Node.val <= 10^5", "pos is -1 or a valid index"]',
+        'Fast and Slow Pointers',
+        'Use two pointers: slow moves one step, fast moves two steps. If there is a cycle, they will eventually meet.',
+        E'def hasCycle(head: ListNode) -> bool:\\n    slow = fast = head\\n    while fast and fast.next:\\n        slow = slow.next\\n        fast = fast.next.next\\n        if slow == fast:\\n            return True\\n    return False',
+        'O(n)',
+        'O(1)',
+        '["Initialize slow and fast to head", "While fast and fast.next exist", "Move slow one step, fast two steps", "If they meet, cycle exists", "If fast reaches end, no cycle"]',
+        '["Empty list", "Single node no cycle", "Single node with self-loop", "Cycle at beginning", "Cycle at end", "No cycle"]',
+        '["Hash Table", "Linked List", "Two Pointers"]',
+        'easy',
+        141
+    ),
+    (
+        'Merge Two Sorted Lists',
+        'You are given the heads of two sorted linked lists list1 and list2. Merge the two lists into one sorted list. The list should be made by splicing together the nodes of the first two lists. Return the head of the merged linked list.',
+        'Input: list1 = [1,2,4], list2 = [1,3,4]
+Output: [1,1,2,3,4,4]',
+        '["The number of nodes in both lists is in the range [0, 50]", "-100 <= Node.val <= 100", "Both lists are sorted in non-decreasing order"]',
+        'Two Pointers / Dummy Node',
+        'Use dummy node to simplify edge cases. Compare nodes from both lists, append smaller one to result. Attach remaining nodes at end.',
+        E'def mergeTwoLists(list1: ListNode, list2: ListNode) -> ListNode:\\n    dummy = ListNode(0)\\n    curr = dummy\\n    while list1 and list2:\\n        if list1.val <= list2.val:\\n            curr.next = list1\\n            list1 = list1.next\\n        else:\\n            curr.next = list2\\n            list2 = list2.next\\n        curr = curr.next\\n    curr.next = list1 or list2\\n    return dummy.next',
+        'O(n + m)',
+        'O(1)',
+        '["Create dummy node, curr points to it", "While both lists have nodes", "Append node with smaller value", "Advance that list pointer", "Advance curr", "Attach remaining nodes", "Return dummy.next"]',
+        '["Both lists empty", "One list empty", "Lists of different lengths", "All elements from one list smaller", "Duplicate values"]',
+        '["Linked List", "Recursion"]',
+        'easy',
+        21
+    ),
+    (
+        'Merge K Sorted Lists',
+        'You are given an array of k linked-lists lists, each linked-list is sorted in ascending order. Merge all the linked-lists into one sorted linked-list and return it.',
+        'Input: lists = [[1,4,5],[1,3,4],[2,6]]
+Output: [1,1,2,3,4,4,5,6]
+Explanation: Merging all sorted lists into one sorted list.',
+        '["k == lists.length", "0 <= k <= 10^4", "0 <= lists[i].length <= 500", "-10^4 <= lists[i][j] <= 10^4", "lists[i] is sorted in ascending order", "The sum of lists[i].length <= 10^4"]',
+        'Divide and Conquer / Min Heap',
+        'Divide and conquer: merge pairs of lists until one remains. Or use min-heap to always pick smallest node from k lists.',
+        E'def mergeKLists(lists: List[ListNode]) -> ListNode:\\n    if not lists:\\n        return None\\n    while len(lists) > 1:\\n        merged = []\\n        for i in range(0, len(lists), 2):\\n            l1 = lists[i]\\n            l2 = lists[i + 1] if i + 1 < len(lists) else None\\n            merged.append(mergeTwoLists(l1, l2))\\n        lists = merged\\n    return lists[0]',
+        'O(N log k)',
+        'O(1)',
+        '["Handle empty lists array", "Use divide and conquer: merge pairs", "Or use min-heap of size k", "Push first node of each list to heap", "Pop min, add to result, push popped node''s next", "Continue until heap empty"]',
+        '["Empty array", "Array with empty lists", "Single list", "All lists empty", "Lists of very different sizes"]',
+        '["Linked List", "Divide and Conquer", "Heap", "Merge Sort"]',
+        'hard',
+        23
+    ),
+    (
+        'Remove Nth Node From End of List',
+        'Given the head of a linked list, remove the nth node from the end of the list and return its head.',
+        'Input: head = [1,2,3,4,5], n = 2
+Output: [1,2,3,5]
+Explanation: Remove the 2nd node from the end (node with value 4).',
+        '["The number of nodes in the list is sz", "1 <= sz <= 30", "0 <= Node.val <= 100", "1 <= n <= sz"]',
+        'Two Pointers with Offset',
+        'Use two pointers with n nodes between them. When fast reaches end, slow is at node before the one to remove.',
+        E'def removeNthFromEnd(head: ListNode, n: int) -> ListNode:\\n    dummy = ListNode(0, head)\\n    slow = fast = dummy\\n    # Move fast n+1 ahead\\n    for _ in range(n + 1):\\n        fast = fast.next\\n    # Move both until fast reaches end\\n    while fast:\\n        slow = slow.next\\n        fast = fast.next\\n    slow.next = slow.next.next\\n    return dummy.next',
+        'O(n)',
+        'O(1)',
+        '["Create dummy node before head", "Move fast pointer n+1 positions ahead", "Move both pointers until fast reaches None", "slow.next is the node to remove", "Skip it: slow.next = slow.next.next", "Return dummy.next"]',
+        '["Remove head (n equals length)", "Remove tail (n = 1)", "Single node list", "Remove middle node"]',
+        '["Linked List", "Two Pointers"]',
+        'medium',
+        19
+    ),
+    (
+        'Reorder List',
+        'You are given the head of a singly linked list: L0 → L1 → ... → Ln-1 → Ln. Reorder it to: L0 → Ln → L1 → Ln-1 → L2 → Ln-2 → ... You may not modify the values, only the nodes themselves.',
+        'Input: head = [1,2,3,4]
+Output: [1,4,2,3]',
+        '["The number of nodes is in the range [1, 5 × 10^4]", "1 <= Node.val <= 1000"]',
+        'Find Middle + Reverse + Merge',
+        'Find middle of list. Reverse second half. Merge two halves by alternating nodes.',
+        E'def reorderList(head: ListNode) -> None:\\n    # Find middle\\n    slow = fast = head\\n    while fast.next and fast.next.next:\\n        slow = slow.next\\n        fast = fast.next.next\\n    # Reverse second half\\n    prev, curr = None, slow.next\\n    slow.next = None\\n    while curr:\\n        next_node = curr.next\\n        curr.next = prev\\n        prev = curr\\n        curr = next_node\\n    # Merge two halves\\n    first, second = head, prev\\n    while second:\\n        tmp1, tmp2 = first.next, second.next\\n        first.next = second\\n        second.next = tmp1\\n        first, second = tmp1, tmp2',
+        'O(n)',
+        'O(1)',
+        '["Find middle using slow/fast pointers", "Split list into two halves", "Reverse the second half", "Merge by alternating: first→second→first.next→...", "Continue until second half exhausted"]',
+        '["Single node", "Two nodes", "Odd length list", "Even length list"]',
+        '["Linked List", "Two Pointers", "Stack", "Recursion"]',
+        'medium',
+        143
+    ),
+    (
+        'Set Matrix Zeroes',
+        'Given an m x n integer matrix, if an element is 0, set its entire row and column to 0. You must do it in place.',
+        'Input: matrix = [[1,1,1],[1,0,1],[1,1,1]]
+Output: [[1,0,1],[0,0,0],[1,0,1]]',
+        '["m == matrix.length", "n == matrix[0].length", "1 <= m, n <= 200", "-2^31 <= matrix[i][j] <= 2^31 - 1"]',
+        'In-place Markers',
+        'Use first row and column as markers. First pass: mark rows/cols to zero. Second pass: set zeros based on markers.',
+        E'def setZeroes(matrix: List[List[int]]) -> None:\\n    m, n = len(matrix), len(matrix[0])\\n    first_row_zero = any(matrix[0][j] == 0 for j in range(n))\\n    first_col_zero = any(matrix[i][0] == 0 for i in range(m))\\n    # Mark zeros in first row/col\\n    for i in range(1, m):\\n        for j in range(1, n):\\n            if matrix[i][j] == 0:\\n                matrix[i][0] = matrix[0][j] = 0\\n    # Set zeros based on markers\\n    for i in range(1, m):\\n        for j in range(1, n):\\n            if matrix[i][0] == 0 or matrix[0][j] == 0:\\n                matrix[i][j] = 0\\n    # Handle first row and column\\n    if first_row_zero:\\n        for j in range(n): matrix[0][j] = 0\\n    if first_col_zero:\\n        for i in range(m): matrix[i][0] = 0',
+        'O(m * n)',
+        'O(1)',
+        '["Check if first row/column originally have zeros", "Use first row/column as markers", "For each cell with 0, mark its row start and column start", "Second pass: if marker is 0, set cell to 0", "Handle first row/column separately at end"]',
+        '["No zeros", "All zeros", "Single row/column", "Zero in first row or column", "1x1 matrix"]',
+        '["Array", "Hash Table", "Matrix"]',
+        'medium',
+        73
+    ),
+    (
+        'Spiral Matrix',
+        'Given an m x n matrix, return all elements of the matrix in spiral order.',
+        'Input: matrix = [[1,2,3],[4,5,6],[7,8,9]]
+Output: [1,2,3,6,9,8,7,4,5]',
+        '["m == matrix.length", "n == matrix[i].length", "1 <= m, n <= 10", "-100 <= matrix[i][j] <= 100"]',
+        'Boundary Tracking',
+        'Track four boundaries (top, bottom, left, right). Move in spiral: right→down→left→up, shrinking boundaries after each direction.',
+        E'def spiralOrder(matrix: List[List[int]]) -> List[int]:\\n    result = []\\n    top, bottom = 0, len(matrix) - 1\\n    left, right = 0, len(matrix[0]) - 1\\n    while top <= bottom and left <= right:\\n        for j in range(left, right + 1): result.append(matrix[top][j])\\n        top += 1\\n        for i in range(top, bottom + 1): result.append(matrix[i][right])\\n        right -= 1\\n        if top <= bottom:\\n            for j in range(right, left - 1, -1): result.append(matrix[bottom][j])\\n            bottom -= 1\\n        if left <= right:\\n            for i in range(bottom, top - 1, -1): result.append(matrix[i][left])\\n            left += 1\\n    return result',
+        'O(m * n)',
+        'O(1)',
+        '["Initialize boundaries: top=0, bottom=m-1, left=0, right=n-1", "While boundaries valid", "Traverse right: top row, then top++", "Traverse down: right column, then right--", "Traverse left: bottom row (if valid), then bottom--", "Traverse up: left column (if valid), then left++"]',
+        '["1x1 matrix", "Single row", "Single column", "Wide matrix (1xn)", "Tall matrix (mx1)"]',
+        '["Array", "Matrix", "Simulation"]',
+        'medium',
+        54
+    ),
+    (
+        'Rotate Image',
+        'You are given an n x n 2D matrix representing an image. Rotate the image by 90 degrees clockwise. You have to rotate the image in-place.',
+        'Input: matrix = [[1,2,3],[4,5,6],[7,8,9]]
+Output: [[7,4,1],[8,5,2],[9,6,3]]',
+        '["n == matrix.length == matrix[i].length", "1 <= n <= 20", "-1000 <= matrix[i][j] <= 1000"]',
+        'Transpose + Reverse',
+        'Rotate 90° clockwise = Transpose matrix + Reverse each row. Or rotate layer by layer, swapping 4 elements at a time.',
+        E'def rotate(matrix: List[List[int]]) -> None:\\n    n = len(matrix)\\n    # Transpose\\n    for i in range(n):\\n        for j in range(i + 1, n):\\n            matrix[i][j], matrix[j][i] = matrix[j][i], matrix[i][j]\\n    # Reverse each row\\n    for row in matrix:\\n        row.reverse()',
+        'O(n²)',
+        'O(1)',
+        '["Transpose matrix: swap matrix[i][j] with matrix[j][i]", "Only swap upper triangle to avoid double swap", "Reverse each row", "This achieves 90° clockwise rotation"]',
+        '["1x1 matrix", "2x2 matrix", "Odd dimension", "Even dimension"]',
+        '["Array", "Math", "Matrix"]',
+        'medium',
+        48
+    ),
+    (
+        'Word Search',
+        'Given an m x n grid of characters board and a string word, return true if word exists in the grid. The word can be constructed from letters of sequentially adjacent cells (horizontally or vertically), where the same cell may not be used more than once.',
+        'Input: board = [["A","B","C","E"],["S","F","C","S"],["A","D","E","E"]], word = "ABCCED"
+Output: true',
+        '["m == board.length", "n = board[i].length", "1 <= m, n <= 6", "1 <= word.length <= 15", "board and word consist of only lowercase and uppercase English letters"]',
+        'Backtracking DFS',
+        'DFS from each cell. Track visited cells in current path. If character matches, explore neighbors. Backtrack by unmarking visited.',
+        E'def exist(board: List[List[str]], word: str) -> bool:\\n    m, n = len(board), len(board[0])\\n    def dfs(i, j, k):\\n        if k == len(word):\\n            return True\\n        if i < 0 or i >= m or j < 0 or j >= n or board[i][j] != word[k]:\\n            return False\\n        temp, board[i][j] = board[i][j], "#"  # Mark visited\\n        found = dfs(i+1,j,k+1) or dfs(i-1,j,k+1) or dfs(i,j+1,k+1) or dfs(i,j-1,k+1)\\n        board[i][j] = temp  # Unmark\\n        return found\\n    return any(dfs(i, j, 0) for i in range(m) for j in range(n))',
+        'O(m * n * 4^L)',
+        'O(L)',
+        '["Try starting DFS from each cell", "If out of bounds or character doesn''t match, return False", "If all characters matched, return True", "Mark current cell as visited (modify in place)", "Explore all 4 directions", "Backtrack: restore original character"]',
+        '["Word not in grid", "Word is entire grid", "Single cell grid", "Word with repeated characters", "Multiple possible paths"]',
+        '["Array", "Backtracking", "Matrix"]',
+        'medium',
+        79
+    ),
+    (
+        'Longest Substring Without Repeating Characters',
+        'Given a string s, find the length of the longest substring without repeating characters.',
+        'Input: s = "abcabcbb"
+Output: 3
+Explanation: The answer is "abc", with length 3.',
+        '["0 <= s.length <= 5 * 10^4", "s consists of English letters, digits, symbols and spaces"]',
+        'Sliding Window',
+        'Use a set to track characters in current window. Expand right, if duplicate found, shrink left until no duplicate.',
+        E'def lengthOfLongestSubstring(s: str) -> int:\\n    char_set = set()\\n    left = max_len = 0\\n    for right in range(len(s)):\\n        while s[right] in char_set:\\n            char_set.remove(s[left])\\n            left += 1\\n        char_set.add(s[right])\\n        max_len = max(max_len, right - left + 1)\\n    return max_len',
+        'O(n)',
+        'O(min(m, n))',
+        '["Use set to track characters in window", "Expand window by moving right pointer", "If duplicate found, shrink from left until no duplicate", "Update max length at each step", "Return max length"]',
+        '["Empty string", "All same characters", "All unique characters", "Repeating pattern", "Single character"]',
+        '["Hash Table", "String", "Sliding Window"]',
+        'medium',
+        3
+    )
+ON CONFLICT (title) DO UPDATE SET
+    prompt = EXCLUDED.prompt,
+    example = EXCLUDED.example,
+    constraints = EXCLUDED.constraints,
+    pattern = EXCLUDED.pattern,
+    key_idea = EXCLUDED.key_idea,
+    solution = EXCLUDED.solution,
+    time_complexity = EXCLUDED.time_complexity,
+    space_complexity = EXCLUDED.space_complexity,
+    steps = EXCLUDED.steps,
+    expected_edge_cases = EXCLUDED.expected_edge_cases,
+    topics = EXCLUDED.topics,
+    difficulty = EXCLUDED.difficulty,
+    leetcode_number = EXCLUDED.leetcode_number;
+
+-- Problems 51-75
+INSERT INTO public.blind_problems (title, prompt, example, constraints, pattern, key_idea, solution, time_complexity, space_complexity, steps, expected_edge_cases, topics, difficulty, leetcode_number)
+VALUES
+    (
+        'Longest Repeating Character Replacement',
+        'You are given a string s and an integer k. You can choose any character of the string and change it to any other uppercase English character. You can perform this operation at most k times. Return the length of the longest substring containing the same letter you can get after performing the above operations.',
+        'Input: s = "AABABBA", k = 1
+Output: 4
+Explanation: Replace one ''A'' in the middle to get "AABBBBA" with substring "BBBB" of length 4.
+
+Input: s = "ABBA", k = 1
+Output: 3
+Explanation: Replace one ''A'' to get substring "BBB" of length 3, or replace one ''B'' to get substring "AAA" of length 3.',
+        '["1 <= s.length <= 10^5", "s consists of only uppercase English letters", "0 <= k <= s.length"]',
+        'Sliding Window',
+        'Window is valid if (window_length - max_freq) <= k, where max_freq tracks the highest frequency seen (doesn''t decrease when shrinking - an optimization that still works). Expand right, shrink left when invalid.',
+        E'def characterReplacement(s: str, k: int) -> int:\\n    count = {}\\n    left = max_freq = max_len = 0\\n    for right in range(len(s)):\\n        count[s[right]] = count.get(s[right], 0) + 1\\n        max_freq = max(max_freq, count[s[right]])\\n        while (right - left + 1) - max_freq > k:\\n            count[s[left]] -= 1\\n            left += 1\\n        max_len = max(max_len, right - left + 1)\\n    return max_len',
+        'O(n)',
+        'O(26)',
+        '["Track character counts in current window", "Track max frequency of any character", "Window valid if (length - max_freq) <= k", "If invalid, shrink from left", "Update max length", "Note: max_freq doesn''t need to decrease when shrinking"]',
+        '["All same characters", "k = 0 (no changes)", "k >= string length", "Alternating characters", "Single character"]',
+        '["Hash Table", "String", "Sliding Window"]',
+        'medium',
+        424
+    ),
+    (
+        'Minimum Window Substring',
+        'Given two strings s and t, return the minimum window substring of s such that every character in t (including duplicates) is included in the window. If there is no such substring, return the empty string.',
+        'Input: s = "ADOBECODEBANC", t = "ABC"
+Output: "BANC"
+Explanation: "BANC" is the minimum window containing all chars of t.',
+        '["1 <= s.length, t.length <= 10^5", "s and t consist of uppercase and lowercase English letters"]',
+        'Sliding Window with Frequency Count',
+        'Track needed chars and have count. Expand until all chars found. Then shrink from left while still valid, updating minimum.',
+        E'def minWindow(s: str, t: str) -> str:\\n    from collections import Counter\\n    need = Counter(t)\\n    have, required = 0, len(need)\\n    left = 0\\n    min_len, result = float("inf"), ""\\n    window = {}\\n    for right in range(len(s)):\\n        c = s[right]\\n        window[c] = window.get(c, 0) + 1\\n        if c in need and window[c] == need[c]:\\n            have += 1\\n        while have == required:\\n            if right - left + 1 < min_len:\\n                min_len = right - left + 1\\n                result = s[left:right+1]\\n            window[s[left]] -= 1\\n            if s[left] in need and window[s[left]] < need[s[left]]:\\n                have -= 1\\n            left += 1\\n    return result',
+        'O(n + m)',
+        'O(n + m)',
+        '["Count required characters from t", "Expand window, track when each required char count is satisfied", "When all required chars satisfied, try shrinking from left", "Update minimum window while shrinking", "Stop shrinking when window becomes invalid"]',
+        '["t longer than s", "No valid window exists", "t equals s", "Single character strings", "Duplicate characters in t"]',
+        '["Hash Table", "String", "Sliding Window"]',
+        'hard',
+        76
+    ),
+    (
+        'Valid Anagram',
+        'Given two strings s and t, return true if t is an anagram of s, and false otherwise. An anagram is a word formed by rearranging the letters of another word, using all the original letters exactly once.',
+        'Input: s = "anagram", t = "nagaram"
+Output: true',
+        '["1 <= s.length, t.length <= 5 * 10^4", "s and t consist of lowercase English letters"]',
+        'Hash Map / Sorting',
+        'Count character frequencies in both strings. If counts match, they are anagrams. Or sort both strings and compare.',
+        E'def isAnagram(s: str, t: str) -> bool:\\n    if len(s) != len(t):\\n        return False\\n    count = {}\\n    for c in s:\\n        count[c] = count.get(c, 0) + 1\\n    for c in t:\\n        count[c] = count.get(c, 0) - 1\\n        if count[c] < 0:\\n            return False\\n    return True',
+        'O(n)',
+        'O(1)',
+        '["If lengths differ, return False", "Count frequency of each character in s", "Decrement counts for each character in t", "If any count goes negative, return False", "Return True if all counts balance"]',
+        '["Different lengths", "Empty strings", "Same string", "Same characters different frequencies", "Single character"]',
+        '["Hash Table", "String", "Sorting"]',
+        'easy',
+        242
+    ),
+    (
+        'Group Anagrams',
+        'Given an array of strings strs, group the anagrams together. You can return the answer in any order.',
+        'Input: strs = ["eat","tea","tan","ate","nat","bat"]
+Output: [["bat"],["nat","tan"],["ate","eat","tea"]]',
+        '["1 <= strs.length <= 10^4", "0 <= strs[i].length <= 100", "strs[i] consists of lowercase English letters"]',
+        'Hash Map with Character Count Key',
+        'Use character count tuple as key (or sorted string). Words with same key are anagrams.',
+        E'def groupAnagrams(strs: List[str]) -> List[List[str]]:\\n    from collections import defaultdict\\n    groups = defaultdict(list)\\n    for s in strs:\\n        # Create key from character counts\\n        count = [0] * 26\\n        for c in s:\\n            count[ord(c) - ord("a")] += 1\\n        groups[tuple(count)].append(s)\\n    return list(groups.values())',
+        'O(n * k)',
+        'O(n * k)',
+        '["Create hash map with count-tuple as key", "For each string, count character frequencies", "Convert count array to tuple (hashable)", "Group strings with same key", "Return all groups"]',
+        '["Empty strings", "Single string", "No anagrams (all unique)", "All strings are anagrams", "Mixed case (problem says lowercase only)"]',
+        '["Array", "Hash Table", "String", "Sorting"]',
+        'medium',
+        49
+    ),
+    (
+        'Valid Parentheses',
+        'Given a string s containing just the characters ''('', '')'', ''{'', ''}'', ''['', '']'', determine if the input string is valid. An input string is valid if: Open brackets are closed by the same type of brackets. Open brackets are closed in the correct order. Every close bracket has a corresponding open bracket.',
+        'Input: s = "()[]{}"
+Output: true',
+        '["1 <= s.length <= 10^4", "s consists of parentheses only ''()[]{}''"]',
+        'Stack',
+        'Push opening brackets onto stack. For closing brackets, pop and check if it matches. Stack should be empty at end.',
+        E'def isValid(s: str) -> bool:\\n    stack = []\\n    pairs = {")": "(", "}": "{", "]": "["}\\n    for c in s:\\n        if c in pairs:  # Closing bracket\\n            if not stack or stack.pop() != pairs[c]:\\n                return False\\n        else:  # Opening bracket\\n            stack.append(c)\\n    return len(stack) == 0',
+        'O(n)',
+        'O(n)',
+        '["Create mapping of closing to opening brackets", "For each character", "If opening bracket, push to stack", "If closing bracket, pop and check match", "If no match or empty stack, return False", "Return True if stack empty at end"]',
+        '["Empty string", "Single bracket", "Only opening brackets", "Only closing brackets", "Nested brackets", "Interleaved brackets"]',
+        '["String", "Stack"]',
+        'easy',
+        20
+    ),
+    (
+        'Valid Palindrome',
+        'A phrase is a palindrome if, after converting all uppercase letters to lowercase and removing all non-alphanumeric characters, it reads the same forward and backward. Given a string s, return true if it is a palindrome, or false otherwise.',
+        'Input: s = "A man, a plan, a canal: Panama"
+Output: true
+Explanation: "amanaplanacanalpanama" is a palindrome.',
+        '["1 <= s.length <= 2 * 10^5", "s consists only of printable ASCII characters"]',
+        'Two Pointers',
+        'Use two pointers from both ends. Skip non-alphanumeric characters. Compare characters (case-insensitive).',
+        E'def isPalindrome(s: str) -> bool:\\n    left, right = 0, len(s) - 1\\n    while left < right:\\n        while left < right and not s[left].isalnum():\\n            left += 1\\n        while left < right and not s[right].isalnum():\\n            right -= 1\\n        if s[left].lower() != s[right].lower():\\n            return False\\n        left += 1\\n        right -= 1\\n    return True',
+        'O(n)',
+        'O(1)',
+        '["Initialize left and right pointers", "Skip non-alphanumeric from left", "Skip non-alphanumeric from right", "Compare characters (lowercase)", "If not equal, return False", "Move pointers inward", "Return True if all match"]',
+        '["Empty string", "Single character", "Only non-alphanumeric", "All same character", "Spaces and punctuation only"]',
+        '["Two Pointers", "String"]',
+        'easy',
+        125
+    ),
+    (
+        'Longest Palindromic Substring',
+        'Given a string s, return the longest palindromic substring in s.',
+        'Input: s = "babad"
+Output: "bab"
+Explanation: "aba" is also a valid answer.',
+        '["1 <= s.length <= 1000", "s consist of only digits and English letters"]',
+        'Expand Around Center',
+        'For each character (and between characters), expand outward while palindrome. Track longest found.',
+        E'def longestPalindrome(s: str) -> str:\\n    result = ""\\n    def expand(left, right):\\n        while left >= 0 and right < len(s) and s[left] == s[right]:\\n            left -= 1\\n            right += 1\\n        return s[left + 1:right]\\n    for i in range(len(s)):\\n        # Odd length palindrome\\n        odd = expand(i, i)\\n        if len(odd) > len(result):\\n            result = odd\\n        # Even length palindrome\\n        even = expand(i, i + 1)\\n        if len(even) > len(result):\\n            result = even\\n    return result',
+        'O(n²)',
+        'O(1)',
+        '["For each position i", "Expand around i (odd-length palindrome)", "Expand around i, i+1 (even-length palindrome)", "Track longest palindrome found", "Return longest"]',
+        '["Single character", "All same characters", "No palindrome longer than 1", "Entire string is palindrome", "Palindrome at beginning/middle/end"]',
+        '["String", "Dynamic Programming"]',
+        'medium',
+        5
+    ),
+    (
+        'Palindromic Substrings',
+        'Given a string s, return the number of palindromic substrings in it. A string is a palindrome when it reads the same backward as forward. A substring is a contiguous sequence of characters within the string.',
+        'Input: s = "abc"
+Output: 3
+Explanation: Three palindromic strings: "a", "b", "c".',
+        '["1 <= s.length <= 1000", "s consists of lowercase English letters"]',
+        'Expand Around Center',
+        'For each center (character and between characters), expand outward counting palindromes. Each expansion that succeeds is a palindrome.',
+        E'def countSubstrings(s: str) -> int:\\n    count = 0\\n    def expand(left, right):\\n        nonlocal count\\n        while left >= 0 and right < len(s) and s[left] == s[right]:\\n            count += 1\\n            left -= 1\\n            right += 1\\n    for i in range(len(s)):\\n        expand(i, i)      # Odd length\\n        expand(i, i + 1)  # Even length\\n    return count',
+        'O(n²)',
+        'O(1)',
+        '["For each position i", "Expand around i (odd-length centers)", "Expand around i, i+1 (even-length centers)", "Each successful expansion is a palindrome", "Increment count for each palindrome found"]',
+        '["Single character (count = 1)", "All same characters", "No palindromes longer than 1", "Entire string is palindrome"]',
+        '["String", "Dynamic Programming"]',
+        'medium',
+        647
+    ),
+    (
+        'Encode and Decode Strings',
+        'Design an algorithm to encode a list of strings to a string. The encoded string is then sent over the network and decoded back to the original list of strings.',
+        'Input: ["lint","code","love","you"]
+Output: ["lint","code","love","you"]
+Explanation: Encode then decode returns original.',
+        '["1 <= strs.length <= 200", "0 <= strs[i].length <= 200", "strs[i] contains any possible characters from 0 to 255"]',
+        'Length Prefix Encoding',
+        'Prefix each string with its length followed by a delimiter. This handles any characters including the delimiter itself.',
+        E'class Codec:\\n    def encode(self, strs: List[str]) -> str:\\n        result = ""\\n        for s in strs:\\n            result += str(len(s)) + "#" + s\\n        return result\\n    \\n    def decode(self, s: str) -> List[str]:\\n        result = []\\n        i = 0\\n        while i < len(s):\\n            j = i\\n            while s[j] != "#":\\n                j += 1\\n            length = int(s[i:j])\\n            result.append(s[j + 1:j + 1 + length])\\n            i = j + 1 + length\\n        return result',
+        'O(n)',
+        'O(n)',
+        '["Encode: For each string, write length + # + string", "Decode: Read until #, parse length", "Read next length characters as the string", "Repeat until end of encoded string"]',
+        '["Empty list", "List with empty strings", "Strings containing # or digits", "Very long strings", "Unicode characters"]',
+        '["Array", "String", "Design"]',
+        'medium',
+        271
+    ),
+    (
+        'Maximum Depth of Binary Tree',
+        'Given the root of a binary tree, return its maximum depth. A binary tree''s maximum depth is the number of nodes along the longest path from the root node down to the farthest leaf node.',
+        'Input: root = [3,9,20,null,null,15,7]
+Output: 3',
+        '["The number of nodes is in the range [0, 10^4]", "-100 <= Node.val <= 100"]',
+        'DFS Recursion',
+        'Maximum depth = 1 + max(depth of left subtree, depth of right subtree). Base case: empty tree has depth 0.',
+        E'def maxDepth(root: TreeNode) -> int:\\n    if not root:\\n        return 0\\n    return 1 + max(maxDepth(root.left), maxDepth(root.right))',
+        'O(n)',
+        'O(h)',
+        '["Base case: if root is None, return 0", "Recursively get depth of left subtree", "Recursively get depth of right subtree", "Return 1 + max of both depths"]',
+        '["Empty tree", "Single node", "Skewed tree (all left or all right)", "Balanced tree", "Complete tree"]',
+        '["Tree", "Depth-First Search", "Breadth-First Search", "Binary Tree"]',
+        'easy',
+        104
+    ),
+    (
+        'Same Tree',
+        'Given the roots of two binary trees p and q, write a function to check if they are the same or not. Two binary trees are considered the same if they are structurally identical and the nodes have the same value.',
+        'Input: p = [1,2,3], q = [1,2,3]
+Output: true',
+        '["The number of nodes in both trees is in the range [0, 100]", "-10^4 <= Node.val <= 10^4"]',
+        'DFS Recursion',
+        'Both trees are same if: both roots are null, or both have same value AND left subtrees are same AND right subtrees are same.',
+        E'def isSameTree(p: TreeNode, q: TreeNode) -> bool:\\n    if not p and not q:\\n        return True\\n    if not p or not q or p.val != q.val:\\n        return False\\n    return isSameTree(p.left, q.left) and isSameTree(p.right, q.right)',
+        'O(n)',
+        'O(h)',
+        '["If both null, return True", "If one null or values differ, return False", "Recursively check left subtrees", "Recursively check right subtrees", "Return True only if both subtrees match"]',
+        '["Both empty", "One empty one not", "Same structure different values", "Different structures", "Single node trees"]',
+        '["Tree", "Depth-First Search", "Breadth-First Search", "Binary Tree"]',
+        'easy',
+        100
+    ),
+    (
+        'Invert Binary Tree',
+        'Given the root of a binary tree, invert the tree, and return its root.',
+        'Input: root = [4,2,7,1,3,6,9]
+Output: [4,7,2,9,6,3,1]
+Explanation: Left and right subtrees are swapped at each level.',
+        '["The number of nodes is in the range [0, 100]", "-100 <= Node.val <= 100"]',
+        'DFS Recursion',
+        'Recursively invert left and right subtrees, then swap them.',
+        E'def invertTree(root: TreeNode) -> TreeNode:\\n    if not root:\\n        return None\\n    root.left, root.right = root.right, root.left\\n    invertTree(root.left)\\n    invertTree(root.right)\\n    return root',
+        'O(n)',
+        'O(h)',
+        '["Base case: if root is None, return None", "Swap left and right children", "Recursively invert left subtree", "Recursively invert right subtree", "Return root"]',
+        '["Empty tree", "Single node", "Skewed tree", "Complete binary tree", "Already symmetric tree"]',
+        '["Tree", "Depth-First Search", "Breadth-First Search", "Binary Tree"]',
+        'easy',
+        226
+    ),
+    (
+        'Binary Tree Maximum Path Sum',
+        'A path in a binary tree is a sequence of nodes where each pair of adjacent nodes has an edge. A path sum is the sum of node values in the path. Given the root of a binary tree, return the maximum path sum of any non-empty path.',
+        'Input: root = [-10,9,20,null,null,15,7]
+Output: 42
+Explanation: The optimal path is 15 → 20 → 7 with sum 42.',
+        '["The number of nodes is in the range [1, 3 * 10^4]", "-1000 <= Node.val <= 1000"]',
+        'DFS with Global Max',
+        'At each node, calculate max path going through it (left + node + right). Track global max. Return max single path (node + one child) for parent.',
+        E'def maxPathSum(root: TreeNode) -> int:\\n    max_sum = float("-inf")\\n    def dfs(node):\\n        nonlocal max_sum\\n        if not node:\\n            return 0\\n        left = max(0, dfs(node.left))   # Ignore negative paths\\n        right = max(0, dfs(node.right))\\n        max_sum = max(max_sum, left + node.val + right)  # Path through node\\n        return node.val + max(left, right)  # Path to parent\\n    dfs(root)\\n    return max_sum',
+        'O(n)',
+        'O(h)',
+        '["DFS returns max path sum starting from node going down", "At each node, left_gain = max(0, left_path)", "right_gain = max(0, right_path)", "Update global max with node.val + left_gain + right_gain", "Return node.val + max(left_gain, right_gain) to parent"]',
+        '["All negative values", "Single node", "Linear tree (skewed)", "Balanced tree", "Path doesn''t include root"]',
+        '["Dynamic Programming", "Tree", "Depth-First Search", "Binary Tree"]',
+        'hard',
+        124
+    ),
+    (
+        'Binary Tree Level Order Traversal',
+        'Given the root of a binary tree, return the level order traversal of its nodes'' values. (i.e., from left to right, level by level).',
+        'Input: root = [3,9,20,null,null,15,7]
+Output: [[3],[9,20],[15,7]]',
+        '["The number of nodes is in the range [0, 2000]", "-1000 <= Node.val <= 1000"]',
+        'BFS with Queue',
+        'Use a queue. Process nodes level by level: for each level, process all nodes currently in queue, adding their children for next level.',
+        E'def levelOrder(root: TreeNode) -> List[List[int]]:\\n    if not root:\\n        return []\\n    result = []\\n    queue = [root]\\n    while queue:\\n        level = []\\n        level_size = len(queue)\\n        for _ in range(level_size):\\n            node = queue.pop(0)\\n            level.append(node.val)\\n            if node.left:\\n                queue.append(node.left)\\n            if node.right:\\n                queue.append(node.right)\\n        result.append(level)\\n    return result',
+        'O(n)',
+        'O(n)',
+        '["Handle empty tree", "Initialize queue with root", "While queue not empty", "Process all nodes at current level (use level_size)", "Add children to queue for next level", "Append level values to result"]',
+        '["Empty tree", "Single node", "Complete tree", "Skewed tree", "Tree with one child at each level"]',
+        '["Tree", "Breadth-First Search", "Binary Tree"]',
+        'medium',
+        102
+    ),
+    (
+        'Serialize and Deserialize Binary Tree',
+        'Design an algorithm to serialize a binary tree to a string and deserialize that string back to the original tree structure.',
+        'Input: root = [1,2,3,null,null,4,5]
+Output: [1,2,3,null,null,4,5]
+Explanation: Serialize then deserialize returns original tree.',
+        '["The number of nodes is in the range [0, 10^4]", "-1000 <= Node.val <= 1000"]',
+        'Preorder DFS',
+        'Serialize: preorder traversal, use marker for null. Deserialize: read values in same order, recursively build tree.',
+        E'class Codec:\\n    def serialize(self, root: TreeNode) -> str:\\n        result = []\\n        def dfs(node):\\n            if not node:\\n                result.append("N")\\n                return\\n            result.append(str(node.val))\\n            dfs(node.left)\\n            dfs(node.right)\\n        dfs(root)\\n        return ",".join(result)\\n    \\n    def deserialize(self, data: str) -> TreeNode:\\n        values = data.split(",")\\n        self.i = 0\\n        def dfs():\\n            if values[self.i] == "N":\\n                self.i += 1\\n                return None\\n            node = TreeNode(int(values[self.i]))\\n            self.i += 1\\n            node.left = dfs()\\n            node.right = dfs()\\n            return node\\n        return dfs()',
+        'O(n)',
+        'O(n)',
+        '["Serialize: preorder DFS, add value or N for null", "Join with delimiter", "Deserialize: split by delimiter", "Read values in order, build tree recursively", "N means return None, otherwise create node and recurse"]',
+        '["Empty tree", "Single node", "Skewed tree", "Complete tree", "Negative values"]',
+        '["String", "Tree", "Depth-First Search", "Breadth-First Search", "Design", "Binary Tree"]',
+        'hard',
+        297
+    ),
+    (
+        'Subtree of Another Tree',
+        'Given the roots of two binary trees root and subRoot, return true if there is a subtree of root with the same structure and node values as subRoot.',
+        'Input: root = [3,4,5,1,2], subRoot = [4,1,2]
+Output: true',
+        '["The number of nodes in root is in the range [1, 2000]", "The number of nodes in subRoot is in the range [1, 1000]", "-10^4 <= root.val, subRoot.val <= 10^4"]',
+        'DFS with Same Tree Check',
+        'For each node in root, check if subtree starting there matches subRoot using isSameTree logic.',
+        E'def isSubtree(root: TreeNode, subRoot: TreeNode) -> bool:\\n    def isSame(p, q):\\n        if not p and not q:\\n            return True\\n        if not p or not q or p.val != q.val:\\n            return False\\n        return isSame(p.left, q.left) and isSame(p.right, q.right)\\n    \\n    def dfs(node):\\n        if not node:\\n            return False\\n        if isSame(node, subRoot):\\n            return True\\n        return dfs(node.left) or dfs(node.right)\\n    \\n    return dfs(root)',
+        'O(m * n)',
+        'O(h)',
+        '["Create isSameTree helper function", "DFS through main tree", "At each node, check if subtree matches subRoot", "If match found, return True", "Otherwise check left and right subtrees"]',
+        '["subRoot equals entire root", "subRoot is leaf", "subRoot not found", "Multiple potential matches", "Single node trees"]',
+        '["Tree", "Depth-First Search", "String Matching", "Binary Tree", "Hash Function"]',
+        'easy',
+        572
+    ),
+    (
+        'Construct Binary Tree from Preorder and Inorder Traversal',
+        'Given two integer arrays preorder and inorder where preorder is the preorder traversal and inorder is the inorder traversal of the same tree, construct and return the binary tree.',
+        'Input: preorder = [3,9,20,15,7], inorder = [9,3,15,20,7]
+Output: [3,9,20,null,null,15,7]',
+        '["1 <= preorder.length <= 3000", "inorder.length == preorder.length", "-3000 <= preorder[i], inorder[i] <= 3000", "preorder and inorder consist of unique values", "Each value of inorder also appears in preorder", "preorder is guaranteed to be the preorder traversal", "inorder is guaranteed to be the inorder traversal"]',
+        'Divide and Conquer',
+        'First element of preorder is root. Find it in inorder - left part is left subtree, right part is right subtree. Recurse.',
+        E'def buildTree(preorder: List[int], inorder: List[int]) -> TreeNode:\\n    inorder_map = {val: i for i, val in enumerate(inorder)}\\n    pre_idx = [0]\\n    def build(left, right):\\n        if left > right:\\n            return None\\n        root_val = preorder[pre_idx[0]]\\n        pre_idx[0] += 1\\n        root = TreeNode(root_val)\\n        mid = inorder_map[root_val]\\n        root.left = build(left, mid - 1)\\n        root.right = build(mid + 1, right)\\n        return root\\n    return build(0, len(inorder) - 1)',
+        'O(n)',
+        'O(n)',
+        '["Build hashmap of inorder value -> index", "First preorder element is root", "Find root in inorder to split left/right subtrees", "Recursively build left subtree (elements before root in inorder)", "Recursively build right subtree (elements after root in inorder)"]',
+        '["Single node", "Left-skewed tree", "Right-skewed tree", "Balanced tree", "Complete tree"]',
+        '["Array", "Hash Table", "Divide and Conquer", "Tree", "Binary Tree"]',
+        'medium',
+        105
+    ),
+    (
+        'Validate Binary Search Tree',
+        'Given the root of a binary tree, determine if it is a valid binary search tree (BST). A valid BST has: left subtree only contains nodes less than root, right subtree only contains nodes greater than root, and both subtrees are also valid BSTs.',
+        'Input: root = [2,1,3]
+Output: true',
+        '["The number of nodes is in the range [1, 10^4]", "-2^31 <= Node.val <= 2^31 - 1"]',
+        'DFS with Range Validation',
+        'Each node must be within a valid range. Pass min/max bounds down the tree. Left child must be < current, right child must be > current.',
+        E'def isValidBST(root: TreeNode) -> bool:\\n    def validate(node, min_val, max_val):\\n        if not node:\\n            return True\\n        if node.val <= min_val or node.val >= max_val:\\n            return False\\n        return validate(node.left, min_val, node.val) and validate(node.right, node.val, max_val)\\n    return validate(root, float("-inf"), float("inf"))',
+        'O(n)',
+        'O(h)',
+        '["DFS with min and max bounds", "Start with (-inf, +inf) bounds", "Each node must be strictly within bounds", "For left child: new max = current node value", "For right child: new min = current node value"]',
+        '["Single node", "All left children", "All right children", "Equal values (invalid)", "Integer overflow values"]',
+        '["Tree", "Depth-First Search", "Binary Search Tree", "Binary Tree"]',
+        'medium',
+        98
+    ),
+    (
+        'Kth Smallest Element in a BST',
+        'Given the root of a binary search tree and an integer k, return the kth smallest value (1-indexed) of all the values of the nodes in the tree.',
+        'Input: root = [3,1,4,null,2], k = 1
+Output: 1',
+        '["The number of nodes is in the range [1, 10^4]", "0 <= Node.val <= 10^4", "1 <= k <= number of nodes"]',
+        'Inorder Traversal',
+        'Inorder traversal of BST gives nodes in sorted order. Perform inorder traversal and return kth element.',
+        E'def kthSmallest(root: TreeNode, k: int) -> int:\\n    stack = []\\n    curr = root\\n    count = 0\\n    while stack or curr:\\n        while curr:\\n            stack.append(curr)\\n            curr = curr.left\\n        curr = stack.pop()\\n        count += 1\\n        if count == k:\\n            return curr.val\\n        curr = curr.right\\n    return -1',
+        'O(H + k)',
+        'O(H)',
+        '["Use iterative inorder traversal with stack", "Go left as far as possible", "Pop and process node (increment count)", "If count equals k, return value", "Go right and repeat"]',
+        '["k = 1 (smallest)", "k = n (largest)", "Single node", "Skewed tree", "Balanced tree"]',
+        '["Tree", "Depth-First Search", "Binary Search Tree", "Binary Tree"]',
+        'medium',
+        230
+    ),
+    (
+        'Lowest Common Ancestor of a Binary Search Tree',
+        'Given a binary search tree (BST), find the lowest common ancestor (LCA) of two given nodes p and q. The LCA is the lowest node that has both p and q as descendants (where a node can be a descendant of itself).',
+        'Input: root = [6,2,8,0,4,7,9,null,null,3,5], p = 2, q = 8
+Output: 6
+Explanation: LCA of nodes 2 and 8 is 6.',
+        '["The number of nodes is in the range [2, 10^5]", "-10^9 <= Node.val <= 10^9", "All Node.val are unique", "p != q", "p and q will exist in the BST"]',
+        'BST Property Navigation',
+        'Use BST property: if both p and q are smaller, go left. If both larger, go right. Otherwise, current node is LCA.',
+        E'def lowestCommonAncestor(root: TreeNode, p: TreeNode, q: TreeNode) -> TreeNode:\\n    while root:\\n        if p.val < root.val and q.val < root.val:\\n            root = root.left\\n        elif p.val > root.val and q.val > root.val:\\n            root = root.right\\n        else:\\n            return root\\n    return None',
+        'O(h)',
+        'O(1)',
+        '["Start at root", "If both p and q values < root, LCA is in left subtree", "If both p and q values > root, LCA is in right subtree", "Otherwise, current root is LCA (split point)", "Return current node"]',
+        '["p or q is root", "p is ancestor of q", "p and q are siblings", "p and q in different subtrees", "Deep tree"]',
+        '["Tree", "Depth-First Search", "Binary Search Tree", "Binary Tree"]',
+        'medium',
+        235
+    ),
+    (
+        'Implement Trie (Prefix Tree)',
+        'A trie (prefix tree) is a tree data structure used to efficiently store and retrieve keys in a dataset of strings. Implement the Trie class with insert, search, and startsWith methods.',
+        'Input: ["Trie", "insert", "search", "search", "startsWith", "insert", "search"]
+[[], ["apple"], ["apple"], ["app"], ["app"], ["app"], ["app"]]
+Output: [null, null, true, false, true, null, true]',
+        '["1 <= word.length, prefix.length <= 2000", "word and prefix consist only of lowercase English letters", "At most 3 * 10^4 calls to insert, search, and startsWith"]',
+        'Trie Data Structure',
+        'Each node has children (dict of char->node) and isEnd flag. Insert: add nodes for each char. Search: traverse and check isEnd. StartsWith: traverse without checking isEnd.',
+        E'class TrieNode:\\n    def __init__(self):\\n        self.children = {}\\n        self.is_end = False\\n\\nclass Trie:\\n    def __init__(self):\\n        self.root = TrieNode()\\n    \\n    def insert(self, word: str) -> None:\\n        node = self.root\\n        for c in word:\\n            if c not in node.children:\\n                node.children[c] = TrieNode()\\n            node = node.children[c]\\n        node.is_end = True\\n    \\n    def search(self, word: str) -> bool:\\n        node = self.root\\n        for c in word:\\n            if c not in node.children:\\n                return False\\n            node = node.children[c]\\n        return node.is_end\\n    \\n    def startsWith(self, prefix: str) -> bool:\\n        node = self.root\\n        for c in prefix:\\n            if c not in node.children:\\n                return False\\n            node = node.children[c]\\n        return True',
+        'O(m)',
+        'O(m)',
+        '["TrieNode has children dict and is_end flag", "Insert: create nodes for each character, mark end", "Search: traverse nodes, return is_end at last node", "StartsWith: traverse nodes, return True if all chars found"]',
+        '["Empty trie", "Single character words", "Words with common prefixes", "Search for prefix only", "Search non-existent word"]',
+        '["Hash Table", "String", "Design", "Trie"]',
+        'medium',
+        208
+    ),
+    (
+        'Design Add and Search Words Data Structure',
+        'Design a data structure that supports adding new words and finding if a string matches any previously added string. The search word can contain dots ''.'' where dots can match any letter.',
+        'Input: ["WordDictionary","addWord","addWord","addWord","search","search","search","search"]
+[[],["bad"],["dad"],["mad"],["pad"],["bad"],[".ad"],["b.."]]
+Output: [null,null,null,null,false,true,true,true]',
+        '["1 <= word.length <= 25", "word in addWord consists of lowercase letters", "word in search consists of lowercase letters or ''.''", "At most 10^4 calls to addWord and search"]',
+        'Trie with DFS for Wildcards',
+        'Use Trie for storage. For search, when encountering ''.'', try all possible children using DFS.',
+        E'class WordDictionary:\\n    def __init__(self):\\n        self.root = {}\\n    \\n    def addWord(self, word: str) -> None:\\n        node = self.root\\n        for c in word:\\n            if c not in node:\\n                node[c] = {}\\n            node = node[c]\\n        node["#"] = True\\n    \\n    def search(self, word: str) -> bool:\\n        def dfs(node, i):\\n            if i == len(word):\\n                return "#" in node\\n            if word[i] == ".":\\n                return any(dfs(node[c], i + 1) for c in node if c != "#")\\n            if word[i] not in node:\\n                return False\\n            return dfs(node[word[i]], i + 1)\\n        return dfs(self.root, 0)',
+        'O(m) for add, O(26^m) worst for search',
+        'O(total chars)',
+        '["Use Trie structure for word storage", "addWord: standard trie insert", "search: DFS with special handling for ''.''", "For ''.'': recursively try all children", "For regular char: follow that child only"]',
+        '["Search with all dots", "Search without dots", "No matching word", "Multiple matching words", "Empty dictionary"]',
+        '["String", "Depth-First Search", "Design", "Trie"]',
+        'medium',
+        211
+    ),
+    (
+        'Word Search II',
+        'Given an m x n board of characters and a list of strings words, return all words found in the board. Each word must be constructed from letters of sequentially adjacent cells (horizontally or vertically), where the same cell may not be used more than once in a word.',
+        'Input: board = [["o","a","a","n"],["e","t","a","e"],["i","h","k","r"],["i","f","l","v"]], words = ["oath","pea","eat","rain"]
+Output: ["eat","oath"]',
+        '["m == board.length", "n == board[i].length", "1 <= m, n <= 12", "1 <= words.length <= 3 * 10^4", "1 <= words[i].length <= 10", "board and words[i] consist of lowercase English letters", "All words are unique"]',
+        'Trie + Backtracking',
+        'Build trie from words. DFS on each cell, following trie paths. When reaching word end in trie, add to result. Prune trie to optimize.',
+        E'def findWords(board: List[List[str]], words: List[str]) -> List[str]:\\n    # Build trie\\n    trie = {}\\n    for word in words:\\n        node = trie\\n        for c in word:\\n            node = node.setdefault(c, {})\\n        node["#"] = word\\n    \\n    result = []\\n    m, n = len(board), len(board[0])\\n    \\n    def dfs(r, c, node):\\n        char = board[r][c]\\n        if char not in node:\\n            return\\n        next_node = node[char]\\n        if "#" in next_node:\\n            result.append(next_node["#"])\\n            del next_node["#"]  # Avoid duplicates\\n        board[r][c] = "#"  # Mark visited\\n        for dr, dc in [(0,1),(0,-1),(1,0),(-1,0)]:\\n            nr, nc = r + dr, c + dc\\n            if 0 <= nr < m and 0 <= nc < n and board[nr][nc] in next_node:\\n                dfs(nr, nc, next_node)\\n        board[r][c] = char  # Unmark\\n    \\n    for r in range(m):\\n        for c in range(n):\\n            dfs(r, c, trie)\\n    return result',
+        'O(m * n * 4^L)',
+        'O(total chars in words)',
+        '["Build trie from word list, store word at end node", "DFS from each cell with trie node", "If char matches trie child, continue DFS", "If word end found, add to result", "Mark cells visited during DFS, backtrack after"]',
+        '["No words found", "All words found", "Overlapping words", "Same word multiple paths", "Large word list"]',
+        '["Array", "String", "Backtracking", "Trie", "Matrix"]',
+        'hard',
+        212
+    ),
+    (
+        'Top K Frequent Elements',
+        'Given an integer array nums and an integer k, return the k most frequent elements. You may return the answer in any order.',
+        'Input: nums = [1,1,1,2,2,3], k = 2
+Output: [1,2]',
+        '["1 <= nums.length <= 10^5", "-10^4 <= nums[i] <= 10^4", "k is in the range [1, number of unique elements]", "The answer is guaranteed to be unique"]',
+        'Bucket Sort / Heap',
+        'Count frequencies. Use bucket sort with frequency as index, or min-heap of size k. Bucket sort is O(n).',
+        E'def topKFrequent(nums: List[int], k: int) -> List[int]:\\n    from collections import Counter\\n    count = Counter(nums)\\n    # Bucket sort approach\\n    buckets = [[] for _ in range(len(nums) + 1)]\\n    for num, freq in count.items():\\n        buckets[freq].append(num)\\n    result = []\\n    for i in range(len(buckets) - 1, -1, -1):\\n        for num in buckets[i]:\\n            result.append(num)\\n            if len(result) == k:\\n                return result\\n    return result',
+        'O(n)',
+        'O(n)',
+        '["Count frequency of each element", "Create buckets where index = frequency", "Place each number in its frequency bucket", "Iterate buckets from highest to lowest frequency", "Collect k elements"]',
+        '["k = 1", "k equals unique elements", "All same frequency", "Single element repeated", "All unique elements"]',
+        '["Array", "Hash Table", "Divide and Conquer", "Sorting", "Heap", "Bucket Sort", "Counting", "Quickselect"]',
+        'medium',
+        347
+    ),
+    (
+        'Find Median from Data Stream',
+        'The median is the middle value in an ordered list. If the list has an even count, the median is the average of the two middle values. Design a data structure that supports adding integers and finding the median.',
+        'Input: ["MedianFinder", "addNum", "addNum", "findMedian", "addNum", "findMedian"]
+[[], [1], [2], [], [3], []]
+Output: [null, null, null, 1.5, null, 2.0]',
+        '["-10^5 <= num <= 10^5", "There will be at least one element before calling findMedian", "At most 5 * 10^4 calls to addNum and findMedian"]',
+        'Two Heaps',
+        'Use max-heap for smaller half and min-heap for larger half. Keep heaps balanced. Median is from top of heap(s).',
+        E'class MedianFinder:\\n    def __init__(self):\\n        self.small = []  # max-heap (negate values)\\n        self.large = []  # min-heap\\n    \\n    def addNum(self, num: int) -> None:\\n        import heapq\\n        heapq.heappush(self.small, -num)\\n        # Ensure small''s max <= large''s min\\n        if self.small and self.large and -self.small[0] > self.large[0]:\\n            heapq.heappush(self.large, -heapq.heappop(self.small))\\n        # Balance sizes\\n        if len(self.small) > len(self.large) + 1:\\n            heapq.heappush(self.large, -heapq.heappop(self.small))\\n        elif len(self.large) > len(self.small):\\n            heapq.heappush(self.small, -heapq.heappop(self.large))\\n    \\n    def findMedian(self) -> float:\\n        if len(self.small) > len(self.large):\\n            return -self.small[0]\\n        return (-self.small[0] + self.large[0]) / 2',
+        'O(log n) add, O(1) find',
+        'O(n)',
+        '["Use max-heap for smaller half (negate for Python)", "Use min-heap for larger half", "On add: push to small, then rebalance", "Ensure max of small <= min of large", "Keep sizes balanced (differ by at most 1)", "Median from top of larger heap or average of both tops"]',
+        '["Single element", "Two elements", "All same values", "Sorted input", "Reverse sorted input"]',
+        '["Two Pointers", "Design", "Sorting", "Heap", "Data Stream"]',
+        'hard',
+        295
+    )
+ON CONFLICT (title) DO UPDATE SET
+    prompt = EXCLUDED.prompt,
+    example = EXCLUDED.example,
+    constraints = EXCLUDED.constraints,
+    pattern = EXCLUDED.pattern,
+    key_idea = EXCLUDED.key_idea,
+    solution = EXCLUDED.solution,
+    time_complexity = EXCLUDED.time_complexity,
+    space_complexity = EXCLUDED.space_complexity,
+    steps = EXCLUDED.steps,
+    expected_edge_cases = EXCLUDED.expected_edge_cases,
+    topics = EXCLUDED.topics,
+    difficulty = EXCLUDED.difficulty,
+    leetcode_number = EXCLUDED.leetcode_number;
+
+-- detailed_hint for 75 problems (requires supabase-add-detailed-hint.sql)
+UPDATE public.blind_problems AS bp
+SET detailed_hint = v.detailed_hint
+FROM (VALUES
+    (
+        'Two Sum',
+        'Think about this problem in terms of what you''re really searching for at each step. As you iterate through the array, for each number you see, you''re asking: "Does the number I need to complete this sum exist somewhere I''ve already seen?"
+
+This is a classic complement search problem. Instead of using nested loops to check every pair (O(n²)), you can use a hash map to remember what you''ve seen. For each number, calculate target - current_number to find what you need. If it''s in your map, you''re done. If not, add the current number to the map for future lookups.
+
+The key insight: you''re trading space for time by storing past values for O(1) lookup.'
+    ),
+    (
+        'Best Time to Buy and Sell Stock',
+        'The key insight is that for any given day, the maximum profit you can make by selling on that day depends only on the minimum price you''ve seen BEFORE that day. You can''t go back in time to buy.
+
+Visualize it: as you scan left to right through prices, you''re maintaining the best "buy" opportunity so far. At each new price, you calculate the potential profit if you sold today (current_price - min_price_so_far), and update your max profit if it''s better.
+
+This is a single-pass solution because both values you''re tracking (min_price and max_profit) only look backwards.'
+    ),
+    (
+        'Contains Duplicate',
+        'This is a fundamental problem about detecting if you''ve seen something before. As you iterate through the array, you need constant-time lookup to check "have I seen this number already?"
+
+A hash set is perfect for this because it gives you O(1) insertion and O(1) lookup. The moment you try to add a number that already exists in the set, you''ve found your duplicate.
+
+Alternative approach: Sort the array first, then check adjacent elements. But this is O(n log n) vs O(n) with the hash set approach.'
+    ),
+    (
+        'Product of Array Except Self',
+        'The trick is to realize that for any position i, the answer is (product of all elements to the left of i) × (product of all elements to the right of i).
+
+You can compute this with two passes:
+1. First pass (left to right): Build up a "prefix product" array where each position contains the product of all elements before it.
+2. Second pass (right to left): Multiply each position by the "suffix product" (product of all elements after it).
+
+The clever optimization: You don''t need separate arrays. Use the result array for prefix products, then multiply in-place during the second pass with a running suffix product.'
+    ),
+    (
+        'Maximum Subarray',
+        'Kadane''s Algorithm is elegant once you understand the core decision at each step: "Should I extend the current subarray, or start fresh?"
+
+At each position, you ask: "Is the previous subarray helping me or hurting me?" If the running sum is negative, it''s hurting—any future elements would be larger on their own. So you reset and start a new subarray at the current element.
+
+Track two things: the current sum (which might reset) and the maximum sum seen so far. The current sum represents "the best subarray ending here."'
+    ),
+    (
+        'Maximum Product Subarray',
+        'Unlike max sum, products have a twist: multiplying two negatives makes a positive. So a very negative number could become very positive later!
+
+You need to track BOTH the maximum AND minimum products ending at each position. When you see a negative number, what was your minimum becomes your maximum (after multiplication) and vice versa.
+
+At each step, compute both: max_ending_here = max(num, num*prev_max, num*prev_min) and min_ending_here = min(num, num*prev_max, num*prev_min). Update your global result accordingly.
+
+Don''t forget: zeros reset everything because anything times zero is zero.'
+    ),
+    (
+        'Find Minimum in Rotated Sorted Array',
+        'The rotation creates a "pivot point" where the array is split into two sorted halves. The minimum is at this pivot. Your goal: use binary search to find where the "break" is.
+
+Compare the middle element to the rightmost element:
+- If mid > right: The minimum must be in the right half (the break happened there)
+- If mid < right: The minimum is in the left half (including mid itself—it might be the minimum!)
+
+Key detail: Use right = mid (not mid - 1) when going left, because mid could be the answer. But use left = mid + 1 when going right, because mid definitely isn''t the minimum in that case.'
+    ),
+    (
+        'Search in Rotated Sorted Array',
+        'The key insight: even though the array is rotated, at least ONE half is always properly sorted. You can use this to determine which half to search.
+
+Find the midpoint and figure out which half is sorted:
+- If nums[left] <= nums[mid]: Left half is sorted
+- Otherwise: Right half is sorted
+
+Once you know which half is sorted, check if the target lies within that sorted range. If yes, search there. If no, search the other half.
+
+This gives you O(log n) because you''re still halving the search space each time.'
+    ),
+    (
+        '3Sum',
+        'The key to making this O(n²) instead of O(n³) is to first sort the array, then use the two-pointer technique.
+
+For each number at index i, you''re looking for two numbers to its right that sum to -nums[i]. This becomes a two-sum problem! Use two pointers (left starting at i+1, right starting at end).
+
+If the sum is too small, move left pointer right. Too big, move right pointer left. When you find a match, move BOTH pointers (and skip duplicates!).
+
+The sorting helps with: (1) the two-pointer approach, and (2) skipping duplicate triplets efficiently.'
+    ),
+    (
+        'Container With Most Water',
+        'Start with the widest possible container (pointers at both ends). The area = min(height[left], height[right]) × (right - left).
+
+Now the key insight: To possibly find a larger area, you must move the pointer at the SHORTER line inward. Why? The height is limited by the shorter line, and moving the taller line inward would only decrease width while never increasing the height limit.
+
+By always moving the shorter pointer, you guarantee you''re exploring all configurations that could potentially be larger. You never need to move the taller pointer because any container formed by doing so would be smaller.'
+    ),
+    (
+        'Sum of Two Integers',
+        'You need to add without + or -. Think about what happens in binary addition:
+- XOR (^) gives you the sum without carrying (1+1=0, 1+0=1, 0+0=0)
+- AND (&) gives you the positions where carries occur (1+1 produces a carry)
+- Left shift (<<1) moves those carries to the correct position
+
+The algorithm: XOR for the partial sum, AND + left shift for the carry. Repeat until there''s no carry left.
+
+Watch for negative numbers in languages that don''t handle integer overflow the same way. You may need to mask to 32 bits.'
+    ),
+    (
+        'Number of 1 Bits',
+        'The straightforward way: check each of the 32 bits using right shift and AND with 1. But there''s a clever trick.
+
+The expression n & (n-1) clears the rightmost set bit. Why? When you subtract 1, you flip all bits from the rightmost 1 to the end. ANDing with the original clears just that bit.
+
+Example: 1100 & 1011 = 1000 (cleared the rightmost 1)
+
+Count how many times you can do this before n becomes 0. That''s your answer, and it only iterates once per set bit!'
+    ),
+    (
+        'Counting Bits',
+        'You could solve each number independently, but there''s a beautiful pattern using dynamic programming.
+
+Key observation: The number of 1s in i equals the number of 1s in i/2 (right shift) plus whether i''s last bit is 1.
+Formula: dp[i] = dp[i >> 1] + (i & 1)
+
+Alternatively: dp[i] = dp[i & (i-1)] + 1, using the "clear last bit" trick.
+
+Both approaches give O(n) time because you''re building on previously computed results.'
+    ),
+    (
+        'Missing Number',
+        'Three elegant approaches, all O(n) time:
+
+1. Math: The sum of 0 to n is n*(n+1)/2. Calculate expected sum, subtract actual sum of array.
+
+2. XOR: XOR all array indices (0 to n-1) and the number n, then XOR all array values. Since a^a=0, everything pairs off except the missing number.
+
+3. Cyclic sort (in-place): Since values are in range [0,n], place each value at its "correct" index. The index without its matching value is the answer.
+
+The XOR solution is particularly elegant because it uses no extra space and handles overflow gracefully.'
+    ),
+    (
+        'Reverse Bits',
+        'Process each bit from right to left, build the result from left to right.
+
+For each of the 32 iterations:
+1. Extract the last bit of n using (n & 1)
+2. Add it to result (shift result left first, then OR with the extracted bit)
+3. Right shift n to process the next bit
+
+After 32 iterations, your result is the reversed number.
+
+Optimization: Use a lookup table for 8-bit chunks if you need to reverse many numbers.'
+    ),
+    (
+        'Climbing Stairs',
+        'This is the Fibonacci sequence in disguise! To reach step n, you could have come from step n-1 (one step) or step n-2 (two steps).
+
+So: ways(n) = ways(n-1) + ways(n-2)
+
+Base cases: ways(1) = 1 (one way to climb 1 stair), ways(2) = 2 (either 1+1 or 2).
+
+You only need the last two values, so you can solve this in O(1) space instead of maintaining a full DP array.'
+    ),
+    (
+        'Coin Change',
+        'Build up from smaller amounts. Define dp[i] = minimum coins needed to make amount i.
+
+For each amount from 1 to target, try each coin. If you can use a coin (coin <= amount), then: dp[amount] = min(dp[amount], dp[amount - coin] + 1)
+
+The intuition: "If I use this coin, I need 1 + (minimum coins to make the remaining amount)."
+
+Initialize dp[0] = 0 (zero coins for zero amount). Initialize all others to infinity or amount+1 (impossible). If dp[target] is still impossible at the end, return -1.'
+    ),
+    (
+        'Longest Increasing Subsequence',
+        'Classic DP approach (O(n²)): Let dp[i] = length of longest increasing subsequence ending at index i. For each i, look back at all j < i where nums[j] < nums[i], and take dp[i] = max(dp[j] + 1).
+
+Optimized approach (O(n log n)): Maintain a "tails" array where tails[i] is the smallest ending element for an increasing subsequence of length i+1. For each number, binary search to find where it fits (replace or extend). The final length is len(tails).
+
+The tails array trick works because you''re greedily keeping the best (smallest) ending element for each length.'
+    ),
+    (
+        'Longest Common Subsequence',
+        'Use a 2D DP table where dp[i][j] = LCS length for text1[0..i-1] and text2[0..j-1].
+
+The recurrence:
+- If text1[i-1] == text2[j-1]: dp[i][j] = dp[i-1][j-1] + 1 (extend the LCS)
+- Otherwise: dp[i][j] = max(dp[i-1][j], dp[i][j-1]) (take the best of skipping either character)
+
+Build the table bottom-up, and the answer is dp[m][n].
+
+Space optimization: Since you only need the previous row, you can reduce to O(min(m,n)) space.'
+    ),
+    (
+        'Word Break',
+        'Define dp[i] = true if s[0..i-1] can be segmented into dictionary words.
+
+For each position i, check all possible last words: for j from 0 to i-1, if dp[j] is true AND s[j..i-1] is in the dictionary, then dp[i] = true.
+
+The intuition: "Can I find a valid split point where everything before it is breakable, and the rest is a dictionary word?"
+
+Base case: dp[0] = true (empty string is valid). Answer: dp[n].
+
+Optimization: Convert dictionary to a set for O(1) word lookup.'
+    ),
+    (
+        'Combination Sum',
+        'This is a backtracking problem. At each step, you have choices: include a candidate or skip it. Since you can reuse candidates, when you include one, don''t move to the next index—stay and consider including it again.
+
+Build combinations recursively. When the remaining target becomes 0, you''ve found a valid combination. When it goes negative or you''ve exhausted candidates, backtrack.
+
+To avoid duplicates like [2,3] and [3,2], always iterate forward from your current index. This ensures you build combinations in sorted order.'
+    ),
+    (
+        'House Robber',
+        'At each house, you have two choices: rob it (and skip the previous) or skip it (and take whatever was best up to the previous house).
+
+dp[i] = max(dp[i-2] + nums[i], dp[i-1])
+
+"The best at house i is either: (1) I robbed house i-2, skipped i-1, and rob i, OR (2) I take whatever was best up to i-1."
+
+You only need two variables (prev1, prev2) instead of a full array, giving O(1) space.'
+    ),
+    (
+        'House Robber II',
+        'The houses form a circle, so house 0 and house n-1 are adjacent. You can''t rob both.
+
+The trick: Run the House Robber I solution twice:
+1. Once on houses [0..n-2] (exclude the last house)
+2. Once on houses [1..n-1] (exclude the first house)
+
+Return the maximum of these two results. This covers all valid scenarios because at least one of the first or last house must be excluded.'
+    ),
+    (
+        'Decode Ways',
+        'At each position, ask: "How many ways can I decode up to here?"
+
+dp[i] represents the number of ways to decode s[0..i-1].
+
+Single digit: If s[i-1] is ''1''-''9'' (valid), add dp[i-1] ways.
+Two digits: If s[i-2:i] forms a valid number (10-26), add dp[i-2] ways.
+
+Edge cases are tricky: ''0'' cannot stand alone, so ''0'' means 0 ways unless it''s part of ''10'' or ''20''. Leading zeros in two-digit numbers (like ''01'') are invalid.
+
+Base: dp[0] = 1 (empty prefix has one way). Answer: dp[n].'
+    ),
+    (
+        'Unique Paths',
+        'In a grid, to reach cell (i,j), you must have come from either (i-1,j) or (i,j-1). So: dp[i][j] = dp[i-1][j] + dp[i][j-1].
+
+Initialize the first row and first column to 1 (only one way to reach any cell on the edge—keep going in one direction).
+
+Space optimization: You only need the previous row, so use a 1D array of size n. Update in-place left to right: dp[j] = dp[j] + dp[j-1].
+
+Math approach: This is a combinatorics problem. You need (m-1) downs and (n-1) rights in any order. Answer: C(m+n-2, m-1).'
+    ),
+    (
+        'Jump Game',
+        'Greedy approach: Track the farthest index you can reach. Iterate through the array, and at each position, update the max reach: maxReach = max(maxReach, i + nums[i]).
+
+If at any point your current index exceeds maxReach, you''re stuck—return false. If maxReach >= last index, return true.
+
+Alternative DP approach: Work backwards. A position is "good" if you can reach the end from it. Check if any jump from the current position lands on a "good" position.
+
+The greedy approach is O(n) time and O(1) space.'
+    ),
+    (
+        'Clone Graph',
+        'Use a hash map to track {original_node: cloned_node}. This serves two purposes:
+1. Avoid infinite loops by checking if we''ve already cloned a node
+2. Connect cloned neighbors correctly
+
+DFS approach: For each node, create its clone if not exists. Then recursively clone all neighbors and connect them.
+
+BFS approach: Use a queue. Clone the starting node, then for each node in the queue, clone its neighbors (if not already cloned) and add them to the queue.
+
+The map ensures each node is cloned exactly once.'
+    ),
+    (
+        'Course Schedule',
+        'This is cycle detection in a directed graph. If there''s a cycle, you can''t complete all courses (circular dependency).
+
+DFS approach: Use three states for each node—unvisited, visiting (in current path), visited (fully processed). If you encounter a "visiting" node, you''ve found a cycle.
+
+BFS/Kahn''s algorithm: Track in-degrees. Start with nodes that have 0 in-degree (no prerequisites). Remove each from the graph, decreasing neighbors'' in-degrees. If you process all nodes, no cycle. If nodes remain with non-zero in-degree, there''s a cycle.'
+    ),
+    (
+        'Pacific Atlantic Water Flow',
+        'Instead of asking "can water from this cell reach both oceans?", reverse the question: "which cells can be reached FROM each ocean?"
+
+Start BFS/DFS from Pacific borders (top row, left column) and from Atlantic borders (bottom row, right column). Water flows "uphill" in reverse—you can move to a neighbor if it''s >= current height.
+
+Find the intersection of cells reachable from both oceans. This is more efficient than checking every cell independently.'
+    ),
+    (
+        'Number of Islands',
+        'Each island is a connected component of ''1''s. When you find a ''1'', you''ve found a new island—increment your count and then "sink" the entire island by marking all connected ''1''s as visited.
+
+DFS/BFS from each unvisited ''1'', marking cells as ''0'' (or using a visited set) to avoid counting them again.
+
+The key: Each ''1'' is visited at most once, so despite nested loops, the total time is O(m×n).'
+    ),
+    (
+        'Longest Consecutive Sequence',
+        'Use a hash set for O(1) lookups. For each number, check if it could be the START of a sequence (i.e., num-1 is NOT in the set).
+
+If it''s a sequence start, count how many consecutive numbers exist: check num+1, num+2, etc.
+
+Why this is O(n): Each number is only counted once—either as a sequence start (and we extend from there) or as part of another sequence (skipped because num-1 exists).
+
+The key insight: Don''t start counting from the middle of a sequence.'
+    ),
+    (
+        'Alien Dictionary',
+        'This is a topological sort problem. You need to discover the ordering rules between characters, then sort them.
+
+Step 1: Compare adjacent words to find ordering rules. If word1 = "abc" and word2 = "abd", comparing character by character, ''c'' comes before ''d''. Add edge c → d.
+
+Step 2: Topological sort the graph. Use Kahn''s (BFS with in-degrees) or DFS. If there''s a cycle, return "" (no valid ordering).
+
+Edge case: If a longer word comes before its prefix (like ["abc", "ab"]), that''s invalid—return "".'
+    ),
+    (
+        'Graph Valid Tree',
+        'A graph is a valid tree if it: (1) has exactly n-1 edges, (2) is fully connected, and (3) has no cycles.
+
+If edges.length != n-1, immediately return false.
+
+Then check connectivity using Union-Find or DFS:
+- Union-Find: Process each edge. If both nodes are already in the same set, there''s a cycle. After all edges, check if there''s exactly one connected component.
+- DFS: Start from node 0, visit all reachable nodes. If all n nodes are visited and no back-edge is found, it''s a valid tree.'
+    ),
+    (
+        'Number of Connected Components in an Undirected Graph',
+        'Classic Union-Find (Disjoint Set) problem. Initialize each node as its own component (count = n).
+
+For each edge, union the two nodes. Every successful union (nodes were in different sets) decreases the count by 1.
+
+Alternatively, use DFS: Start DFS from each unvisited node, marking all reachable nodes as visited. The number of times you start a new DFS equals the number of components.
+
+Union-Find with path compression and union by rank gives nearly O(1) per operation.'
+    ),
+    (
+        'Insert Interval',
+        'Process intervals in three phases:
+1. Add all intervals that END BEFORE the new interval starts (no overlap, come before)
+2. Merge all intervals that OVERLAP with the new interval (start <= newEnd AND end >= newStart)
+3. Add all intervals that START AFTER the new interval ends (no overlap, come after)
+
+For merging overlapping intervals, track the merged interval as: [min(starts), max(ends)].
+
+Since intervals are already sorted, you can do this in a single pass through the array.'
+    ),
+    (
+        'Merge Intervals',
+        'First, sort intervals by their start time. This ensures that if two intervals overlap, they''ll be adjacent in the sorted order.
+
+Then iterate: Compare the current interval with the last one in your result. If they overlap (current.start <= last.end), merge them by updating last.end = max(last.end, current.end). Otherwise, add the current interval as a new non-overlapping interval.
+
+The key insight: After sorting by start, you only need to compare each interval with the previous one.'
+    ),
+    (
+        'Non-overlapping Intervals',
+        'This is an interval scheduling problem. Sort by END time, then greedily keep intervals that end earliest.
+
+Why sort by end time? An interval that ends earlier leaves more room for future intervals. It''s the greedy choice that maximizes the number of non-overlapping intervals.
+
+Count kept intervals: if current.start >= prev_end, keep it and update prev_end. The answer is total - kept.
+
+Alternative: Sort by start, and when overlap occurs, remove the interval that ends later (it causes more future conflicts).'
+    ),
+    (
+        'Meeting Rooms',
+        'A person can attend all meetings only if no two meetings overlap.
+
+Sort meetings by start time. Then check each consecutive pair: if the next meeting starts before the current one ends, there''s a conflict.
+
+Simply: for each i, check if meetings[i].start < meetings[i-1].end.
+
+If any overlap exists, return false. If you get through all meetings, return true.'
+    ),
+    (
+        'Meeting Rooms II',
+        'You need to find the maximum number of overlapping meetings at any point in time.
+
+Two approaches:
+
+1. Min-Heap: Sort meetings by start time. Use a min-heap to track end times of ongoing meetings. For each meeting, remove all meetings that have ended (end <= current.start), then add current meeting''s end time. Track the max heap size.
+
+2. Sweep Line: Create events for all starts (+1) and ends (-1). Sort by time (end before start if same time). Sweep through, tracking the running count. Max count = min rooms needed.'
+    ),
+    (
+        'Reverse Linked List',
+        'Iterative approach: Use three pointers—prev (starts null), current, and next. At each step:
+1. Save next = current.next
+2. Reverse the pointer: current.next = prev
+3. Move prev and current forward
+
+Recursive approach: Reverse the rest of the list, then fix the current node''s connection. The key line is: head.next.next = head (make the next node point back to me).
+
+Both are O(n) time. Iterative is O(1) space, recursive uses O(n) stack space.'
+    ),
+    (
+        'Linked List Cycle',
+        'Floyd''s Cycle Detection (Tortoise and Hare): Use two pointers—slow moves 1 step, fast moves 2 steps.
+
+If there''s a cycle, fast will eventually "lap" slow and they''ll meet inside the cycle. If there''s no cycle, fast will reach null.
+
+Why does this work? If there''s a cycle, once both pointers are in the cycle, the gap between them decreases by 1 each step (fast gains on slow). They must meet.
+
+O(n) time, O(1) space. No need for a hash set!'
+    ),
+    (
+        'Merge Two Sorted Lists',
+        'Use a dummy head to simplify the logic (you don''t have to special-case the first node). Maintain a tail pointer.
+
+Compare the heads of both lists. Append the smaller one to tail, advance that list''s pointer. Repeat until one list is exhausted.
+
+Append the remaining list (it''s already sorted) to tail.
+
+Return dummy.next.
+
+Recursive alternative: The merged list is the smaller head connected to the merged result of the rest.'
+    ),
+    (
+        'Merge K Sorted Lists',
+        'Three main approaches:
+
+1. Min-Heap (O(n log k)): Put the head of each list in a min-heap. Pop the smallest, add it to result, push its next node if exists. The heap always has at most k elements.
+
+2. Divide and Conquer (O(n log k)): Pair up lists and merge each pair. Repeat until one list remains. Like merge sort on lists.
+
+3. Merge one by one (O(nk)): Merge list 1 and 2, then merge result with list 3, etc. Simpler but slower.
+
+The heap approach is usually cleanest to implement.'
+    ),
+    (
+        'Remove Nth Node From End of List',
+        'Use two pointers spaced n nodes apart. Move the first pointer n steps ahead. Then move both pointers together until the first reaches the end. The second pointer will be at the node BEFORE the one to remove.
+
+The spacing trick: When fast is at the end (null), slow is exactly n+1 nodes from the end, allowing you to skip the nth node.
+
+Use a dummy head to handle edge cases like removing the first node. slow.next = slow.next.next does the removal.'
+    ),
+    (
+        'Reorder List',
+        'Break this into three steps:
+
+1. Find the middle: Use slow/fast pointers. When fast reaches the end, slow is at the middle.
+
+2. Reverse the second half: Starting from slow.next, reverse that portion of the list.
+
+3. Merge the two halves: Alternately pick nodes from the first half and the reversed second half.
+
+No extra space needed beyond pointers! Each step is O(n), total is O(n).'
+    ),
+    (
+        'Set Matrix Zeroes',
+        'The challenge is O(1) space. Use the first row and first column as markers!
+
+1. First, check if the first row or first column originally contains zeros (save this info in two boolean flags).
+
+2. Iterate through the rest of the matrix. If cell (i,j) is 0, mark matrix[i][0] = 0 and matrix[0][j] = 0.
+
+3. Use these markers to set zeros: For each cell (i,j), if matrix[i][0] == 0 OR matrix[0][j] == 0, set it to 0.
+
+4. Finally, handle the first row and column using the saved flags.'
+    ),
+    (
+        'Spiral Matrix',
+        'Maintain four boundaries: top, bottom, left, right. Move in order: right across top, down the right side, left across bottom, up the left side.
+
+After each direction:
+- After going right: top++
+- After going down: right--
+- After going left: bottom--
+- After going up: left++
+
+Stop when boundaries cross (top > bottom or left > right).
+
+Check the boundary conditions carefully, especially for non-square matrices where you might not need all four directions in the last loop.'
+    ),
+    (
+        'Rotate Image',
+        'For 90° clockwise rotation, there''s an elegant two-step approach:
+
+1. Transpose the matrix (swap matrix[i][j] with matrix[j][i])
+2. Reverse each row
+
+For 90° counter-clockwise: Transpose, then reverse each column (or reverse each row first, then transpose).
+
+Why this works: Transposing flips the matrix along the diagonal. Reversing rows then moves each element to its final position.
+
+Alternative: Rotate in place by moving four cells at a time in a cycle.'
+    ),
+    (
+        'Word Search',
+        'Use backtracking with DFS. From each cell, try to match the word starting there.
+
+At each step:
+1. Check bounds, check if current cell matches current character
+2. Mark the cell as visited (can modify the cell temporarily)
+3. Recursively try all four directions for the next character
+4. If any path succeeds, return true. Otherwise, unmark (backtrack) and return false.
+
+The backtracking is crucial: you must restore the cell when returning, as it might be needed for a different path.'
+    ),
+    (
+        'Longest Substring Without Repeating Characters',
+        'Sliding window with a hash map/set. Expand the window by moving the right pointer. When you see a duplicate, shrink from the left until it''s valid again.
+
+Optimization: Instead of shrinking one by one, store the INDEX of each character. When you see a duplicate, jump left directly to (last occurrence + 1).
+
+At each step, update maxLength = max(maxLength, right - left + 1).
+
+The window always contains unique characters.'
+    ),
+    (
+        'Longest Repeating Character Replacement',
+        'Sliding window approach. The key insight: a window is valid if (window_length - count_of_most_frequent_char) <= k.
+
+Expand right, update character frequencies. If the window becomes invalid (too many characters to replace), shrink from left.
+
+Track the max frequency in the current window. Technically, you don''t even need to decrease maxFreq when shrinking—an invalid window with old maxFreq still gives correct results because we''re looking for the maximum.
+
+Answer: the largest valid window size seen.'
+    ),
+    (
+        'Minimum Window Substring',
+        'Sliding window with character counting. Use two maps: one for target characters and counts, one for the current window.
+
+Expand right to include characters. When you have a valid window (contains all target characters with sufficient counts), try to shrink from the left while maintaining validity. Track the minimum length window.
+
+Use a "formed" counter to track how many unique characters match their target count. When formed == required (number of unique chars in target), the window is valid.
+
+This is O(m + n) where m and n are the string lengths.'
+    ),
+    (
+        'Valid Anagram',
+        'Two strings are anagrams if they have the same character frequencies.
+
+Approach 1: Sort both strings and compare. O(n log n) time.
+
+Approach 2: Use a hash map or array of size 26 (for lowercase letters). Increment for characters in s, decrement for characters in t. All counts should be zero at the end.
+
+Approach 3: Single pass—same as approach 2 but check that all counts are zero afterward.
+
+Edge case: Different lengths mean they can''t be anagrams—check this first.'
+    ),
+    (
+        'Group Anagrams',
+        'The key: all anagrams share the same "signature." Group by signature.
+
+Signature option 1: Sort the word. All anagrams have the same sorted form. O(n * k log k) where k is max word length.
+
+Signature option 2: Character count tuple. Count occurrences of each letter and use that as a hashable key. O(n * k).
+
+Use a hash map: {signature: [list of words]}. Iterate through all words, compute each signature, add to the appropriate list. Return all values from the map.'
+    ),
+    (
+        'Valid Parentheses',
+        'Use a stack. Push opening brackets, pop for closing brackets.
+
+When you see a closing bracket, the top of the stack MUST be its matching opening bracket. If not, or if the stack is empty, invalid.
+
+At the end, the stack must be empty (all brackets matched).
+
+Map closing to opening brackets for clean code: {")": "(", "]": "[", "}": "{"}.'
+    ),
+    (
+        'Valid Palindrome',
+        'Two pointers from both ends, moving toward the center.
+
+Skip non-alphanumeric characters: while left < right and not isAlphanumeric(s[left]): left++.
+
+Compare characters case-insensitively. If they don''t match, return false. If they match, move both pointers inward.
+
+If the pointers meet or cross without mismatches, it''s a valid palindrome.
+
+Note: "alphanumeric" means letters AND digits (0-9), not just letters.'
+    ),
+    (
+        'Longest Palindromic Substring',
+        'Expand around center approach (O(n²)): For each position, expand outward while characters match. Try both odd-length (single center) and even-length (two centers) palindromes.
+
+For each center, expand while s[left] == s[right], tracking the longest found.
+
+DP approach: dp[i][j] = true if s[i..j] is a palindrome. dp[i][j] = (s[i] == s[j]) AND dp[i+1][j-1]. Fill diagonally or by length.
+
+The expand approach is simpler and often faster in practice due to early termination.'
+    ),
+    (
+        'Palindromic Substrings',
+        'Same expand-around-center technique as Longest Palindromic Substring, but COUNT instead of tracking the longest.
+
+For each center (both odd and even), expand outward while characters match. Each successful expansion is one more palindrome.
+
+There are 2n-1 centers (n single positions + n-1 gaps between positions).
+
+Alternative: DP where dp[i][j] indicates if s[i..j] is a palindrome. Count all true values. But the expand approach is typically cleaner.'
+    ),
+    (
+        'Encode and Decode Strings',
+        'The challenge: strings can contain any character, including delimiters. You need a delimiter-free encoding.
+
+Solution: Length-prefix encoding. For each string, store its LENGTH followed by a delimiter, then the string itself.
+
+Example: ["abc", "de"] → "3#abc2#de"
+
+To decode: Read digits until you hit #, parse the length n, then read exactly n characters. Repeat.
+
+This works because you always know exactly how many characters belong to each string, regardless of their content.'
+    ),
+    (
+        'Maximum Depth of Binary Tree',
+        'Recursive approach (DFS): The depth of a tree is 1 + max(depth of left subtree, depth of right subtree). Base case: null node has depth 0.
+
+Iterative approach (BFS): Level-order traversal. Count the number of levels. Use a queue, process level by level, increment depth after each level.
+
+Both are O(n) time. Recursive uses O(h) stack space (h = height), BFS uses O(w) queue space (w = max width).'
+    ),
+    (
+        'Same Tree',
+        'Recursive comparison: Two trees are the same if:
+1. Both are null (base case, return true)
+2. Both are non-null AND their values are equal AND their left subtrees are the same AND their right subtrees are the same.
+
+If one is null and the other isn''t, or values differ, return false.
+
+Iterative: Use two queues/stacks in parallel. At each step, pop from both and compare. Push children in the same order.'
+    ),
+    (
+        'Invert Binary Tree',
+        'At each node, swap its left and right children, then recursively invert both subtrees.
+
+The recursive solution is elegant:
+```
+if not root: return None
+root.left, root.right = root.right, root.left
+invert(root.left)
+invert(root.right)
+return root
+```
+
+Or: first invert children, then swap. Both work!
+
+Iterative: Use a queue/stack. For each node, swap its children, then add the children to the queue.'
+    ),
+    (
+        'Binary Tree Maximum Path Sum',
+        'The tricky part: a path can go through a node in two ways:
+1. The node is part of a longer path going up to its parent
+2. The node is the "apex" of a path (left → node → right)
+
+For each node, calculate the max contribution it can make going UP (itself + max of one child, or just itself if children are negative).
+
+But also check if this node could be the apex: left_gain + node.val + right_gain. Update global max if this is better.
+
+Use a helper function that returns the "max gain going up" but also updates the global maximum for path sums.'
+    ),
+    (
+        'Binary Tree Level Order Traversal',
+        'Classic BFS with a queue. The key is tracking level boundaries.
+
+Approach: When processing a level, note the current queue size. Pop exactly that many nodes (they''re all from the current level), and add their children for the next level.
+
+```
+while queue not empty:
+    level_size = len(queue)
+    current_level = []
+    for i in range(level_size):
+        node = queue.pop()
+        current_level.append(node.val)
+        if node.left: queue.add(node.left)
+        if node.right: queue.add(node.right)
+    result.append(current_level)
+```'
+    ),
+    (
+        'Serialize and Deserialize Binary Tree',
+        'Preorder traversal with null markers works well.
+
+Serialize: Visit node, output value (or "null"), recursively serialize left, then right. Result: "1,2,null,null,3,4,null,null,5,null,null"
+
+Deserialize: Split by delimiter into a queue/iterator. Pop the next value:
+- If "null", return None
+- Otherwise, create node, recursively deserialize left child, then right child
+
+The preorder structure + null markers perfectly capture the tree shape. BFS also works with level-order serialization.'
+    ),
+    (
+        'Subtree of Another Tree',
+        'For each node in the main tree, check if the subtree rooted there matches the target tree.
+
+Two functions:
+1. isSubtree(s, t): Returns true if t is a subtree of s. Check if s matches t, OR if t is a subtree of s.left, OR t is a subtree of s.right.
+
+2. isSameTree(s, t): Returns true if two trees are identical (same structure and values).
+
+For each node in s, try isSameTree with t. Return true if any match.
+
+Time: O(m * n) in worst case, but typically faster due to early termination.'
+    ),
+    (
+        'Construct Binary Tree from Preorder and Inorder Traversal',
+        'Key insight: In preorder, the first element is always the root. In inorder, elements left of the root are the left subtree, elements right are the right subtree.
+
+Algorithm:
+1. Pop from preorder—this is the current root
+2. Find this value in inorder (use a hash map for O(1) lookup)
+3. Everything left of it in inorder is the left subtree; everything right is the right subtree
+4. Recursively build left and right subtrees
+
+Use indices to avoid creating new arrays. Preorder tells you WHAT the root is; inorder tells you the SPLIT.'
+    ),
+    (
+        'Validate Binary Search Tree',
+        'Pass down valid ranges for each node. A node is valid if it''s within (min, max) AND both subtrees are valid with updated ranges.
+
+For left child: max becomes current node''s value
+For right child: min becomes current node''s value
+
+Start with (-infinity, +infinity).
+
+Alternative: Inorder traversal of a valid BST produces a sorted sequence. Track the previously visited value and ensure each node is greater.
+
+Careful: It''s not enough to check node.left.val < node.val < node.right.val. You must check the entire range!'
+    ),
+    (
+        'Kth Smallest Element in a BST',
+        'Inorder traversal of a BST visits nodes in sorted order. The kth node visited is the kth smallest.
+
+Iterative inorder with a counter: Use a stack, go left as far as possible, pop and count. When count == k, return that node''s value.
+
+Recursive: Do inorder traversal but stop early when you''ve found the kth element.
+
+Follow-up: If the BST is modified often, store subtree sizes at each node. Then you can find the kth smallest in O(h) time using binary search on subtree sizes.'
+    ),
+    (
+        'Lowest Common Ancestor of a Binary Search Tree',
+        'Use the BST property! Starting from root:
+- If both p and q are smaller than current, go left
+- If both p and q are larger than current, go right
+- Otherwise, current node is the LCA (one is on each side, or one IS the current node)
+
+The first node where p and q "split" is their LCA.
+
+This is O(h) time—you traverse a single path from root to the answer. Works iteratively too, no recursion needed.'
+    ),
+    (
+        'Implement Trie (Prefix Tree)',
+        'Each node contains: a dictionary of children (char → child_node) and an is_end_of_word flag.
+
+Insert: Traverse/create nodes for each character. Mark the last node as end_of_word.
+
+Search: Traverse nodes for each character. Return true only if you reach the end AND is_end_of_word is true.
+
+StartsWith: Same as search, but return true if you can traverse all characters (don''t check is_end_of_word).
+
+Each node can have up to 26 children (for lowercase letters). Using a dictionary is more space-efficient than an array when words are sparse.'
+    ),
+    (
+        'Design Add and Search Words Data Structure',
+        'A Trie with wildcard support. The add operation is standard Trie insertion.
+
+For search with ''.'':
+- If the current character is a letter, follow the standard Trie path
+- If it''s ''.'', try ALL children recursively. If any path matches the rest of the word, return true.
+
+The wildcard makes this potentially O(26^m) in the worst case (all dots), but practically it''s much faster because most paths don''t exist in the Trie.
+
+Use DFS for the search, backtracking through all possibilities for wildcards.'
+    ),
+    (
+        'Word Search II',
+        'Combine Trie with backtracking. Build a Trie from all words, then search the grid using DFS.
+
+For each cell, start a DFS that follows the Trie. If the current path matches a Trie node, continue exploring. If you reach a word end in the Trie, add it to results.
+
+Optimization: Remove words from the Trie after finding them to avoid duplicates and speed up subsequent searches.
+
+Optimization: Instead of storing just is_word, store the actual word at Trie nodes. This makes it easy to add found words to results.
+
+Time complexity is O(m * n * 4^L) in worst case, but Trie pruning makes it much faster.'
+    ),
+    (
+        'Top K Frequent Elements',
+        'Three main approaches:
+
+1. Min-Heap of size k (O(n log k)): Count frequencies, then maintain a min-heap of the k most frequent. If heap size exceeds k, pop the minimum. The remaining k elements are the answer.
+
+2. Bucket Sort (O(n)): Frequencies range from 1 to n. Create n buckets where bucket[i] contains elements with frequency i. Collect elements from highest buckets until you have k.
+
+3. Quickselect (O(n) average): Use quickselect to partition by frequency, finding the k elements with highest frequencies.
+
+For interviews, heap is most commonly expected. Bucket sort is the optimal solution.'
+    ),
+    (
+        'Find Median from Data Stream',
+        'Use two heaps:
+- Max-heap for the smaller half of numbers
+- Min-heap for the larger half of numbers
+
+The median is either the max of the smaller half (odd count) or the average of both heap tops (even count).
+
+When adding a number:
+1. Add to max-heap first (smaller half)
+2. Pop from max-heap and push to min-heap (balance)
+3. If min-heap has more elements than max-heap, pop and push back to max-heap
+
+This keeps the heaps balanced (sizes differ by at most 1) and the smaller half always in the max-heap.
+
+addNum: O(log n), findMedian: O(1).'
+    )
+) AS v(title, detailed_hint)
+WHERE bp.title = v.title;
+
+-- definition for 75 problems (requires supabase-add-definition.sql)
+UPDATE public.blind_problems AS bp
+SET definition = v.definition
+FROM (VALUES
+    (
+        'Two Sum',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based). Arrays have O(1) random access but O(n) search for unsorted data.
+
+**Hash Map (Dictionary)**: A data structure that stores key-value pairs and provides O(1) average-time lookups, insertions, and deletions. It uses a hash function to convert keys into array indices.'
+    ),
+    (
+        'Best Time to Buy and Sell Stock',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based). In this problem, the array represents stock prices over time, where each index is a day.
+
+**Running Minimum/Maximum**: A technique where you track the smallest (or largest) value seen so far as you iterate through an array. This allows single-pass solutions for problems that depend on past values.'
+    ),
+    (
+        'Contains Duplicate',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based).
+
+**Hash Set**: A collection that stores unique elements and provides O(1) average-time lookups and insertions. Unlike a hash map, it only stores keys (no values). Perfect for tracking "have I seen this before?" questions.'
+    ),
+    (
+        'Product of Array Except Self',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based).
+
+**Prefix/Suffix Arrays**: Prefix arrays store cumulative computations from the start (e.g., prefix[i] = operation on elements 0 to i-1). Suffix arrays store computations from the end. Together, they help answer queries about "all elements except one" efficiently.'
+    ),
+    (
+        'Maximum Subarray',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based).
+
+**Subarray**: A contiguous portion of an array. Unlike a subsequence, elements must be adjacent. For array [1,2,3,4], valid subarrays include [2,3] and [1,2,3], but NOT [1,3] (non-contiguous).
+
+**Kadane''s Algorithm**: A dynamic programming technique that finds the maximum sum subarray in O(n) time by deciding at each position: extend the current subarray or start fresh?'
+    ),
+    (
+        'Maximum Product Subarray',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based).
+
+**Subarray**: A contiguous portion of an array where elements must be adjacent.
+
+**Key Insight for Products**: Unlike sums, products have special behavior with negative numbers—multiplying two negatives gives a positive. This means the minimum product could become the maximum after one more multiplication.'
+    ),
+    (
+        'Find Minimum in Rotated Sorted Array',
+        '**Sorted Array**: An array where elements are arranged in increasing (or decreasing) order. Enables O(log n) binary search.
+
+**Rotated Sorted Array**: A sorted array that has been "rotated" at some pivot point. For example, [1,2,3,4,5] rotated at index 3 becomes [4,5,1,2,3]. It consists of two sorted subarrays.
+
+**Binary Search**: A divide-and-conquer algorithm that repeatedly halves the search space by comparing the target to the middle element. Requires O(log n) time on sorted data.'
+    ),
+    (
+        'Search in Rotated Sorted Array',
+        '**Sorted Array**: An array where elements are arranged in increasing (or decreasing) order. Enables O(log n) binary search.
+
+**Rotated Sorted Array**: A sorted array that has been "rotated" at some pivot point. For example, [1,2,3,4,5] rotated at index 3 becomes [4,5,1,2,3]. The key property: at least one half of the array is always properly sorted.
+
+**Binary Search**: A divide-and-conquer algorithm that repeatedly halves the search space. The challenge here is determining which half to search when the array is rotated.'
+    ),
+    (
+        '3Sum',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based).
+
+**Two-Pointer Technique**: A strategy using two pointers that move toward each other (or in the same direction) to solve problems in O(n) time instead of O(n²). Often used on sorted arrays.
+
+**N-Sum Pattern**: A family of problems (2Sum, 3Sum, 4Sum) that can be reduced: solve 3Sum by fixing one element and solving 2Sum on the remainder.'
+    ),
+    (
+        'Container With Most Water',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations. Here, each element represents the height of a vertical line.
+
+**Two-Pointer Technique**: A strategy using two pointers (often at opposite ends) that move toward each other. The key insight is determining which pointer to move based on some condition—here, always move the shorter line inward.'
+    ),
+    (
+        'Sum of Two Integers',
+        '**Bit Manipulation**: Operating directly on the binary representation of numbers using bitwise operators: AND (&), OR (|), XOR (^), NOT (~), left shift (<<), right shift (>>).
+
+**Binary Addition**: When adding in binary, XOR gives the sum without carries, AND identifies where carries occur, and left shift positions the carries correctly. Repeat until no carries remain.
+
+**32-bit Integer**: Most languages use 32 bits for integers. When doing bit manipulation, you may need to mask results to handle overflow.'
+    ),
+    (
+        'Number of 1 Bits',
+        '**Bit Manipulation**: Operating directly on the binary representation of numbers using bitwise operators.
+
+**Binary Representation**: Every integer can be represented as a sequence of 0s and 1s. For example, 5 in binary is 101 (4 + 0 + 1).
+
+**Hamming Weight**: The number of 1 bits in a binary representation. Also called "population count" or "popcount."
+
+**Brian Kernighan''s Algorithm**: The expression n & (n-1) clears the rightmost set bit. Counting how many times you can do this gives the number of 1 bits.'
+    ),
+    (
+        'Counting Bits',
+        '**Bit Manipulation**: Operating directly on the binary representation of numbers using bitwise operators.
+
+**Dynamic Programming (DP)**: Solving problems by breaking them into overlapping subproblems and storing results. Here, the number of 1s in a number relates to previously computed values.
+
+**Key Relationship**: The count of 1s in number i equals count(i >> 1) + (i & 1). Right-shifting removes the last bit; (i & 1) checks if the last bit was 1.'
+    ),
+    (
+        'Missing Number',
+        '**Array**: An ordered collection of elements stored at contiguous memory locations, accessed by index (0-based).
+
+**XOR Properties**: XOR (^) has useful properties: a ^ a = 0, a ^ 0 = a, and XOR is commutative/associative. If you XOR all numbers from 0 to n with all array elements, duplicates cancel out, leaving the missing number.
+
+**Gauss''s Formula**: The sum of integers from 0 to n is n*(n+1)/2. Subtracting the actual array sum gives the missing number.'
+    ),
+    (
+        'Reverse Bits',
+        '**Bit Manipulation**: Operating directly on the binary representation of numbers using bitwise operators.
+
+**32-bit Unsigned Integer**: A number represented with exactly 32 binary digits, with no sign bit (all values are non-negative).
+
+**Bit Extraction and Placement**: To reverse bits, extract each bit from the right side of the input and place it on the left side of the output. Use (n & 1) to extract the last bit and (result << 1) to make room in the result.'
+    ),
+    (
+        'Climbing Stairs',
+        '**Dynamic Programming (DP)**: A technique for solving problems by breaking them into smaller overlapping subproblems, solving each once, and storing the results.
+
+**Fibonacci Sequence**: A sequence where each number is the sum of the two preceding ones: 1, 1, 2, 3, 5, 8, 13... Climbing stairs follows this pattern because you can reach step n from either step n-1 or n-2.
+
+**State Transition**: The core of DP—defining how to compute the current state from previous states. Here: ways(n) = ways(n-1) + ways(n-2).'
+    ),
+    (
+        'Coin Change',
+        '**Dynamic Programming (DP)**: A technique for solving optimization problems by building solutions to larger problems from solutions to smaller subproblems.
+
+**Unbounded Knapsack**: A category of DP problems where you can use each item (coin) unlimited times. Unlike 0/1 knapsack, the same coin can contribute multiple times to the solution.
+
+**State Definition**: dp[amount] = minimum coins needed to make that amount. Build from dp[0] = 0 up to dp[target].'
+    ),
+    (
+        'Longest Increasing Subsequence',
+        '**Subsequence**: A sequence derived from another by deleting some (or no) elements without changing the order. For [1,3,2,4], valid subsequences include [1,3,4] and [1,2,4]. Unlike subarrays, elements need not be contiguous.
+
+**Dynamic Programming (DP)**: Build solutions by computing the LIS ending at each index, using previously computed values.
+
+**Patience Sorting / Binary Search Optimization**: An O(n log n) approach that maintains the smallest possible ending element for each subsequence length.'
+    ),
+    (
+        'Longest Common Subsequence',
+        '**Subsequence**: A sequence derived from another by deleting some (or no) elements without changing the order. For "abcde", valid subsequences include "ace" and "bde".
+
+**2D Dynamic Programming**: When comparing two sequences, use a 2D table where dp[i][j] represents the solution for the first i characters of string1 and first j characters of string2.
+
+**Optimal Substructure**: The LCS of two strings depends on whether their last characters match. If yes, extend the LCS. If no, take the better of excluding either character.'
+    ),
+    (
+        'Word Break',
+        '**Dynamic Programming (DP)**: A technique for solving problems by storing solutions to subproblems. Here, dp[i] indicates whether the first i characters can be segmented into dictionary words.
+
+**String Segmentation**: Breaking a string into valid parts. At each position, check all possible "last words" that end there.
+
+**Hash Set for Dictionary**: Convert the word list to a set for O(1) lookup when checking if a substring is a valid word.'
+    ),
+    (
+        'Combination Sum',
+        '**Backtracking**: A systematic way to explore all possibilities by building candidates incrementally and abandoning ("backtracking") paths that cannot lead to valid solutions.
+
+**Combination vs Permutation**: Combinations ignore order ([1,2] = [2,1]), permutations consider order. For combinations, always iterate forward from the current index to avoid duplicates.
+
+**Unbounded Selection**: Each candidate can be used unlimited times. When including a candidate, stay at the same index to allow reuse.'
+    ),
+    (
+        'House Robber',
+        '**Dynamic Programming (DP)**: A technique for solving optimization problems by making optimal choices at each step based on previous results.
+
+**Linear DP with Constraints**: At each house, you choose to rob it (adding to the loot from two houses back) or skip it (keeping the loot from the previous house). This creates the recurrence: dp[i] = max(dp[i-2] + nums[i], dp[i-1]).
+
+**Space Optimization**: Since you only need the last two values, you can reduce from O(n) space to O(1).'
+    ),
+    (
+        'House Robber II',
+        '**Circular Array**: An array where the last element is considered adjacent to the first. This creates a constraint: you cannot select both the first and last elements.
+
+**Problem Reduction**: Solve the circular constraint by breaking it into two linear subproblems: one excluding the first house, one excluding the last house. Take the maximum of both solutions.
+
+**Linear DP**: Same as House Robber I, but applied to the two subproblems.'
+    ),
+    (
+        'Decode Ways',
+        '**Dynamic Programming (DP)**: Building the count of valid decodings by considering how each position can be decoded.
+
+**String to Integer Mapping**: Letters A-Z map to numbers 1-26. A string of digits can be decoded in multiple ways: "12" could be "AB" (1,2) or "L" (12).
+
+**Valid Decoding Rules**: Single digits 1-9 are valid (not 0). Two-digit numbers 10-26 are valid. Leading zeros (like "01") are invalid. The digit 0 can only be part of "10" or "20".'
+    ),
+    (
+        'Unique Paths',
+        '**2D Grid**: A matrix with rows and columns. Movement is typically restricted to right and down (no diagonal or backward moves in this problem).
+
+**2D Dynamic Programming**: dp[i][j] represents the number of ways to reach cell (i,j). Each cell can only be reached from the cell above or the cell to the left.
+
+**Combinatorics Alternative**: This is equivalent to choosing (m-1) down moves out of (m+n-2) total moves, which equals C(m+n-2, m-1).'
+    ),
+    (
+        'Jump Game',
+        '**Array**: Each element represents the maximum jump length from that position.
+
+**Greedy Algorithm**: Make the locally optimal choice at each step. Here, always track the farthest index reachable so far.
+
+**Reachability**: A position is reachable if your current maximum reach is >= that position''s index. If you can reach the last index, return true.'
+    ),
+    (
+        'Clone Graph',
+        '**Graph**: A data structure consisting of nodes (vertices) connected by edges. Can be directed or undirected.
+
+**Adjacency List**: A common graph representation where each node stores a list of its neighbors. Node 1 with neighbors [2, 3] means edges exist from node 1 to nodes 2 and 3.
+
+**Deep Copy**: Creating a completely independent copy where no references point to the original. Each node must be newly created with new neighbor lists.
+
+**Hash Map for Visited**: Maps original nodes to their clones. Prevents infinite loops and ensures each node is cloned exactly once.'
+    ),
+    (
+        'Course Schedule',
+        '**Directed Graph**: A graph where edges have direction (A → B means you can go from A to B, but not necessarily B to A). Prerequisites naturally form directed edges.
+
+**Cycle Detection**: In a dependency graph, a cycle means a circular dependency (A requires B, B requires C, C requires A). If a cycle exists, not all tasks can be completed.
+
+**Topological Sort**: Ordering nodes so that for every directed edge A → B, A comes before B. Only possible in acyclic graphs (DAGs).
+
+**Three-State DFS**: Track nodes as unvisited, visiting (in current path), or visited (fully processed). Finding a "visiting" node means a cycle exists.'
+    ),
+    (
+        'Pacific Atlantic Water Flow',
+        '**2D Grid/Matrix**: A grid where each cell has a height value. Water flows from higher cells to equal or lower adjacent cells.
+
+**Multi-Source BFS/DFS**: Instead of checking each cell individually, start from the destination (ocean borders) and work backwards. Find all cells that can reach each ocean.
+
+**Reverse Flow**: Water flows downhill, but we search uphill from the oceans—a cell can reach the ocean if we can reach it from the ocean going uphill (to equal or higher cells).'
+    ),
+    (
+        'Number of Islands',
+        '**2D Grid/Matrix**: A grid of characters where ''1'' represents land and ''0'' represents water.
+
+**Connected Components**: In graph terms, an island is a connected component of ''1''s. Two cells are connected if they share an edge (not diagonal).
+
+**Flood Fill Algorithm**: When you find an unvisited land cell, you''ve discovered a new island. Use DFS/BFS to mark all connected land cells as visited ("sink" the island), then continue searching for more islands.'
+    ),
+    (
+        'Longest Consecutive Sequence',
+        '**Array/Set**: The input is an unsorted array. Convert to a hash set for O(1) lookups.
+
+**Sequence**: A consecutive sequence like [1, 2, 3, 4] where each element differs by 1 from its neighbors. Elements can appear anywhere in the original array.
+
+**Sequence Start Detection**: To avoid counting the same sequence multiple times, only start counting from the beginning of a sequence—a number is a sequence start if (number - 1) is NOT in the set.'
+    ),
+    (
+        'Alien Dictionary',
+        '**Directed Graph**: Each character is a node. An edge from ''a'' to ''b'' means ''a'' comes before ''b'' in the alien alphabet.
+
+**Topological Sort**: Ordering nodes respecting all directed edges. The alien alphabet is a valid topological ordering of the character graph.
+
+**Lexicographic Ordering**: In a sorted word list, comparing adjacent words reveals ordering rules. The first differing character between two adjacent words tells us which character comes first in the alphabet.'
+    ),
+    (
+        'Graph Valid Tree',
+        '**Tree**: A special type of graph that is connected (all nodes reachable from any node) and acyclic (no cycles). A tree with n nodes has exactly n-1 edges.
+
+**Union-Find (Disjoint Set Union)**: A data structure that tracks which elements belong to the same set. Supports near-O(1) union and find operations. If unioning two nodes that are already in the same set, a cycle exists.
+
+**Connected Components**: Groups of nodes where each node is reachable from every other node in the group. A valid tree has exactly one connected component.'
+    ),
+    (
+        'Number of Connected Components in an Undirected Graph',
+        '**Undirected Graph**: A graph where edges have no direction—if A connects to B, then B connects to A.
+
+**Connected Components**: Groups of nodes where every node in the group is reachable from every other node in the same group. Nodes in different components have no path between them.
+
+**Union-Find (Disjoint Set Union)**: Initialize each node as its own component. For each edge, union the two nodes. Count remaining distinct sets.'
+    ),
+    (
+        'Insert Interval',
+        '**Interval**: A pair [start, end] representing a continuous range. Two intervals overlap if one starts before the other ends and vice versa.
+
+**Sorted Intervals**: When intervals are sorted by start time, overlapping intervals are adjacent. This enables single-pass algorithms.
+
+**Interval Merging**: When two intervals overlap, merge them into [min(starts), max(ends)]. Non-overlapping intervals remain separate.'
+    ),
+    (
+        'Merge Intervals',
+        '**Interval**: A pair [start, end] representing a continuous range from start to end (inclusive).
+
+**Overlapping Intervals**: Two intervals [a, b] and [c, d] overlap if one starts before the other ends: a <= d AND c <= b. Or simpler: they overlap if NOT (b < c OR d < a).
+
+**Merge Operation**: When intervals overlap, combine them into a single interval: [min(a, c), max(b, d)]. Sorting by start time ensures overlapping intervals are adjacent.'
+    ),
+    (
+        'Non-overlapping Intervals',
+        '**Interval**: A pair [start, end] representing a continuous range.
+
+**Interval Scheduling**: A classic greedy problem—select the maximum number of non-overlapping intervals, or equivalently, remove the minimum number to make them non-overlapping.
+
+**Greedy Choice**: Sort by END time. Always keep the interval that ends earliest—it leaves the most room for future intervals. When conflicts occur, remove the one that ends later.'
+    ),
+    (
+        'Meeting Rooms',
+        '**Interval**: A pair [start, end] representing a meeting''s time range.
+
+**Overlap Detection**: Two meetings conflict if one starts before the other ends. After sorting by start time, just check if each meeting starts after the previous one ends.
+
+**Sorted Intervals**: Sorting brings potentially overlapping intervals adjacent to each other, simplifying the comparison to just consecutive pairs.'
+    ),
+    (
+        'Meeting Rooms II',
+        '**Interval**: A pair [start, end] representing a meeting''s time range.
+
+**Concurrent Events**: At any point in time, multiple meetings may be happening simultaneously. The maximum number of concurrent meetings equals the minimum rooms needed.
+
+**Min-Heap**: A data structure where the minimum element is always at the top. Use it to track the earliest ending meeting—if a new meeting starts after it ends, reuse that room.
+
+**Sweep Line Algorithm**: Create +1 events for starts and -1 events for ends. Sort by time and scan through, tracking the running count. The maximum count is the answer.'
+    ),
+    (
+        'Reverse Linked List',
+        '**Linked List**: A linear data structure where each node contains a value and a pointer to the next node. Unlike arrays, elements are not stored contiguously—they''re connected via pointers.
+
+**Singly Linked List**: Each node only points forward (to next). You can only traverse in one direction.
+
+**In-Place Reversal**: Reversing without creating new nodes. Change each node''s next pointer to point to its previous node instead.'
+    ),
+    (
+        'Linked List Cycle',
+        '**Linked List**: A linear data structure where each node points to the next. The last node typically points to null, but a cycle occurs when it points to an earlier node.
+
+**Cycle**: When following next pointers leads back to a previously visited node, creating an infinite loop.
+
+**Floyd''s Cycle Detection (Tortoise and Hare)**: Use two pointers—slow moves 1 step, fast moves 2 steps. If there''s a cycle, they will eventually meet inside it. If fast reaches null, there''s no cycle.'
+    ),
+    (
+        'Merge Two Sorted Lists',
+        '**Linked List**: A linear data structure where each node contains a value and a pointer to the next node.
+
+**Sorted Linked List**: A linked list where values are in ascending order. Merging two sorted lists produces one sorted list containing all elements.
+
+**Dummy Head Node**: A technique to simplify linked list construction. Create a dummy node at the start, build the list after it, then return dummy.next. This avoids special-casing the first node.'
+    ),
+    (
+        'Merge K Sorted Lists',
+        '**Linked List**: A linear data structure where each node contains a value and a pointer to the next node.
+
+**Min-Heap (Priority Queue)**: A data structure that always gives you the minimum element in O(log n) time. Perfect for repeatedly finding the smallest among k elements.
+
+**Divide and Conquer**: Pair up lists and merge each pair. Repeat until one list remains. Similar to merge sort—each level halves the number of lists.'
+    ),
+    (
+        'Remove Nth Node From End of List',
+        '**Linked List**: A linear data structure where each node points to the next. You cannot directly access elements by index—you must traverse from the head.
+
+**Two-Pointer Technique (Gap Method)**: Use two pointers spaced n nodes apart. When the lead pointer reaches the end, the trailing pointer is at the right position.
+
+**Dummy Head Node**: Placing a dummy node before the head helps handle edge cases, like removing the first node (when n equals the list length).'
+    ),
+    (
+        'Reorder List',
+        '**Linked List**: A linear data structure where each node contains a value and a pointer to the next node.
+
+**Finding the Middle**: Use slow/fast pointers—slow moves 1 step, fast moves 2 steps. When fast reaches the end, slow is at the middle.
+
+**In-Place Interleaving**: The problem requires rearranging without extra space: find middle, reverse second half, then interleave the two halves.'
+    ),
+    (
+        'Set Matrix Zeroes',
+        '**Matrix**: A 2D array with rows and columns. Access elements as matrix[row][col].
+
+**In-Place Algorithm**: Solve the problem using only the existing matrix for storage, achieving O(1) extra space.
+
+**Marker Technique**: Use the first row and first column of the matrix itself to mark which rows/columns should be zeroed. This avoids needing separate arrays to track this information.'
+    ),
+    (
+        'Spiral Matrix',
+        '**Matrix**: A 2D array with m rows and n columns. Elements are accessed as matrix[row][col].
+
+**Boundary Tracking**: Maintain four boundaries (top, bottom, left, right) that shrink as you traverse the matrix. After completing each direction, shrink the corresponding boundary.
+
+**Spiral Order**: Move right along the top row, down the right column, left along the bottom row, and up the left column. Repeat with shrinking boundaries until they cross.'
+    ),
+    (
+        'Rotate Image',
+        '**Matrix**: A 2D array, specifically an n×n square matrix in this problem.
+
+**In-Place Rotation**: Rotate without using additional matrix storage. Each element moves to a new position, and you can chain these moves in groups of 4.
+
+**Transpose**: Swapping matrix[i][j] with matrix[j][i], effectively flipping along the main diagonal.
+
+**90° Clockwise Rotation = Transpose + Reverse Each Row**: This two-step approach is cleaner than rotating elements directly.'
+    ),
+    (
+        'Word Search',
+        '**Matrix/Grid**: A 2D array of characters where you can move up, down, left, or right to adjacent cells.
+
+**Backtracking**: Explore paths by making choices, and undo them (backtrack) when they don''t lead to a solution. Mark cells as visited while exploring, then unmark when returning.
+
+**DFS (Depth-First Search)**: Explore as far as possible along each path before backtracking. At each cell, try all four directions recursively.'
+    ),
+    (
+        'Longest Substring Without Repeating Characters',
+        '**String**: A sequence of characters, accessed by index. In most languages, strings are immutable.
+
+**Substring**: A contiguous sequence of characters within a string. Unlike subsequence, characters must be adjacent.
+
+**Sliding Window**: A technique using two pointers to define a "window" that slides through the data. Expand by moving the right pointer, shrink by moving the left pointer when a condition is violated.
+
+**Hash Set/Map**: Track which characters are in the current window for O(1) duplicate detection.'
+    ),
+    (
+        'Longest Repeating Character Replacement',
+        '**String**: A sequence of characters, accessed by index.
+
+**Sliding Window**: Maintain a window of characters. The window is valid if (window_length - count_of_most_frequent_char) <= k, meaning you can replace up to k characters to make all characters the same.
+
+**Character Frequency Map**: Track how many times each character appears in the current window. The most frequent character is the one you want to keep.'
+    ),
+    (
+        'Minimum Window Substring',
+        '**String**: A sequence of characters. You''re finding the smallest substring of s that contains all characters in t (with correct frequencies).
+
+**Sliding Window**: Expand right to include more characters, shrink left to minimize the window while maintaining validity.
+
+**Character Frequency Matching**: Use two hash maps—one for target frequencies, one for current window. Track how many characters have met their required count.'
+    ),
+    (
+        'Valid Anagram',
+        '**String**: A sequence of characters. Strings in this problem contain only lowercase letters.
+
+**Anagram**: A word formed by rearranging all letters of another word exactly once. "listen" and "silent" are anagrams—same letters, different order.
+
+**Character Frequency**: Count occurrences of each character. Two strings are anagrams if and only if they have identical character frequencies.'
+    ),
+    (
+        'Group Anagrams',
+        '**String**: A sequence of characters. Each string in the input contains only lowercase letters.
+
+**Anagram**: Words with the same characters in different arrangements. All anagrams share the same "signature"—either sorted characters or character counts.
+
+**Hash Map Grouping**: Use the signature as a key in a hash map. All strings mapping to the same key are anagrams of each other.'
+    ),
+    (
+        'Valid Parentheses',
+        '**String**: A sequence containing only the characters ''('', '')'', ''{'', ''}'', ''['', '']''.
+
+**Stack**: A Last-In-First-Out (LIFO) data structure. Push adds to the top, pop removes from the top. Perfect for matching pairs where the most recent opening bracket must match the next closing bracket.
+
+**Bracket Matching**: Opening brackets are pushed onto the stack. Closing brackets must match the top of the stack. If they don''t match, or the stack is empty when we need to match, the string is invalid.'
+    ),
+    (
+        'Valid Palindrome',
+        '**String**: A sequence of characters. This problem considers only alphanumeric characters (letters and digits), ignoring case.
+
+**Palindrome**: A string that reads the same forwards and backwards. "racecar" and "A man a plan a canal Panama" (ignoring spaces/case) are palindromes.
+
+**Two-Pointer Technique**: Use pointers at both ends, moving toward the center. Skip non-alphanumeric characters. Compare characters case-insensitively.'
+    ),
+    (
+        'Longest Palindromic Substring',
+        '**String**: A sequence of characters, accessed by index.
+
+**Palindrome**: A string that reads the same forwards and backwards.
+
+**Expand Around Center**: Every palindrome has a center (single character for odd length, between two characters for even length). From each possible center, expand outward while characters match. There are 2n-1 possible centers in a string of length n.'
+    ),
+    (
+        'Palindromic Substrings',
+        '**String**: A sequence of characters.
+
+**Palindrome**: A string that reads the same forwards and backwards. Every single character is a palindrome.
+
+**Substring**: A contiguous portion of a string. For "abc", substrings are "a", "b", "c", "ab", "bc", "abc".
+
+**Expand Around Center**: Count palindromes by expanding from each possible center. Each successful expansion (characters match) counts as one palindrome.'
+    ),
+    (
+        'Encode and Decode Strings',
+        '**String Array**: A list of strings that may contain any characters, including delimiters you might want to use for encoding.
+
+**Serialization**: Converting a data structure (list of strings) into a single string for storage or transmission, then reconstructing the original structure.
+
+**Length-Prefix Encoding**: Prefix each string with its length and a delimiter (e.g., "3#abc"). This unambiguously separates strings regardless of their content.'
+    ),
+    (
+        'Maximum Depth of Binary Tree',
+        '**Binary Tree**: A tree where each node has at most two children, called left and right. The tree starts at a root node.
+
+**Depth (Height)**: The number of nodes along the longest path from the root to a leaf. An empty tree has depth 0. A single node has depth 1.
+
+**Recursive Definition**: The depth of a tree is 1 + max(depth of left subtree, depth of right subtree). Base case: null node has depth 0.'
+    ),
+    (
+        'Same Tree',
+        '**Binary Tree**: A tree data structure where each node has at most two children (left and right).
+
+**Structural Equality**: Two trees are the same if they have identical structure AND identical values at each corresponding position.
+
+**Recursive Comparison**: Two trees are the same if: (1) both are null, OR (2) both are non-null, their values match, AND their left and right subtrees are the same.'
+    ),
+    (
+        'Invert Binary Tree',
+        '**Binary Tree**: A tree data structure where each node has a value and pointers to at most two children: left and right.
+
+**Tree Inversion (Mirror)**: Swapping the left and right children of every node in the tree. The result is a mirror image of the original tree.
+
+**Recursive Structure**: Invert a tree by swapping the current node''s children, then recursively inverting both subtrees.'
+    ),
+    (
+        'Binary Tree Maximum Path Sum',
+        '**Binary Tree**: A tree where each node has a value (can be negative) and at most two children.
+
+**Path**: A sequence of nodes where each pair of adjacent nodes has an edge. A path does NOT need to go through the root. A path can start and end at any nodes.
+
+**Path Sum**: The sum of all node values along a path. The maximum path sum might be a single node (if all neighbors are negative).
+
+**Contribution vs Path**: A node contributes to a path going UP to its parent (itself + one child). But it could also be the "apex" of a path (left + node + right).'
+    ),
+    (
+        'Binary Tree Level Order Traversal',
+        '**Binary Tree**: A tree where each node has at most two children (left and right).
+
+**Level Order Traversal (BFS)**: Visit all nodes at depth 1, then depth 2, then depth 3, etc. Process the tree level by level, left to right within each level.
+
+**Queue**: A First-In-First-Out (FIFO) data structure. Use it to process nodes in the order they were added. Add children to the queue as you process each node.'
+    ),
+    (
+        'Serialize and Deserialize Binary Tree',
+        '**Binary Tree**: A tree where each node has a value and at most two children (left and right).
+
+**Serialization**: Converting a data structure to a string format that can be stored or transmitted. The format must capture both values AND structure.
+
+**Preorder with Null Markers**: Traverse root-left-right, recording each node''s value (or "null" for missing children). This format uniquely represents the tree structure.'
+    ),
+    (
+        'Subtree of Another Tree',
+        '**Binary Tree**: A tree where each node has at most two children (left and right).
+
+**Subtree**: A tree rooted at some node of the original tree. The subtree includes that node and all its descendants. For tree A with subtree B, B''s root must exist in A, and everything under it must match.
+
+**Tree Matching**: To check if B is a subtree of A, for each node in A, check if the tree rooted there is identical to B.'
+    ),
+    (
+        'Construct Binary Tree from Preorder and Inorder Traversal',
+        '**Binary Tree**: A tree where each node has at most two children (left and right).
+
+**Preorder Traversal**: Visit order is root → left subtree → right subtree. The first element is always the root.
+
+**Inorder Traversal**: Visit order is left subtree → root → right subtree. For any node, elements to its left in inorder belong to its left subtree.
+
+**Reconstruction**: Preorder tells you WHAT the root is. Inorder tells you HOW to split into left and right subtrees.'
+    ),
+    (
+        'Validate Binary Search Tree',
+        '**Binary Search Tree (BST)**: A binary tree where for every node: all values in its left subtree are LESS than the node''s value, and all values in its right subtree are GREATER than the node''s value.
+
+**Valid Range**: Each node must fall within a valid range. The root can be any value. Left children must be less than their parent and inherit an upper bound. Right children must be greater and inherit a lower bound.
+
+**Inorder Property**: An inorder traversal of a valid BST produces values in strictly increasing order.'
+    ),
+    (
+        'Kth Smallest Element in a BST',
+        '**Binary Search Tree (BST)**: A binary tree where left children are smaller and right children are larger than their parent. This property applies recursively to all subtrees.
+
+**Inorder Traversal**: Visiting nodes in left → root → right order. For a BST, this visits nodes in ascending sorted order.
+
+**Kth Element**: The kth smallest is the kth node visited during an inorder traversal. You can stop early once you''ve counted k nodes.'
+    ),
+    (
+        'Lowest Common Ancestor of a Binary Search Tree',
+        '**Binary Search Tree (BST)**: A binary tree where for every node: left subtree values < node value < right subtree values.
+
+**Lowest Common Ancestor (LCA)**: The deepest (lowest) node that is an ancestor of both given nodes. An ancestor of a node is any node on the path from root to that node (including the node itself).
+
+**BST Property for LCA**: The LCA is the first node where the two target values "split"—one goes left, one goes right, or one equals the current node.'
+    ),
+    (
+        'Implement Trie (Prefix Tree)',
+        '**Trie (Prefix Tree)**: A tree-like data structure for storing strings where each node represents a character. Paths from root to nodes represent prefixes. Efficient for prefix-based operations.
+
+**Node Structure**: Each node contains a map of children (character → child node) and a flag indicating if a complete word ends at this node.
+
+**Time Complexity**: Insert, search, and startsWith operations are all O(m) where m is the word length—independent of how many words are stored.'
+    ),
+    (
+        'Design Add and Search Words Data Structure',
+        '**Trie (Prefix Tree)**: A tree for storing strings where each path from root represents a prefix or complete word.
+
+**Wildcard Search**: The ''.'' character matches any single letter. When encountered during search, try all possible children and return true if any path matches.
+
+**Backtracking for Wildcards**: Each ''.'' creates branching search paths. Use DFS/recursion to try all possibilities.'
+    ),
+    (
+        'Word Search II',
+        '**Matrix/Grid**: A 2D array of characters where you search for words by moving to adjacent cells (up, down, left, right).
+
+**Trie (Prefix Tree)**: Store all target words in a Trie. When searching the grid, follow Trie paths—if a path doesn''t exist in the Trie, prune that search branch.
+
+**Backtracking**: Explore paths in the grid, marking cells as visited. If a path leads nowhere (not in Trie or already visited), backtrack and try other directions.'
+    ),
+    (
+        'Top K Frequent Elements',
+        '**Array**: An input array of integers where we need to find the k most common elements.
+
+**Frequency Count**: Use a hash map to count occurrences of each element.
+
+**Min-Heap of Size K**: Keep a heap of the k most frequent elements seen so far. If a new element is more frequent than the heap minimum, replace it. The heap maintains O(log k) operations.
+
+**Bucket Sort Alternative**: Create buckets indexed by frequency (1 to n). Place elements in their frequency bucket. Collect from highest buckets until you have k elements—O(n) time.'
+    ),
+    (
+        'Find Median from Data Stream',
+        '**Data Stream**: Numbers arrive one at a time, and you need to efficiently find the median after each insertion.
+
+**Median**: The middle value of a sorted list. For odd count, it''s the middle element. For even count, it''s the average of the two middle elements.
+
+**Two Heaps**: Split numbers into two halves—a max-heap for the smaller half and a min-heap for the larger half. The median is at the tops of these heaps.
+
+**Heap Balancing**: Keep heaps balanced (sizes differ by at most 1). The max-heap can have one extra element for odd counts.'
+    )
+) AS v(title, definition)
+WHERE bp.title = v.title;
+
+-- problem_group for 75 problems (requires supabase-add-problem-group.sql)
+UPDATE public.blind_problems AS bp
+SET problem_group = v.problem_group
+FROM (VALUES
+    (
+        'Two Sum',
+        'arrays_hashing'
+    ),
+    (
+        'Best Time to Buy and Sell Stock',
+        'sliding_window'
+    ),
+    (
+        'Contains Duplicate',
+        'arrays_hashing'
+    ),
+    (
+        'Product of Array Except Self',
+        'arrays_hashing'
+    ),
+    (
+        'Maximum Subarray',
+        'dp_1d'
+    ),
+    (
+        'Maximum Product Subarray',
+        'dp_1d'
+    ),
+    (
+        'Find Minimum in Rotated Sorted Array',
+        'binary_search'
+    ),
+    (
+        'Search in Rotated Sorted Array',
+        'binary_search'
+    ),
+    (
+        '3Sum',
+        'two_pointers'
+    ),
+    (
+        'Container With Most Water',
+        'two_pointers'
+    ),
+    (
+        'Sum of Two Integers',
+        'bit_manipulation'
+    ),
+    (
+        'Number of 1 Bits',
+        'bit_manipulation'
+    ),
+    (
+        'Counting Bits',
+        'bit_manipulation'
+    ),
+    (
+        'Missing Number',
+        'bit_manipulation'
+    ),
+    (
+        'Reverse Bits',
+        'bit_manipulation'
+    ),
+    (
+        'Climbing Stairs',
+        'dp_1d'
+    ),
+    (
+        'Coin Change',
+        'dp_1d'
+    ),
+    (
+        'Longest Increasing Subsequence',
+        'dp_1d'
+    ),
+    (
+        'Longest Common Subsequence',
+        'dp_2d'
+    ),
+    (
+        'Word Break',
+        'dp_1d'
+    ),
+    (
+        'Combination Sum',
+        'backtracking'
+    ),
+    (
+        'House Robber',
+        'dp_1d'
+    ),
+    (
+        'House Robber II',
+        'dp_1d'
+    ),
+    (
+        'Decode Ways',
+        'dp_1d'
+    ),
+    (
+        'Unique Paths',
+        'dp_2d'
+    ),
+    (
+        'Jump Game',
+        'dp_1d'
+    ),
+    (
+        'Clone Graph',
+        'graph'
+    ),
+    (
+        'Course Schedule',
+        'graph'
+    ),
+    (
+        'Pacific Atlantic Water Flow',
+        'graph'
+    ),
+    (
+        'Number of Islands',
+        'graph'
+    ),
+    (
+        'Longest Consecutive Sequence',
+        'arrays_hashing'
+    ),
+    (
+        'Alien Dictionary',
+        'graph'
+    ),
+    (
+        'Graph Valid Tree',
+        'graph'
+    ),
+    (
+        'Number of Connected Components in an Undirected Graph',
+        'graph'
+    ),
+    (
+        'Insert Interval',
+        'intervals'
+    ),
+    (
+        'Merge Intervals',
+        'intervals'
+    ),
+    (
+        'Non-overlapping Intervals',
+        'intervals'
+    ),
+    (
+        'Meeting Rooms',
+        'intervals'
+    ),
+    (
+        'Meeting Rooms II',
+        'intervals'
+    ),
+    (
+        'Reverse Linked List',
+        'linked_list'
+    ),
+    (
+        'Linked List Cycle',
+        'linked_list'
+    ),
+    (
+        'Merge Two Sorted Lists',
+        'linked_list'
+    ),
+    (
+        'Merge K Sorted Lists',
+        'linked_list'
+    ),
+    (
+        'Remove Nth Node From End of List',
+        'linked_list'
+    ),
+    (
+        'Reorder List',
+        'linked_list'
+    ),
+    (
+        'Set Matrix Zeroes',
+        'matrix'
+    ),
+    (
+        'Spiral Matrix',
+        'matrix'
+    ),
+    (
+        'Rotate Image',
+        'matrix'
+    ),
+    (
+        'Word Search',
+        'backtracking'
+    ),
+    (
+        'Longest Substring Without Repeating Characters',
+        'sliding_window'
+    ),
+    (
+        'Longest Repeating Character Replacement',
+        'sliding_window'
+    ),
+    (
+        'Minimum Window Substring',
+        'sliding_window'
+    ),
+    (
+        'Valid Anagram',
+        'arrays_hashing'
+    ),
+    (
+        'Group Anagrams',
+        'arrays_hashing'
+    ),
+    (
+        'Valid Parentheses',
+        'stack'
+    ),
+    (
+        'Valid Palindrome',
+        'two_pointers'
+    ),
+    (
+        'Longest Palindromic Substring',
+        'string_palindrome'
+    ),
+    (
+        'Palindromic Substrings',
+        'string_palindrome'
+    ),
+    (
+        'Encode and Decode Strings',
+        'arrays_hashing'
+    ),
+    (
+        'Maximum Depth of Binary Tree',
+        'binary_tree'
+    ),
+    (
+        'Same Tree',
+        'binary_tree'
+    ),
+    (
+        'Invert Binary Tree',
+        'binary_tree'
+    ),
+    (
+        'Binary Tree Maximum Path Sum',
+        'binary_tree'
+    ),
+    (
+        'Binary Tree Level Order Traversal',
+        'binary_tree'
+    ),
+    (
+        'Serialize and Deserialize Binary Tree',
+        'binary_tree'
+    ),
+    (
+        'Subtree of Another Tree',
+        'binary_tree'
+    ),
+    (
+        'Construct Binary Tree from Preorder and Inorder Traversal',
+        'binary_tree'
+    ),
+    (
+        'Validate Binary Search Tree',
+        'bst'
+    ),
+    (
+        'Kth Smallest Element in a BST',
+        'bst'
+    ),
+    (
+        'Lowest Common Ancestor of a Binary Search Tree',
+        'bst'
+    ),
+    (
+        'Implement Trie (Prefix Tree)',
+        'tries'
+    ),
+    (
+        'Design Add and Search Words Data Structure',
+        'tries'
+    ),
+    (
+        'Word Search II',
+        'tries'
+    ),
+    (
+        'Top K Frequent Elements',
+        'heap'
+    ),
+    (
+        'Find Median from Data Stream',
+        'heap'
+    )
+) AS v(title, problem_group)
+WHERE bp.title = v.title;
+
+COMMIT;
@@ -299,6 +299,7 @@ export interface Problem {
   problemGroup?: string; // Learning group/pattern (e.g., 'arrays_hashing', 'two_pointers', 'dp_1d')
   leetcodeNumber?: number;
   mnemonicImageUrl?: string; // Visual mnemonic image URL from Supabase Storage
+  relatedProblems?: number[]; // LeetCode numbers of similar problems, most similar first (scripts/related_problems.py)
   isSystemCoding?: boolean; // True for system coding questions (use System Junior/Dean)
   source?: string; // Source URL (e.g., interview report link, video solution)
   company?: string; // Company name(s) that ask this question
@@ -30,6 +30,7 @@ export interface Database {
           problem_group: string | null
           leetcode_number: number | null
           mnemonic_image_url: string | null
+          related_problems: number[] | null
           created_at: string
         }
         Insert: {
@@ -52,6 +53,7 @@ export interface Database {
           problem_group?: string | null
           leetcode_number?: number | null
           mnemonic_image_url?: string | null
+          related_problems?: number[] | null
           created_at?: string
         }
         Update: {
@@ -74,6 +76,7 @@ export interface Database {
           problem_group?: string | null
           leetcode_number?: number | null
           mnemonic_image_url?: string | null
+          related_problems?: number[] | null
           created_at?: string
         }
       }
@@ -226,6 +229,41 @@ export interface Database {
           updated_at?: string
         }
       }
+      user_review_queues: {
+        Row: {
+          user_id: string
+          queue_date: string
+          review_titles: string[]
+          new_titles: string[]
+          due_today: number
+          due_tomorrow: number
+          learning_count: number
+          mastered_count: number
+          computed_at: string
+        }
+        Insert: {
+          user_id: string
+          queue_date: string
+          review_titles?: string[]
+          new_titles?: string[]
+          due_today?: number
+          due_tomorrow?: number
+          learning_count?: number
+          mastered_count?: number
+          computed_at?: string
+        }
+        Update: {
+          user_id?: string
+          queue_date?: string
+          review_titles?: string[]
+          new_titles?: string[]
+          due_today?: number
+          due_tomorrow?: number
+          learning_count?: number
+          mastered_count?: number
+          computed_at?: string
+        }
+      }
       skill_modules: {
         Row: {
           id: string
@@ -387,6 +425,19 @@ export interface StudyStats {
   };
 }
 
+// Queue computed nightly by scripts/precompute_review_queues.py
+export interface PrecomputedReviewQueue {
+  userId: string;
+  queueDate: string;  // YYYY-MM-DD format
+  reviewTitles: string[];  // Due reviews, most overdue first
+  newTitles: string[];  // New problems, easy -> hard
+  dueToday: number;
+  dueTomorrow: number;
+  learningCount: number;
+  masteredCount: number;
+  computedAt: Date;
+}
+
 // ============================================
 // Daily Activity Tracking Types
 // ============================================